@@ -50,7 +50,7 @@ fileConfig(config.config_file_name)
 # 🔥 IMPORT MODELS METADATA
 # ==========================================
 # Now imports will work because PYTHONPATH changed
-from app.models import RefreshToken, User, Admin, Client, Broker, Worker, Credit, RegistrationInvite, Promotion
+from app.models import RefreshToken, User, Admin, Client, Broker, Worker, Credit, CreditDailyRollup, RegistrationInvite, Promotion, EmailOutbox  # noqa: F401 — реєстрація моделей у Base.metadata
 
 from db.session import Base
 
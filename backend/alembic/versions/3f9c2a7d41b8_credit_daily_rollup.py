@@ -0,0 +1,60 @@
+"""credit daily rollup
+
+Revision ID: 3f9c2a7d41b8
+Revises: e77e4d0504a4
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d41b8'
+down_revision: Union[str, Sequence[str], None] = 'e77e4d0504a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    credit_status = postgresql.ENUM(
+        'NEW', 'APPROVED', 'REJECTED', 'TREATMENT', 'COMPLETED',
+        name='credit_status', create_type=False,
+    )
+    op.create_table('credit_daily_rollup',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('worker_id', sa.UUID(), nullable=False),
+    sa.Column('broker_id', sa.UUID(), nullable=False),
+    sa.Column('status', credit_status, nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=14, scale=2), server_default=sa.text('0'), nullable=False),
+    sa.Column('credits_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'worker_id', 'broker_id', 'status')
+    )
+    op.create_index('ix_credit_daily_rollup_worker_day', 'credit_daily_rollup', ['worker_id', 'day'], unique=False)
+    op.create_index('ix_credit_daily_rollup_broker_day', 'credit_daily_rollup', ['broker_id', 'day'], unique=False)
+
+    # backfill з існуючих кредитів (те саме робить `python -m db.rebuild_credit_rollup`)
+    op.execute(
+        """
+        INSERT INTO credit_daily_rollup (day, worker_id, broker_id, status, total_amount, credits_count)
+        SELECT date(issued_at),
+               coalesce(worker_id, '00000000-0000-0000-0000-000000000000'::uuid),
+               coalesce(broker_id, '00000000-0000-0000-0000-000000000000'::uuid),
+               status,
+               coalesce(sum(amount), 0),
+               count(id)
+        FROM credits
+        WHERE is_deleted IS false
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_credit_daily_rollup_broker_day', table_name='credit_daily_rollup')
+    op.drop_index('ix_credit_daily_rollup_worker_day', table_name='credit_daily_rollup')
+    op.drop_table('credit_daily_rollup')
@@ -0,0 +1,64 @@
+"""search trigram indexes
+
+Revision ID: 5d2a9e7c3b14
+Revises: 8b1e5c0f2a6d
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2a9e7c3b14'
+down_revision: Union[str, Sequence[str], None] = '8b1e5c0f2a6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.add_column('clients', sa.Column(
+        'search_document',
+        sa.Text(),
+        sa.Computed(
+            "lower(coalesce(full_name, '') || ' ' || coalesce(email, '') || ' ' "
+            "|| coalesce(phone_number, '') || ' ' || coalesce(fact_address, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.add_column('clients', sa.Column(
+        'phone_digits',
+        sa.String(length=30),
+        sa.Computed("regexp_replace(phone_number, '[^0-9]', '', 'g')", persisted=True),
+        nullable=True,
+    ))
+    op.add_column('credits', sa.Column(
+        'id_text',
+        sa.String(length=36),
+        sa.Computed('(id)::text', persisted=True),
+        nullable=True,
+    ))
+
+    op.create_index('ix_clients_search_document_trgm', 'clients', ['search_document'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'search_document': 'gin_trgm_ops'})
+    op.create_index('ix_clients_phone_digits_trgm', 'clients', ['phone_digits'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'phone_digits': 'gin_trgm_ops'})
+    op.create_index('ix_credits_id_text_trgm', 'credits', ['id_text'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'id_text': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_credits_id_text_trgm', table_name='credits', postgresql_using='gin')
+    op.drop_index('ix_clients_phone_digits_trgm', table_name='clients', postgresql_using='gin')
+    op.drop_index('ix_clients_search_document_trgm', table_name='clients', postgresql_using='gin')
+    op.drop_column('credits', 'id_text')
+    op.drop_column('clients', 'phone_digits')
+    op.drop_column('clients', 'search_document')
+    # pg_trgm залишаємо: розширення могло з'явитись не лише заради цих індексів
@@ -0,0 +1,31 @@
+"""keyset pagination indexes
+
+Revision ID: 8b1e5c0f2a6d
+Revises: 3f9c2a7d41b8
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b1e5c0f2a6d'
+down_revision: Union[str, Sequence[str], None] = '3f9c2a7d41b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index('ix_credits_issued_at_id', 'credits', ['issued_at', 'id'], unique=False)
+    op.create_index('ix_credits_broker_issued_at_id', 'credits', ['broker_id', 'issued_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_credits_broker_issued_at_id', table_name='credits')
+    op.drop_index('ix_credits_issued_at_id', table_name='credits')
+    op.drop_index('ix_users_created_at_id', table_name='users')
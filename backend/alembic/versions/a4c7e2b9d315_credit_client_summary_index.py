@@ -0,0 +1,27 @@
+"""credit client summary index
+
+Revision ID: a4c7e2b9d315
+Revises: 5d2a9e7c3b14
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c7e2b9d315'
+down_revision: Union[str, Sequence[str], None] = '5d2a9e7c3b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_credits_client_issued_at_id', 'credits', ['client_id', 'issued_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_credits_client_issued_at_id', table_name='credits')
@@ -0,0 +1,34 @@
+"""activity feed indexes and admin timezone
+
+Revision ID: c81f4d6a2e90
+Revises: a4c7e2b9d315
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4d6a2e90'
+down_revision: Union[str, Sequence[str], None] = 'a4c7e2b9d315'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_clients_taken_at_worker_id', 'clients', ['taken_at_worker', 'id'], unique=False)
+    op.create_index('ix_clients_taken_at_broker_id', 'clients', ['taken_at_broker', 'id'], unique=False)
+    op.create_index('ix_users_role_created_at_id', 'users', ['role', 'created_at', 'id'], unique=False)
+    op.add_column('admins', sa.Column('timezone', sa.String(length=64), server_default='UTC', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('admins', 'timezone')
+    op.drop_index('ix_users_role_created_at_id', table_name='users')
+    op.drop_index('ix_clients_taken_at_broker_id', table_name='clients')
+    op.drop_index('ix_clients_taken_at_worker_id', table_name='clients')
@@ -0,0 +1,49 @@
+"""email outbox
+
+Revision ID: d4e8a1f6b702
+Revises: c81f4d6a2e90
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e8a1f6b702'
+down_revision: Union[str, Sequence[str], None] = 'c81f4d6a2e90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    email_status = postgresql.ENUM('PENDING', 'SENT', 'FAILED', name='email_status')
+    op.create_table('email_outbox',
+    sa.Column('template', sa.String(length=64), nullable=False),
+    sa.Column('recipient', sa.String(length=255), nullable=False),
+    sa.Column('context', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('status', email_status, nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_email_outbox_pending_next_attempt', 'email_outbox', ['next_attempt_at'],
+        unique=False, postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_email_outbox_pending_next_attempt', table_name='email_outbox',
+                  postgresql_where=sa.text("status = 'PENDING'"))
+    op.drop_table('email_outbox')
+    sa.Enum(name='email_status').drop(op.get_bind(), checkfirst=True)
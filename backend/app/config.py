@@ -1,8 +1,11 @@
+import logging
 import sys
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # ==========================================
 # ALWAYS LOAD .env FROM PROJECT ROOT
 # ==========================================
@@ -12,15 +15,17 @@ project_root = Path(__file__).resolve().parents[2]
 
 env_file = project_root / ".env"
 
+# модуль імпортується один раз на процес; змінні, вже задані в оточенні, не перезаписуються
 if env_file.exists():
-    print(f"🔧 Loading .env from: {env_file}")
+    logger.debug("Loading .env from: %s", env_file)
     load_dotenv(env_file)
 else:
-    print("⚠️ .env NOT FOUND in project root, using environment variables")
+    logger.debug(".env not found in project root, using environment variables")
 
 
 # add project root to PYTHONPATH
-sys.path.append(str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
 
 # === DATABASE CONFIGURATION ===
 required_env = ["DB_USER", "DB_PASSWORD", "DB_HOST", "DB_PORT", "DB_NAME"]
@@ -34,8 +39,159 @@ SQLALCHEMY_DATABASE_URI = (
     f"@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
 )
 
+# === Read replica (optional) ===
+# окремий engine для читань дашбордів / analyze; не задано → читання йдуть у primary
+SQLALCHEMY_READ_DATABASE_URI = os.getenv("SQLALCHEMY_READ_DATABASE_URI") or (
+    f"postgresql+asyncpg://{os.getenv('DB_REPLICA_USER', os.getenv('DB_USER'))}"
+    f":{os.getenv('DB_REPLICA_PASSWORD', os.getenv('DB_PASSWORD'))}"
+    f"@{os.getenv('DB_REPLICA_HOST')}:{os.getenv('DB_REPLICA_PORT', os.getenv('DB_PORT'))}"
+    f"/{os.getenv('DB_REPLICA_NAME', os.getenv('DB_NAME'))}"
+    if os.getenv("DB_REPLICA_HOST") else None
+)
+# лаг (сек), вище якого читання повертаються в primary, і як часто його перевіряти
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", 5))
+REPLICA_LAG_CHECK_SECONDS = float(os.getenv("REPLICA_LAG_CHECK_SECONDS", 2))
+
 # === Optional SQLAlchemy pool settings ===
 SQLALCHEMY_POOL_PRE_PING = os.getenv("SQLALCHEMY_POOL_PRE_PING", "True")
 SQLALCHEMY_POOL_SIZE = int(os.getenv("SQLALCHEMY_POOL_SIZE", 10))
 SQLALCHEMY_MAX_OVERFLOW = int(os.getenv("SQLALCHEMY_MAX_OVERFLOW", 20))
 SQLALCHEMY_POOL_TIMEOUT = int(os.getenv("SQLALCHEMY_POOL_TIMEOUT", 30))
+
+# === SQL instrumentation ===
+# echo кожного запиту в лог — лише для локальної розробки
+SQL_ECHO = os.getenv("SQL_ECHO", "False").lower() == "true"
+# гістограми латентності по fingerprint/методу + /api/system/metrics (opt-in)
+SQL_INSTRUMENTATION = os.getenv("SQL_INSTRUMENTATION", "False").lower() == "true"
+SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", 250))
+SQL_METRICS_MAX_SERIES = int(os.getenv("SQL_METRICS_MAX_SERIES", 2000))
+
+# === Request metrics ===
+ENV = os.getenv("ENV", "development").lower()
+# per-route латентність / розмір відповіді / кількість SQL на запит (/api/system/metrics)
+REQUEST_METRICS = os.getenv("REQUEST_METRICS", "True").lower() == "true"
+# N+1: один і той самий fingerprint частіше ніж N разів за запит
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", 10))
+N_PLUS_ONE_WARN = os.getenv(
+    "N_PLUS_ONE_WARN", str(ENV in ("development", "dev", "test"))
+).lower() == "true"
+# JSON-знімок метрик при shutdown (CI: порівняння з базовим прогоном)
+REQUEST_METRICS_DUMP_PATH = os.getenv("REQUEST_METRICS_DUMP_PATH")
+
+# === Auth middleware ===
+# префікси шляхів, де токен обов'язковий (через кому); напр. "/api/entities,/api/analyze"
+AUTH_HTTP_PROTECTED_PATHS = tuple(p.strip() for p in os.getenv("AUTH_HTTP_PROTECTED_PATHS", "").split(",") if p.strip())
+# WebSocket — усі шляхи, як і раніше
+AUTH_WS_PROTECTED_PATHS = tuple(p.strip() for p in os.getenv("AUTH_WS_PROTECTED_PATHS", "/").split(",") if p.strip())
+# LRU перевірених токенів (за підписом, до exp)
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", 4096))
+
+# === Password hashing ===
+# bcrypt у окремому пулі: thread (bcrypt відпускає GIL) | process
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread").lower()
+# 0 → os.cpu_count()
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 0))
+# скільки операцій може чекати в черзі понад workers; далі — 503
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 32))
+# вартість bcrypt; хеші з іншою вартістю перехешовуються при успішному логіні
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", 12))
+
+# === Refresh-token sessions ===
+# скільки активних сесій (пристроїв) на користувача; старіші видаляються при логіні
+SESSION_MAX_PER_USER = int(os.getenv("SESSION_MAX_PER_USER", 10))
+# sweeper прострочених/відкликаних токенів; 0 — вимкнено
+SESSION_SWEEP_INTERVAL_SECONDS = float(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", 3600))
+SESSION_SWEEP_BATCH_SIZE = int(os.getenv("SESSION_SWEEP_BATCH_SIZE", 1000))
+# кеш hash → (user_id, role, expires_at): memory | redis (CACHE_REDIS_URL) | off
+SESSION_CACHE_BACKEND = os.getenv("SESSION_CACHE_BACKEND", "memory").lower()
+SESSION_CACHE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL_SECONDS", 300))
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", 50_000))
+
+# === Email outbox ===
+MAIL_OUTBOX_BATCH_SIZE = int(os.getenv("MAIL_OUTBOX_BATCH_SIZE", 50))
+# як часто воркер перевіряє чергу, якщо його не розбудив commit (повтори за backoff)
+MAIL_OUTBOX_POLL_SECONDS = float(os.getenv("MAIL_OUTBOX_POLL_SECONDS", 15))
+MAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("MAIL_OUTBOX_MAX_ATTEMPTS", 8))
+MAIL_RETRY_BASE_SECONDS = float(os.getenv("MAIL_RETRY_BASE_SECONDS", 30))
+MAIL_RETRY_MAX_SECONDS = float(os.getenv("MAIL_RETRY_MAX_SECONDS", 3600))
+# скільки лист «зайнятий» воркером; після падіння процесу — повтор
+MAIL_OUTBOX_LEASE_SECONDS = float(os.getenv("MAIL_OUTBOX_LEASE_SECONDS", 300))
+MAIL_OUTBOX_RETENTION_DAYS = float(os.getenv("MAIL_OUTBOX_RETENTION_DAYS", 7))
+SMTP_TIMEOUT_SECONDS = float(os.getenv("SMTP_TIMEOUT_SECONDS", 30))
+# постійне SMTP-з'єднання перевідкривається після такого простою
+SMTP_IDLE_CLOSE_SECONDS = float(os.getenv("SMTP_IDLE_CLOSE_SECONDS", 60))
+
+# === Client bulk import ===
+# рядків на транзакцію: валідація, дедуплікація й вставка йдуть пачками
+CLIENT_IMPORT_CHUNK_SIZE = int(os.getenv("CLIENT_IMPORT_CHUNK_SIZE", 1000))
+# скільки помилок по рядках повертати у звіті (решта лише рахується)
+CLIENT_IMPORT_MAX_ERRORS = int(os.getenv("CLIENT_IMPORT_MAX_ERRORS", 1000))
+# окремий пул bcrypt для імпорту (0 = cpu_count), щоб не займати пул логінів
+CLIENT_IMPORT_HASH_WORKERS = int(os.getenv("CLIENT_IMPORT_HASH_WORKERS", 0))
+# дешевші хеші при імпорті; при першому логіні перехешуються до PASSWORD_BCRYPT_ROUNDS
+CLIENT_IMPORT_BCRYPT_ROUNDS = int(os.getenv("CLIENT_IMPORT_BCRYPT_ROUNDS", 10))
+
+# === Bulk client assignment ===
+# рядків у одному UPDATE … FROM (VALUES …): 2 параметри на рядок, ліміт asyncpg — 32767
+CLIENT_ASSIGN_BATCH_SIZE = int(os.getenv("CLIENT_ASSIGN_BATCH_SIZE", 10000))
+
+# === Lead routing ===
+# нові клієнти без воркера автоматично йдуть найменш завантаженому доступному воркеру
+LEAD_ROUTING_ENABLED = os.getenv("LEAD_ROUTING_ENABLED", "True").lower() == "true"
+# вікно (сек), за яке зміни з change bus зливаються в одне перечитування лічильників роутера
+LEAD_ROUTER_RESYNC_SECONDS = float(os.getenv("LEAD_ROUTER_RESYNC_SECONDS", 1))
+# повне перечитування лічильників з БД (сек): change bus — лише свого процесу, тож зміни,
+# зроблені іншими воркерами, підтягуються не пізніше за цей інтервал; 0 — вимкнено
+LEAD_ROUTER_FULL_SYNC_SECONDS = float(os.getenv("LEAD_ROUTER_FULL_SYNC_SECONDS", 30))
+
+# === Startup profiling ===
+# GET /system/startup/imports — `python -X importtime` у свіжому процесі; лише для ADMIN,
+# за замовчуванням вимкнено (вмикати явно, напр. на staging)
+IMPORT_PROFILER_ENABLED = os.getenv("IMPORT_PROFILER_ENABLED", "False").lower() == "true"
+IMPORT_PROFILE_CACHE_SIZE = int(os.getenv("IMPORT_PROFILE_CACHE_SIZE", 8))
+IMPORT_PROFILE_TIMEOUT_SECONDS = float(os.getenv("IMPORT_PROFILE_TIMEOUT_SECONDS", 60))
+
+# === Streaming export ===
+# рядків на одну вибірку серверного курсора (yield_per) і на один шматок відповіді
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 2000))
+# одночасних експортів на користувача (actor); понад це — 429
+EXPORT_MAX_CONCURRENT_PER_USER = int(os.getenv("EXPORT_MAX_CONCURRENT_PER_USER", 2))
+
+# === Analytics engine ===
+# /<role>/analyze/<metric>: бакети, що вже закрилися (до початку поточного дня / тижня / місяця),
+# кешуються надовго; поточний бакет — коротко і скидається змінами (change bus)
+ANALYTICS_CLOSED_TTL_SECONDS = int(os.getenv("ANALYTICS_CLOSED_TTL_SECONDS", 3600))
+ANALYTICS_OPEN_TTL_SECONDS = int(os.getenv("ANALYTICS_OPEN_TTL_SECONDS", 30))
+
+# === Paginated totals ===
+# TTL (сек) для total_mode="cached": COUNT(*) кешується по нормалізованому фільтру
+COUNT_CACHE_TTL_SECONDS = int(os.getenv("COUNT_CACHE_TTL_SECONDS", 30))
+# максимум закешованих total (LRU; кожен окремий фільтр / пошуковий запит — окремий ключ)
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", 1024))
+
+# === Dashboard read cache ===
+# memory (LRU у процесі) | redis (спільний для всіх процесів) | off;
+# за замовчуванням redis, якщо задано CACHE_REDIS_URL, інакше memory
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "redis" if os.getenv("CACHE_REDIS_URL") else "memory").lower()
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+# кількість воркерів gunicorn/uvicorn (обидва беруть її як --workers за замовчуванням);
+# memory-кеш інвалідується лише у своєму процесі, тож при > 1 воркері без redis він вимикається
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 1))
+# TTL — верхня межа «життя» значення; свіжість після записів гарантує інвалідація по тегах
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", 30))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 10_000))
+
+# === Admin activity feed ===
+# максимум подій на одну сторінку стрічки (далі — next_cursor)
+ACTIVITY_FEED_MAX_ROWS = int(os.getenv("ACTIVITY_FEED_MAX_ROWS", 500))
+
+# === Live dashboard (analyze WebSocket) ===
+# вікно (сек), за яке зміни з change bus зливаються в один перерахунок метрики
+LIVE_DASHBOARD_DEBOUNCE_SECONDS = float(os.getenv("LIVE_DASHBOARD_DEBOUNCE_SECONDS", 0.5))
+
+# === WebSocket connection hub ===
+# розмір черги відправки на одне з'єднання (переповнення → відкидаємо найстаріші кадри)
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", 256))
+# інтервал ping (сек) і таймаут неактивності, після якого з'єднання закривається
+WS_HEARTBEAT_INTERVAL_SECONDS = float(os.getenv("WS_HEARTBEAT_INTERVAL_SECONDS", 20))
+WS_IDLE_TIMEOUT_SECONDS = float(os.getenv("WS_IDLE_TIMEOUT_SECONDS", 60))
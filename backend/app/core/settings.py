@@ -14,6 +14,7 @@ class Settings(BaseSettings):
     JWT_ALGO: str
     ACCESS_EXPIRE_MINUTES: int
     REFRESH_EXPIRE_DAYS: int
+    PASSWORD_RESET_TOKEN_TTL: int = 30  # minutes
 
     # --- SMTP ---
     MAIL_USERNAME: EmailStr
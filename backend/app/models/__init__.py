@@ -12,6 +12,7 @@ from .entities.client import Client
 from .entities.broker import Broker
 from .entities.worker import Worker
 from .entities.credit import Credit
+from .entities.credit_rollup import CreditDailyRollup
 from .entities.registration_invite import RegistrationInvite
 from .entities.promotion import Promotion
 
@@ -26,9 +27,12 @@ from .mixins.timestamp import TimeStampMixin
 # === Sessions ===
 from .sessions.refresh_token import RefreshToken
 
+# === Outbox ===
+from .outbox.email_outbox import EmailOutbox
+
 __all__ = [
     # Entities
-    "User", "Admin", "Client", "Broker", "Worker", "Credit", "RegistrationInvite", "Promotion",
+    "User", "Admin", "Client", "Broker", "Worker", "Credit", "CreditDailyRollup", "RegistrationInvite", "Promotion",
 
     # Mixins
     "AuthMixin", "DynamicLinkAuthMixin", "SoftDeleteMixin",
@@ -36,4 +40,7 @@ __all__ = [
 
     # Session
     "RefreshToken",
+
+    # Outbox
+    "EmailOutbox",
 ]
@@ -12,6 +12,7 @@ from .worker import Worker
 from .broker import Broker
 from .admin import Admin
 from .credit import Credit
+from .credit_rollup import CreditDailyRollup
 from .registration_invite import RegistrationInvite
 from .promotion import Promotion
 
@@ -23,6 +24,7 @@ __all__ = [
     "Broker",
     "Admin",
     "Credit",
+    "CreditDailyRollup",
     "RegistrationInvite",
     "Promotion"
 ]
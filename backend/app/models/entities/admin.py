@@ -44,6 +44,15 @@ class Admin(User, TimeStampAuthMixin, DynamicLinkAuthMixin):
         info={"description": "Whether the admin is super admin"}
     )
 
+    # IANA-таймзона адміна (Europe/Kyiv, …): межі «сьогодні/вчора» у стрічці активності
+    timezone: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        default="UTC",
+        server_default="UTC",
+        info={"description": "IANA timezone used for the admin's day windows"}
+    )
+
     __mapper_args__ = {
         "inherit_condition": (id == User.id),
         "polymorphic_identity": PermissionRole.ADMIN,
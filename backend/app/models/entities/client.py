@@ -2,8 +2,8 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import ForeignKey, String, Text, Integer, CheckConstraint, DateTime
+from sqlalchemy.orm import Mapped, mapped_column, relationship, query_expression
+from sqlalchemy import ForeignKey, String, Text, Integer, CheckConstraint, DateTime, Computed, Index
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
 
 from app.models.entities.user import User
@@ -44,6 +44,16 @@ class Client(User):
         # якщо є timestamp від брокера, має існувати broker_id
         CheckConstraint("(taken_at_broker IS NULL) OR (broker_id IS NOT NULL)",
                         name='ck_clients_broker_ts_consistency'),
+
+        # пошук: pg_trgm GIN по згенерованих колонках (LIKE '%…%' без seq scan)
+        Index('ix_clients_search_document_trgm', 'search_document',
+              postgresql_using='gin', postgresql_ops={'search_document': 'gin_trgm_ops'}),
+        Index('ix_clients_phone_digits_trgm', 'phone_digits',
+              postgresql_using='gin', postgresql_ops={'phone_digits': 'gin_trgm_ops'}),
+
+        # стрічка активності: діапазон по часу взяття в роботу + keyset (at, id)
+        Index('ix_clients_taken_at_worker_id', 'taken_at_worker', 'id'),
+        Index('ix_clients_taken_at_broker_id', 'taken_at_broker', 'id'),
     )
 
     # Inherited primary key mapped to users table (joined-table inheritance)
@@ -101,6 +111,26 @@ class Client(User):
     phone_number: Mapped[str] = mapped_column(String(30), nullable=False, unique=True)
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
 
+    # =========================
+    # 📌 Search (generated, read-only)
+    # =========================
+    # нормалізований документ для пошуку: lower(ПІБ + email + телефон + фактична адреса)
+    search_document: Mapped[Optional[str]] = mapped_column(
+        Text,
+        Computed(
+            "lower(coalesce(full_name, '') || ' ' || coalesce(email, '') || ' ' "
+            "|| coalesce(phone_number, '') || ' ' || coalesce(fact_address, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+    # лише цифри телефону: '+7 (900) 123' і '7900123' шукаються однаково
+    phone_digits: Mapped[Optional[str]] = mapped_column(
+        String(30),
+        Computed("regexp_replace(phone_number, '[^0-9]', '', 'g')", persisted=True),
+        deferred=True,
+    )
+
     # =========================
     # 📌 Financial Questionnaire
     # =========================
@@ -144,6 +174,13 @@ class Client(User):
         nullable=True,
         default=None
     )
+
+    # зведення по кредитах — заповнюється лише профілем завантаження (with_expression),
+    # інакше None; див. app/services/entities/client/load_profiles.py
+    credits_count: Mapped[Optional[int]] = query_expression()
+    credits_total: Mapped[Optional[float]] = query_expression()
+    last_credit_status: Mapped[Optional[str]] = query_expression()
+
     # Enables polymorphic identity for the Client role
     __mapper_args__ = {
         "inherit_condition": (id == User.id),
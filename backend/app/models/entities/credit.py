@@ -3,7 +3,7 @@ from datetime import datetime
 from enum import StrEnum
 from uuid import UUID, uuid4
 
-from sqlalchemy import ForeignKey, Numeric, Enum, DateTime, String, Text, text
+from sqlalchemy import ForeignKey, Numeric, Enum, DateTime, String, Text, Index, Computed, text
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -21,6 +21,16 @@ class CreditStatus(StrEnum):
 
 class Credit(Base, SoftDeleteMixin):
     __tablename__ = "credits"
+    __table_args__ = (
+        # keyset-пагінація: ORDER BY issued_at, id (глобально і в межах брокера)
+        Index("ix_credits_issued_at_id", "issued_at", "id"),
+        Index("ix_credits_broker_issued_at_id", "broker_id", "issued_at", "id"),
+        # зведення по клієнту (count/sum/останній статус) у списках клієнтів
+        Index("ix_credits_client_issued_at_id", "client_id", "issued_at", "id"),
+        # пошук за фрагментом id кредиту
+        Index("ix_credits_id_text_trgm", "id_text",
+              postgresql_using="gin", postgresql_ops={"id_text": "gin_trgm_ops"}),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True),
@@ -29,6 +39,10 @@ class Credit(Base, SoftDeleteMixin):
         server_default=text("gen_random_uuid()"),  # DB-side (надійно й уніфіковано)
         nullable=False,
     )
+    # текстове представлення id (generated) — для частичного пошуку по UUID
+    id_text: Mapped[str | None] = mapped_column(
+        String(36), Computed("(id)::text", persisted=True), deferred=True
+    )
     client_id: Mapped[UUID] = mapped_column(ForeignKey("clients.id", ondelete="CASCADE"), nullable=False)
     broker_id: Mapped[UUID] = mapped_column(ForeignKey("brokers.id", ondelete="SET NULL"), nullable=True)
     worker_id: Mapped[UUID] = mapped_column(ForeignKey("workers.id", ondelete="SET NULL"), nullable=True)
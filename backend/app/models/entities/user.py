@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Enum, String
+from sqlalchemy import Enum, Index, String
 
 from app.models.mixins import UUIDMixin, TimeStampMixin, SoftDeleteMixin, AuthMixin
 from app.permissions.enums import PermissionRole
@@ -18,6 +18,12 @@ class User(Base, AuthMixin, UUIDMixin, TimeStampMixin, SoftDeleteMixin):
     """
 
     __tablename__ = 'users'
+    __table_args__ = (
+        # keyset-пагінація бакетів: ORDER BY created_at, id
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # стрічка активності: нові воркери/брокери за вікно часу
+        Index("ix_users_role_created_at_id", "role", "created_at", "id"),
+    )
 
     # Username of the user in Telegram, used for display/logging/search
     role: Mapped[PermissionRole] = mapped_column(
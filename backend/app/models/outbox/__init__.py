@@ -0,0 +1,13 @@
+"""
+Outbox package initializer.
+
+Re-exports models of messages that are written in a business transaction
+and delivered asynchronously by background workers.
+"""
+
+from .email_outbox import EmailOutbox, EmailStatus
+
+__all__ = [
+    "EmailOutbox",
+    "EmailStatus",
+]
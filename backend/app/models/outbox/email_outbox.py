@@ -0,0 +1,53 @@
+from __future__ import annotations
+from datetime import datetime
+from enum import StrEnum
+from typing import Optional
+
+from sqlalchemy import DateTime, Enum, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from db.session import Base
+from app.models.mixins import UUIDMixin, TimeStampMixin
+
+
+class EmailStatus(StrEnum):
+    PENDING = "pending"  # чекає відправки (або повтору після помилки)
+    SENT = "sent"        # відправлено
+    FAILED = "failed"    # вичерпано спроби / постійна помилка SMTP
+
+
+class EmailOutbox(Base, UUIDMixin, TimeStampMixin):
+    """
+    Transactional outbox for outgoing email.
+
+    Рядок пишеться в тій самій транзакції, що й бізнес-зміна (`enqueue_email`), і
+    відправляється фоновим `MailOutboxWorker`. Лист рендериться з шаблону `template`
+    і `context` уже під час відправки; після успіху context очищається (посилання
+    з токенами не лежать у БД довше, ніж треба).
+    """
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # вибірка воркера: pending, у яких настав час спроби
+        Index(
+            "ix_email_outbox_pending_next_attempt",
+            "next_attempt_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+
+    template: Mapped[str] = mapped_column(String(64), nullable=False)
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    context: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+
+    status: Mapped[EmailStatus] = mapped_column(
+        Enum(EmailStatus, name="email_status"),
+        nullable=False,
+        default=EmailStatus.PENDING,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
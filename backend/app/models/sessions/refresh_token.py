@@ -19,7 +19,8 @@ class RefreshToken(Base, UUIDMixin, TimeStampMixin):
     user_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
-    user = relationship("User", back_populates="refresh_tokens", lazy="selectin")
+    # refresh читає роль одним JOIN-ом (RefreshTokenService.verify) — User не довантажується
+    user = relationship("User", back_populates="refresh_tokens")
 
     token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
 
@@ -1,13 +1,23 @@
-from fastapi import APIRouter
+from functools import cache
 
-def create_api_router() -> APIRouter:
-    # from app.routes.entities import create_analyze_websocket_router
+from ._group import RouterGroup
+
+
+@cache
+def create_api_router() -> RouterGroup:
+    """
+    All API routes under ``/api``, composed lazily: ``create_api_router().mount(app)``
+    builds each route once (see RouterGroup). The group is cached per process, so
+    repeated app construction (tests, several apps in one process) reuses the
+    already-built leaf routers.
+    """
     from .auth import login_router, create_register_router, reset_password_router, register_invite_router
     from .entities import create_crud_router, admin_dashboard_router, worker_dashboard_router, broker_dashboard_router
+    from .entities import create_analyze_router, create_analyze_websocket_router
     from .sessions import create_refresh_router, logout_router
     from .system import create_system_router
 
-    router = APIRouter(prefix="/api")
+    router = RouterGroup(prefix="/api")
 
 
     # System endpoints
@@ -31,10 +41,13 @@ def create_api_router() -> APIRouter:
     router.include_router(worker_dashboard_router, prefix="/dashboard/worker", tags=["Admin"])
     router.include_router(broker_dashboard_router, prefix="/dashboard/broker", tags=["Admin"])
 
-    #
-    # router.include_router(create_analyze_websocket_router(), prefix="/analyze", tags=["Analyze"])
+    # Analyze metrics (GET): /api/<role>/analyze/<metric>
+    router.include_router(create_analyze_router(), tags=["Analyze"])
+
+    # Live analyze (WebSocket): /api/<role>/ws/analyze/live
+    router.include_router(create_analyze_websocket_router(), tags=["Analyze"])
 
     return router
 
 
-__all__ = ["create_api_router"]
+__all__ = ["create_api_router", "RouterGroup"]
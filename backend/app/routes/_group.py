@@ -0,0 +1,64 @@
+"""
+RouterGroup — lazy composition of routers.
+
+FastAPI's ``include_router`` rebuilds every route it copies (dependant analysis,
+pydantic TypeAdapters for params and response models), so each level of
+router-in-router nesting builds all of its routes once more. The route factories
+used to nest 3–4 levels deep, which made route construction the largest part of
+a worker's cold start.
+
+``RouterGroup.include_router`` only records (router, prefix, tags). ``mount(app)``
+then includes every leaf ``APIRouter`` straight into the app with the composed
+prefix and tags — each route is built once, in the same order and with the same
+paths / tags as the nested version.
+
+    create_api_router().mount(app)
+"""
+
+from typing import List, Optional, Sequence, Union
+
+from fastapi import APIRouter, FastAPI
+
+
+class RouterGroup:
+    def __init__(self, *, prefix: str = "", tags: Optional[Sequence[str]] = None):
+        self.prefix = prefix
+        self.tags: List[str] = list(tags or [])
+        self.children: List[tuple[Union[APIRouter, "RouterGroup"], str, List[str]]] = []
+
+    def include_router(
+        self,
+        router: Union[APIRouter, "RouterGroup"],
+        *,
+        prefix: str = "",
+        tags: Optional[Sequence[str]] = None,
+    ) -> "RouterGroup":
+        self.children.append((router, prefix, list(tags or [])))
+        return self
+
+    def mount(
+        self,
+        target: Union[FastAPI, APIRouter],
+        *,
+        prefix: str = "",
+        tags: Optional[Sequence[str]] = None,
+    ) -> None:
+        # порядок тегів — як у вкладеному include_router: зовнішні → групи → include → маршруту
+        outer = [*(tags or []), *self.tags]
+        for child, child_prefix, child_tags in self.children:
+            full_prefix = prefix + self.prefix + child_prefix
+            full_tags = [*outer, *child_tags]
+            if isinstance(child, RouterGroup):
+                child.mount(target, prefix=full_prefix, tags=full_tags)
+            else:
+                target.include_router(child, prefix=full_prefix, tags=full_tags or None)
+
+    def leaves(self) -> List[APIRouter]:
+        """All leaf routers, depth-first (mount order)."""
+        result: List[APIRouter] = []
+        for child, _, _ in self.children:
+            result.extend(child.leaves() if isinstance(child, RouterGroup) else [child])
+        return result
+
+
+__all__ = ["RouterGroup"]
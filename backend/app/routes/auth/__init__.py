@@ -14,19 +14,19 @@ Exported Callables:
 
 To mount:
     app.include_router(create_login_router(), prefix="/auth/login", tags=["Auth"])
-    app.include_router(create_register_router(), prefix="/auth/register", tags=["Auth"])
+    create_register_router().mount(app, prefix="/auth/register", tags=["Auth"])
 """
 
 from .reset_password.reset_password_router import router as reset_password_router
 from .login import login_router
 from .register import register_invite_router
 
-from fastapi import APIRouter
+from app.routes._group import RouterGroup
 
 
 
-def create_register_router() -> APIRouter:
-    register_router = APIRouter()
+def create_register_router() -> RouterGroup:
+    register_router = RouterGroup()
 
     from app.routes.auth.register.router_factory import create_register_routers
 
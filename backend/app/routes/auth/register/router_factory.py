@@ -15,6 +15,7 @@ from db.session import get_async_db
 from app.routes.auth.register._base import generate_register_endpoints
 from app.schemas import AdminSchema, WorkerSchema, BrokerSchema, ClientSchema
 from app.services.entities import AdminService, WorkerService, BrokerService, ClientService
+from app.services.entities.worker.lead_router import lead_router
 
 # Type variables for generic schemas and services
 SchemaT = TypeVar("SchemaT", AdminSchema, WorkerSchema, BrokerSchema, ClientSchema)
@@ -50,12 +51,17 @@ def make_register_handler(
 
         data_dict = data.model_dump()
 
-        # Обробка worker_username
+        # Обробка worker_username: id з пам'яті lead_router, у БД — лише якщо роутер його ще не знає
         if role == PermissionRole.CLIENT and hasattr(data, "worker_username"):
-            worker = await WorkerService(db=db).get_by_username(cast(str, data.worker_username))
-            data_dict["worker_id"] = worker.id if worker else None
-            data_dict.pop("worker_username", None)
-            print(data_dict)
+            username = data_dict.pop("worker_username", None)
+            if username:
+                worker_id = lead_router.resolve(username)
+                if worker_id is None:
+                    worker = await WorkerService(db=db).get_by_username(cast(str, username))
+                    worker_id = worker.id if worker else None
+                data_dict["worker_id"] = worker_id
+            elif "worker_id" in data_dict:
+                data_dict["worker_id"] = None
 
         # Тепер формуємо payload з очищеним словником
         payload = schema_cls.Create(**data_dict)
@@ -66,7 +72,20 @@ def make_register_handler(
         if await service.get_by_email(payload.email):
             raise HTTPException(status.HTTP_409_CONFLICT, detail="User already exists")
 
-        user = await service.create(payload)
+        # Без воркера → найменш завантажений доступний (O(log n), без запиту до clients)
+        routed = None
+        if role == PermissionRole.CLIENT:
+            if payload.worker_id is None:
+                payload.worker_id = routed = lead_router.pick()
+            else:
+                lead_router.assigned(payload.worker_id)
+                routed = payload.worker_id
+
+        try:
+            user = await service.create(payload)
+        except Exception:
+            lead_router.assigned(routed, -1)
+            raise
         user = await service.get_by_id(user.id)
 
         access, refresh, expires_in = await generate_token_pair(
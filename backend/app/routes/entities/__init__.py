@@ -1,10 +1,10 @@
 from .crud import create_crud_router, admin_dashboard_router, worker_dashboard_router, broker_dashboard_router
-# from .analyze import create_analyze_router # create_analyze_websocket_router
+from .analyze import create_analyze_router, create_analyze_websocket_router
 
 __all__ = [
     "create_crud_router",
-    # "create_analyze_router",
-    # "create_analyze_websocket_router",
+    "create_analyze_router",
+    "create_analyze_websocket_router",
     "admin_dashboard_router",
     "worker_dashboard_router",
     "broker_dashboard_router",
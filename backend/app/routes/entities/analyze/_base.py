@@ -1,16 +1,40 @@
-from typing import Callable, Awaitable
+from typing import Callable, Awaitable, Optional
+from uuid import UUID
+
 from fastapi import APIRouter, WebSocket
+from fastapi.requests import HTTPConnection
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models import User
+from app.permissions import PermissionRole
 from app.utils.decorators import handle_route_exceptions, handle_ws_exceptions
 from app.utils.middlewares.limiter import rate_limit
 
+
+async def resolve_user(
+    connection: HTTPConnection, db: AsyncSession
+) -> tuple[Optional[UUID], Optional[PermissionRole]]:
+    """User id з JWT (scope["user"], AuthMiddleware) + роль з БД (у токені її немає) — через сесію обробника."""
+    payload = connection.scope.get("user") or {}
+    try:
+        user_id = UUID(str(payload.get("sub")))
+    except ValueError:
+        return None, None
+
+    row = (await db.execute(
+        select(User.role).where(User.id == user_id, User.is_active.is_(True), User.is_deleted.is_(False))
+    )).first()
+    return (user_id, row.role) if row else (user_id, None)
+
+
 def generate_analyze_endpoints(
     router: APIRouter,
     *,
     path: str,  # e.g. "clients_growth"
     handler: Callable[..., Awaitable],
     tags: list[str],
-    wrapper: Callable[[Callable[..., Awaitable]], Callable[..., Awaitable]] = handle_route_exceptions,
+    wrapper: Callable[[Callable[..., Awaitable]], Callable[..., Awaitable]] = handle_route_exceptions(),
     name: str = __name__,
     rate_limit_rule: str | None = None
 ) -> None:
@@ -30,7 +54,7 @@ def generate_analyze_endpoints(
         handler = rate_limit(rate_limit_rule)(handler)
 
     router.get(
-        path=path,
+        path=f"/analyze/{path}",
         tags=tags,
         name=name,
         summary=f"{tags[0]} - {path.replace('_', ' ').title()}"
@@ -59,4 +83,4 @@ def generate_analyze_ws_endpoint(
     router.websocket(f"/{path}")(wrapper(handler))
 
 
-__all__ = ["generate_analyze_ws_endpoint", "generate_analyze_endpoints"]
+__all__ = ["generate_analyze_ws_endpoint", "generate_analyze_endpoints", "resolve_user"]
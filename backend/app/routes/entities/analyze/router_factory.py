@@ -4,68 +4,57 @@
 🔹 Each router lives under its role prefix (``/admin``, ``/worker`` …).
 🔹 Every analysis metric (listed in ``AnalyzeType``) is exposed as
    ``GET /<role>/analyze/<metric>``.
-🔹 The heavy lifting (filters → query → DTO) is done by a dynamic
-   ``make_analyze_handler`` so we don’t duplicate code per role/metric.
+🔹 The heavy lifting (filters → aggregate SQL → cached result) is done by
+   ``analytics_engine``; ``make_analyze_handler`` only authorizes the caller
+   and hands over the query string.
 """
 
-from __future__ import annotations
-
 from typing import Awaitable, Callable, Any, List
-from fastapi import APIRouter, HTTPException, Request, Depends
+from fastapi import APIRouter, HTTPException, Request, Depends, status
 
-from db.session import get_async_db
-from app.routes.entities.analyze._base import generate_analyze_endpoints
+from db.session import get_async_read_db
+from app.routes.entities.analyze._base import generate_analyze_endpoints, resolve_user
 from app.routes.entities.analyze.types import AnalyzeType
 from app.routes.entities.analyze.config import ROLE_REGISTRY
 from app.permissions import PermissionRole
-from app.utils.protocols import BaseService
-from app.utils.wrappers import RoleServiceWrapper
+from app.services.analytics import AnalyticsError, analytics_engine
+
 
 def make_analyze_handler(
     *,
-    service_cls: RoleServiceWrapper[BaseService],
-    interface_cls: RoleServiceWrapper[BaseService],
-    filter_cls: RoleServiceWrapper[BaseService],
     role: PermissionRole,
     metric: AnalyzeType,
 ) -> Callable[[Request], Awaitable[Any]]:
     """
     Returns an async FastAPI handler bound to one role + metric.
+
+    Worker/broker metrics are scoped to the calling user; admin metrics are global.
+    Query params: metric filters (``date_from``, ``date_to``, ``status`` …) and
+    ``bucket=day|week|month`` for time series.
     """
 
     async def _handler(
         request: Request,
-        db=Depends(get_async_db),
+        db=Depends(get_async_read_db),
     ) -> Any:
-        service = service_cls.resolve()
-        interface = interface_cls.resolve()
-        flt = filter_cls.resolve()
+        user_id, user_role = await resolve_user(request, db)
+        if user_id is None:
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+        if user_role != role:
+            raise HTTPException(status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+        if analytics_engine.spec(metric.value, role) is None:
+            raise HTTPException(
+                status.HTTP_501_NOT_IMPLEMENTED,
+                detail=f"Metric '{metric.value}' not implemented for role {role.value}",
+            )
 
+        params = {key: request.query_params.getlist(key) for key in request.query_params.keys()}
+        scope_id = None if role == PermissionRole.ADMIN else user_id
         try:
-            base_query = await service.get_query(db)
-        except AttributeError as exc:
-            raise HTTPException(500, detail="Service lacks .get_query(db) method") from exc
-
-        flt_instance = flt(base_query)
-
-        for key, value in request.query_params.multi_items():
-            if hasattr(flt_instance, key):
-                await getattr(flt_instance, key)(value)
-            else:
-                raise HTTPException(400, detail=f"Unsupported filter '{key}' for role {role.value}")
-
-        query = await flt_instance.apply()
-
-        method_name = f"run_{metric.value}"
-        if not hasattr(service, method_name):
-            raise HTTPException(501, detail=f"Metric '{metric.value}' not implemented for role {role.value}")
-
-        run_metric = getattr(service, method_name)
-        raw_result = await run_metric(query)
-
-        if hasattr(interface, "to_dto"):
-            return await interface.to_dto(metric, raw_result)
-        return raw_result
+            return await analytics_engine.run(db, role, metric.value, scope_id, params)
+        except AnalyticsError as exc:
+            raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     _handler.__name__ = f"analyze_{role.value.lower()}_{metric.value}"
     return _handler
@@ -74,23 +63,18 @@ def create_analyze_routers() -> List[APIRouter]:
     routers: List[APIRouter] = []
 
     for role, bundle in ROLE_REGISTRY.items():
+        if role == PermissionRole.CLIENT:
+            continue
         router = APIRouter(prefix=bundle.prefix)
 
         for metric in AnalyzeType:
-            handler = make_analyze_handler(
-                service_cls=bundle.service,
-                interface_cls=bundle.interface,
-                filter_cls=bundle.filter,
-                role=role,
-                metric=metric,
-            )
+            handler = make_analyze_handler(role=role, metric=metric)
 
             generate_analyze_endpoints(
                 router=router,
                 path=metric.value,
                 handler=handler,
                 tags=[f"{role.value}"],
-                rate_limit_rule="20/minute",
                 name=handler.__name__,
             )
 
@@ -19,22 +19,14 @@ class AnalyzeType(str, Enum):
     """
     Supported analytics metrics.
 
-    Each value must correspond to a method named `run_<metric>`
-    in the appropriate Service class. Example: `run_clients_growth`.
+    Each value is a `MetricSpec` name in `app.services.analytics.METRICS`
+    and is served as `GET /<role>/analyze/<metric>`.
     """
 
     # 📈 Clients
-    class Client(Enum):
-        CLIENTS_GROWTH = "clients_growth"                    # Client registration trend over time
-        CLIENTS_PER_BROKER = "clients_per_broker"            # Distribution of clients by broker
-        CLIENTS_PER_WORKER = "clients_per_worker"            # Distribution of clients by worker
-
-    class Worker(Enum):
-        pass
-    class Admin(Enum):
-        pass
-    class Broker(Enum):
-        pass
+    CLIENTS_GROWTH = "clients_growth"                    # Client registration trend over time
+    CLIENTS_PER_BROKER = "clients_per_broker"            # Distribution of clients by broker
+    CLIENTS_PER_WORKER = "clients_per_worker"            # Distribution of clients by worker
 
     # 🗂 Applications
     APPLICATIONS_SUMMARY = "applications_summary"        # Total, approved, rejected stats
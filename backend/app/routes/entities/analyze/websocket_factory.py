@@ -2,114 +2,116 @@
 
 from __future__ import annotations
 
+import json
+from functools import partial
 from typing import Awaitable, Callable, List
-from fastapi import APIRouter, WebSocket, Depends, WebSocketException, status
+
+from fastapi import APIRouter, WebSocket
 from fastapi.websockets import WebSocketDisconnect
 
-from db.session import get_async_db
-from app.routes.entities.analyze._base import generate_analyze_ws_endpoint
-from app.routes.entities.analyze.types import AnalyzeType
+from db.session import actor_key, read_session_factory
+from app.routes.entities.analyze._base import generate_analyze_ws_endpoint, resolve_user
 from app.routes.entities.analyze.config import ROLE_REGISTRY
-from app.utils.protocols import BaseService
-from app.utils.wrappers import RoleServiceWrapper
 from app.permissions import PermissionRole
-from app.websockets import WebSocketConnection
+from app.websockets import WebSocketConnection, connection_hub
+from app.services.live.hub import live_dashboard_hub, LiveMetricError
+from app.services.live.metrics import LIVE_ROLES
 
 
-def make_analyze_websocket_handler(
-    *,
-    service_cls: RoleServiceWrapper[BaseService],
-    interface_cls: RoleServiceWrapper[BaseService],
-    filter_cls: RoleServiceWrapper[BaseService],
-    role: PermissionRole,
-    metric: AnalyzeType,
-) -> Callable[[WebSocket], Awaitable[None]]:
+def make_live_analyze_handler(*, role: PermissionRole) -> Callable[[WebSocket], Awaitable[None]]:
     """
-    Returns a WebSocket handler for a given role and analysis metric.
+    Returns a long-lived WebSocket handler for the role's live dashboard.
+
+    Protocol (JSON text frames):
+    🔹 → {"action": "subscribe", "metric": "summary", "params": {...}}
+       ← {"type": "snapshot", "metric", "params", "data"} — одразу, далі лише зміни
+    🔹 ← {"type": "delta", ...} (змінені ключі) / {"type": "snapshot", ...} після змін у БД
+    🔹 → {"action": "unsubscribe", "metric", "params"}
+    🔹 → {"action": "ping"}  ← {"type": "pong"}
+    🔹 ← {"type": "ping"} (heartbeat) → {"action": "pong"}; мовчазні сокети закриваються (4408)
 
-    This handler:
-    🔹 Resolves the service, interface, and filter classes for the role.
-    🔹 Executes the metric logic using `run_<metric>` method from the service.
-    🔹 Applies optional filters (can be extended via receive_json).
-    🔹 Sends JSON response with the result back through WebSocket.
+    Worker/broker metrics are scoped to the connected user; admin metrics are global.
     """
-    async def _handler(websocket: WebSocket, db=Depends(get_async_db)) -> None:
-        connection = WebSocketConnection(websocket)
+    async def _handler(websocket: WebSocket) -> None:
+        # сесія лише на перевірку ролі — не тримати з'єднання з БД весь час життя сокета
+        session_factory = await read_session_factory(actor_key(websocket))
+        async with session_factory() as db:
+            user_id, user_role = await resolve_user(websocket, db)
+        if user_role != role:
+            await websocket.close(code=4403)
+            return
+
+        scope_id = None if role == PermissionRole.ADMIN else user_id
+        connection = WebSocketConnection(websocket, user_id=user_id, role=role)
+        # переповнена черга → повні snapshot-и підписок замість втрачених delta
+        connection.on_overflow = partial(live_dashboard_hub.snapshots, connection)
         await connection.connect()
-
+        connection_hub.register(connection)
         try:
-            # Resolve service dependencies
-            service = service_cls.resolve()
-            interface = interface_cls.resolve()
-            flt = filter_cls.resolve()
-
-            # Build query and apply filters
-            base_query = await service.get_query(db)
-            flt_instance = flt(base_query)
-            # (Optional) add support for dynamic filters via `receive_json`
-            query = await flt_instance.apply()
-
-            # Find and run appropriate method (e.g. run_clients_growth)
-            method_name = f"run_{metric.value}"
-            if not hasattr(service, method_name):
-                raise WebSocketException(code=status.WS_1011_INTERNAL_ERROR)
-
-            run_metric = getattr(service, method_name)
-            raw_result = await run_metric(query)
-
-            # Convert result to DTO (if supported)
-            result = (
-                await interface.to_dto(metric, raw_result)
-                if hasattr(interface, "to_dto")
-                else raw_result
-            )
-
-            # Send result to frontend
-            await connection.send_json({"metric": metric.value, "data": result})
+            while connection.active:
+                message = await connection.receive_json()
+                if not isinstance(message, dict):
+                    continue
+
+                action = message.get("action")
+                if action == "ping":
+                    await connection.send_json({"type": "pong"})
+                    continue
+                if action == "pong":
+                    # відповідь на heartbeat ConnectionHub — last_seen вже оновлено
+                    continue
+                if action not in ("subscribe", "unsubscribe"):
+                    await connection.send_json({"type": "error", "data": f"Unsupported action '{action}'"})
+                    continue
+
+                name, params = message.get("metric"), message.get("params")
+                try:
+                    if action == "subscribe":
+                        await live_dashboard_hub.subscribe(connection, role, scope_id, name, params)
+                    else:
+                        metric, params = live_dashboard_hub.resolve(role, name, params)
+                        key = (role, name, scope_id, json.dumps(params, sort_keys=True, default=str))
+                        live_dashboard_hub.unsubscribe(connection, key)
+                        await connection.send_json({"type": "unsubscribed", "metric": name, "params": params})
+                except LiveMetricError as e:
+                    await connection.send_json({"type": "error", "metric": name, "data": str(e)})
         except WebSocketDisconnect:
-            # Graceful disconnect
             pass
-        except Exception as e:
-            # Any unexpected error during processing
-            await connection.send_json({"error": str(e)})
         finally:
+            live_dashboard_hub.drop(connection)
+            connection_hub.unregister(connection)
             await connection.close()
 
-    _handler.__name__ = f"analyze_{role.value.lower()}_{metric.value}_ws"
+    _handler.__name__ = f"analyze_{role.value.lower()}_live_ws"
     return _handler
 
 
 def create_analyze_ws_routers() -> List[APIRouter]:
     """
-    Generates all role-prefixed routers for analysis WebSocket endpoints.
+    Generates role-prefixed routers for the live analysis WebSocket.
 
-    Each role gets its own router at:
-        🔸 /<role>/ws/analyze/<metric>
+    Each role with live metrics gets one long-lived endpoint:
+        🔸 /<role>/ws/analyze/live
 
     Example:
-        /admin/ws/analyze/clients_growth
-        /worker/ws/analyze/revenue_per_day
+        /admin/ws/analyze/live   → subscribe "overview", "credits_monthly", ...
+        /worker/ws/analyze/live  → subscribe "summary", ...
     """
     routers: List[APIRouter] = []
 
     for role, bundle in ROLE_REGISTRY.items():
-        router = APIRouter(prefix=f"{bundle.prefix}/ws/analyze")
+        if role not in LIVE_ROLES:
+            continue
 
-        for metric in AnalyzeType:
-            ws_handler = make_analyze_websocket_handler(
-                service_cls=bundle.service,
-                interface_cls=bundle.interface,
-                filter_cls=bundle.filter,
-                role=role,
-                metric=metric,
-            )
-
-            generate_analyze_ws_endpoint(
-                router=router,
-                path=metric.value,
-                handler=ws_handler,
-                name=ws_handler.__name__,
-            )
+        router = APIRouter(prefix=f"{bundle.prefix}/ws/analyze")
+        ws_handler = make_live_analyze_handler(role=role)
+
+        generate_analyze_ws_endpoint(
+            router=router,
+            path="live",
+            handler=ws_handler,
+            name=ws_handler.__name__,
+        )
 
         routers.append(router)
 
@@ -13,19 +13,19 @@ Exported Callable:
 - create_crud_router()
 
 To mount:
-    app.include_router(create_crud_router(), prefix="/entities", tags=["Entities"])
+    create_crud_router().mount(app, prefix="/entities", tags=["Entities"])
 """
 
-from fastapi import APIRouter
+from app.routes._group import RouterGroup
 from app.routes.entities.crud.dashboard import (
     admin_dashboard_router,
     broker_dashboard_router,
     worker_dashboard_router
 )
 
-def create_crud_router() -> APIRouter:
+def create_crud_router() -> RouterGroup:
     # Main router for all entity-related operations
-    crud_router = APIRouter(tags=["Entities"])
+    crud_router = RouterGroup(tags=["Entities"])
 
     # Lazy import to avoid circular deps and unused modules
     from .router_factories import (
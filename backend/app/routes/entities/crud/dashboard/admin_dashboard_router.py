@@ -4,15 +4,26 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Any, Dict, Optional, List, Literal
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query, Body, Response, HTTPException, status
+from fastapi import APIRouter, Depends, Query, Body, Request, Response, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.routes.entities.crud.dashboard.types import DeletedFilter
+from app.utils.pagination import TotalMode
+from app.utils.serialization import FastJSONResponse
 from app.schemas import WorkerSchema, BrokerSchema, ClientSchema
 from app.schemas.auth.invite_schema import InviteIn, InviteOut
-from app.schemas.entities.client_schema import WorkerClientNewToday, UserNewToday
+from app.schemas.entities.client_schema import (
+    WorkerClientNewToday, BrokerClientNewToday, UserNewToday, ClientImportReport,
+    ClientAssignRequest, ClientUnassignRequest, ClientAssignReport, AssignStrategy,
+)
+from app.schemas.entities.activity_schema import ActivityFeedOut, ActivityItemOut, ActivityKind
+from app.config import ACTIVITY_FEED_MAX_ROWS
+from app.services.entities.admin.activity_feed import ActivityFeed, day_window
 from app.services.auth.invite_service import InviteService
-from db.session import get_async_db
+from app.services.entities.client.client_import import ClientImportService, import_format
+from app.services.entities.client.client_assignment import ClientAssignmentService
+from app.services.export import ExportFormat, export_response
+from db.session import get_async_db, get_async_read_db
 from app.services.entities.admin.admin_dashboard import AdminDashboard
 from app.models.entities.promotion import PromotionEnum
 from app.services.entities.promotion.promotion_service import PromotionService
@@ -26,6 +37,7 @@ from app.schemas.entities.promotion_schema import (
 from app.routes.entities.crud.dashboard.types import (
     SimpleIntOut,
     StatusMessage,
+    AdminOverviewOut,
     AdminPaginatedClientsOut,
     AdminPaginatedWorkersOut,
     AdminPaginatedBrokersOut,
@@ -33,6 +45,7 @@ from app.routes.entities.crud.dashboard.types import (
     WorkerIdIn,
     ClientIdIn,
     BrokerIdIn, BrokerClientListOut,
+    AdminIdIn,
 )
 
 router = APIRouter(tags=["admin:dashboard"])
@@ -44,38 +57,43 @@ async def create_invite(data: InviteIn, db: AsyncSession = Depends(get_async_db)
     return {"raw": raw}
 
 # --- GLOBAL ---
+@router.get("/overview", response_model=AdminOverviewOut)
+async def overview(db: AsyncSession = Depends(get_async_read_db)):
+    # усі глобальні KPI одним запитом; окремі ендпоінти нижче — для сумісності
+    return await AdminDashboard(db).get_overview()
+
 @router.get("/credits/total", response_model=SimpleIntOut)
-async def total_credits(db: AsyncSession = Depends(get_async_db)):
+async def total_credits(db: AsyncSession = Depends(get_async_read_db)):
     amount = await AdminDashboard(db).get_total_sum_credits()
     return {"value": amount}
 
 @router.get("/credits/month", response_model=SimpleIntOut)
-async def month_credits(db: AsyncSession = Depends(get_async_db)):
+async def month_credits(db: AsyncSession = Depends(get_async_read_db)):
     amount = await AdminDashboard(db).get_month_sum_credits()
     return {"value": amount}
 
 @router.get("/users/total", response_model=SimpleIntOut)
-async def total_users(db: AsyncSession = Depends(get_async_db)):
+async def total_users(db: AsyncSession = Depends(get_async_read_db)):
     total = await AdminDashboard(db).get_sum_users()
     return {"value": total}
 
 @router.get("/clients/total", response_model=SimpleIntOut)
-async def total_clients(db: AsyncSession = Depends(get_async_db)):
+async def total_clients(db: AsyncSession = Depends(get_async_read_db)):
     total = await AdminDashboard(db).get_sum_clients()
     return {"value": total}
 
 @router.get("/brokers/total", response_model=SimpleIntOut)
-async def total_brokers(db: AsyncSession = Depends(get_async_db)):
+async def total_brokers(db: AsyncSession = Depends(get_async_read_db)):
     total = await AdminDashboard(db).get_sum_brokers()
     return {"value": total}
 
 @router.get("/workers/total", response_model=SimpleIntOut)
-async def total_workers(db: AsyncSession = Depends(get_async_db)):
+async def total_workers(db: AsyncSession = Depends(get_async_read_db)):
     total = await AdminDashboard(db).get_sum_workers()
     return {"value": total}
 
 @router.get("/credits/count", response_model=SimpleIntOut)
-async def credits_count(db: AsyncSession = Depends(get_async_db)):
+async def credits_count(db: AsyncSession = Depends(get_async_read_db)):
     total = await AdminDashboard(db).get_count_credits()
     return {"value": total}
 
@@ -84,75 +102,176 @@ async def credits_count(db: AsyncSession = Depends(get_async_db)):
 async def credits_range(
     date_from: date = Query(...),
     date_to: date = Query(...),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     amount = await AdminDashboard(db).get_sum_credits_by_date(date_from, date_to)
     return {"value": amount}
 
-# --- PER-WORKER / PER-BROKER NEW ---
+# --- ACTIVITY FEED ---
+@router.get("/activity/{admin_id}", response_model=ActivityFeedOut)
+async def activity_feed(
+    admin_id: UUID,
+    kinds: List[ActivityKind] | None = Query(None, description="Види подій; за замовчуванням — усі"),
+    start: Optional[datetime] = Query(None, description="Початок вікна (без tz — час адміна)"),
+    end: Optional[datetime] = Query(None, description="Кінець вікна, не включно"),
+    day_offset: int = Query(0, le=0, description="Якщо start/end не задані: 0 — сьогодні, -1 — вчора, …"),
+    limit: int = Query(ACTIVITY_FEED_MAX_ROWS, ge=1, le=ACTIVITY_FEED_MAX_ROWS),
+    cursor: Optional[str] = Query(None, description="next_cursor попередньої сторінки"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    feed = ActivityFeed(db)
+    tz = await feed.timezone_of(admin_id)
+    if start is None and end is None:
+        start, end = day_window(tz, offset=day_offset)
+    return await feed.get(kinds, start, end, tz=tz, limit=limit, cursor=cursor)
+activity_feed._meta = {"input_model": AdminIdIn}
+
+
+async def _day_activity(db: AsyncSession, admin_id: UUID, kind: ActivityKind, offset: int) -> list[ActivityItemOut]:
+    # сумісність зі старими new-today / new-yesterday ендпоінтами: одна доба стрічки в tz адміна
+    feed = ActivityFeed(db)
+    tz = await feed.timezone_of(admin_id)
+    start, end = day_window(tz, offset=offset)
+    return (await feed.get([kind], start, end, tz=tz)).items
+
+
+# --- PER-WORKER / PER-BROKER NEW (сумісність; див. /activity) ---
 @router.get("/workers/clients/new-today/{admin_id}", response_model=list[WorkerClientNewToday])
-async def today_new_clients_worker(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
-    return await AdminDashboard(db).get_today_new_clients_worker()
+async def today_new_clients_worker(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
+    items = await _day_activity(db, admin_id, ActivityKind.CLIENT_TAKEN_BY_WORKER, 0)
+    return [{"id": i.id, "taken_at_worker": i.at} for i in items]
 today_new_clients_worker._meta = {"input_model": WorkerIdIn}
 
 @router.get("/workers/clients/new-yesterday/{admin_id}", response_model=list[WorkerClientNewToday])
-async def yesterday_new_clients_worker(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
-    return await AdminDashboard(db).get_yesterday_new_clients_worker()
+async def yesterday_new_clients_worker(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
+    items = await _day_activity(db, admin_id, ActivityKind.CLIENT_TAKEN_BY_WORKER, -1)
+    return [{"id": i.id, "taken_at_worker": i.at} for i in items]
 yesterday_new_clients_worker._meta = {"input_model": WorkerIdIn}
 
-@router.get("/brokers/clients/new-today/{admin_id}", response_model=list[WorkerClientNewToday])
-async def today_new_clients_broker(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
-    return await AdminDashboard(db).get_today_new_clients_broker()
+@router.get("/brokers/clients/new-today/{admin_id}", response_model=list[BrokerClientNewToday])
+async def today_new_clients_broker(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
+    items = await _day_activity(db, admin_id, ActivityKind.CLIENT_TAKEN_BY_BROKER, 0)
+    return [{"id": i.id, "taken_at_broker": i.at} for i in items]
 today_new_clients_broker._meta = {"input_model": WorkerIdIn}
 
-@router.get("/brokers/clients/new-yesterday/{admin_id}", response_model=list[WorkerClientNewToday])
-async def yesterday_new_clients_broker(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
-    return await AdminDashboard(db).get_yesterday_new_clients_broker()
+@router.get("/brokers/clients/new-yesterday/{admin_id}", response_model=list[BrokerClientNewToday])
+async def yesterday_new_clients_broker(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
+    items = await _day_activity(db, admin_id, ActivityKind.CLIENT_TAKEN_BY_BROKER, -1)
+    return [{"id": i.id, "taken_at_broker": i.at} for i in items]
 yesterday_new_clients_broker._meta = {"input_model": WorkerIdIn}
 
 @router.get("/workers/new-today/{admin_id}", response_model=list[UserNewToday])
-async def today_new_workers(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
-    return await AdminDashboard(db).get_today_new_workers()
+async def today_new_workers(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
+    items = await _day_activity(db, admin_id, ActivityKind.WORKER_CREATED, 0)
+    return [{"id": i.id, "created_at": i.at} for i in items]
 today_new_workers._meta = {"input_model": WorkerIdIn}
 
 @router.get("/workers/new-yesterday/{admin_id}", response_model=list[UserNewToday])
-async def yesterday_new_workers(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
-    return await AdminDashboard(db).get_yesterday_new_workers()
+async def yesterday_new_workers(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
+    items = await _day_activity(db, admin_id, ActivityKind.WORKER_CREATED, -1)
+    return [{"id": i.id, "created_at": i.at} for i in items]
 yesterday_new_workers._meta = {"input_model": WorkerIdIn}
 
 @router.get("/brokers/new-today/{admin_id}", response_model=list[UserNewToday])
-async def today_new_brokers(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
-    return await AdminDashboard(db).get_today_new_brokers()
+async def today_new_brokers(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
+    items = await _day_activity(db, admin_id, ActivityKind.BROKER_CREATED, 0)
+    return [{"id": i.id, "created_at": i.at} for i in items]
 today_new_brokers._meta = {"input_model": WorkerIdIn}
 
 @router.get("/brokers/new-yesterday/{admin_id}", response_model=list[UserNewToday])
-async def yesterday_new_brokers(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
-    return await AdminDashboard(db).get_yesterday_new_brokers()
+async def yesterday_new_brokers(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
+    items = await _day_activity(db, admin_id, ActivityKind.BROKER_CREATED, -1)
+    return [{"id": i.id, "created_at": i.at} for i in items]
 yesterday_new_brokers._meta = {"input_model": WorkerIdIn}
 
 @router.get("/workers/{worker_id}/clients/signed-count", response_model=SimpleIntOut)
-async def signed_by_worker(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def signed_by_worker(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     total = await AdminDashboard(db).get_count_signed_clients_by_worker(worker_id)
     return {"value": total}
 signed_by_worker._meta = {"input_model": WorkerIdIn}
 
 @router.get("/workers/{worker_id}/clients/unsigned-count", response_model=SimpleIntOut)
-async def unsigned_by_worker(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def unsigned_by_worker(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     total = await AdminDashboard(db).get_count_unsigned_clients_by_worker()
     return {"value": total}
 unsigned_by_worker._meta = {"input_model": WorkerIdIn}
 
 # --- BROKER TOTALS ---
 @router.get("/brokers/clients/signed-count", response_model=SimpleIntOut)
-async def signed_by_brokers(db: AsyncSession = Depends(get_async_db)):
+async def signed_by_brokers(db: AsyncSession = Depends(get_async_read_db)):
     total = await AdminDashboard(db).get_total_count_signed_clients_by_brokers()
     return {"value": total}
 
 @router.get("/brokers/clients/unsigned-count", response_model=SimpleIntOut)
-async def unsigned_by_brokers(db: AsyncSession = Depends(get_async_db)):
+async def unsigned_by_brokers(db: AsyncSession = Depends(get_async_read_db)):
     total = await AdminDashboard(db).get_total_count_unsigned_clients_by_brokers()
     return {"value": total}
 
+# --- BULK IMPORT ---
+@router.post("/clients/import", response_model=ClientImportReport, summary="Масовий імпорт клієнтів (CSV / NDJSON)")
+async def import_clients(
+    request: Request,
+    fmt: Optional[Literal["csv", "ndjson"]] = Query(None, alias="format", description="За замовчуванням — з Content-Type"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    # тіло читається потоком (без multipart): curl --data-binary @clients.csv -H 'Content-Type: text/csv'
+    fmt = fmt or import_format(request.headers.get("content-type"))
+    return await ClientImportService(db).import_stream(request.stream(), fmt)
+
+# --- EXPORT (потоково, CSV / XLSX; фільтри — як у filter/bucket і /credits) ---
+@router.get("/clients/export", summary="Експорт клієнтів (CSV / XLSX)")
+async def export_clients(
+    request: Request,
+    fmt: ExportFormat = Query("csv", alias="format"),
+    email: str | None = Query(None, description="Часть e-mail"),
+    phone_number: str | None = Query(None, description="Часть номера"),
+    full_name: str | None = Query(None, description="Часть ФИО"),
+    is_deleted: bool | None = Query(None, description="true — удалённые, false — активные, None — все"),
+):
+    filters = dict(email=email, phone_number=phone_number, full_name=full_name, is_deleted=is_deleted)
+    return await export_response(request, "clients", lambda db: AdminDashboard(db).client_rows_select(**filters), fmt)
+
+@router.get("/workers/export", summary="Експорт працівників (CSV / XLSX)")
+async def export_workers(
+    request: Request,
+    fmt: ExportFormat = Query("csv", alias="format"),
+    email: str | None = Query(None, description="Часть e-mail"),
+    username: str | None = Query(None, description="Часть никнейма"),
+    is_deleted: bool | None = Query(None, description="true — удалённые, false — активные, None — все"),
+):
+    filters = dict(email=email, username=username, is_deleted=is_deleted)
+    return await export_response(request, "workers", lambda db: AdminDashboard(db).worker_rows_select(**filters), fmt)
+
+@router.get("/brokers/export", summary="Експорт брокерів (CSV / XLSX)")
+async def export_brokers(
+    request: Request,
+    fmt: ExportFormat = Query("csv", alias="format"),
+    email: str | None = Query(None, description="Часть e-mail"),
+    company_name: str | None = Query(None, description="Часть компании"),
+    region: str | None = Query(None, description="Часть региона"),
+    is_deleted: bool | None = Query(None, description="true — удалённые, false — активные, None — все"),
+):
+    filters = dict(email=email, company_name=company_name, region=region, is_deleted=is_deleted)
+    return await export_response(request, "brokers", lambda db: AdminDashboard(db).broker_rows_select(**filters), fmt)
+
+@router.get("/credits/export", summary="Експорт кредитів (CSV / XLSX)", tags=["admin:credits"])
+async def export_credits(
+    request: Request,
+    fmt: ExportFormat = Query("csv", alias="format"),
+    statuses: List[CreditStatus] | None = Query(None),
+    broker_id: UUID | None = Query(None),
+    client_id: UUID | None = Query(None),
+    created_from: Optional[datetime] = Query(None),
+    created_to: Optional[datetime] = Query(None),
+    deleted: DeletedFilter = Query("active", description="'active'| 'only' | 'all'"),
+    search: Optional[str] = Query(None, description="id кредита, email/телефон/ФИО клиента"),
+):
+    filters = dict(
+        statuses=statuses, broker_id=broker_id, client_id=client_id,
+        created_from=created_from, created_to=created_to, deleted=deleted, search=search,
+    )
+    return await export_response(request, "credits", lambda db: CreditService(db).rows_select(**filters), fmt)
+
 # --- BUCKETS ---
 @router.get("/clients/{admin_id}", response_model=AdminPaginatedClientsOut)
 async def bucket_clients(
@@ -161,10 +280,15 @@ async def bucket_clients(
     limit: int = Query(20, ge=1, le=200),
     search: Optional[str] = Query(None, description="Поиск по ФИО/email/телефону/адресу/UUID"),
     deleted: DeletedFilter = Query("all", description="'active' | 'only' | 'all'"),
-    db: AsyncSession = Depends(get_async_db),
+    cursor: Optional[str] = Query(None, description="Keyset-режим: '' — перша сторінка, далі next_cursor"),
+    total_mode: TotalMode = Query("exact", description="total: 'exact' | 'estimated' | 'cached'"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    items, total = await AdminDashboard(db).get_bucket_clients(skip=skip, limit=limit, search=search, deleted=deleted)
-    return {"clients": items, "total": total}
+    page = await AdminDashboard(db).get_bucket_clients(
+        skip=skip, limit=limit, search=search, deleted=deleted, cursor=cursor, total_mode=total_mode, as_rows=True
+    )
+    # швидкий шлях: items — dict з рядків, Response не валідовується повторно через response_model
+    return FastJSONResponse({"clients": page.items, "total": page.total, "next_cursor": page.next_cursor, "total_mode": page.total_mode})
 
 @router.get("/brokers/{admin_id}", response_model=AdminPaginatedBrokersOut)
 async def bucket_brokers(
@@ -172,10 +296,15 @@ async def bucket_brokers(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1),
     deleted: DeletedFilter = Query("all", description="'active' | 'only' | 'all'"),
-    db: AsyncSession = Depends(get_async_db),
+    cursor: Optional[str] = Query(None, description="Keyset-режим: '' — перша сторінка, далі next_cursor"),
+    total_mode: TotalMode = Query("exact", description="total: 'exact' | 'estimated' | 'cached'"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    items, total = await AdminDashboard(db).get_bucket_brokers(skip=skip, limit=limit, deleted=deleted)
-    return {"clients": items, "total": total}
+    page = await AdminDashboard(db).get_bucket_brokers(
+        skip=skip, limit=limit, deleted=deleted, cursor=cursor, total_mode=total_mode, as_rows=True
+    )
+    # швидкий шлях: items — dict з рядків, Response не валідовується повторно через response_model
+    return FastJSONResponse({"clients": page.items, "total": page.total, "next_cursor": page.next_cursor, "total_mode": page.total_mode})
 
 @router.get("/workers/{admin_id}", response_model=AdminPaginatedWorkersOut)
 async def bucket_workers(
@@ -183,24 +312,29 @@ async def bucket_workers(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1),
     deleted: DeletedFilter = Query("all", description="'active' | 'only' | 'all'"),
-    db: AsyncSession = Depends(get_async_db),
+    cursor: Optional[str] = Query(None, description="Keyset-режим: '' — перша сторінка, далі next_cursor"),
+    total_mode: TotalMode = Query("exact", description="total: 'exact' | 'estimated' | 'cached'"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    items, total = await AdminDashboard(db).get_bucket_workers(skip=skip, limit=limit, deleted=deleted)
-    return {"clients": items, "total": total}
+    page = await AdminDashboard(db).get_bucket_workers(
+        skip=skip, limit=limit, deleted=deleted, cursor=cursor, total_mode=total_mode, as_rows=True
+    )
+    # швидкий шлях: items — dict з рядків, Response не валідовується повторно через response_model
+    return FastJSONResponse({"clients": page.items, "total": page.total, "next_cursor": page.next_cursor, "total_mode": page.total_mode})
 
 # --- SINGLE ENTITIES ---
 @router.get("/client/{client_id}")
-async def get_client(client_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_client(client_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     return await AdminDashboard(db).get_client(client_id)
 get_client._meta = {"input_model": ClientIdIn}
 
 @router.get("/worker/{worker_id}")
-async def get_worker(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_worker(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     return await AdminDashboard(db).get_worker(worker_id)
 get_worker._meta = {"input_model": WorkerIdIn}
 
 @router.get("/broker/{broker_id}")
-async def get_broker(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_broker(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     return await AdminDashboard(db).get_broker(broker_id)
 get_broker._meta = {"input_model": BrokerIdIn}
 
@@ -234,6 +368,29 @@ async def assign_broker_by_email(
     await AdminDashboard(db).broker_reassign_client_by_email(client_id, broker_email)
     return {"status": "reassigned", "broker_email": broker_email}
 
+@router.post("/clients/assign", response_model=ClientAssignReport, summary="Масовий розподіл клієнтів між воркерами")
+async def assign_clients(
+    payload: ClientAssignRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await ClientAssignmentService(db).distribute(payload.client_ids, payload.worker_ids, payload.strategy)
+
+@router.post("/clients/unassign", response_model=SimpleIntOut, summary="Масово відв'язати клієнтів від воркерів")
+async def unassign_clients(
+    payload: ClientUnassignRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    return {"value": await ClientAssignmentService(db).unassign(payload.client_ids)}
+
+@router.post("/worker/{worker_id}/release", response_model=ClientAssignReport, summary="Передати всіх клієнтів воркера іншим")
+async def release_worker_clients(
+    worker_id: UUID,
+    worker_ids: Optional[List[UUID]] = Body(None, embed=True, description="Кому передати; None → усім активним воркерам"),
+    strategy: AssignStrategy = Query("least_loaded"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await ClientAssignmentService(db).release_worker(worker_id, worker_ids, strategy)
+
 # --- CREDIT CONTROL ---
 @router.patch("/credit/{credit_id}/force-complete", response_model=StatusMessage)
 async def force_complete_credit(credit_id: UUID, db: AsyncSession = Depends(get_async_db)):
@@ -268,7 +425,7 @@ async def edit_worker(worker_id: UUID, fields: Dict[str, Any] = Body(...), db: A
 @router.get("/credits/sum/monthly")
 async def credits_sum_monthly(
     month: str = Query(..., example="2025-06"),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     service = AdminDashboard(db)
     items = await service.get_credits_for_month(month)
@@ -277,7 +434,7 @@ async def credits_sum_monthly(
 @router.get("/credits/sum/yearly")
 async def credits_sum_yearly(
     year: int = Query(..., example=2025),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     service = AdminDashboard(db)
     items = await service.get_credits_for_year(year)
@@ -285,13 +442,13 @@ async def credits_sum_yearly(
 
 # --- CREDITS COUNTS ---
 @router.get("/credits/count/active/{admin_id}", response_model=SimpleIntOut)
-async def get_active_credits_count(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_active_credits_count(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     count = await AdminDashboard(db).get_count_active_credits()
     return SimpleIntOut(value=count)
 get_active_credits_count._meta = {"input_model": BrokerIdIn}
 
 @router.get("/credits/count/completed/{admin_id}", response_model=SimpleIntOut)
-async def get_completed_credits_count(admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_completed_credits_count(admin_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     count = await AdminDashboard(db).get_count_completed_credits()
     return SimpleIntOut(value=count)
 get_completed_credits_count._meta = {"input_model": BrokerIdIn}
@@ -306,7 +463,7 @@ async def filter_bucket_clients_of_admins(
     phone_number: str | None = Query(None, description="Часть номера"),
     full_name: str | None = Query(None, description="Часть ФИО"),
     is_deleted: bool | None = Query(None, description="true — удалённые, false — активные, None — все"),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     service = AdminDashboard(db)
     clients, total = await service.filter_bucket_clients(
@@ -322,7 +479,7 @@ async def filter_bucket_workers_for_admins(
     email: str | None = Query(None, description="Часть e-mail"),
     username: str | None = Query(None, description="Часть никнейма"),
     is_deleted: bool | None = Query(None, description="true — удалённые, false — активные, None — все"),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     service = AdminDashboard(db)
     workers, total = await service.filter_bucket_workers(skip=skip, limit=limit, email=email, username=username, is_deleted=is_deleted)
@@ -337,7 +494,7 @@ async def filter_bucket_brokers_for_admins(
     company_name: str | None = Query(None, description="Часть компании"),
     region: str | None = Query(None, description="Часть региона"),
     is_deleted: bool | None = Query(None, description="true — удалённые, false — активные, None — все"),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     service = AdminDashboard(db)
     brokers, total = await service.filter_bucket_brokers(
@@ -347,11 +504,11 @@ async def filter_bucket_brokers_for_admins(
 
 # --- PROMOTIONS (unchanged) ---
 @router.get("/promotions/top-workers", response_model=list[TopWorkerOut], tags=["admin:promotions"])
-async def top_workers_by_credits_count(limit: int = Query(3, ge=1, le=20), db: AsyncSession = Depends(get_async_db)):
+async def top_workers_by_credits_count(limit: int = Query(3, ge=1, le=20), db: AsyncSession = Depends(get_async_read_db)):
     return await AdminDashboard(db).top_workers_by_count(limit=limit)
 
 @router.get("/promotions/summary", response_model=list[PromotionSummaryOut], tags=["admin:promotions"])
-async def list_promotions_summary(ptype: PromotionEnum | None = Query(None), limit: int = Query(12, ge=1, le=200), db: AsyncSession = Depends(get_async_db)):
+async def list_promotions_summary(ptype: PromotionEnum | None = Query(None), limit: int = Query(12, ge=1, le=200), db: AsyncSession = Depends(get_async_read_db)):
     return await AdminDashboard(db).list_promotions_summary(ptype=ptype, limit=limit)
 
 @router.get("/promotions", response_model=list[PromotionOut], tags=["admin:promotions"])
@@ -359,7 +516,7 @@ async def list_promotions(
     is_active: bool | None = Query(None),
     ptype: PromotionEnum | None = Query(None),
     limit: int = Query(8, ge=1, le=200),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     return await PromotionService.list(db, limit=limit, ptype=(ptype.value if ptype else None), is_active=is_active, include_deleted=False)
 
@@ -368,7 +525,7 @@ async def create_promotion(payload: PromotionCreate, db: AsyncSession = Depends(
     return await AdminDashboard(db).create_promotion(payload)
 
 @router.get("/promotions/{promo_id}", response_model=PromotionOut, tags=["admin:promotions"])
-async def get_promotion(promo_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_promotion(promo_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     return await AdminDashboard(db).get_promotion(promo_id)
 
 @router.patch("/promotions/{promo_id}", response_model=PromotionOut, tags=["admin:promotions"])
@@ -408,7 +565,7 @@ async def admin_create_credit(payload: CreditCreate, db: AsyncSession = Depends(
 
 
 @router.get("/credits/{credit_id}", response_model=CreditOut, tags=["admin:credits"])
-async def admin_get_credit(credit_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def admin_get_credit(credit_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     credit = await CreditService(db).get_by_id(credit_id)
     if not credit:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Credit not found")
@@ -425,19 +582,23 @@ async def admin_list_credits(
     created_to: Optional[datetime] = Query(None),
     deleted: DeletedFilter = Query("active", description="'active'| 'only' | 'all'"),
     search: Optional[str] = Query(None, description="id кредита, email/телефон/ФИО клиента"),
-    db: AsyncSession = Depends(get_async_db),
+    cursor: Optional[str] = Query(None, description="Keyset-режим: '' — перша сторінка, далі next_cursor"),
+    total_mode: TotalMode = Query("exact", description="total: 'exact' | 'estimated' | 'cached'"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     service = CreditService(db)
-    items, total = await service.list_paginated(
+    page = await service.list_paginated(
         skip=skip, limit=limit, statuses=statuses,
         broker_id=broker_id, client_id=client_id,
         created_from=created_from, created_to=created_to,
-        deleted=deleted, search=search,
-    )
-    return AdminPaginatedCreditsOut(
-        credits=[CreditOut.model_validate(c) for c in items],
-        total=total,
+        deleted=deleted, search=search, cursor=cursor, total_mode=total_mode, as_rows=True,
     )
+    return FastJSONResponse({
+        "credits": page.items,
+        "total": page.total,
+        "next_cursor": page.next_cursor,
+        "total_mode": page.total_mode,
+    })
 
 
 @router.patch("/credits/{credit_id}", response_model=CreditOut, tags=["admin:credits"])
@@ -6,9 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.schemas.entities.client_schema import ClientBrokerOut, BrokerClientNewToday
-from db.session import get_async_db
+from db.session import get_async_db, get_async_read_db
 from app.services.entities.broker.broker_dashboard import BrokerDashboard
 from app.services.entities.credit.credit_service import CreditService, CreditStatus
+from app.utils.pagination import TotalMode
+from app.utils.serialization import FastJSONResponse
 from app.schemas.entities.credit_schema import (
     CreditOut, CreditStatusUpdate, CreditCommentIn, BrokerPaginatedCreditsOut
 )
@@ -29,7 +31,7 @@ router = APIRouter(
 
 # 1. Total number of all credits from broker's clients
 @router.get("/credits/count/total/{broker_id}", response_model=SimpleIntOut)
-async def get_total_credits_count(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_total_credits_count(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     count = await service.get_total_credits_count(broker_id)
     return SimpleIntOut(value=count)
@@ -38,7 +40,7 @@ get_total_credits_count._meta = {"input_model": BrokerIdIn}
 
 # 2. Credits issued this month
 @router.get("/credits/count/month/{broker_id}", response_model=SimpleIntOut)
-async def get_month_credits_count(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_month_credits_count(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     count = await service.get_mount_credits_count(broker_id)
     return SimpleIntOut(value=count)
@@ -46,7 +48,7 @@ get_month_credits_count._meta = {"input_model": BrokerIdIn}
 
 # 3. Active credits
 @router.get("/credits/count/active/{broker_id}", response_model=SimpleIntOut)
-async def get_active_credits_count(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_active_credits_count(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     count = await service.get_count_active_credits(broker_id)
     return SimpleIntOut(value=count)
@@ -54,7 +56,7 @@ get_active_credits_count._meta = {"input_model": BrokerIdIn}
 
 # 4. Completed credits
 @router.get("/credits/count/completed/{broker_id}", response_model=SimpleIntOut)
-async def get_completed_credits_count(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_completed_credits_count(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     count = await service.get_count_completed_credits(broker_id)
     return SimpleIntOut(value=count)
@@ -62,7 +64,7 @@ get_completed_credits_count._meta = {"input_model": BrokerIdIn}
 
 # 5. Signed clients (attached to workers)
 @router.get("/signed/sum/{broker_id}", response_model=SimpleIntOut)
-async def get_sum_signed_clients(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_sum_signed_clients(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     count = await service.get_sum_signed_clients(broker_id)
     return SimpleIntOut(value=count)
@@ -74,14 +76,16 @@ async def get_signed_clients(
     broker_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(8, ge=1),
-    db: AsyncSession = Depends(get_async_db)
+    cursor: Optional[str] = Query(None, description="Keyset-режим: '' — перша сторінка, далі next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     service = BrokerDashboard(db)
-    signed_clients = await service.get_bucket_signed_clients(broker_id, skip=skip, limit=limit)
+    signed_clients, next_cursor = await service.get_bucket_signed_clients(broker_id, skip=skip, limit=limit, cursor=cursor)
     total = await service.get_sum_signed_clients(broker_id)
     return {
         "clients": [ClientBrokerOut.model_validate(c) for c in signed_clients],
-        "total": total
+        "total": total,
+        "next_cursor": next_cursor,
     }
 get_signed_clients._meta = {"input_model": BrokerBucketClientsIn}
 
@@ -91,15 +95,24 @@ async def get_unsigned_clients(
     broker_id: UUID,
     skip: int = Query(0, ge=0),
     limit: int = Query(8, ge=1),
-    db: AsyncSession = Depends(get_async_db)
+    cursor: Optional[str] = Query(None, description="Keyset-режим: '' — перша сторінка, далі next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     service = BrokerDashboard(db)
-    return await service.get_bucket_unsigned_clients(broker_id, skip=skip, limit=limit)
+    unsigned_clients, next_cursor = await service.get_bucket_unsigned_clients(
+        broker_id, skip=skip, limit=limit, cursor=cursor
+    )
+    total = await service.get_sum_unsigned_clients(broker_id)
+    return {
+        "clients": [ClientBrokerOut.model_validate(c) for c in unsigned_clients],
+        "total": total,
+        "next_cursor": next_cursor,
+    }
 get_unsigned_clients._meta = {"input_model": BrokerBucketClientsIn}
 
 # 8. Get single client info
 @router.get("/{client_id}", response_model=ClientBrokerOut)
-async def get_client(client_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_client(client_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     client = await service.get_client(client_id)
     if client is None:
@@ -133,7 +146,7 @@ create_credit._meta = {"input_model": BrokerCreateCredit}
 
 # 12. Count new clients taken today
 @router.get("/new-today/sum/{broker_id}", response_model=SimpleIntOut)
-async def get_sum_today_new_clients(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_sum_today_new_clients(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     total = await service.get_sum_today_new_clients(broker_id)
     return SimpleIntOut(value=total)
@@ -141,7 +154,7 @@ get_sum_today_new_clients._meta = {"input_model": BrokerIdIn}
 
 # 13. Count new clients taken yesterday
 @router.get("/new-yesterday/sum/{broker_id}", response_model=SimpleIntOut)
-async def get_sum_yesterday_new_clients(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_sum_yesterday_new_clients(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     total = await service.get_sum_yesterday_new_clients(broker_id)
     return SimpleIntOut(value=total)
@@ -149,14 +162,14 @@ get_sum_yesterday_new_clients._meta = {"input_model": BrokerIdIn}
 
 # 14. New clients taken today by broker
 @router.get("/new-today/{broker_id}", response_model=list[BrokerClientNewToday])
-async def get_today_new_clients(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_today_new_clients(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     return await service.get_today_new_clients(broker_id)
 get_today_new_clients._meta = {"input_model": BrokerIdIn}
 
 # 15. Total sum of all credits from broker's clients
 @router.get("/credits/sum/total/{broker_id}", response_model=SimpleIntOut)
-async def get_total_credits_sum(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_total_credits_sum(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     commissions_sum = await service.get_sum_broker_commissions(broker_id)
     return SimpleFloatOut(value=commissions_sum)
@@ -165,7 +178,7 @@ get_total_credits_sum._meta = {"input_model": BrokerIdIn}
 
 # 16. Credits issued this month
 @router.get("/credits/sum/month/{broker_id}", response_model=SimpleIntOut)
-async def get_month_credits_sum(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_month_credits_sum(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     commissions_sum = await service.get_month_broker_commissions(broker_id)
     return SimpleFloatOut(value=commissions_sum)
@@ -173,7 +186,7 @@ get_month_credits_sum._meta = {"input_model": BrokerIdIn}
 
 # 17. Active credits
 @router.get("/credits/sum/active/{broker_id}", response_model=SimpleFloatOut)
-async def get_active_credits_sum(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_active_credits_sum(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     count = await service.get_sum_active_credits(broker_id)
     return SimpleFloatOut(value=count)
@@ -181,7 +194,7 @@ get_active_credits_sum._meta = {"input_model": BrokerIdIn}
 
 # 18. Completed credits
 @router.get("/credits/sum/completed/{broker_id}", response_model=SimpleFloatOut)
-async def get_completed_credits_sum(broker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_completed_credits_sum(broker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = BrokerDashboard(db)
     count = await service.get_sum_completed_credits(broker_id)
     return SimpleFloatOut(value=count)
@@ -192,7 +205,7 @@ get_completed_credits_sum._meta = {"input_model": BrokerIdIn}
 async def get_credits_for_month(
     broker_id: UUID,
     month: str = Query(..., example="2025-06"),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     service = BrokerDashboard(db)
     total = await service.get_credits_for_month(broker_id, month)
@@ -203,7 +216,7 @@ async def get_credits_for_month(
 async def get_credits_for_year(
     broker_id: UUID,
     year: int = Query(..., example=2025),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     service = BrokerDashboard(db)
     data = await service.get_credits_for_year(broker_id, year)
@@ -222,7 +235,7 @@ async def filter_bucket_clients_of_worker(
     email: str | None        = Query(None, description="Часть e-mail"),
     phone_number: str | None = Query(None, description="Часть номера"),
     full_name: str | None    = Query(None, description="Часть ФИО"),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     service = BrokerDashboard(db)
 
@@ -250,13 +263,15 @@ async def broker_list_credits(
     client_id: Optional[UUID] = Query(None),
     created_from: Optional[datetime.datetime] = Query(default=None),
     created_to: Optional[datetime.datetime] = Query(default=None),
-    db: AsyncSession = Depends(get_async_db),
+    cursor: Optional[str] = Query(None, description="Keyset-режим: '' — перша сторінка, далі next_cursor"),
+    total_mode: TotalMode = Query("exact", description="total: 'exact' | 'estimated' | 'cached'"),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     Брокер бачить лише СВОЇ кредити. Фільтри та пагінація.
     """
     service = CreditService(db)
-    items, total = await service.list_for_broker_paginated(
+    page = await service.list_for_broker_paginated(
         broker_id,
         skip=skip,
         limit=limit,
@@ -264,18 +279,23 @@ async def broker_list_credits(
         client_id=client_id,
         created_from=created_from,
         created_to=created_to,
+        cursor=cursor,
+        total_mode=total_mode,
+        as_rows=True,
     )
-    return BrokerPaginatedCreditsOut(
-        credits=[CreditOut.model_validate(c) for c in items],
-        total=total,
-    )
+    return FastJSONResponse({
+        "credits": page.items,
+        "total": page.total,
+        "next_cursor": page.next_cursor,
+        "total_mode": page.total_mode,
+    })
 
 
 @router.get("/credits/{broker_id}/{credit_id}", response_model=CreditOut)
 async def broker_get_credit(
     broker_id: UUID,
     credit_id: UUID,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     Брокер може отримати тільки кредит, який прив’язаний до нього.
@@ -1,10 +1,11 @@
 from dataclasses import Field
 from uuid import UUID
 from pydantic import BaseModel
-from typing import List, Literal
+from typing import List, Literal, Optional
 from app.schemas.entities.client_schema import ClientOut, ClientWorkerOut, ClientBrokerOut, ClientAdminOut
 from app.schemas.entities.broker_schema import BrokerOut, BrokerAdminOut
 from app.schemas.entities.worker_schema import WorkerOut, WorkerAdminOut
+from app.utils.pagination import TotalMode
 
 
 class SimpleIntOut(BaseModel):
@@ -19,10 +20,12 @@ class StatusMessage(BaseModel):
 class WorkerClientListOut(BaseModel):
     clients: List[ClientWorkerOut]
     total: int
+    next_cursor: Optional[str] = None
 
 class BrokerClientListOut(BaseModel):
     clients: List[ClientBrokerOut]
     total: int
+    next_cursor: Optional[str] = None
 
 class ClientIdIn(BaseModel):
     client_id: UUID
@@ -69,16 +72,22 @@ class BucketIn(BaseModel):
 class AdminPaginatedClientsOut(BaseModel):
     clients: List[ClientAdminOut]
     total: int
+    next_cursor: Optional[str] = None
+    total_mode: TotalMode = "exact"
 
 
 class AdminPaginatedWorkersOut(BaseModel):
     clients: List[WorkerAdminOut]
     total: int
+    next_cursor: Optional[str] = None
+    total_mode: TotalMode = "exact"
 
 
 class AdminPaginatedBrokersOut(BaseModel):
     clients: List[BrokerAdminOut]
     total: int
+    next_cursor: Optional[str] = None
+    total_mode: TotalMode = "exact"
 
 
 # ─── AGGREGATE SUMMARY ──────────────────
@@ -91,4 +100,22 @@ class AdminDashboardSummaryOut(BaseModel):
     issued_amount: int
     paid_amount: int
 
+
+class AdminOverviewOut(BaseModel):
+    """
+    All global admin KPIs, computed by a single aggregate statement.
+    """
+    total_sum_credits: float
+    month_sum_credits: float
+    count_credits: int
+    count_active_credits: int
+    count_completed_credits: int
+    sum_users: int
+    sum_clients: int
+    sum_brokers: int
+    sum_workers: int
+    count_signed_clients: int
+    count_unsigned_clients: int
+
+
 DeletedFilter = Literal["active", "only", "all"]
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
 
-from db.session import get_async_db
+from db.session import get_async_db, get_async_read_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
@@ -22,7 +23,7 @@ router = APIRouter(
 
 # 1. Total number of clients
 @router.get("/sum/{worker_id}", response_model=SimpleIntOut)
-async def get_clients_sum(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_clients_sum(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = WorkerDashboardService(db)
     return {"value": await service.get_sum_clients(worker_id)}
 get_clients_sum._meta = {"input_model": WorkerIdIn}
@@ -30,7 +31,7 @@ get_clients_sum._meta = {"input_model": WorkerIdIn}
 
 # 2. Total credits
 @router.get("/credits/total/{worker_id}", response_model=SimpleFloatOut)
-async def get_total_credits(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_total_credits(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = WorkerDashboardService(db)
     return {"value": await service.get_total_sum_credits(worker_id)}
 get_total_credits._meta = {"input_model": WorkerIdIn}
@@ -38,7 +39,7 @@ get_total_credits._meta = {"input_model": WorkerIdIn}
 
 # 3. Monthly credits
 @router.get("/credits/month/{worker_id}", response_model=SimpleFloatOut)
-async def get_month_credits(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_month_credits(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = WorkerDashboardService(db)
     return {"value": await service.get_month_sum_credits(worker_id)}
 get_month_credits._meta = {"input_model": WorkerIdIn}
@@ -46,7 +47,7 @@ get_month_credits._meta = {"input_model": WorkerIdIn}
 
 # 4. Total number of deals (credits entries)
 @router.get("/deals-sum/{worker_id}", response_model=SimpleIntOut)
-async def get_sum_deals(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_sum_deals(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = WorkerDashboardService(db)
     return {"value": await service.get_sum_deals(worker_id)}
 get_sum_deals._meta = {"input_model": WorkerIdIn}
@@ -54,21 +55,21 @@ get_sum_deals._meta = {"input_model": WorkerIdIn}
 
 # 5. Today's new clients count
 @router.get("/new-today/count/{worker_id}", response_model=SimpleIntOut)
-async def get_sum_today_new_clients(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_sum_today_new_clients(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = WorkerDashboardService(db)
     return {"value": await service.get_sum_today_new_clients(worker_id)}
 get_sum_today_new_clients._meta = {"input_model": WorkerIdIn}
 
 # 5. Today's new clients count
 @router.get("/yesterday-today/count/{worker_id}", response_model=SimpleIntOut)
-async def get_sum_yesterday_new_clients(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_sum_yesterday_new_clients(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = WorkerDashboardService(db)
     return {"value": await service.get_sum_yesterday_new_clients(worker_id)}
 get_sum_today_new_clients._meta = {"input_model": WorkerIdIn}
 
 # 6. Today's new clients
 @router.get("/new-today/{worker_id}", response_model=list[WorkerClientNewToday])
-async def get_sum_today_new_clients(worker_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_sum_today_new_clients(worker_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = WorkerDashboardService(db)
     return await service.get_today_new_clients(worker_id)
 get_sum_today_new_clients._meta = {"input_model": WorkerIdIn}
@@ -79,17 +80,18 @@ async def get_bucket_clients(
     worker_id: UUID,
     skip: int = 0,
     limit: int = 6,
-    db: AsyncSession = Depends(get_async_db)
+    cursor: Optional[str] = Query(None, description="Keyset-режим: '' — перша сторінка, далі next_cursor"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     service = WorkerDashboardService(db)
-    clients = await service.get_bucket_clients(worker_id, skip=skip, limit=limit)
+    clients, next_cursor = await service.get_bucket_clients(worker_id, skip=skip, limit=limit, cursor=cursor)
     total_clients = await service.get_sum_clients(worker_id)
-    return {"clients": clients, "total": total_clients}
+    return {"clients": clients, "total": total_clients, "next_cursor": next_cursor}
 get_bucket_clients._meta = {"input_model": WorkerBucketClientsIn}
 
 # 8. Get client by ID
 @router.get("/{client_id}", response_model=ClientWorkerOut)
-async def get_client(client_id: UUID, db: AsyncSession = Depends(get_async_db)):
+async def get_client(client_id: UUID, db: AsyncSession = Depends(get_async_read_db)):
     service = WorkerDashboardService(db)
     return await service.get_client(client_id)
 get_client._meta = {"input_model": ClientIdIn}
@@ -119,7 +121,7 @@ from fastapi import Query
 async def get_credits_for_month(
     worker_id: UUID,
     month: str = Query(..., example="2025-06"),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     service = WorkerDashboardService(db)
     total = await service.get_credits_for_month(worker_id, month)
@@ -130,7 +132,7 @@ async def get_credits_for_month(
 async def get_credits_for_year(
     worker_id: UUID,
     year: int = Query(..., example=2025),
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     service = WorkerDashboardService(db)
     data = await service.get_credits_for_year(worker_id, year)
@@ -140,7 +142,7 @@ async def get_credits_for_year(
 @router.get("/active/count/{worker_id}")
 async def get_active_credits_count(
     worker_id: UUID,
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     service = WorkerDashboardService(db)
     count = await service.get_count_active_clients(worker_id)
@@ -150,7 +152,7 @@ async def get_active_credits_count(
 @router.get("/completed/count/{worker_id}")
 async def get_completed_credits_count(
     worker_id: UUID,
-    db: AsyncSession = Depends(get_async_db)
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     service = WorkerDashboardService(db)
     count = await service.get_count_completed_clients(worker_id)
@@ -169,7 +171,7 @@ async def filter_bucket_clients_of_worker(
     email: str | None        = Query(None, description="Часть e-mail"),
     phone_number: str | None = Query(None, description="Часть номера"),
     full_name: str | None    = Query(None, description="Часть ФИО"),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     service = WorkerDashboardService(db)
 
@@ -1,8 +1,8 @@
-from fastapi import APIRouter
+from app.routes._group import RouterGroup
 
 
-def create_refresh_router() -> APIRouter:
-    refresh_router = APIRouter()
+def create_refresh_router() -> RouterGroup:
+    refresh_router = RouterGroup()
 
     from .router_factory import create_refresh_routers
 
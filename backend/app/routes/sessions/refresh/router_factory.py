@@ -44,19 +44,22 @@ def make_refresh_handler(
         if token_row is None:
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token")
 
-        if token_row.user.role != role:
+        if token_row.role != role:
             raise HTTPException(
                 status.HTTP_403_FORBIDDEN,
                 detail=f"Invalid role for this endpoint: expected {role.name}",
             )
 
-        # Generate new access and refresh tokens
-        access, ttl = access_svc.create(str(token_row.user_id))
+        # Rotate first: a token that was already used / revoked meanwhile gets no new pair
         refresh = await refresh_svc.rotate(
             stored_token=token_row,
             ip=request.client.host,
             ua=request.headers.get("User-Agent"),
         )
+        if refresh is None:
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired refresh token")
+
+        access, ttl = access_svc.create(str(token_row.user_id))
 
         response: JSONResponse | TokenPair
 
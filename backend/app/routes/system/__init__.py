@@ -1,17 +1,23 @@
-from fastapi import APIRouter
+from app.routes._group import RouterGroup
 
-def create_system_router() -> APIRouter:
-    system_router = APIRouter()
+def create_system_router() -> RouterGroup:
+    system_router = RouterGroup()
 
     from .ping import router as ping
     from .routes_info import router as info
     from .status import router as status
     from .dashboard import router as dashboard
+    from .websockets import router as websockets
+    from .metrics import router as metrics
+    from .startup import router as startup
 
     system_router.include_router(ping)
     system_router.include_router(info)
     system_router.include_router(status)
     system_router.include_router(dashboard)
+    system_router.include_router(websockets)
+    system_router.include_router(metrics)
+    system_router.include_router(startup)
 
     return system_router
 
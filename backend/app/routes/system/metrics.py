@@ -0,0 +1,33 @@
+from typing import Literal
+
+from fastapi import APIRouter, Query
+from fastapi.responses import PlainTextResponse
+
+from app.config import REQUEST_METRICS, SQL_INSTRUMENTATION
+from app.utils.instrumentation import request_metrics, sql_metrics
+from app.utils.serialization import FastJSONResponse
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", tags=["System"], response_class=PlainTextResponse)
+def metrics(format: Literal["prometheus", "json"] = Query("prometheus")):
+    """
+    Per-route request metrics + SQL latency histograms in Prometheus text format.
+    `?format=json` — per-route summary (latency, SQL per request, N+1) for CI regression checks.
+    """
+    if format == "json":
+        return FastJSONResponse(request_metrics.snapshot())
+
+    parts = []
+    if REQUEST_METRICS:
+        parts.append(request_metrics.render())
+    else:
+        parts.append("# Request metrics are disabled (set REQUEST_METRICS=true)\n")
+    if SQL_INSTRUMENTATION:
+        parts.append(sql_metrics.render())
+    else:
+        parts.append("# SQL instrumentation is disabled (set SQL_INSTRUMENTATION=true)\n")
+    return PlainTextResponse("".join(parts), media_type=PROMETHEUS_CONTENT_TYPE)
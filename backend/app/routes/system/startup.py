@@ -0,0 +1,45 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+
+from db.session import get_async_read_db
+
+from app.config import IMPORT_PROFILER_ENABLED
+from app.permissions import PermissionRole
+from app.routes.entities.analyze._base import resolve_user
+from app.utils.instrumentation import import_profiler, startup_timings
+
+router = APIRouter()
+
+
+@router.get("/startup", tags=["System"])
+def startup_report(request: Request):
+    """Cold start of this worker: imports / app_created / ready (ms from import of main) + route-table build."""
+    return {**startup_timings.snapshot(), "routes": len(request.app.routes)}
+
+
+@router.get("/startup/imports", tags=["System"])
+async def import_time_report(
+    request: Request,
+    module: str = Query("main", description="Модуль, імпорт якого профілюється (main або app.*)"),
+    top: int = Query(30, ge=1, le=500),
+    refresh: bool = Query(False, description="Зняти профіль заново (інакше — закешований)"),
+    db=Depends(get_async_read_db),
+):
+    """
+    `python -X importtime -c "import <module>"` у свіжому інтерпретаторі:
+    найдорожчі модулі (cumulative / self) і пакети за власним часом імпорту. Лише для ADMIN.
+    """
+    if not IMPORT_PROFILER_ENABLED:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Import profiler is disabled (IMPORT_PROFILER_ENABLED)")
+    user_id, role = await resolve_user(request, db)
+    if user_id is None:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    if role != PermissionRole.ADMIN:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, detail="Forbidden")
+    try:
+        return await import_profiler.report(module, top=top, refresh=refresh)
+    except ValueError as exc:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    except asyncio.TimeoutError as exc:
+        raise HTTPException(status.HTTP_504_GATEWAY_TIMEOUT, detail="Import profiling timed out") from exc
@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+
+from app.websockets import connection_hub
+
+router = APIRouter()
+
+
+@router.get("/websockets", tags=["System"])
+def websocket_metrics():
+    """Live WebSocket connections: counts, queue depth, dropped frames, send latency."""
+    from app.services.live.hub import live_dashboard_hub
+
+    return {
+        **connection_hub.metrics(),
+        "live_dashboard": live_dashboard_hub.stats(),
+    }
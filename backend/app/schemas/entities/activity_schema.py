@@ -0,0 +1,32 @@
+from __future__ import annotations
+from datetime import datetime
+from enum import StrEnum
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from app.schemas import SchemaBase
+
+
+class ActivityKind(StrEnum):
+    CLIENT_CREATED = "client_created"                  # клієнт зареєструвався
+    CLIENT_TAKEN_BY_WORKER = "client_taken_by_worker"  # воркер взяв клієнта в роботу
+    CLIENT_TAKEN_BY_BROKER = "client_taken_by_broker"  # брокер взяв / передав клієнта
+    WORKER_CREATED = "worker_created"                  # новий воркер
+    BROKER_CREATED = "broker_created"                  # новий брокер
+
+
+class ActivityItemOut(SchemaBase):
+    kind: ActivityKind
+    id: UUID = Field(..., description="UUID сутності (клієнт / воркер / брокер)")
+    at: datetime = Field(..., description="Момент події в таймзоні адміна")
+    label: Optional[str] = Field(None, description="ПІБ / username / компанія — для відображення")
+
+
+class ActivityFeedOut(BaseModel):
+    items: List[ActivityItemOut]
+    next_cursor: Optional[str] = None   # наступна сторінка в межах того ж вікна
+    start: datetime                     # [start, end) — вікно в таймзоні адміна
+    end: datetime
+    timezone: str
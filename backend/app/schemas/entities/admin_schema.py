@@ -19,6 +19,11 @@ class AdminBase(UserSchema.Base, TimeStampAuthSchema, DynamicLinkAuthSchema):
         example="Jane Admin",
         description="Friendly display name used in dashboards or logs"
     )
+    timezone: Optional[str] = Field(
+        None,
+        example="Europe/Kyiv",
+        description="IANA timezone for dashboard day windows"
+    )
 
 
 class AdminCreate(UserSchema.Create):
@@ -40,6 +45,11 @@ class AdminUpdate(UserSchema.Update):
         example="Jane A.",
         description="Updated friendly display name"
     )
+    timezone: Optional[str] = Field(
+        None,
+        example="Europe/Kyiv",
+        description="IANA timezone for dashboard day windows"
+    )
 
 
 class AdminOut(AdminBase):
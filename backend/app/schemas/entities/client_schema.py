@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import datetime
-from typing import Optional, List, Dict, Type, TYPE_CHECKING
+from typing import Optional, List, Dict, Literal, Type, TYPE_CHECKING
 from uuid import UUID
 from pydantic import BaseModel, Field, EmailStr, field_validator
 from datetime import datetime
@@ -179,6 +179,10 @@ class ClientWorkerOut(SchemaBase):
     workplace: Optional[str] = Field(None)
     taken_at_worker: Optional[datetime] = Field(None)
     is_deleted: bool = False
+    # зведення по кредитах (профіль завантаження, див. client/load_profiles.py)
+    credits_count: Optional[int] = Field(None, description="Number of client's credits")
+    credits_total: Optional[float] = Field(None, description="Sum of client's credit amounts")
+    last_credit_status: Optional[str] = Field(None, description="Status of the latest credit")
 
 
 class ClientBrokerOut(SchemaBase):
@@ -209,6 +213,10 @@ class ClientBrokerOut(SchemaBase):
     contact_person: Optional[str] = Field(None)
     taken_at_broker: Optional[datetime] = Field(None)
     is_deleted: bool = False
+    # зведення по кредитах (профіль завантаження, див. client/load_profiles.py)
+    credits_count: Optional[int] = Field(None, description="Number of client's credits")
+    credits_total: Optional[float] = Field(None, description="Sum of client's credit amounts")
+    last_credit_status: Optional[str] = Field(None, description="Status of the latest credit")
 
 
 class ClientAdminOut(SchemaBase):
@@ -241,6 +249,66 @@ class ClientAdminOut(SchemaBase):
     taken_at_broker: Optional[datetime] = Field(None)
     created_at: datetime
     is_deleted: bool = False
+    # зведення по кредитах (профіль завантаження, див. client/load_profiles.py)
+    credits_count: Optional[int] = Field(None, description="Number of client's credits")
+    credits_total: Optional[float] = Field(None, description="Sum of client's credit amounts")
+    last_credit_status: Optional[str] = Field(None, description="Status of the latest credit")
+
+class ClientImportError(BaseModel):
+    """
+    One rejected row of a bulk client import.
+    """
+    row: int = Field(..., description="Line number in the uploaded file (CSV header is line 1)")
+    field: Optional[str] = Field(None, example="phone_number")
+    message: str = Field(..., example="Client with this phone number already exists")
+
+
+class ClientImportReport(BaseModel):
+    """
+    Result of a bulk client import.
+    """
+    total: int = Field(..., description="Data rows read from the file")
+    imported: int
+    duplicates: int = Field(..., description="Rows skipped: email / phone already exists or repeats in the file")
+    failed: int = Field(..., description="Rows rejected by validation or by the database")
+    errors: List[ClientImportError] = Field(default_factory=list)
+    errors_truncated: bool = Field(False, description="More errors than CLIENT_IMPORT_MAX_ERRORS")
+
+
+AssignStrategy = Literal["round_robin", "least_loaded"]
+
+
+class ClientAssignRequest(BaseModel):
+    """
+    Bulk distribution of clients across workers.
+    """
+    client_ids: List[UUID] = Field(..., min_length=1)
+    worker_ids: Optional[List[UUID]] = Field(None, description="Target workers; None → all active workers")
+    strategy: AssignStrategy = Field("least_loaded", description="round_robin | least_loaded")
+
+
+class ClientUnassignRequest(BaseModel):
+    client_ids: List[UUID] = Field(..., min_length=1)
+
+
+class WorkerLoad(BaseModel):
+    """
+    One target worker after a bulk assignment.
+    """
+    worker_id: UUID
+    assigned: int = Field(..., description="Clients assigned to the worker by this operation")
+    load: int = Field(..., description="Active clients of the worker after the operation")
+
+
+class ClientAssignReport(BaseModel):
+    """
+    Result of a bulk assignment / reassignment.
+    """
+    assigned: int
+    unchanged: int = Field(0, description="Clients planned to the worker that already owned them (left as is)")
+    missing: List[UUID] = Field(default_factory=list, description="Unknown or deleted client ids (skipped)")
+    workers: List[WorkerLoad] = Field(default_factory=list)
+
 
 class ClientSchema:
     Base:   Type[BaseModel] = ClientBase
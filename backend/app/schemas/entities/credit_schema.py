@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 
 from app.models.entities.credit import CreditStatus
 from app.schemas import SchemaBase
+from app.utils.pagination import TotalMode
 
 
 class CreditBase(BaseModel):
@@ -60,11 +61,15 @@ class CreditOut(CreditBase):
 class AdminPaginatedCreditsOut(BaseModel):
     credits: List[CreditOut]
     total: int
+    next_cursor: Optional[str] = None  # лише в cursor-режимі
+    total_mode: TotalMode = "exact"    # як порахований total
 
 
 class BrokerPaginatedCreditsOut(BaseModel):
     credits: List[CreditOut]
     total: int
+    next_cursor: Optional[str] = None  # лише в cursor-режимі
+    total_mode: TotalMode = "exact"    # як порахований total
 
 
 class CreditShort(SchemaBase):
@@ -0,0 +1,12 @@
+from .engine import AnalyticsEngine, analytics_engine
+from .metrics import METRICS
+from .spec import AnalyticsError, Filter, MetricSpec
+
+__all__ = [
+    "AnalyticsEngine",
+    "AnalyticsError",
+    "Filter",
+    "METRICS",
+    "MetricSpec",
+    "analytics_engine",
+]
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from datetime import date, datetime, UTC
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Mapping, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, bindparam, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import ANALYTICS_CLOSED_TTL_SECONDS, ANALYTICS_OPEN_TTL_SECONDS
+from app.permissions import PermissionRole
+from app.utils.cache import cache, entry_tags
+from app.utils.decorators import handle_exceptions
+from .metrics import METRICS
+from .spec import GRANULARITIES, AnalyticsError, MetricSpec, bucket_expr, bucket_start
+
+logger = logging.getLogger(__name__)
+
+# query-параметр гранулярності серій (решта параметрів — фільтри метрики)
+BUCKET_PARAM = "bucket"
+
+
+def _plain(value: Any) -> Any:
+    """Значення з рядка результату → JSON-примітив (і для відповіді, і для кешу)."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _bucket_label(value: Any) -> Optional[str]:
+    # PostgreSQL повертає timestamp (date_trunc), sqlite — рядок 'YYYY-MM-DD'
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return None if value is None else str(value)[:10]
+
+
+def _digest(values: Mapping[str, Any]) -> str:
+    return hashlib.sha1(repr(sorted(values.items())).encode()).hexdigest()
+
+
+class AnalyticsEngine:
+    """
+    Compiled, cached analytics over `MetricSpec` registry.
+
+    🔹 Компіляція: (role, metric, набір фільтрів, гранулярність, діалект) → один SELECT
+       з агрегатами; значення фільтрів і скоупу — bind-параметри, тож statement
+       будується один раз і його SQL бере SQLAlchemy compiled cache.
+    🔹 Фільтри, скоуп ролі й date_from / date_to — у WHERE; у Python приходять
+       лише агреговані рядки (бакети / групи), ніколи — сутності.
+    🔹 Мемоізація по часових бакетах: закриті бакети (до початку поточного дня /
+       тижня / місяця) кешуються на `closed_ttl` без тегів; відкритий — на `open_ttl`
+       з тегами change bus, тож нова заявка скидає лише «сьогодні».
+    """
+
+    def __init__(
+        self,
+        registry: Mapping[str, MetricSpec] = METRICS,
+        *,
+        closed_ttl: float = ANALYTICS_CLOSED_TTL_SECONDS,
+        open_ttl: float = ANALYTICS_OPEN_TTL_SECONDS,
+    ):
+        self.registry = registry
+        self.closed_ttl = closed_ttl
+        self.open_ttl = open_ttl
+        self._compiled: dict[tuple, Select] = {}
+
+    def spec(self, metric: str, role: PermissionRole) -> Optional[MetricSpec]:
+        """Специфікація метрики, якщо вона є для ролі (інакше None → 501)."""
+        spec = self.registry.get(metric)
+        return spec if spec is not None and spec.allows(role) else None
+
+    # ───────────── parse ─────────────
+    @staticmethod
+    def parse(spec: MetricSpec, params: Mapping[str, Sequence[str]]) -> tuple[dict[str, Any], Optional[str]]:
+        """{param: [values]} → (значення фільтрів, гранулярність серії)."""
+        filters = spec.all_filters()
+        values: dict[str, Any] = {}
+        granularity = "day" if spec.series else None
+        for name, raw in params.items():
+            if name == BUCKET_PARAM and spec.series:
+                if len(raw) != 1 or raw[0] not in GRANULARITIES:
+                    raise AnalyticsError(f"'{BUCKET_PARAM}' must be one of {list(GRANULARITIES)}")
+                granularity = raw[0]
+            elif name in filters:
+                values[name] = filters[name].parse(raw)
+            else:
+                raise AnalyticsError(f"Unsupported filter '{name}' for metric '{spec.name}'")
+        return values, granularity
+
+    # ───────────── compile ─────────────
+    def compile(
+        self,
+        spec: MetricSpec,
+        role: PermissionRole,
+        shape: frozenset[str],
+        granularity: Optional[str],
+        dialect: str,
+    ) -> Select:
+        key = (role, spec.name, shape, granularity, dialect)
+        stmt = self._compiled.get(key)
+        if stmt is None:
+            stmt = self._compiled[key] = self._build(spec, role, shape, granularity, dialect)
+        return stmt
+
+    @staticmethod
+    def _build(
+        spec: MetricSpec,
+        role: PermissionRole,
+        shape: frozenset[str],
+        granularity: Optional[str],
+        dialect: str,
+    ) -> Select:
+        columns = []
+        if spec.series:
+            columns.append(bucket_expr(spec.time_column, granularity, dialect).label("bucket"))
+        elif spec.dimension is not None:
+            name, expr = spec.dimension
+            columns.append(expr.label(name))
+        columns += [expr.label(name) for name, expr in spec.measures.items()]
+
+        stmt = select(*columns)
+        if spec.source is not None:
+            stmt = stmt.select_from(spec.source)
+
+        filters = spec.all_filters()
+        where = [*spec.where, *(filters[name].clause(name) for name in sorted(shape))]
+        if role != PermissionRole.ADMIN:
+            where.append(spec.scopes[role] == bindparam("scope_id"))
+        if where:
+            stmt = stmt.where(*where)
+
+        if spec.series or spec.dimension is not None:
+            # GROUP BY 1: вираз групування може містити bind-параметри (CASE / date_trunc),
+            # а в SELECT і GROUP BY вони були б різними $n — PostgreSQL таке не прийме
+            stmt = stmt.group_by(literal_column("1"))
+            stmt = stmt.order_by(*(spec.order_by or (literal_column("1"),)))
+        if spec.limit:
+            stmt = stmt.limit(spec.limit)
+        return stmt
+
+    # ───────────── run ─────────────
+    @handle_exceptions()
+    async def run(
+        self,
+        db: AsyncSession,
+        role: PermissionRole,
+        metric: str,
+        scope_id: Optional[UUID],
+        params: Mapping[str, Sequence[str]],
+    ) -> dict[str, Any]:
+        spec = self.spec(metric, role)
+        if spec is None:
+            raise AnalyticsError(f"Metric '{metric}' is not available for role {role.value}")
+        if role != PermissionRole.ADMIN and scope_id is None:
+            raise AnalyticsError("Scoped metric requires the user id")
+
+        values, granularity = self.parse(spec, params)
+        now = datetime.now(UTC)
+        dialect = db.get_bind().dialect.name
+
+        if not spec.series:
+            rows = await self._part(db, spec, role, scope_id, values, granularity, dialect, now)
+            data = rows if spec.dimension is not None else (rows[0] if rows else {})
+            return {"metric": spec.name, "data": data}
+
+        # серія = закриті бакети [date_from, open_start) + відкритий [open_start, date_to)
+        open_start = bucket_start(now, granularity)
+        date_from, date_to = values.get("date_from"), values.get("date_to")
+        rows = []
+        closed_to = min(date_to, open_start) if date_to is not None else open_start
+        if date_from is None or date_from < closed_to:
+            rows += await self._part(
+                db, spec, role, scope_id, {**values, "date_to": closed_to}, granularity, dialect, now,
+            )
+        open_from = max(date_from, open_start) if date_from is not None else open_start
+        if date_to is None or open_from < date_to:
+            rows += await self._part(
+                db, spec, role, scope_id, {**values, "date_from": open_from}, granularity, dialect, now,
+            )
+
+        for name in spec.cumulative:
+            total = 0
+            for row in rows:
+                total += row[name] or 0
+                row[f"{name}_cumulative"] = total
+        return {"metric": spec.name, "granularity": granularity, "data": rows}
+
+    async def _part(
+        self,
+        db: AsyncSession,
+        spec: MetricSpec,
+        role: PermissionRole,
+        scope_id: Optional[UUID],
+        values: dict[str, Any],
+        granularity: Optional[str],
+        dialect: str,
+        now: datetime,
+    ) -> list[dict[str, Any]]:
+        """Один SELECT по діапазону; мемоізується як закритий або відкритий шматок."""
+        stmt = self.compile(spec, role, frozenset(values), granularity, dialect)
+        binds = dict(values)
+        if role != PermissionRole.ADMIN:
+            binds["scope_id"] = scope_id
+        if spec.binds is not None:
+            binds.update(spec.binds(now))
+
+        async def compute() -> list[dict[str, Any]]:
+            result = await db.execute(stmt, binds)
+            rows = []
+            for row in result.mappings():
+                item = {key: _plain(value) for key, value in row.items()}
+                if spec.series:
+                    item["bucket"] = _bucket_label(row["bucket"])
+                rows.append(item)
+            return rows
+
+        date_to = values.get("date_to")
+        closed = spec.time_column is not None and date_to is not None and spec.binds is None and (
+            date_to <= bucket_start(now, granularity or "day")
+        )
+        key = f"analytics:{role.value}:{scope_id}:{spec.name}:{granularity}:{_digest(values)}"
+        if closed:
+            ttl, tags = self.closed_ttl, frozenset()
+        else:
+            ttl = self.open_ttl
+            if role == PermissionRole.ADMIN:
+                tags = entry_tags(role.value, None, wide_topics=spec.topics)
+            else:
+                tags = entry_tags(role.value, scope_id, topics=spec.topics)
+        lag_bound = db.info.get("read_lag_bound", 0.0)
+        return await cache.get_or_compute(key, tags, compute, ttl, lag_bound)
+
+
+analytics_engine = AnalyticsEngine()
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Mapping
+
+from sqlalchemy import bindparam, case, func, literal, select, union_all
+
+from app.models.entities import Broker, Client, Credit, Worker
+from app.models.entities.credit import CreditStatus
+from app.permissions import PermissionRole
+from app.services.live.change_bus import CLIENTS, CREDITS, USERS
+from .spec import Filter, MetricSpec, parse_enum, parse_uuid
+
+# ───────────── shared pieces ─────────────
+_LIVE_CREDIT = Credit.is_deleted.is_(False)
+_LIVE_CLIENT = Client.is_deleted.is_(False)
+
+_AMOUNT = func.coalesce(func.sum(Credit.amount), 0)
+_COUNT = func.count()
+
+_CREDIT_FILTERS: Mapping[str, Filter] = {
+    "status": Filter(Credit.status, "in", parse_enum(CreditStatus)),
+    "worker_id": Filter(Credit.worker_id, "eq", parse_uuid),
+    "broker_id": Filter(Credit.broker_id, "eq", parse_uuid),
+}
+_CLIENT_FILTERS: Mapping[str, Filter] = {
+    "worker_id": Filter(Client.worker_id, "eq", parse_uuid),
+    "broker_id": Filter(Client.broker_id, "eq", parse_uuid),
+}
+
+_CREDIT_SCOPES = {PermissionRole.WORKER: Credit.worker_id, PermissionRole.BROKER: Credit.broker_id}
+_CLIENT_SCOPES = {PermissionRole.WORKER: Client.worker_id, PermissionRole.BROKER: Client.broker_id}
+
+
+def _credits(name: str, measures: Mapping, **kwargs) -> MetricSpec:
+    kwargs.setdefault("scopes", _CREDIT_SCOPES)
+    where = kwargs.pop("where", ())
+    return MetricSpec(
+        name=name,
+        source=Credit,
+        measures=measures,
+        where=(_LIVE_CREDIT, *where),
+        time_column=Credit.issued_at,
+        filters=_CREDIT_FILTERS,
+        topics=frozenset({CREDITS}),
+        **kwargs,
+    )
+
+
+def _clients(name: str, measures: Mapping, **kwargs) -> MetricSpec:
+    kwargs.setdefault("scopes", _CLIENT_SCOPES)
+    where = kwargs.pop("where", ())
+    return MetricSpec(
+        name=name,
+        source=Client,
+        measures=measures,
+        where=(_LIVE_CLIENT, *where),
+        time_column=Client.created_at,
+        filters=_CLIENT_FILTERS,
+        topics=frozenset({CLIENTS}),
+        **kwargs,
+    )
+
+
+# Останні входи воркерів і брокерів (у клієнтів / адмінів поля немає)
+_LOGINS = union_all(
+    select(Worker.last_login_at.label("last_login_at"), literal("worker").label("role"))
+    .where(Worker.is_deleted.is_(False)),
+    select(Broker.last_login_at.label("last_login_at"), literal("broker").label("role"))
+    .where(Broker.is_deleted.is_(False)),
+).subquery("logins")
+
+
+def _today(now: datetime) -> dict:
+    return {"today": now.replace(hour=0, minute=0, second=0, microsecond=0)}
+
+
+def _login_ages(now: datetime) -> dict:
+    return {
+        "day_ago": now - timedelta(days=1),
+        "week_ago": now - timedelta(days=7),
+        "month_ago": now - timedelta(days=30),
+    }
+
+
+def _count(model, *where) -> object:
+    return select(func.count()).select_from(model).where(model.is_deleted.is_(False), *where).scalar_subquery()
+
+
+# ───────────── registry ─────────────
+METRICS: dict[str, MetricSpec] = {spec.name: spec for spec in (
+    # 🗂 Applications
+    _credits("applications_summary", {
+        "total": _COUNT,
+        **{str(s.value): _COUNT.filter(Credit.status == s) for s in CreditStatus},
+        "amount": _AMOUNT,
+    }),
+    _credits("applications_over_time", {"count": _COUNT, "amount": _AMOUNT}, series=True),
+    _credits(
+        "applications_by_source",
+        {"count": _COUNT, "amount": _AMOUNT},
+        dimension=("source", case(
+            (Credit.broker_id.is_not(None), "broker"),
+            (Credit.worker_id.is_not(None), "worker"),
+            else_="direct",
+        )),
+    ),
+
+    # 💸 Financial
+    _credits("revenue_per_day", {"amount": _AMOUNT}, series=True),
+    _credits("average_amount", {"average": func.coalesce(func.avg(Credit.amount), 0), "count": _COUNT}),
+    _credits("total_revenue", {"amount": _AMOUNT, "count": _COUNT}),
+
+    # 🏢 Organization (воркер бачить брокерів, з якими працює, і навпаки)
+    _credits(
+        "brokers_activity",
+        {
+            "count": _COUNT,
+            "amount": _AMOUNT,
+            "approved": _COUNT.filter(Credit.status.in_((CreditStatus.APPROVED, CreditStatus.COMPLETED))),
+            "last_issued_at": func.max(Credit.issued_at),
+        },
+        dimension=("broker_id", Credit.broker_id),
+        where=(Credit.broker_id.is_not(None),),
+        scopes={PermissionRole.WORKER: Credit.worker_id},
+        order_by=(_COUNT.desc(),),
+    ),
+    _credits(
+        "workers_activity",
+        {
+            "count": _COUNT,
+            "amount": _AMOUNT,
+            "approved": _COUNT.filter(Credit.status.in_((CreditStatus.APPROVED, CreditStatus.COMPLETED))),
+            "last_issued_at": func.max(Credit.issued_at),
+        },
+        dimension=("worker_id", Credit.worker_id),
+        where=(Credit.worker_id.is_not(None),),
+        scopes={PermissionRole.BROKER: Credit.broker_id},
+        order_by=(_COUNT.desc(),),
+    ),
+
+    # 📈 Clients
+    _clients("clients_growth", {"count": _COUNT}, series=True, cumulative=("count",)),
+    _clients(
+        "clients_per_broker",
+        {"count": _COUNT},
+        dimension=("broker_id", Client.broker_id),
+        scopes={PermissionRole.WORKER: Client.worker_id},
+        order_by=(_COUNT.desc(),),
+    ),
+    _clients(
+        "clients_per_worker",
+        {"count": _COUNT},
+        dimension=("worker_id", Client.worker_id),
+        scopes={PermissionRole.BROKER: Client.broker_id},
+        order_by=(_COUNT.desc(),),
+    ),
+
+    # 👤 User activity (лише адмін)
+    MetricSpec(
+        name="active_users_today",
+        source=_LOGINS,
+        measures={
+            "total": _COUNT,
+            "workers": _COUNT.filter(_LOGINS.c.role == "worker"),
+            "brokers": _COUNT.filter(_LOGINS.c.role == "broker"),
+        },
+        where=(_LOGINS.c.last_login_at >= bindparam("today"),),
+        binds=_today,
+        topics=frozenset({USERS}),
+    ),
+    MetricSpec(
+        name="last_login_distribution",
+        source=_LOGINS,
+        measures={"count": _COUNT},
+        dimension=("period", case(
+            (_LOGINS.c.last_login_at.is_(None), "never"),
+            (_LOGINS.c.last_login_at >= bindparam("day_ago"), "day"),
+            (_LOGINS.c.last_login_at >= bindparam("week_ago"), "week"),
+            (_LOGINS.c.last_login_at >= bindparam("month_ago"), "month"),
+            else_="older",
+        )),
+        binds=_login_ages,
+        topics=frozenset({USERS}),
+    ),
+
+    # 📊 System diagnostics (лише адмін): кілька COUNT-підзапитів одним SELECT
+    MetricSpec(
+        name="system_load",
+        source=None,
+        measures={
+            "clients": _count(Client),
+            "workers": _count(Worker),
+            "brokers": _count(Broker),
+            "credits": _count(Credit),
+            "credits_in_progress": _count(
+                Credit, Credit.status.in_((CreditStatus.NEW, CreditStatus.TREATMENT)),
+            ),
+        },
+        topics=frozenset({CLIENTS, CREDITS, USERS}),
+    ),
+    # errors_per_day: помилки ніде не зберігаються (лише лог) — метрика не зареєстрована (501)
+)}
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from enum import Enum
+from typing import Any, Callable, Literal, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, func, literal_column
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.permissions import PermissionRole
+
+Granularity = Literal["day", "week", "month"]
+GRANULARITIES: Tuple[str, ...] = ("day", "week", "month")
+
+_DATETIME = TypeAdapter(datetime)
+
+
+class AnalyticsError(ValueError):
+    """Unknown metric / filter or a bad filter value (→ 400)."""
+
+
+# ───────────── time buckets ─────────────
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    """Початок бакета (UTC), що містить `moment`: день / тиждень з понеділка / місяць."""
+    day = moment.astimezone(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def bucket_expr(column: Any, granularity: str, dialect: str) -> ColumnElement:
+    """SQL-вираз бакета для GROUP BY: date_trunc на PostgreSQL, date()/strftime на sqlite."""
+    if dialect == "postgresql":
+        # бакети в UTC незалежно від TimeZone сесії
+        return func.date_trunc(literal_column(f"'{granularity}'"), func.timezone(literal_column("'UTC'"), column))
+    if granularity == "week":
+        return func.date(column, "weekday 0", "-6 days")  # понеділок
+    if granularity == "month":
+        return func.strftime("%Y-%m-01", column)
+    return func.date(column)
+
+
+# ───────────── filters ─────────────
+def _one(values: Sequence[str]) -> str:
+    if len(values) != 1:
+        raise AnalyticsError("expected a single value")
+    return values[0]
+
+
+def parse_datetime(values: Sequence[str]) -> datetime:
+    try:
+        value = _DATETIME.validate_python(_one(values))
+    except ValueError as exc:
+        raise AnalyticsError(f"invalid date '{values[0]}'") from exc
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def parse_uuid(values: Sequence[str]) -> UUID:
+    try:
+        return UUID(_one(values))
+    except ValueError as exc:
+        raise AnalyticsError(f"invalid id '{values[0]}'") from exc
+
+
+def parse_enum(enum: type[Enum]) -> Callable[[Sequence[str]], list]:
+    def _parse(values: Sequence[str]) -> list:
+        # ?status=new&status=approved або ?status=new,approved
+        raw = [v.strip() for value in values for v in value.split(",") if v.strip()]
+        try:
+            return [enum(v) for v in raw]
+        except ValueError as exc:
+            raise AnalyticsError(f"expected one of {[e.value for e in enum]}") from exc
+    return _parse
+
+
+@dataclass(frozen=True)
+class Filter:
+    """
+    Pushed-down filter: `column <op> :name`.
+
+    Значення потрапляє в запит лише як bind-параметр, тож скомпільований SELECT
+    однаковий для будь-яких значень — змінюється лише набір фільтрів (shape).
+    """
+    column: Any
+    op: Literal["eq", "in", "ge", "lt"]
+    parse: Callable[[Sequence[str]], Any]
+
+    def clause(self, name: str) -> ColumnElement:
+        if self.op == "in":
+            return self.column.in_(bindparam(name, expanding=True))
+        param = bindparam(name)
+        if self.op == "ge":
+            return self.column >= param
+        if self.op == "lt":
+            return self.column < param
+        return self.column == param
+
+
+# ───────────── metric spec ─────────────
+Measures = Mapping[str, ColumnElement]
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """
+    Declarative SQL aggregate.
+
+    • source / where — FROM і постійні умови (напр. is_deleted = false);
+    • measures — агрегати {назва: вираз}; dimension — GROUP BY (назва, вираз),
+      або series=True — GROUP BY часового бакета по `time_column`;
+    • time_column — date_from / date_to і межа «закритих» бакетів для мемоізації;
+    • scopes — колонка власника для ролі (воркер / брокер бачать лише своє);
+      ролі без колонки (крім ADMIN) метрику не отримують;
+    • filters — дозволені фільтри з query string;
+    • binds — серверні параметри, які обчислюються при кожному запуску (напр. now);
+    • cumulative — міри, для яких у серії додається наростаючий підсумок (<name>_cumulative);
+    • topics — топіки change bus, що змінюють значення (інвалідація кешу).
+    """
+    name: str
+    source: Any
+    measures: Measures
+    topics: frozenset[str]
+    where: Tuple[ColumnElement, ...] = ()
+    dimension: Optional[Tuple[str, ColumnElement]] = None
+    series: bool = False
+    time_column: Any = None
+    scopes: Mapping[PermissionRole, Any] = field(default_factory=dict)
+    filters: Mapping[str, Filter] = field(default_factory=dict)
+    binds: Optional[Callable[[datetime], dict]] = None
+    cumulative: Tuple[str, ...] = ()
+    order_by: Tuple[ColumnElement, ...] = ()
+    limit: Optional[int] = None
+
+    def allows(self, role: PermissionRole) -> bool:
+        return role == PermissionRole.ADMIN or role in self.scopes
+
+    def all_filters(self) -> Mapping[str, Filter]:
+        if self.time_column is None:
+            return self.filters
+        return {
+            "date_from": Filter(self.time_column, "ge", parse_datetime),
+            "date_to": Filter(self.time_column, "lt", parse_datetime),
+            **self.filters,
+        }
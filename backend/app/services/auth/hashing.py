@@ -0,0 +1,132 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.config import (
+    PASSWORD_BCRYPT_ROUNDS,
+    PASSWORD_HASH_EXECUTOR,
+    PASSWORD_HASH_MAX_QUEUE,
+    PASSWORD_HASH_WORKERS,
+)
+
+R = TypeVar("R")
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+# Поточні параметри; хеші з іншою вартістю (rounds) позначаються needs_update → rehash при логіні.
+# passlib і bcrypt-бекенд завантажуються при першому хешуванні, а не при старті воркера
+@cache
+def get_pwd_ctx() -> "CryptContext":
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=PASSWORD_BCRYPT_ROUNDS)
+
+
+def __getattr__(name: str):
+    # сумісність: `hashing.pwd_ctx` як і раніше — той самий (лінивий) контекст
+    if name == "pwd_ctx":
+        return get_pwd_ctx()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Module-level, щоб їх можна було передати в ProcessPoolExecutor (pickle за іменем)
+def _hash(password: str, rounds: Optional[int] = None) -> str:
+    # rounds нижче за поточні → needs_update, хеш оновиться при першому логіні
+    ctx = get_pwd_ctx()
+    return ctx.hash(password, rounds=rounds) if rounds else ctx.hash(password)
+
+
+def _verify(plain: str, hashed: str) -> bool:
+    return get_pwd_ctx().verify(plain, hashed)
+
+
+def _verify_and_update(plain: str, hashed: str) -> tuple[bool, Optional[str]]:
+    return get_pwd_ctx().verify_and_update(plain, hashed)
+
+
+class PasswordHasher:
+    """
+    Bounded pool for bcrypt hash / verify, off the event loop.
+
+    • thread (за замовчуванням) — bcrypt відпускає GIL, тож потоки масштабуються по ядрах;
+      process — якщо бекенд хешування GIL тримає.
+    • Не більше `workers + max_queue` операцій одночасно (у роботі + в черзі); понад це —
+      503 з Retry-After, замість того щоб логіни накопичувались і відвалювались по таймауту.
+    • Пул створюється ліниво, при першому виклику.
+    """
+
+    def __init__(self, *, kind: str = PASSWORD_HASH_EXECUTOR, workers: int = PASSWORD_HASH_WORKERS,
+                 max_queue: int = PASSWORD_HASH_MAX_QUEUE):
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def _run(self, fn: Callable[..., R], *args) -> R:
+        if self._in_flight >= self.capacity:
+            raise HTTPException(
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication is temporarily overloaded, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def hash_many(self, passwords: Sequence[str], *, rounds: Optional[int] = None) -> list[str]:
+        """
+        Пачка хешів для масових операцій (імпорт): без 503 — розмір пачки обмежує викликач.
+        Для таких задач краще окремий екземпляр, щоб не займати пул логінів.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        self._in_flight += len(passwords)
+        try:
+            return list(await asyncio.gather(
+                *(loop.run_in_executor(executor, _hash, password, rounds) for password in passwords)
+            ))
+        finally:
+            self._in_flight -= len(passwords)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._run(_verify, plain, hashed)
+
+    async def verify_and_update(self, plain: str, hashed: str) -> tuple[bool, Optional[str]]:
+        """(valid, new_hash) — new_hash не None, якщо хеш створено зі старими параметрами."""
+        return await self._run(_verify_and_update, plain, hashed)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
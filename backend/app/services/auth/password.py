@@ -4,11 +4,9 @@ from __future__ import annotations
 from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from passlib.context import CryptContext
 
 from app.models.entities.user import User   # базова модель
-
-pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from .hashing import password_hasher
 
 class PasswordService:
     """Hash / verify / authenticate any polymorphic User."""
@@ -16,17 +14,17 @@ class PasswordService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    # ---------- static helpers ----------
+    # ---------- static helpers (bcrypt у пулі password_hasher, не в event loop) ----------
 
     @staticmethod
-    def hash(password: str) -> str:
+    async def hash(password: str) -> str:
         """Return bcrypt-hash for given plain password."""
-        return pwd_ctx.hash(password)
+        return await password_hasher.hash(password)
 
     @staticmethod
-    def verify(plain: str, hashed: str) -> bool:
+    async def verify(plain: str, hashed: str) -> bool:
         """Check plain password against stored hash."""
-        return pwd_ctx.verify(plain, hashed)
+        return await password_hasher.verify(plain, hashed)
 
     # ---------- main method ----------
 
@@ -50,6 +48,15 @@ class PasswordService:
         result = await self.db.execute(stmt)
         user: User | None = result.scalar_one_or_none()
 
-        if user and self.verify(password, user.password_hash):
-            return user     # automatically loaded as proper subclass
-        return None
+        if user is None:
+            return None
+
+        valid, new_hash = await password_hasher.verify_and_update(password, user.password_hash)
+        if not valid:
+            return None
+
+        if new_hash is not None:
+            # хеш зі старими параметрами (rounds) — перехешовуємо прозоро, пароль уже відомий
+            user.password_hash = new_hash
+            await self.db.commit()
+        return user     # automatically loaded as proper subclass
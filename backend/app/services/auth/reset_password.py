@@ -1,5 +1,5 @@
 from app.services.auth.token_manager import TokenManager
-from app.services.smtp_service import SMTPService
+from app.services.mail import enqueue_email
 from app.services.entities.user.user_service import UserService
 from app.core.settings import settings
 
@@ -17,14 +17,14 @@ class ResetPasswordService:
         2. Validates token and sets new password.
 
     Dependencies:
-        - SMTPService: used to send reset link via email
+        - Email outbox: the reset link is queued in the request transaction
+          and delivered by MailOutboxWorker (no SMTP on the request path)
         - TokenManager: encodes/decodes JWT with 'reset' type
         - UserService: fetches and updates user by email or ID
     """
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.smtp = SMTPService()
         self.user_service = UserService(db)
 
     @handle_route_exceptions()
@@ -100,10 +100,17 @@ class ResetPasswordService:
 
     async def _send_reset_email(self, email: EmailStr, token: str) -> None:
         """
-        Sends the reset token via email.
+        Queues the reset email (outbox row committed with this request).
 
         Args:
             email (EmailStr): Recipient's email.
             token (str): JWT token to include in the email.
         """
-        await self.smtp.send_password_reset_email(to_email=email, reset_token=token)
+        enqueue_email(
+            self.db,
+            "password_reset",
+            email,
+            reset_link=f"{settings.FRONTEND_URL}/reset-password?token={token}",
+            ttl_minutes=settings.PASSWORD_RESET_TOKEN_TTL,
+        )
+        await self.db.commit()
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any, Iterable, Optional, Sequence
+from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import func, literal, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import ACTIVITY_FEED_MAX_ROWS
+from app.models import Admin, Broker, Client, User, Worker
+from app.permissions import PermissionRole
+from app.schemas.entities.activity_schema import ActivityFeedOut, ActivityItemOut, ActivityKind
+from app.utils.decorators import handle_exceptions
+from app.utils.pagination import decode_cursor_tiebreak, encode_cursor
+
+
+@dataclass(frozen=True)
+class _Source:
+    """
+    Звідки береться подія одного виду. `at` + `id` — з тієї ж таблиці, що й індекс
+    (clients для taken_at_*, users для created_at), щоб ORDER BY (at, id) йшов по ньому;
+    `role` — префікс індексу ix_users_role_created_at_id.
+    """
+    at: Any
+    id: Any
+    label: Any
+    role: Optional[PermissionRole]
+    naive: bool  # колонка без tz (taken_at_*) — зберігається як naive UTC
+
+
+_SOURCES: dict[ActivityKind, _Source] = {
+    ActivityKind.CLIENT_CREATED: _Source(
+        Client.created_at, User.id, Client.full_name, PermissionRole.CLIENT, naive=False
+    ),
+    ActivityKind.CLIENT_TAKEN_BY_WORKER: _Source(
+        Client.taken_at_worker, Client.id, Client.full_name, None, naive=True
+    ),
+    ActivityKind.CLIENT_TAKEN_BY_BROKER: _Source(
+        Client.taken_at_broker, Client.id, Client.full_name, None, naive=True
+    ),
+    ActivityKind.WORKER_CREATED: _Source(
+        Worker.created_at, User.id, Worker.username, PermissionRole.WORKER, naive=False
+    ),
+    ActivityKind.BROKER_CREATED: _Source(
+        Broker.created_at, User.id, func.coalesce(Broker.company_name, Broker.email), PermissionRole.BROKER, naive=False
+    ),
+}
+
+
+def resolve_timezone(name: Optional[str]) -> ZoneInfo:
+    """IANA-назва → ZoneInfo; невідома / порожня → UTC."""
+    try:
+        return ZoneInfo(name) if name else ZoneInfo("UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+
+def day_window(tz: ZoneInfo, day: Optional[date] = None, *, offset: int = 0) -> tuple[datetime, datetime]:
+    """
+    [00:00, 00:00 наступного дня) локального дня `day` (за замовчуванням — сьогодні в tz),
+    зсунутого на `offset` днів (-1 → вчора). Межі — aware; DST-безпечно (не +24h).
+    """
+    local_day = (day or datetime.now(tz).date()) + timedelta(days=offset)
+    start = datetime.combine(local_day, time.min, tzinfo=tz)
+    end = datetime.combine(local_day + timedelta(days=1), time.min, tzinfo=tz)
+    return start, end
+
+
+class ActivityFeed:
+    """
+    Windowed activity feed for the admin dashboard.
+
+    Одна стрічка замість восьми «new today / new yesterday» запитів:
+    довільне вікно [start, end) і набір видів подій → один UNION ALL,
+    де кожна гілка — діапазонний скан по індексу (at, id) з власним LIMIT.
+    Повертає легкі проєкції (kind, id, at, label), не ORM-сутності;
+    сторінка обмежена ACTIVITY_FEED_MAX_ROWS, далі — keyset next_cursor
+    по (at, id, kind): created і taken_at_* одного клієнта мають той самий id
+    і можуть збігтися в часі, тож (at, id) між видами не унікальні.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _dialect(self) -> str:
+        return (self.db.bind and self.db.bind.dialect.name) or "postgresql"
+
+    @handle_exceptions()
+    async def timezone_of(self, admin_id: Optional[UUID]) -> ZoneInfo:
+        if admin_id is None:
+            return ZoneInfo("UTC")
+        name = (await self.db.execute(select(Admin.timezone).where(Admin.id == admin_id))).scalar_one_or_none()
+        return resolve_timezone(name)
+
+    @handle_exceptions()
+    async def get(
+        self,
+        kinds: Optional[Iterable[ActivityKind]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        *,
+        tz: ZoneInfo = ZoneInfo("UTC"),
+        limit: int = ACTIVITY_FEED_MAX_ROWS,
+        cursor: Optional[str] = None,
+    ) -> ActivityFeedOut:
+        """
+        Події видів `kinds` (None → усі) у вікні [start, end), новіші першими.
+
+        start/end без tz трактуються як локальний час адміна; якщо не задані —
+        поточна доба в tz. `at` у відповіді — aware, у таймзоні адміна.
+        """
+        if start is None or end is None:
+            day_start, day_end = day_window(tz)
+            start, end = start or day_start, end or day_end
+        start, end = _localize(start, tz), _localize(end, tz)
+        limit = max(1, min(limit, ACTIVITY_FEED_MAX_ROWS))
+        after = decode_cursor_tiebreak(cursor) if cursor else None
+
+        kinds = list(dict.fromkeys(kinds)) if kinds else list(_SOURCES)
+        rows = await self._fetch(kinds, start, end, limit, after)
+
+        page, next_cursor = rows[:limit], None
+        if len(rows) > limit:
+            last = page[-1]
+            next_cursor = encode_cursor(_as_utc(last.at), last.id, last.kind)
+
+        return ActivityFeedOut(
+            items=[
+                ActivityItemOut(kind=r.kind, id=r.id, at=_as_utc(r.at).astimezone(tz), label=r.label)
+                for r in page
+            ],
+            next_cursor=next_cursor,
+            start=start,
+            end=end,
+            timezone=tz.key,
+        )
+
+    async def _fetch(
+        self,
+        kinds: Sequence[ActivityKind],
+        start: datetime,
+        end: datetime,
+        limit: int,
+        after: Optional[tuple[datetime, UUID, Optional[str]]],
+    ) -> list:
+        pg = self._dialect() == "postgresql"
+        branches = []
+        for kind in kinds:
+            src = _SOURCES[kind]
+            lo, hi = _bound(start, src), _bound(end, src)
+            # naive (UTC) колонку віддаємо як timestamptz, щоб UNION мав один тип `at`
+            at = func.timezone("UTC", src.at) if pg and src.naive else src.at
+            stmt = (
+                select(
+                    literal(kind.value).label("kind"),
+                    src.id.label("id"),
+                    at.label("at"),
+                    src.label.label("label"),
+                )
+                .where(src.at >= lo, src.at < hi)
+            )
+            if src.role is not None:
+                stmt = stmt.where(User.role == src.role)
+            if after is not None:
+                # kind у гілці — константа: (at, id, kind) < cursor ⇔ (at, id) <= / < (at, id) cursor-а
+                after_at, after_id, after_kind = after
+                key, bound = tuple_(src.at, src.id), tuple_(_bound(after_at, src), after_id)
+                stmt = stmt.where(key <= bound if after_kind and kind.value < after_kind else key < bound)
+            # кожна гілка — власний index range scan з LIMIT, а не повний діапазон
+            sub = stmt.order_by(src.at.desc(), src.id.desc()).limit(limit + 1).subquery()
+            branches.append(select(sub.c.kind, sub.c.id, sub.c.at, sub.c.label))
+
+        feed = union_all(*branches).subquery("activity") if len(branches) > 1 else branches[0].subquery("activity")
+        stmt = select(feed).order_by(feed.c.at.desc(), feed.c.id.desc(), feed.c.kind.desc()).limit(limit + 1)
+        return list((await self.db.execute(stmt)).all())
+
+
+def _localize(value: datetime, tz: ZoneInfo) -> datetime:
+    return value.replace(tzinfo=tz) if value.tzinfo is None else value.astimezone(tz)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _bound(value: datetime, src: _Source) -> datetime:
+    """Межа вікна у форматі колонки: naive UTC для taken_at_*, aware — для created_at."""
+    value = _as_utc(value)
+    return value.replace(tzinfo=None) if src.naive else value
@@ -1,39 +1,54 @@
 from __future__ import annotations
 
-import re
-
 from datetime import datetime, UTC, timedelta, date
 from typing import Sequence, Any, Mapping, Optional, Tuple
 
 from sqlalchemy import (
     select,
     func,
-    extract,
     update,
     and_,
-    literal_column,
-    exists,
-    or_,
+    true,
+    Select,
+    Table,
 )
+from sqlalchemy.sql.elements import ColumnElement
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from uuid import UUID
 
 from app.routes.entities.crud.dashboard.admin_dashboard_router import DeletedFilter
+from app.routes.entities.crud.dashboard.types import AdminOverviewOut
 from app.models import Client, Broker, Worker, User
 from app.models.entities.credit import Credit, CreditStatus
+from app.permissions import PermissionRole
 from app.schemas.entities.broker_schema import BrokerAdminOut
-from app.schemas.entities.client_schema import WorkerClientNewToday, UserNewToday, ClientAdminOut, ClientBrokerOut
+from app.schemas.entities.client_schema import ClientAdminOut, ClientBrokerOut
 from app.schemas.entities.worker_schema import WorkerAdminOut
-from app.services.entities import WorkerService, BrokerService
+from app.services.entities import (
+    WorkerService, BrokerService, ClientFilterService, WorkerFilterService, BrokerFilterService,
+)
+from app.services.entities.credit.credit_service import CreditService
+from app.services.entities.credit.credit_rollup import CreditRollupService
+from app.services.search import SearchQuery, ClientSearch
+from app.services.entities.client.load_profiles import CLIENT_ADMIN, CLIENT_BROKER, ClientLoadProfile
 from app.utils.decorators import handle_exceptions
+from app.utils.pagination import Page, TotalMode, apply_keyset, count_total, split_page
+from app.utils.serialization import RowProjection
 from app.models.entities.promotion import Promotion, PromotionEnum
+from app.services.entities.client.client_scope import client_owners
+from app.services.live.change_bus import CLIENTS, USERS, notify_change
 from app.schemas.entities.promotion_schema import (
     PromotionCreate, PromotionUpdate, PromotionSummaryOut, TopWorkerOut
 )
 
 
+# рядкові проєкції для швидкого шляху бакетів (as_rows=True)
+_WORKER_ROWS = RowProjection(Worker, WorkerAdminOut)
+_BROKER_ROWS = RowProjection(Broker, BrokerAdminOut)
+
+
 class AdminDashboard:
     """
     High-level service for global analytics & administration.
@@ -47,48 +62,98 @@ class AdminDashboard:
     # 📊 GLOBAL AGGREGATES
     # ─────────────────────────────
 
+    @staticmethod
+    def _current_month_bounds() -> Tuple[datetime, datetime]:
+        # issued_at зберігається як naive UTC → межі теж naive UTC
+        now = datetime.now(UTC)
+        start = datetime(now.year, now.month, 1)
+        end = datetime(now.year + (1 if now.month == 12 else 0), 1 if now.month == 12 else now.month + 1, 1)
+        return start, end
+
+    def _aggregates(self) -> dict[Table, dict[str, ColumnElement]]:
+        """
+        Global KPIs grouped by source table: {table: {kpi: aggregate}}.
+        Shared by get_overview() (all of them) and the single-KPI getters (one).
+        """
+        month_start, month_end = self._current_month_bounds()
+        live = Credit.is_deleted.is_(False)
+        return {
+            Credit.__table__: {
+                "total_sum_credits": func.coalesce(func.sum(Credit.amount), 0),
+                "month_sum_credits": func.coalesce(
+                    func.sum(Credit.amount).filter(Credit.issued_at >= month_start, Credit.issued_at < month_end), 0
+                ),
+                "count_credits": func.count(Credit.id),
+                "count_active_credits": func.count(Credit.id).filter(live, Credit.status != CreditStatus.COMPLETED),
+                "count_completed_credits": func.count(Credit.id).filter(live, Credit.status == CreditStatus.COMPLETED),
+            },
+            User.__table__: {
+                "sum_users": func.count(User.id),
+                "sum_clients": func.count(User.id).filter(User.role == PermissionRole.CLIENT),
+                "sum_brokers": func.count(User.id).filter(User.role == PermissionRole.BROKER),
+                "sum_workers": func.count(User.id).filter(User.role == PermissionRole.WORKER),
+            },
+            Client.__table__: {
+                "count_signed_clients": func.count().filter(Client.worker_id.isnot(None)),
+                "count_unsigned_clients": func.count().filter(Client.worker_id.is_(None)),
+            },
+        }
+
+    @handle_exceptions()
+    async def get_overview(self) -> AdminOverviewOut:
+        """
+        Every global KPI in one round trip.
+
+        One single-row aggregate per table (credits / users / clients), using FILTER
+        clauses instead of separate queries, cross-joined into one SELECT.
+        """
+        subqueries = [
+            select(*(agg.label(name) for name, agg in kpis.items())).select_from(table).subquery(f"{table.name}_agg")
+            for table, kpis in self._aggregates().items()
+        ]
+        joined = subqueries[0]
+        for subquery in subqueries[1:]:
+            joined = joined.join(subquery, true())
+        row = (await self.db.execute(select(*subqueries).select_from(joined))).one()
+        return AdminOverviewOut(**row._mapping)
+
+    async def _aggregate(self, name: str) -> Any:
+        """Один KPI — лише його агрегат по його таблиці, без решти overview."""
+        for table, kpis in self._aggregates().items():
+            if name in kpis:
+                return (await self.db.execute(select(kpis[name]).select_from(table))).scalar_one()
+        raise KeyError(name)
+
+    # Окремі KPI — вузькі запити через _aggregate (ті самі вирази, що й в overview)
+
     @handle_exceptions()
-    async def get_total_sum_credits(self) -> int:
-        stmt = select(func.coalesce(func.sum(Credit.amount), 0))
-        return (await self.db.execute(stmt)).scalar_one()
+    async def get_total_sum_credits(self) -> float:
+        return float(await self._aggregate("total_sum_credits"))
 
     @handle_exceptions()
-    async def get_month_sum_credits(self) -> int:
-        now = datetime.now(UTC)
-        stmt = (
-            select(func.coalesce(func.sum(Credit.amount), 0))
-            .where(
-                extract("year", Credit.issued_at) == now.year,
-                extract("month", Credit.issued_at) == now.month,
-            )
-        )
-        return (await self.db.execute(stmt)).scalar_one()
+    async def get_month_sum_credits(self) -> float:
+        return float(await self._aggregate("month_sum_credits"))
 
     @handle_exceptions()
     async def get_sum_users(self) -> int:
         # общее кол-во пользователей (включая удалённых)
-        stmt = select(func.count(User.id))
-        return (await self.db.execute(stmt)).scalar_one()
+        return await self._aggregate("sum_users")
 
     @handle_exceptions()
     async def get_sum_clients(self) -> int:
-        stmt = select(func.count(Client.id))
-        return (await self.db.execute(stmt)).scalar_one()
+        return await self._aggregate("sum_clients")
 
     @handle_exceptions()
     async def get_sum_brokers(self) -> int:
-        stmt = select(func.count(Broker.id))
-        return (await self.db.execute(stmt)).scalar_one()
+        return await self._aggregate("sum_brokers")
 
     @handle_exceptions()
     async def get_sum_workers(self) -> int:
-        stmt = select(func.count(Worker.id))
-        return (await self.db.execute(stmt)).scalar_one()
+        return await self._aggregate("sum_workers")
 
     @handle_exceptions()
     async def get_count_credits(self) -> int:
-        stmt = select(func.count(Credit.id))
-        return (await self.db.execute(stmt)).scalar_one()
+        return await self._aggregate("count_credits")
 
     # ─────────────────────────────
     # 📅 DATE-RANGE AGGREGATES
@@ -118,89 +183,6 @@ class AdminDashboard:
         )
         return (await self.db.execute(stmt)).scalar_one()
 
-    @handle_exceptions()
-    async def get_today_new_clients_worker(self) -> list[WorkerClientNewToday]:
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-
-        stmt = select(Client).where(Client.taken_at_worker >= today_start)
-        result = await self.db.execute(stmt)
-        return [WorkerClientNewToday.model_validate(c) for c in result.scalars().all()]
-
-    @handle_exceptions()
-    async def get_yesterday_new_clients_worker(self) -> list[WorkerClientNewToday]:
-        now = datetime.utcnow()
-        yesterday_start = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
-        yesterday_end = yesterday_start + timedelta(days=1)
-
-        stmt = (
-            select(Client)
-            .where(
-                Client.taken_at_broker >= yesterday_start,
-                Client.taken_at_broker < yesterday_end,
-            )
-        )
-        result = await self.db.execute(stmt)
-        return [WorkerClientNewToday.model_validate(c) for c in result.scalars().all()]
-
-    @handle_exceptions()
-    async def get_today_new_clients_broker(self) -> list[WorkerClientNewToday]:
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-
-        stmt = select(Client).where(Client.taken_at_broker >= today_start)
-        result = await self.db.execute(stmt)
-        rows = (r for r in result.scalars() if r.taken_at_worker)
-        return [WorkerClientNewToday.model_validate(r) for r in rows]
-
-    @handle_exceptions()
-    async def get_yesterday_new_clients_broker(self) -> list[WorkerClientNewToday]:
-        now = datetime.utcnow()
-        yesterday_start = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
-        yesterday_end = yesterday_start + timedelta(days=1)
-
-        stmt = (
-            select(Client)
-            .where(
-                Client.taken_at_broker >= yesterday_start,
-                Client.taken_at_broker < yesterday_end,
-            )
-        )
-        result = await self.db.execute(stmt)
-        return [WorkerClientNewToday.model_validate(c) for c in result.scalars().all()]
-
-    @handle_exceptions()
-    async def get_today_new_workers(self) -> list[UserNewToday]:
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        stmt = select(Worker).where(Worker.created_at >= today_start)
-        result = await self.db.execute(stmt)
-        return [UserNewToday.model_validate(c) for c in result.scalars().all()]
-
-    @handle_exceptions()
-    async def get_yesterday_new_workers(self) -> list[UserNewToday]:
-        now = datetime.utcnow()
-        yesterday_start = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
-        yesterday_end = yesterday_start + timedelta(days=1)
-
-        stmt = select(Worker).where(Worker.created_at >= yesterday_start, Worker.created_at < yesterday_end)
-        result = await self.db.execute(stmt)
-        return [UserNewToday.model_validate(c) for c in result.scalars().all()]
-
-    @handle_exceptions()
-    async def get_today_new_brokers(self) -> list[UserNewToday]:
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        stmt = select(Broker).where(Broker.created_at >= today_start)
-        result = await self.db.execute(stmt)
-        return [UserNewToday.model_validate(c) for c in result.scalars().all()]
-
-    @handle_exceptions()
-    async def get_yesterday_new_brokers(self) -> list[UserNewToday]:
-        now = datetime.utcnow()
-        yesterday_start = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
-        yesterday_end = yesterday_start + timedelta(days=1)
-
-        stmt = select(Broker).where(Broker.created_at >= yesterday_start, Broker.created_at < yesterday_end)
-        result = await self.db.execute(stmt)
-        return [UserNewToday.model_validate(c) for c in result.scalars().all()]
-
     @handle_exceptions()
     async def get_count_signed_clients_by_worker(self, worker_id: UUID) -> int:
         stmt = select(func.count(Client.id)).where(Client.worker_id == worker_id)
@@ -208,18 +190,15 @@ class AdminDashboard:
 
     @handle_exceptions()
     async def get_count_unsigned_clients_by_worker(self) -> int:
-        stmt = select(func.count(Client.id)).where(Client.worker_id.is_(None))
-        return (await self.db.execute(stmt)).scalar_one()
+        return await self._aggregate("count_unsigned_clients")
 
     @handle_exceptions()
     async def get_total_count_signed_clients_by_brokers(self) -> int:
-        stmt = select(func.count(Client.id)).where(Client.worker_id.isnot(None))
-        return (await self.db.execute(stmt)).scalar_one()
+        return await self._aggregate("count_signed_clients")
 
     @handle_exceptions()
     async def get_total_count_unsigned_clients_by_brokers(self) -> int:
-        stmt = select(func.count(Client.id)).where(Client.worker_id.is_(None))
-        return (await self.db.execute(stmt)).scalar_one()
+        return await self._aggregate("count_unsigned_clients")
 
     # ─────────────────────────────
     # 📦 BUCKET (PAGINATION) + filters
@@ -233,10 +212,22 @@ class AdminDashboard:
             limit: int = 20,
             where_clause: Any = None,
             options: tuple = (),
+            profile: Optional[ClientLoadProfile] = None,
+            projection: Optional[RowProjection] = None,
             order_by=None,
             deleted: DeletedFilter = "all",  # ⟵ нове
-    ) -> Tuple[list, int]:
-        """Generic pagination with COUNT(*) using the same WHERE."""
+            cursor: Optional[str] = None,
+            total_mode: TotalMode = "exact",
+    ) -> Page:
+        """
+        Generic pagination with a total over the same WHERE.
+
+        cursor=None → OFFSET/LIMIT (як раніше, next_cursor=None);
+        cursor="" / токен → keyset по (created_at, id) DESC, повертає next_cursor.
+        total_mode → exact | estimated | cached (див. count_total).
+        profile → проєкція/зведення для Client (див. ClientLoadProfile), без додаткових запитів.
+        projection → швидкий шлях: вибираються лише колонки схеми, items — dict (див. RowProjection).
+        """
         # apply deleted filter
         if deleted == "active":
             deleted_clause = model.is_deleted.is_(False)
@@ -249,100 +240,131 @@ class AdminDashboard:
         if deleted_clause is not None:
             final_where = and_(where_clause, deleted_clause) if where_clause is not None else deleted_clause
 
-        count_stmt = select(func.count()).select_from(model)
-        if final_where is not None:
-            count_stmt = count_stmt.where(final_where)
-        total = int((await self.db.execute(count_stmt)).scalar_one())
-
         data_stmt = select(model)
         if final_where is not None:
             data_stmt = data_stmt.where(final_where)
-        if order_by is None:
-            order_by = model.created_at.desc()
-        data_stmt = data_stmt.order_by(order_by).offset(skip).limit(limit)
+
+        total, used_mode = await count_total(
+            self.db,
+            data_stmt,
+            mode=total_mode,
+            estimate_table=model.__table__.name if final_where is None else None,
+        )
+
         if options:
             data_stmt = data_stmt.options(*options)
+        if projection is not None:
+            data_stmt = projection.apply(data_stmt)
+        elif profile is not None:
+            data_stmt = profile.apply(data_stmt, self._dialect())
+
+        if cursor is not None:
+            data_stmt = apply_keyset(data_stmt, model.created_at, model.id, cursor, limit)
+            result = await self.db.execute(data_stmt)
+            rows = result.all() if projection is not None else result.scalars().all()
+            page, next_cursor = split_page(rows, limit, "created_at")
+            if projection is not None:
+                page = projection.to_dicts(page)
+            return Page(page, total, next_cursor, used_mode)
 
-        rows = (await self.db.execute(data_stmt)).scalars().all()
-        return rows, total
+        if order_by is None:
+            order_by = model.created_at.desc()
+        if not isinstance(order_by, (list, tuple)):
+            order_by = (order_by,)
+        data_stmt = data_stmt.order_by(*order_by).offset(skip).limit(limit)
 
-    # ---------- search builder for clients ----------
-    @staticmethod
-    def _clients_search_clause(search: str):
-        if not search:
-            return None
-        terms = [t.strip() for t in re.split(r"[\s,]+", search) if t.strip()]
-        if not terms:
-            return None
-
-        phone_norm = func.regexp_replace(Client.phone_number, r'[^0-9]', '', 'g')
-        and_groups = []
-        for t in terms:
-            like = f"%{t}%"
-            disj = [
-                Client.full_name.ilike(like),
-                Client.email.ilike(like),
-                Client.phone_number.ilike(like),
-                Client.fact_address.ilike(like),
-                phone_norm.ilike(func.regexp_replace(like, r'[^0-9]', '', 'g')),
-            ]
-            # exact UUID match if looks like uuid
-            try:
-                uid = UUID(t)
-                disj.append(Client.id == uid)
-            except Exception:
-                pass
-            and_groups.append(or_(*disj))
-        return and_(*and_groups)
+        result = await self.db.execute(data_stmt)
+        if projection is not None:
+            return Page(projection.to_dicts(result), total, None, used_mode)
+        return Page(list(result.scalars().all()), total, None, used_mode)
 
     # ---------- buckets with TRUE totals ----------
     @handle_exceptions()
     async def get_bucket_clients(
-            self, skip: int = 0, limit: int = 20, search: Optional[str] = None, deleted: DeletedFilter = "all"
-    ) -> Tuple[list[ClientAdminOut], int]:
-        where_clause = self._clients_search_clause(search) if search else None
-        rows, total = await self._paginate_with_total(
+            self,
+            skip: int = 0,
+            limit: int = 20,
+            search: Optional[str] = None,
+            deleted: DeletedFilter = "all",
+            cursor: Optional[str] = None,
+            total_mode: TotalMode = "exact",
+            as_rows: bool = False,
+    ) -> Page:
+        """as_rows=True → items як dict (швидкий шлях, без ORM-об'єктів і model_validate)."""
+        # пошук: trigram-індекси на PG; в offset-режимі — ранжування (точний UUID → схожість)
+        q = SearchQuery.parse(search)
+        where_clause = None
+        order_by = [Client.created_at.desc()]
+        if q is not None:
+            builder = ClientSearch(self._dialect())
+            where_clause = builder.clause(q)
+            order_by = [*builder.ranking(q), *order_by, Client.id.desc()]
+
+        page = await self._paginate_with_total(
             Client,
             skip=skip,
             limit=limit,
             where_clause=where_clause,
-            options=(
-                selectinload(Client.worker),
-                selectinload(Client.broker),
-                selectinload(Client.credits),
-            ),
-            order_by=Client.created_at.desc(),
+            profile=CLIENT_ADMIN,
+            projection=CLIENT_ADMIN.projection(self._dialect()) if as_rows else None,
+            order_by=order_by,
             deleted=deleted,  # ⟵ нове
+            cursor=cursor,
+            total_mode=total_mode,
         )
-        return [ClientAdminOut.model_validate(r) for r in rows], total
+        if as_rows:
+            return page
+        return page._replace(items=[CLIENT_ADMIN.out(r) for r in page.items])
 
     @handle_exceptions()
     async def get_bucket_brokers(
-            self, skip: int = 0, limit: int = 20, deleted: DeletedFilter = "all"
-    ) -> Tuple[list[BrokerAdminOut], int]:
-        rows, total = await self._paginate_with_total(
+            self,
+            skip: int = 0,
+            limit: int = 20,
+            deleted: DeletedFilter = "all",
+            cursor: Optional[str] = None,
+            total_mode: TotalMode = "exact",
+            as_rows: bool = False,
+    ) -> Page:
+        page = await self._paginate_with_total(
             Broker,
             skip=skip,
             limit=limit,
             where_clause=None,
+            projection=_BROKER_ROWS if as_rows else None,
             order_by=Broker.created_at.desc(),
             deleted=deleted,  # ⟵ нове
+            cursor=cursor,
+            total_mode=total_mode,
         )
-        return [BrokerAdminOut.model_validate(r) for r in rows], total
+        if as_rows:
+            return page
+        return page._replace(items=[BrokerAdminOut.model_validate(r) for r in page.items])
 
     @handle_exceptions()
     async def get_bucket_workers(
-            self, skip: int = 0, limit: int = 20, deleted: DeletedFilter = "all"
-    ) -> Tuple[list[WorkerAdminOut], int]:
-        rows, total = await self._paginate_with_total(
+            self,
+            skip: int = 0,
+            limit: int = 20,
+            deleted: DeletedFilter = "all",
+            cursor: Optional[str] = None,
+            total_mode: TotalMode = "exact",
+            as_rows: bool = False,
+    ) -> Page:
+        page = await self._paginate_with_total(
             Worker,
             skip=skip,
             limit=limit,
             where_clause=None,
+            projection=_WORKER_ROWS if as_rows else None,
             order_by=Worker.created_at.desc(),
             deleted=deleted,  # ⟵ нове
+            cursor=cursor,
+            total_mode=total_mode,
         )
-        return [WorkerAdminOut.model_validate(r) for r in rows], total
+        if as_rows:
+            return page
+        return page._replace(items=[WorkerAdminOut.model_validate(r) for r in page.items])
 
     # ─────────────────────────────
     # 🔍 SINGLE-ENTITY FETCH
@@ -354,12 +376,11 @@ class AdminDashboard:
 
     @handle_exceptions()
     async def get_client(self, client_id: UUID) -> ClientAdminOut | None:
-        client = await self._get_one(
-            Client, client_id, selectinload(Client.worker), selectinload(Client.broker), selectinload(Client.credits)
-        )
+        stmt = CLIENT_ADMIN.apply(select(Client).where(Client.id == client_id), self._dialect())
+        client = (await self.db.execute(stmt)).scalar_one_or_none()
         if client is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
-        return ClientAdminOut.model_validate(client)
+        return CLIENT_ADMIN.out(client)
 
     @handle_exceptions()
     async def get_worker(self, worker_id: UUID) -> WorkerAdminOut | None:
@@ -388,6 +409,7 @@ class AdminDashboard:
             .execution_options(synchronize_session=False)
         )
         await self.db.execute(stmt)
+        notify_change(self.db, USERS, CLIENTS)
         await self.db.commit()
 
     @handle_exceptions()
@@ -403,6 +425,7 @@ class AdminDashboard:
             .execution_options(synchronize_session=False)
         )
         await self.db.execute(stmt)
+        notify_change(self.db, USERS, CLIENTS)
         await self.db.commit()
 
     # ── REASSIGNMENT ────────────────────
@@ -419,6 +442,8 @@ class AdminDashboard:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Worker not found")
             new_worker_id = worker.id
 
+        # старий і новий власник — для точкової інвалідації кешу / live-метрик
+        owners = await client_owners(self.db, client_id)
         await self.db.execute(
             update(Client)
             .where(Client.id == client_id)
@@ -428,6 +453,7 @@ class AdminDashboard:
             )
             .execution_options(synchronize_session=False)
         )
+        notify_change(self.db, CLIENTS, worker_ids=[owners.worker_id, new_worker_id], broker_ids=[owners.broker_id])
         await self.db.commit()
 
     @handle_exceptions()
@@ -439,6 +465,8 @@ class AdminDashboard:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Broker not found")
             new_broker_id = broker.id
 
+        # старий і новий власник — для точкової інвалідації кешу / live-метрик
+        owners = await client_owners(self.db, client_id)
         await self.db.execute(
             update(Client)
             .where(Client.id == client_id)
@@ -448,34 +476,20 @@ class AdminDashboard:
             )
             .execution_options(synchronize_session=False)
         )
+        notify_change(self.db, CLIENTS, worker_ids=[], broker_ids=[owners.broker_id, new_broker_id])
         await self.db.commit()
 
     # ── CREDIT CONTROL ─────────────────
 
+    # через CreditService, щоб зміни потрапляли в credit_daily_rollup
+
     @handle_exceptions()
     async def force_complete_credit(self, credit_id: UUID) -> None:
-        stmt = (
-            update(Credit)
-            .where(Credit.id == credit_id)
-            .values(
-                paid_amount=Credit.total_amount,
-                status="completed",
-                last_payment_at=datetime.now(UTC),
-            )
-            .execution_options(synchronize_session=False)
-        )
-        await self.db.execute(stmt)
-        await self.db.commit()
+        await CreditService(self.db).complete(credit_id)
 
     @handle_exceptions()
     async def change_credit_status(self, credit_id: UUID, new_status: str) -> None:
-        stmt = (
-            update(Credit)
-            .where(Credit.id == credit_id)
-            .values(status=new_status)
-            .execution_options(synchronize_session=False)
-        )
-        await self.db.execute(stmt)
+        await CreditService(self.db).change_status(credit_id, CreditStatus(new_status))
 
     # ── EDIT DATA HELPERS ───────────────
 
@@ -546,32 +560,8 @@ class AdminDashboard:
         except Exception:
             raise ValueError("Invalid month format. Expected YYYY-MM.")
 
-        # ключ групування "день"
-        if self._dialect() == "sqlite":
-            day_key = func.strftime("%Y-%m-%d", Credit.issued_at)  # -> str
-        else:
-            day_key = func.date(Credit.issued_at)                  # -> date
-
-        stmt = (
-            select(day_key.label("d"), func.coalesce(func.sum(Credit.amount), 0).label("total"))
-            .where(
-                and_(
-                    Credit.issued_at >= start_date,
-                    Credit.issued_at < end_date,
-                    Credit.is_deleted.is_(False),
-                )
-            )
-            .group_by(day_key)
-            .order_by(day_key)
-        )
-        res = await self.db.execute(stmt)
-        rows = res.all()
-
-        # мапимо за датою; SQLite повертає рядок, PG — date
-        totals_by_day: dict[date, float] = {}
-        for d_val, total in rows:
-            d = date.fromisoformat(d_val) if isinstance(d_val, str) else d_val
-            totals_by_day[d] = float(total or 0.0)
+        # читаємо з credit_daily_rollup (≤ 31 бакет на день), а не сканимо credits
+        totals_by_day = await CreditRollupService(self.db).daily_totals(start_date, end_date)
 
         # повертаємо повний місяць з нулями на порожні дні
         out: list[dict[str, Any]] = []
@@ -582,24 +572,7 @@ class AdminDashboard:
 
     @handle_exceptions()
     async def get_credits_for_year(self, year: int) -> list[dict[str, Any]]:
-        # ключ групування "місяць" і умова на рік — крос-діалектно
-        if self._dialect() == "sqlite":
-            month_key = func.cast(func.strftime("%m", Credit.issued_at), int)  # "01".."12" -> int
-            year_cond = func.strftime("%Y", Credit.issued_at) == str(year)
-        else:
-            month_key = func.extract("month", Credit.issued_at)  # 1..12
-            year_cond = func.extract("year", Credit.issued_at) == year
-
-        stmt = (
-            select(month_key.label("m"), func.coalesce(func.sum(Credit.amount), 0).label("total"))
-            .where(and_(year_cond, Credit.is_deleted.is_(False)))
-            .group_by(month_key)
-            .order_by(month_key)
-        )
-        res = await self.db.execute(stmt)
-        rows = res.all()
-
-        totals_by_month: dict[int, float] = {int(m): float(t or 0.0) for m, t in rows}
+        totals_by_month = await CreditRollupService(self.db).monthly_totals(year)
 
         data: list[dict[str, Any]] = []
         for m in range(1, 13):
@@ -608,28 +581,85 @@ class AdminDashboard:
 
     @handle_exceptions()
     async def get_count_active_credits(self) -> int:
-        stmt = (
-            select(func.count(Credit.id))
-            .where(Credit.status != CreditStatus.COMPLETED)
-            .where(Credit.is_deleted.is_(False))
-        )
-        result = await self.db.execute(stmt)
-        return result.scalar_one()
+        return await self._aggregate("count_active_credits")
 
     @handle_exceptions()
     async def get_count_completed_credits(self) -> int:
-        stmt = (
-            select(func.count(Credit.id))
-            .where(Credit.status == CreditStatus.COMPLETED)
-            .where(Credit.is_deleted.is_(False))
-        )
-        result = await self.db.execute(stmt)
-        return result.scalar_one()
+        return await self._aggregate("count_completed_credits")
 
     # ─────────────────────────────
     # 🔎 FILTER BUCKETS (with is_deleted)
     # ─────────────────────────────
 
+    # фільтри — спільні для бакетів і потокового експорту (app/services/export);
+    # повертають ледачі *FilterService: з них беруться count() / page() / apply()
+    @staticmethod
+    def client_filter(
+        *,
+        email: str | None = None,
+        phone_number: str | None = None,
+        full_name: str | None = None,
+        is_deleted: bool | None = None,
+    ) -> ClientFilterService:
+        service = ClientFilterService()
+        if email:
+            service.by_email(email)
+        if phone_number:
+            service.by_phone_number(phone_number)
+        if full_name:
+            service.by_full_name(full_name)
+        if is_deleted is not None:
+            service.by_status(is_deleted)
+        return service
+
+    @staticmethod
+    def worker_filter(
+        *,
+        email: str | None = None,
+        username: str | None = None,
+        is_deleted: bool | None = None,
+    ) -> WorkerFilterService:
+        service = WorkerFilterService()
+        if email:
+            service.by_email(email)
+        if username:
+            service.search_username(username)
+        if is_deleted is not None:
+            service.by_is_deleted(is_deleted)
+        return service
+
+    @staticmethod
+    def broker_filter(
+        *,
+        email: str | None = None,
+        company_name: str | None = None,
+        region: str | None = None,
+        is_deleted: bool | None = None,
+    ) -> BrokerFilterService:
+        service = BrokerFilterService()
+        if email:
+            service.by_email(email)
+        if company_name:
+            service.by_company_name(company_name)
+        if region:
+            service.search_region(region)
+        if is_deleted is not None:
+            service.by_is_deleted(is_deleted)
+        return service
+
+    # рядкові SELECT-и з тими самими фільтрами, без пагінації — для потокового експорту
+    def client_rows_select(self, **filters) -> Select:
+        stmt = self.client_filter(**filters).apply()
+        return CLIENT_ADMIN.projection(self._dialect()).apply(stmt).order_by(Client.full_name.asc(), Client.id)
+
+    def worker_rows_select(self, **filters) -> Select:
+        stmt = self.worker_filter(**filters).apply()
+        return _WORKER_ROWS.apply(stmt).order_by(Worker.username.asc(), Worker.id)
+
+    def broker_rows_select(self, **filters) -> Select:
+        stmt = self.broker_filter(**filters).apply()
+        return _BROKER_ROWS.apply(stmt).order_by(Broker.company_name.asc(), Broker.id)
+
     @handle_exceptions()
     async def filter_bucket_clients(
         self,
@@ -645,41 +675,16 @@ class AdminDashboard:
         Вернуть (список, total) клиентов с фильтрами и пагинацией.
         Поддерживает фильтр по удалённости записи: is_deleted = True/False/None.
         """
-        conditions = []
-
-        if email:
-            conditions.append(Client.email.ilike(f"%{email}%"))
-        if phone_number:
-            conditions.append(Client.phone_number.ilike(f"%{phone_number}%"))
-        if full_name:
-            conditions.append(Client.full_name.ilike(f"%{full_name}%"))
-        if is_deleted is not None:
-            conditions.append(Client.is_deleted.is_(is_deleted))
-
-        where_clause = and_(*conditions) if conditions else True
-
-        total_stmt = select(func.count()).select_from(Client).where(where_clause)
-        total_res  = await self.db.execute(total_stmt)
-        total: int = total_res.scalar_one()
-
-        data_stmt = (
-            select(Client)
-            .where(where_clause)
-            .options(
-                selectinload(Client.worker),
-                selectinload(Client.broker),
-                selectinload(Client.credits),
-            )
-            .order_by(Client.full_name.asc())
-            .offset(skip)
-            .limit(limit)
+        service = self.client_filter(
+            email=email, phone_number=phone_number, full_name=full_name, is_deleted=is_deleted
         )
+        total: int = (await self.db.execute(service.count())).scalar_one()
 
-        data_res = await self.db.execute(data_stmt)
-        clients: Sequence[Client] = data_res.scalars().all()
+        data_stmt = CLIENT_BROKER.apply(service.page(skip, limit, Client.full_name.asc(), Client.id), self._dialect())
+        clients: Sequence[Client] = (await self.db.execute(data_stmt)).scalars().all()
 
         return (
-            [ClientBrokerOut.model_validate(c) for c in clients],
+            [CLIENT_BROKER.out(c) for c in clients],
             total,
         )
 
@@ -696,30 +701,11 @@ class AdminDashboard:
         """
         Вернуть (список, total) работников с фильтрами и пагинацией.
         """
-        conditions = []
-        if email:
-            conditions.append(Worker.email.ilike(f"%{email}%"))
-        if username:
-            conditions.append(Worker.username.ilike(f"%{username}%"))
-        if is_deleted is not None:
-            conditions.append(Worker.is_deleted.is_(is_deleted))
-
-        where_clause = and_(*conditions) if conditions else True
+        service = self.worker_filter(email=email, username=username, is_deleted=is_deleted)
+        total: int = (await self.db.execute(service.count())).scalar_one()
 
-        total_stmt = select(func.count()).select_from(Worker).where(where_clause)
-        total_res  = await self.db.execute(total_stmt)
-        total: int = total_res.scalar_one()
-
-        data_stmt = (
-            select(Worker)
-            .where(where_clause)
-            .order_by(Worker.username.asc())
-            .offset(skip)
-            .limit(limit)
-        )
-
-        data_res = await self.db.execute(data_stmt)
-        workers: Sequence[Worker] = data_res.scalars().all()
+        data_stmt = service.page(skip, limit, Worker.username.asc(), Worker.id)
+        workers: Sequence[Worker] = (await self.db.execute(data_stmt)).scalars().all()
 
         return (
             [WorkerAdminOut.model_validate(c) for c in workers],
@@ -740,35 +726,13 @@ class AdminDashboard:
         """
         Вернуть (список, total) брокеров с фильтрами и пагинацией.
         """
-        conditions = []
-        if email:
-            conditions.append(Broker.email.ilike(f"%{email}%"))
-        if company_name:
-            conditions.append(Broker.company_name.ilike(f"%{company_name}%"))
-        if region:
-            subquery = select(literal_column("1")).where(
-                literal_column("region_item").ilike(f"%{region}%")
-            ).select_from(func.unnest(Broker.region).alias("region_item"))
-            conditions.append(exists(subquery))
-        if is_deleted is not None:
-            conditions.append(Broker.is_deleted.is_(is_deleted))
-
-        where_clause = and_(*conditions) if conditions else True
-
-        total_stmt = select(func.count()).select_from(Broker).where(where_clause)
-        total_res  = await self.db.execute(total_stmt)
-        total: int = total_res.scalar_one()
-
-        data_stmt = (
-            select(Broker)
-            .where(where_clause)
-            .order_by(Broker.company_name.asc())
-            .offset(skip)
-            .limit(limit)
+        service = self.broker_filter(
+            email=email, company_name=company_name, region=region, is_deleted=is_deleted
         )
+        total: int = (await self.db.execute(service.count())).scalar_one()
 
-        data_res = await self.db.execute(data_stmt)
-        brokers: Sequence[Broker] = data_res.scalars().all()
+        data_stmt = service.page(skip, limit, Broker.company_name.asc(), Broker.id)
+        brokers: Sequence[Broker] = (await self.db.execute(data_stmt)).scalars().all()
 
         return (
             [BrokerAdminOut.model_validate(c) for c in brokers],
@@ -1,5 +1,3 @@
-from sqlalchemy import select
-from sqlalchemy.sql import Select
 from datetime import datetime
 from app.models import Admin
 from app.permissions import PermissionRole
@@ -25,10 +23,7 @@ class AdminFilterService(UserFilterService):
         - search_email_or_display_name(text): Search by partial match in email or display name.
         - apply(): Finalize and return the composed SQLAlchemy Select query.
     """
-    def __init__(self):
-        """Initialize the filter service with a base SELECT query."""
-        super().__init__()
-        self.query: Select = select(Admin)
+    model = Admin
 
     def by_email(self, email: str):
         """
@@ -37,8 +32,7 @@ class AdminFilterService(UserFilterService):
         :param email: Substring of the email to search for.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Admin.email.ilike(f"%{email}%"))
-        return self
+        return self.where(Admin.email.ilike(f"%{email}%"))
 
     def by_display_name(self, name: str):
         """
@@ -47,8 +41,7 @@ class AdminFilterService(UserFilterService):
         :param name: Substring of the display name to search for.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Admin.display_name.ilike(f"%{name}%"))
-        return self
+        return self.where(Admin.display_name.ilike(f"%{name}%"))
 
     def by_role(self, role: PermissionRole):
         """
@@ -57,8 +50,7 @@ class AdminFilterService(UserFilterService):
         :param role: PermissionRole enum value.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Admin.role == role)
-        return self
+        return self.where(Admin.role == role)
 
     def by_is_active(self, is_active: bool = True):
         """
@@ -67,8 +59,7 @@ class AdminFilterService(UserFilterService):
         :param is_active: Boolean indicating if the admin is active.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Admin.is_active == is_active)
-        return self
+        return self.where(Admin.is_active == is_active)
 
     def by_is_deleted(self, is_deleted: bool = False):
         """
@@ -77,8 +68,7 @@ class AdminFilterService(UserFilterService):
         :param is_deleted: Boolean indicating if the admin is marked as deleted.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Admin.is_deleted == is_deleted)
-        return self
+        return self.where(Admin.is_deleted == is_deleted)
 
     def by_created_after(self, dt: datetime):
         """
@@ -87,8 +77,7 @@ class AdminFilterService(UserFilterService):
         :param dt: Datetime value to filter by.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Admin.created_at >= dt)
-        return self
+        return self.where(Admin.created_at >= dt)
 
     def by_created_before(self, dt: datetime):
         """
@@ -97,8 +86,7 @@ class AdminFilterService(UserFilterService):
         :param dt: Datetime value to filter by.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Admin.created_at <= dt)
-        return self
+        return self.where(Admin.created_at <= dt)
 
     def exclude_superadmins(self):
         """
@@ -106,8 +94,7 @@ class AdminFilterService(UserFilterService):
 
         :return: Self (chainable).
         """
-        self.query = self.query.where(Admin.is_super_admin == False)
-        return self
+        return self.where(Admin.is_super_admin == False)
 
     def search_email_or_display_name(self, text: str):
         """
@@ -117,15 +104,6 @@ class AdminFilterService(UserFilterService):
         :return: Self (chainable).
         """
         like = f"%{text}%"
-        self.query = self.query.where(
+        return self.where(
             (Admin.email.ilike(like)) | (Admin.display_name.ilike(like))
         )
-        return self
-
-    def apply(self) -> Select:
-        """
-        Finalize and return the built SQLAlchemy Select query.
-
-        :return: A Select statement ready for async execution.
-        """
-        return self.query
@@ -11,6 +11,7 @@ from app.permissions import PermissionRole
 from app.models.entities import Admin
 from app.utils.decorators import handle_exceptions
 from app.schemas.entities.admin_schema import AdminSchema
+from app.services.live.change_bus import USERS, notify_change
 from db.session import get_async_db
 
 AdminT = TypeVar("AdminT", bound=Admin)
@@ -62,9 +63,10 @@ class AdminService(UserService):
     async def create(self, admin_data: AdminSchema.Create) -> AdminT:
         """Create a new Admin user. Hashes the password before saving."""
         updated_admin_data = admin_data.model_dump()
-        updated_admin_data["password_hash"] = PasswordService.hash(updated_admin_data.pop("password"))
+        updated_admin_data["password_hash"] = await PasswordService.hash(updated_admin_data.pop("password"))
         admin = Admin(**updated_admin_data)
         self.db.add(admin)
+        notify_change(self.db, USERS)
         await self.db.commit()
         await self.db.refresh(admin)
         return cast(AdminT, admin)
@@ -1,6 +1,5 @@
 from sqlalchemy import select, func, update, extract, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from typing import Sequence, Any
 from uuid import UUID
 from datetime import datetime, UTC, timedelta, date
@@ -8,14 +7,24 @@ from datetime import datetime, UTC, timedelta, date
 from app.models import Client
 from app.models.entities.credit import Credit
 from app.schemas.entities.client_schema import WorkerClientNewToday, ClientBrokerOut, BrokerClientNewToday
-from app.utils.decorators import handle_exceptions
+from app.services.entities.client.load_profiles import CLIENT_BROKER
+from app.services.entities.credit.credit_rollup import CreditRollupService, rollup_key
+from app.permissions import PermissionRole
+from app.services.entities.client.client_scope import client_owners
+from app.utils.decorators import cached, handle_exceptions
+from app.utils.pagination import apply_keyset, split_page
+from app.services.live.change_bus import CLIENTS, CREDITS, notify_change
 
 
 class BrokerDashboard:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    def _dialect(self) -> str:
+        return (self.db.bind and self.db.bind.dialect.name) or "postgresql"
+
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CREDITS,))
     async def get_total_credits_count(self, broker_id: UUID) -> int:
         """
         Return total number of all credits assigned to this broker.
@@ -25,6 +34,7 @@ class BrokerDashboard:
         return result.scalar_one()
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CREDITS,))
     async def get_mount_credits_count(self, broker_id: UUID) -> int:
         """
         Return number of credits issued this month by this broker.
@@ -43,6 +53,7 @@ class BrokerDashboard:
         return result.scalar_one()
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CREDITS,))
     async def get_count_active_credits(self, broker_id: UUID) -> int:
         """
         Count active credits (status='active') assigned to the broker.
@@ -55,6 +66,7 @@ class BrokerDashboard:
         return result.scalar_one()
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CREDITS,))
     async def get_count_completed_credits(self, broker_id: UUID) -> int:
         """
         Count completed credits (status='completed') assigned to the broker.
@@ -67,6 +79,7 @@ class BrokerDashboard:
         return result.scalar_one()
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CLIENTS,))
     async def get_sum_signed_clients(self, broker_id: UUID) -> int:
         """
         Count broker's clients that are signed by a worker.
@@ -79,46 +92,66 @@ class BrokerDashboard:
         return result.scalar_one()
 
     @handle_exceptions()
-    async def get_bucket_signed_clients(self, broker_id: UUID, skip: int = 0, limit: int = 8) -> Sequence[Client]:
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CLIENTS,))
+    async def get_sum_unsigned_clients(self, broker_id: UUID) -> int:
+        """
+        Count broker's clients that are not yet signed by a worker.
+        """
+        stmt = (
+            select(func.count(Client.id))
+            .where(Client.broker_id == broker_id, Client.worker_id.is_(None))
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+
+    @handle_exceptions()
+    async def get_bucket_signed_clients(
+        self, broker_id: UUID, skip: int = 0, limit: int = 8, cursor: str | None = None
+    ) -> tuple[Sequence[Client], str | None]:
         """
-        Return paginated list of broker's clients that have been signed by a worker.
+        Return paginated list of broker's clients that have been signed by a worker, plus next_cursor.
         """
         stmt = (
             select(Client)
             .where(Client.broker_id == broker_id)
-            .order_by(Client.taken_at_broker.asc())
-            .offset(skip)
-            .limit(limit)
-            .options(selectinload(Client.worker), selectinload(Client.credits))
         )
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
+        return await self._page(stmt, skip, limit, cursor)
 
     @handle_exceptions()
-    async def get_bucket_unsigned_clients(self, broker_id: UUID, skip: int = 0, limit: int = 8) -> Sequence[Client]:
+    async def get_bucket_unsigned_clients(
+        self, broker_id: UUID, skip: int = 0, limit: int = 8, cursor: str | None = None
+    ) -> tuple[Sequence[Client], str | None]:
         """
-        Return paginated list of broker's clients that are not yet signed by a worker.
+        Return paginated list of broker's clients that are not yet signed by a worker, plus next_cursor.
         """
         stmt = (
             select(Client)
             .where(Client.broker_id == broker_id, Client.worker_id.is_(None))
-            .order_by(Client.taken_at_broker.asc())
-            .offset(skip)
-            .limit(limit)
-            .options(selectinload(Client.credits))
         )
+        return await self._page(stmt, skip, limit, cursor)
+
+    async def _page(self, stmt, skip: int, limit: int, cursor: str | None) -> tuple[Sequence[Client], str | None]:
+        """
+        cursor=None → OFFSET по taken_at_broker (як раніше);
+        cursor="" / токен → keyset по (created_at, id) — taken_at_broker nullable, для keyset не годиться.
+        Рядки вантажаться профілем ClientBrokerOut (колонки + зведення по кредитах) одним запитом.
+        """
+        stmt = CLIENT_BROKER.apply(stmt, self._dialect())
+        if cursor is not None:
+            stmt = apply_keyset(stmt, Client.created_at, Client.id, cursor, limit, descending=False)
+            rows = (await self.db.execute(stmt)).scalars().all()
+            return split_page(rows, limit, "created_at")
+
+        stmt = stmt.order_by(Client.taken_at_broker.asc()).offset(skip).limit(limit)
         result = await self.db.execute(stmt)
-        return result.scalars().all()
+        return result.scalars().all(), None
 
     @handle_exceptions()
     async def get_client(self, client_id: UUID) -> ClientBrokerOut | None:
         """
         Get full client info including broker/worker/credits.
         """
-        stmt = (
-            select(Client)
-            .where(Client.id == client_id)
-        )
+        stmt = CLIENT_BROKER.apply(select(Client).where(Client.id == client_id), self._dialect())
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -133,7 +166,10 @@ class BrokerDashboard:
             .values(broker_id=broker_id, taken_at_broker=datetime.utcnow())
             .execution_options(synchronize_session=False)
         )
+        owners = await client_owners(self.db, client_id)
         await self.db.execute(stmt)
+        # дашборди воркерів від broker_id не залежать — скоуп лише по брокерах
+        notify_change(self.db, CLIENTS, worker_ids=[], broker_ids=[owners.broker_id, broker_id])
         await self.db.commit()
 
     @handle_exceptions()
@@ -147,7 +183,9 @@ class BrokerDashboard:
             .values(broker_id=None, taken_at_broker=None)
             .execution_options(synchronize_session=False)
         )
+        owners = await client_owners(self.db, client_id)
         await self.db.execute(stmt)
+        notify_change(self.db, CLIENTS, worker_ids=[], broker_ids=[owners.broker_id])
         await self.db.commit()
 
     @handle_exceptions()
@@ -157,11 +195,14 @@ class BrokerDashboard:
         """
         credit = Credit(client_id=client_id, broker_id=broker_id, amount=amount)
         self.db.add(credit)
+        await self.db.flush()
+        await CreditRollupService(self.db).apply(None, rollup_key(credit))
         await self.db.commit()
         await self.db.refresh(credit)
         return credit
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CLIENTS,))
     async def get_sum_today_new_clients(self, broker_id: UUID) -> int:
         today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0
                                                 )
@@ -177,6 +218,7 @@ class BrokerDashboard:
         return result.scalar_one()
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CLIENTS,))
     async def get_sum_yesterday_new_clients(self, broker_id: UUID) -> int:
         now = datetime.utcnow()
         yesterday_start = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
@@ -209,6 +251,7 @@ class BrokerDashboard:
         return [BrokerClientNewToday.model_validate(c) for c in result.scalars().all()]
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CLIENTS,), wide_topics=(CREDITS,))
     async def get_sum_broker_commissions(self, broker_id: UUID) -> float:
         """
         Return total sum of worker commissions for this broker's clients.
@@ -222,6 +265,7 @@ class BrokerDashboard:
         return result.scalar_one() or 0.0
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CLIENTS,), wide_topics=(CREDITS,))
     async def get_month_broker_commissions(self, broker_id: UUID) -> float:
         """
         Return sum of broker commissions for this month, for this broker's clients.
@@ -242,6 +286,7 @@ class BrokerDashboard:
         return result.scalar_one() or 0.0
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CREDITS,))
     async def get_sum_active_credits(self, broker_id: UUID) -> int:
         """
         Sum active credits (status='active') assigned to the broker.
@@ -254,6 +299,7 @@ class BrokerDashboard:
         return result.scalar_one() or 0.0
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CREDITS,))
     async def get_sum_completed_credits(self, broker_id: UUID) -> int:
         """
         Sum completed credits (status='completed') assigned to the broker.
@@ -266,6 +312,7 @@ class BrokerDashboard:
         return result.scalar_one() or 0.0
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CREDITS,))
     async def get_credits_for_month(self, broker_id: UUID, month: str) -> list[dict[str, Any]]:
         """
         Return earnings per day for a specific month (YYYY-MM).
@@ -280,19 +327,8 @@ class BrokerDashboard:
         except Exception:
             raise ValueError("Invalid month format. Expected YYYY-MM.")
 
-        # Fetch all earnings in that month
-        stmt = (
-            select(func.date(Credit.issued_at), func.sum(Credit.amount))
-            .where(
-                Credit.broker_id == broker_id,
-                Credit.issued_at >= start_date,
-                Credit.issued_at < end_date,
-            )
-            .group_by(Credit.issued_at)
-        )
-
-        result = await self.db.execute(stmt)
-        credits_map = {row[0]: float(row[1]) for row in result.all()}
+        # Daily buckets from credit_daily_rollup
+        credits_map = await CreditRollupService(self.db).daily_totals(start_date, end_date, broker_id=broker_id)
 
         # Fill all days with 0 if missing
         total_days = (end_date - start_date).days
@@ -308,6 +344,7 @@ class BrokerDashboard:
         return earnings_per_day
 
     @handle_exceptions()
+    @cached(PermissionRole.BROKER, entity="broker_id", topics=(CREDITS,))
     async def get_credits_for_year(self, broker_id: UUID, year: int) -> list[dict[str, Any]]:
         """
         Return earnings per month for a specific year.
@@ -316,25 +353,7 @@ class BrokerDashboard:
         if year < 1900:
             raise ValueError("Invalid year format. Must be 4 digits, e.g. 2025")
 
-        start_date = date(year, 1, 1)
-        end_date = date(year + 1, 1, 1)
-
-        stmt = (
-            select(
-                extract("month", Credit.issued_at).label("month"),
-                func.sum(Credit.amount)
-            )
-            .where(
-                Credit.broker_id == broker_id,
-                Credit.issued_at >= start_date,
-                Credit.issued_at < end_date
-            )
-            .group_by("month")
-            .order_by("month")
-        )
-
-        result = await self.db.execute(stmt)
-        credits_map = {int(row[0]): float(row[1]) for row in result.all()}
+        credits_map = await CreditRollupService(self.db).monthly_totals(year, broker_id=broker_id)
 
         earnings_per_month = []
         for month in range(1, 13):
@@ -382,20 +401,16 @@ class BrokerDashboard:
         data_stmt = (
             select(Client)
             .where(where_clause)
-            .options(
-                selectinload(Client.worker),
-                selectinload(Client.broker),
-                selectinload(Client.credits),
-            )
             .order_by(Client.full_name.asc())
             .offset(skip)
             .limit(limit)
         )
+        data_stmt = CLIENT_BROKER.apply(data_stmt, self._dialect())
 
         data_res = await self.db.execute(data_stmt)
         clients: Sequence[Client] = data_res.scalars().all()
 
         return (
-            [ClientBrokerOut.model_validate(c) for c in clients],
+            [CLIENT_BROKER.out(c) for c in clients],
             total,
         )
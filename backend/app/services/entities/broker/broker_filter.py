@@ -1,5 +1,4 @@
-from sqlalchemy import select, literal
-from sqlalchemy.sql import Select
+from sqlalchemy import exists, func, literal, literal_column, select
 from datetime import datetime
 
 from app.models import Broker
@@ -20,6 +19,7 @@ class BrokerFilterService(UserFilterService):
         - by_display_name(name): Filter by partial Telegram username.
         - by_region(region): Filter brokers that operate in a specific region.
         - by_exact_region_list(regions): Match brokers with exact region list.
+        - search_region(region): Brokers with a region matching the substring.
         - by_role(role): Filter brokers by role (default: BROKER).
         - by_is_deleted(is_deleted): Filter by soft-deletion status.
         - by_created_after(dt): Filter brokers created after given datetime.
@@ -28,9 +28,7 @@ class BrokerFilterService(UserFilterService):
         - apply(): Finalize and return the composed SQLAlchemy Select query.
     """
 
-    def __init__(self):
-        """Initialize the filter service with a base SELECT query."""
-        self.query: Select = select(Broker)
+    model = Broker
 
     def by_email(self, email: str):
         """
@@ -39,8 +37,7 @@ class BrokerFilterService(UserFilterService):
         :param email: Email fragment to search for.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Broker.email.ilike(f"%{email}%"))
-        return self
+        return self.where(Broker.email.ilike(f"%{email}%"))
 
     def by_company_name(self, company: str):
         """
@@ -49,8 +46,7 @@ class BrokerFilterService(UserFilterService):
         :param company: Company name fragment.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Broker.company_name.ilike(f"%{company}%"))
-        return self
+        return self.where(Broker.company_name.ilike(f"%{company}%"))
 
     def by_region(self, region: str):
         """
@@ -59,8 +55,21 @@ class BrokerFilterService(UserFilterService):
         :param region: Region name to match.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Broker.region.any(literal(region)))
-        return self
+        return self.where(Broker.region.any(literal(region)))
+
+    def search_region(self, region: str):
+        """
+        Filter brokers that have a region containing `region` (case-insensitive).
+
+        :param region: Region name fragment.
+        :return: Self (chainable).
+        """
+        region_item = func.unnest(Broker.region).alias("region_item")
+        return self.where(exists(
+            select(literal_column("1"))
+            .select_from(region_item)
+            .where(literal_column("region_item").ilike(f"%{region}%"))
+        ))
 
     def by_exact_region_list(self, regions: list[str]):
         """
@@ -69,8 +78,7 @@ class BrokerFilterService(UserFilterService):
         :param regions: List of region names.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Broker.region == regions)
-        return self
+        return self.where(Broker.region == regions)
 
     def by_role(self, role: PermissionRole = PermissionRole.BROKER):
         """
@@ -79,8 +87,7 @@ class BrokerFilterService(UserFilterService):
         :param role: PermissionRole enum value.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Broker.role == role)
-        return self
+        return self.where(Broker.role == role)
 
     def by_is_deleted(self, is_deleted: bool = False):
         """
@@ -89,8 +96,7 @@ class BrokerFilterService(UserFilterService):
         :param is_deleted: Boolean indicating if broker is marked as deleted.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Broker.is_deleted == is_deleted)
-        return self
+        return self.where(Broker.is_deleted.is_(is_deleted))
 
     def by_created_after(self, dt: datetime):
         """
@@ -99,8 +105,7 @@ class BrokerFilterService(UserFilterService):
         :param dt: Datetime to filter from.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Broker.created_at >= dt)
-        return self
+        return self.where(Broker.created_at >= dt)
 
     def by_created_before(self, dt: datetime):
         """
@@ -109,8 +114,7 @@ class BrokerFilterService(UserFilterService):
         :param dt: Datetime to filter before.
         :return: Self (chainable).
         """
-        self.query = self.query.where(Broker.created_at <= dt)
-        return self
+        return self.where(Broker.created_at <= dt)
 
     def search_email_or_company_name(self, text: str):
         """
@@ -120,15 +124,6 @@ class BrokerFilterService(UserFilterService):
         :return: Self (chainable).
         """
         like = f"%{text}%"
-        self.query = self.query.where(
+        return self.where(
             (Broker.email.ilike(like)) | (Broker.company_name.ilike(like))
         )
-        return self
-
-    def apply(self) -> Select:
-        """
-        Finalize and return the filtered SQLAlchemy Select query.
-
-        :return: A Select query for async execution.
-        """
-        return self.query
@@ -11,6 +11,7 @@ from app.services.auth import PasswordService
 from app.services.entities import UserService
 from app.utils.decorators import handle_exceptions
 from app.schemas.entities.broker_schema import BrokerSchema
+from app.services.live.change_bus import CLIENTS, USERS, notify_change
 
 BrokerT = TypeVar("BrokerT", bound=Broker)
 
@@ -51,9 +52,10 @@ class BrokerService(UserService):
     @handle_exceptions()
     async def create(self, broker_data: BrokerSchema.Create) -> BrokerT:
         updated_data = broker_data.model_dump()
-        updated_data["password_hash"] = PasswordService.hash(updated_data.pop("password"))
+        updated_data["password_hash"] = await PasswordService.hash(updated_data.pop("password"))
         broker = Broker(**updated_data)
         self.db.add(broker)
+        notify_change(self.db, USERS)
         await self.db.commit()
         await self.db.refresh(broker)
         return cast(BrokerT, broker)
@@ -71,6 +73,7 @@ class BrokerService(UserService):
     async def delete(self, broker_id: UUID) -> BrokerT:
         broker = await self.get_by_id(broker_id)
         await self.db.delete(broker)
+        notify_change(self.db, USERS, CLIENTS)
         await self.db.commit()
         return cast(BrokerT, broker)
 
@@ -89,6 +92,7 @@ class BrokerService(UserService):
         client = result.scalar_one_or_none()
         if client:
             client.broker_id = None
+            notify_change(self.db, CLIENTS)
             await self.db.commit()
             await self.db.refresh(client)
         return client
@@ -101,6 +105,7 @@ class BrokerService(UserService):
         client = result.scalar_one_or_none()
         if client:
             client.broker_id = new_broker_id
+            notify_change(self.db, CLIENTS)
             await self.db.commit()
             await self.db.refresh(client)
         return client
@@ -131,4 +136,5 @@ class BrokerService(UserService):
         await self.db.execute(
             update(Client).where(Client.id.in_(client_ids)).values(broker_id=broker_id)
         )
+        notify_change(self.db, CLIENTS)
         await self.db.commit()
@@ -2,10 +2,14 @@ from .client_utils import ClientUtilService
 from .client_service import ClientService
 from .client_filter import ClientFilterService
 from .client_interface import ClientInterfaceService
+from .client_import import ClientImportService
+from .client_assignment import ClientAssignmentService
 
 __all__ = [
     "ClientUtilService",
     "ClientService",
     "ClientFilterService",
     "ClientInterfaceService",
+    "ClientImportService",
+    "ClientAssignmentService",
 ]
\ No newline at end of file
@@ -0,0 +1,203 @@
+import heapq
+from collections import Counter
+from datetime import datetime
+from typing import Any, Iterator, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import case, column, func, literal, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import CLIENT_ASSIGN_BATCH_SIZE
+from app.models import Client, Worker
+from app.schemas.entities.client_schema import AssignStrategy, ClientAssignReport, WorkerLoad
+from app.services.live.change_bus import CLIENTS, notify_change
+from app.utils.decorators import handle_exceptions
+
+_CLIENTS = Client.__table__
+_UUID = _CLIENTS.c.id.type
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def plan_assignment(
+    client_ids: Sequence[UUID],
+    loads: dict[UUID, int],
+    strategy: AssignStrategy = "least_loaded",
+) -> list[tuple[UUID, UUID]]:
+    """
+    Розподіл клієнтів між воркерами → [(client_id, worker_id)].
+
+    round_robin  — по колу, починаючи з найменш завантаженого;
+    least_loaded — кожен наступний клієнт іде воркеру з найменшим поточним навантаженням
+                   (при рівності — у порядку `loads`), тобто навантаження вирівнюється.
+    """
+    if strategy == "round_robin":
+        order = sorted(loads, key=loads.__getitem__)
+        return [(client_id, order[i % len(order)]) for i, client_id in enumerate(client_ids)]
+
+    heap = [(load, i, worker_id) for i, (worker_id, load) in enumerate(loads.items())]
+    heapq.heapify(heap)
+    plan = []
+    for client_id in client_ids:
+        load, i, worker_id = heap[0]
+        plan.append((client_id, worker_id))
+        heapq.heapreplace(heap, (load + 1, i, worker_id))
+    return plan
+
+
+class ClientAssignmentService:
+    """
+    Bulk assign / reassign / unassign of clients to workers.
+
+    • План розподілу рахується в Python з поточного навантаження воркерів (один GROUP BY),
+      а застосовується одним UPDATE … FROM (VALUES (client_id, worker_id), …) на пачку
+      до `batch_size` рядків (на PostgreSQL; інакше — UPDATE … SET worker_id = CASE id …).
+    • Оновлюються лише клієнти, чий воркер справді змінюється: у тих, кого план лишив
+      у того самого воркера, taken_at_worker (і стрічка активності) не чіпаються.
+    • taken_at_worker — один і той самий момент для всієї операції; один commit.
+    • Звіт містить підсумкове навантаження кожного цільового воркера.
+    """
+
+    def __init__(self, db: AsyncSession, batch_size: int = CLIENT_ASSIGN_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+
+    @handle_exceptions()
+    async def distribute(
+        self,
+        client_ids: Sequence[UUID],
+        worker_ids: Optional[Sequence[UUID]] = None,
+        strategy: AssignStrategy = "least_loaded",
+    ) -> ClientAssignReport:
+        """Розподілити клієнтів між `worker_ids` (None → усі активні воркери)."""
+        client_ids = list(dict.fromkeys(client_ids))
+        owners = []
+        for chunk in _chunks(client_ids, self.batch_size):
+            owners += await self._owners(Client.id.in_(chunk))
+        found = {row.id for row in owners}
+        missing = [client_id for client_id in client_ids if client_id not in found]
+
+        report = await self._assign(owners, await self._targets(worker_ids), strategy)
+        report.missing = missing
+        return report
+
+    @handle_exceptions()
+    async def release_worker(
+        self,
+        worker_id: UUID,
+        worker_ids: Optional[Sequence[UUID]] = None,
+        strategy: AssignStrategy = "least_loaded",
+    ) -> ClientAssignReport:
+        """Передати всіх клієнтів воркера іншим (напр. коли воркер звільняється)."""
+        owners = await self._owners(Client.worker_id == worker_id)
+        return await self._assign(owners, await self._targets(worker_ids, exclude=worker_id), strategy)
+
+    @handle_exceptions()
+    async def unassign(self, client_ids: Sequence[UUID]) -> int:
+        """Відв'язати клієнтів від воркерів; повертає кількість відв'язаних."""
+        client_ids = list(dict.fromkeys(client_ids))
+        owners = []
+        for chunk in _chunks(client_ids, self.batch_size):
+            owners += await self._owners(Client.id.in_(chunk), Client.worker_id.is_not(None))
+        if not owners:
+            return 0
+
+        ids = [row.id for row in owners]
+        for chunk in _chunks(ids, self.batch_size):
+            await self.db.execute(
+                update(_CLIENTS).where(_CLIENTS.c.id.in_(chunk)).values(worker_id=None, taken_at_worker=None)
+            )
+        notify_change(
+            self.db, CLIENTS,
+            worker_ids={row.worker_id for row in owners},
+            broker_ids={row.broker_id for row in owners},
+        )
+        await self.db.commit()
+        return len(owners)
+
+    # ───────────── helpers ─────────────
+    async def _owners(self, *where) -> list:
+        """(id, worker_id, broker_id) активних клієнтів — до зміни, для плану й інвалідації."""
+        rows = await self.db.execute(
+            select(Client.id, Client.worker_id, Client.broker_id).where(Client.is_deleted.is_(False), *where)
+        )
+        return list(rows.all())
+
+    async def _targets(self, worker_ids: Optional[Sequence[UUID]], exclude: Optional[UUID] = None) -> dict[UUID, int]:
+        """Активні цільові воркери → кількість їхніх активних клієнтів (у порядку worker_ids)."""
+        stmt = select(Worker.id).where(Worker.is_active.is_(True), Worker.is_deleted.is_(False))
+        if exclude is not None:
+            stmt = stmt.where(Worker.id != exclude)
+        if worker_ids is not None:
+            worker_ids = [w for w in dict.fromkeys(worker_ids) if w != exclude]
+            found = set((await self.db.execute(stmt.where(Worker.id.in_(worker_ids)))).scalars())
+            unknown = [str(w) for w in worker_ids if w not in found]
+            if unknown:
+                raise HTTPException(status.HTTP_404_NOT_FOUND, detail=f"Workers not found or inactive: {unknown}")
+            targets = worker_ids
+        else:
+            targets = list((await self.db.execute(stmt.order_by(Worker.created_at, Worker.id))).scalars())
+        if not targets:
+            raise HTTPException(status.HTTP_409_CONFLICT, detail="No active workers to assign clients to")
+        return await self._loads(targets)
+
+    async def _loads(self, worker_ids: Sequence[UUID]) -> dict[UUID, int]:
+        loads = dict.fromkeys(worker_ids, 0)
+        rows = await self.db.execute(
+            select(Client.worker_id, func.count())
+            .where(Client.worker_id.in_(worker_ids), Client.is_deleted.is_(False))
+            .group_by(Client.worker_id)
+        )
+        loads.update(rows.tuples().all())
+        return loads
+
+    async def _assign(self, owners: list, loads: dict[UUID, int], strategy: AssignStrategy) -> ClientAssignReport:
+        # клієнти, що вже в когось із цільових воркерів, теж перерозподіляються
+        remaining = dict(loads)
+        for row in owners:
+            if row.worker_id in remaining:
+                remaining[row.worker_id] -= 1
+        plan = plan_assignment([row.id for row in owners], remaining, strategy)
+        current = {row.id: row for row in owners}
+        changes = [(client_id, worker_id) for client_id, worker_id in plan if current[client_id].worker_id != worker_id]
+        if changes:
+            now = datetime.utcnow()
+            for chunk in _chunks(changes, self.batch_size):
+                await self._update(chunk, now)
+            moved = [current[client_id] for client_id, _ in changes]
+            notify_change(
+                self.db, CLIENTS,
+                worker_ids={row.worker_id for row in moved} | {worker_id for _, worker_id in changes},
+                broker_ids={row.broker_id for row in moved},
+            )
+            loads = await self._loads(list(loads))
+            await self.db.commit()
+
+        assigned = Counter(worker_id for _, worker_id in changes)
+        return ClientAssignReport(
+            assigned=len(changes),
+            unchanged=len(plan) - len(changes),
+            workers=[WorkerLoad(worker_id=w, assigned=assigned[w], load=load) for w, load in loads.items()],
+        )
+
+    async def _update(self, plan: Sequence[tuple[UUID, UUID]], now: datetime) -> None:
+        conn = await self.db.connection()
+        if conn.dialect.name == "postgresql":
+            rows = values(column("client_id", _UUID), column("worker_id", _UUID), name="assignment").data(plan)
+            stmt = (
+                update(_CLIENTS)
+                .where(_CLIENTS.c.id == rows.c.client_id)
+                .values(worker_id=rows.c.worker_id, taken_at_worker=now)
+            )
+        else:
+            worker_by_client = {client_id: literal(worker_id, _UUID) for client_id, worker_id in plan}
+            stmt = (
+                update(_CLIENTS)
+                .where(_CLIENTS.c.id.in_(list(worker_by_client)))
+                .values(worker_id=case(worker_by_client, value=_CLIENTS.c.id), taken_at_worker=now)
+            )
+        await conn.execute(stmt)
@@ -1,5 +1,3 @@
-from sqlalchemy import select
-from sqlalchemy.sql import Select
 from app.models import Client
 from app.services.entities.user import UserFilterService
 
@@ -12,6 +10,7 @@ class ClientFilterService(UserFilterService):
     Select query (to be executed via AsyncSession).
 
     Filters include:
+    - By email / phone number / full name (partial match)
     - By worker assignment
     - By soft-delete status
     - By credit activity
@@ -30,34 +29,34 @@ class ClientFilterService(UserFilterService):
         clients = result.scalars().all()
     """
 
-    def __init__(self):
-        super().__init__()
-        """Initialize with base SELECT query."""
-        self.query: Select = select(Client)
+    model = Client
+
+    def by_email(self, email: str):
+        """Filter clients by email substring (case-insensitive)."""
+        return self.where(Client.email.ilike(f"%{email}%"))
+
+    def by_phone_number(self, phone_number: str):
+        """Filter clients by phone number substring."""
+        return self.where(Client.phone_number.ilike(f"%{phone_number}%"))
+
+    def by_full_name(self, full_name: str):
+        """Filter clients by full name substring (case-insensitive)."""
+        return self.where(Client.full_name.ilike(f"%{full_name}%"))
 
     def by_worker(self, worker_id: int):
         """Filter clients by assigned worker."""
-        self.query = self.query.where(Client.worker_id == worker_id)
-        return self
+        return self.where(Client.worker_id == worker_id)
 
     def by_status(self, is_deleted: bool):
         """Filter clients by deletion status."""
-        self.query = self.query.where(Client.is_deleted == is_deleted)
-        return self
+        return self.where(Client.is_deleted.is_(is_deleted))
 
     def by_credit_status(self, has_active_credit: bool):
         """Filter clients by active credit status."""
         if has_active_credit:
-            self.query = self.query.where(Client.active_credit > 0)
-        else:
-            self.query = self.query.where(Client.active_credit == 0)
-        return self
+            return self.where(Client.active_credit > 0)
+        return self.where(Client.active_credit == 0)
 
     def by_income_range(self, min_income: int, max_income: int):
         """Filter clients by income range."""
-        self.query = self.query.where(Client.income.between(min_income, max_income))
-        return self
-
-    def apply(self) -> Select:
-        """Finalize and return the built Select query."""
-        return self.query
+        return self.where(Client.income.between(min_income, max_income))
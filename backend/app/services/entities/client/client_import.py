@@ -0,0 +1,379 @@
+import codecs
+import csv
+import re
+import uuid
+from datetime import datetime
+from typing import AsyncIterator, Iterable, Optional
+
+import orjson
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert, literal, select, union_all, cast, String
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import (
+    CLIENT_IMPORT_BCRYPT_ROUNDS,
+    CLIENT_IMPORT_CHUNK_SIZE,
+    CLIENT_IMPORT_HASH_WORKERS,
+    CLIENT_IMPORT_MAX_ERRORS,
+)
+from app.models import Broker, Client, User, Worker
+from app.permissions.enums import PermissionRole
+from app.schemas.entities.client_schema import ClientCreate, ClientImportError, ClientImportReport
+from app.services.auth.hashing import PasswordHasher
+from app.services.live.change_bus import CLIENTS, USERS, notify_change
+from app.utils.decorators import handle_exceptions
+
+# окремий пул: імпорт на 100k рядків не повинен стояти в черзі перед логінами
+import_hasher = PasswordHasher(workers=CLIENT_IMPORT_HASH_WORKERS)
+
+# ті самі інваріанти, що й CHECK-и таблиці clients — рядок відхиляється до вставки,
+# а не валить всю пачку
+_PHONE_RE = re.compile(r"^\+?[1-9]\d{7,14}$")
+
+_USER_COLUMNS = ("id", "role", "is_active", "is_deleted", "email", "password_hash")
+_CLIENT_COLUMNS = tuple(c.name for c in Client.__table__.columns if c.computed is None)
+_CLIENT_DEFAULTS = {"active_credit": 0}
+
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/jsonlines": "ndjson",
+}
+
+
+def import_format(content_type: Optional[str]) -> str:
+    """csv | ndjson за Content-Type запиту; інакше 415."""
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    try:
+        return IMPORT_CONTENT_TYPES[media_type]
+    except KeyError:
+        raise HTTPException(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Expected text/csv or application/x-ndjson body",
+        ) from None
+
+
+# ───────────── streamed parsing ─────────────
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Байтовий потік → рядки (з '\\n'); UTF-8 з BOM або без."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail = ""
+    try:
+        async for chunk in chunks:
+            parts = (tail + decoder.decode(chunk)).split("\n")
+            tail = parts.pop()
+            for part in parts:
+                yield part + "\n"
+        tail += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, detail="File must be UTF-8 encoded") from None
+    if tail:
+        yield tail
+
+
+async def _csv_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, Optional[dict], Optional[str]]]:
+    """
+    (номер рядка, запис, помилка). Перший рядок — заголовок; роздільник «,» або «;»
+    (експорт Excel). Поле в лапках може займати кілька рядків файлу.
+    """
+    header: Optional[list[str]] = None
+    dialect = None
+    buf: list[str] = []
+    quotes = start = lineno = 0
+    async for line in lines:
+        lineno += 1
+        if not buf:
+            if not line.strip():
+                continue
+            start = lineno
+        buf.append(line)
+        quotes += line.count('"')
+        if quotes % 2:  # лапки не закриті — запис продовжується на наступному рядку
+            continue
+        if header is None:
+            delimiter = ";" if buf[0].count(";") > buf[0].count(",") else ","
+            dialect = {"delimiter": delimiter}
+        values = next(csv.reader(buf, **dialect), [])
+        buf, quotes = [], 0
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        # порожня клітинка = поле не задане (Optional → None, обов'язкове → помилка)
+        yield start, {k: v.strip() for k, v in zip(header, values) if v.strip()}, None
+    if buf:
+        yield start, None, "Unterminated quoted field"
+
+
+async def _ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, Optional[dict], Optional[str]]]:
+    lineno = 0
+    async for line in lines:
+        lineno += 1
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as exc:
+            yield lineno, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield lineno, None, "Expected a JSON object"
+            continue
+        yield lineno, record, None
+
+
+_PARSERS = {"csv": _csv_records, "ndjson": _ndjson_records}
+
+
+class ClientImportService:
+    """
+    Bulk client import from a streamed CSV / NDJSON body.
+
+    • Файл читається потоком і обробляється пачками по `chunk_size` рядків — пам'ять
+      не залежить від розміру файлу.
+    • Кожен рядок валідується ClientSchema.Create (+ CHECK-інваріанти таблиці clients);
+      помилки потрапляють у звіт з номером рядка файлу, решта пачки імпортується.
+    • Дублікати: email / телефон, що вже є в БД (один запит на пачку), або повтор
+      у самому файлі — рядок пропускається. Тож повторне завантаження того самого
+      файлу безпечне: імпортуються лише нові рядки. Якщо вставку все ж відхилив
+      конкурентний запис, пачка перевіряється ще раз і вставляється без нього.
+    • worker_id / broker_id з файлу → taken_at_worker / taken_at_broker = час імпорту.
+    • Паролі хешуються паралельно в окремому пулі bcrypt з `rounds`
+      (CLIENT_IMPORT_BCRYPT_ROUNDS) — хеш оновиться до поточних параметрів при
+      першому логіні клієнта.
+    • Вставка: COPY у users + clients на PostgreSQL (asyncpg), інакше — executemany;
+      одна коротка транзакція на пачку, транзакція не тримається під час хешування.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        chunk_size: int = CLIENT_IMPORT_CHUNK_SIZE,
+        max_errors: int = CLIENT_IMPORT_MAX_ERRORS,
+        hasher: PasswordHasher = import_hasher,
+        rounds: Optional[int] = CLIENT_IMPORT_BCRYPT_ROUNDS,
+    ):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.hasher = hasher
+        self.rounds = rounds
+
+    def _reject(self, report: ClientImportReport, row: int, field: Optional[str], message: str) -> None:
+        if len(report.errors) < self.max_errors:
+            report.errors.append(ClientImportError(row=row, field=field, message=message))
+        else:
+            report.errors_truncated = True
+
+    @handle_exceptions()
+    async def import_stream(self, chunks: AsyncIterator[bytes], fmt: str) -> ClientImportReport:
+        """
+        :param chunks: тіло запиту (напр. `request.stream()`).
+        :param fmt: "csv" | "ndjson".
+        """
+        report = ClientImportReport(total=0, imported=0, duplicates=0, failed=0)
+        seen_emails: set[str] = set()
+        seen_phones: set[str] = set()
+        batch: list[tuple[int, ClientCreate]] = []
+
+        async for row, record, error in _PARSERS[fmt](_lines(chunks)):
+            report.total += 1
+            if error is not None:
+                report.failed += 1
+                self._reject(report, row, None, error)
+                continue
+            client = self._validate(report, row, record)
+            if client is None:
+                continue
+            batch.append((row, client))
+            if len(batch) >= self.chunk_size:
+                await self._import_chunk(report, batch, seen_emails, seen_phones)
+                batch = []
+        if batch:
+            await self._import_chunk(report, batch, seen_emails, seen_phones)
+
+        report.errors.sort(key=lambda e: e.row)
+        return report
+
+    def _validate(self, report: ClientImportReport, row: int, record: dict) -> Optional[ClientCreate]:
+        try:
+            client = ClientCreate.model_validate(record)
+        except ValidationError as exc:
+            report.failed += 1
+            for err in exc.errors(include_url=False):
+                self._reject(report, row, ".".join(map(str, err["loc"])) or None, err["msg"])
+            return None
+        if not client.full_name.strip():
+            field, message = "full_name", "Full name must not be blank"
+        elif not _PHONE_RE.match(client.phone_number):
+            field, message = "phone_number", "Phone number must be in E.164 format, e.g. +380931234567"
+        else:
+            return client
+        report.failed += 1
+        self._reject(report, row, field, message)
+        return None
+
+    async def _existing(self, batch: list[tuple[int, ClientCreate]]) -> dict[str, set[str]]:
+        """Які email / телефони / worker_id / broker_id з пачки вже є в БД — одним запитом."""
+        emails = {c.email for _, c in batch}
+        phones = {c.phone_number for _, c in batch}
+        worker_ids = {c.worker_id for _, c in batch if c.worker_id}
+        broker_ids = {c.broker_id for _, c in batch if c.broker_id}
+
+        parts = [
+            select(literal("email").label("kind"), User.email.label("value")).where(User.email.in_(emails)),
+            select(literal("phone"), Client.phone_number).where(Client.phone_number.in_(phones)),
+        ]
+        if worker_ids:
+            parts.append(select(literal("worker"), cast(Worker.id, String)).where(Worker.id.in_(worker_ids)))
+        if broker_ids:
+            parts.append(select(literal("broker"), cast(Broker.id, String)).where(Broker.id.in_(broker_ids)))
+
+        found: dict[str, set[str]] = {"email": set(), "phone": set(), "worker": set(), "broker": set()}
+        for kind, value in (await self.db.execute(union_all(*parts))).all():
+            found[kind].add(value)
+        await self.db.rollback()  # не тримати транзакцію, поки хешуються паролі
+        return found
+
+    @staticmethod
+    def _conflict(
+        client: ClientCreate,
+        found: dict[str, set[str]],
+        seen_emails: set[str],
+        seen_phones: set[str],
+    ) -> Optional[tuple[bool, str, str]]:
+        """(дублікат?, поле, повідомлення), якщо рядок не можна вставити; None — можна."""
+        if client.email in found["email"] or client.email in seen_emails:
+            return True, "email", ("User with this email already exists" if client.email in found["email"]
+                                   else "Duplicate email, already imported from an earlier row")
+        if client.phone_number in found["phone"] or client.phone_number in seen_phones:
+            return True, "phone_number", ("Client with this phone number already exists"
+                                          if client.phone_number in found["phone"]
+                                          else "Duplicate phone number, already imported from an earlier row")
+        if client.worker_id and str(client.worker_id) not in found["worker"]:
+            return False, "worker_id", "Worker not found"
+        if client.broker_id and str(client.broker_id) not in found["broker"]:
+            return False, "broker_id", "Broker not found"
+        return None
+
+    def _count_conflict(self, report: ClientImportReport, row: int, conflict: tuple[bool, str, str]) -> None:
+        duplicate, field, message = conflict
+        if duplicate:
+            report.duplicates += 1
+        else:
+            report.failed += 1
+        self._reject(report, row, field, message)
+
+    async def _import_chunk(
+        self,
+        report: ClientImportReport,
+        batch: list[tuple[int, ClientCreate]],
+        seen_emails: set[str],
+        seen_phones: set[str],
+    ) -> None:
+        found = await self._existing(batch)
+
+        accepted: list[tuple[int, ClientCreate]] = []
+        for row, client in batch:
+            conflict = self._conflict(client, found, seen_emails, seen_phones)
+            if conflict is not None:
+                self._count_conflict(report, row, conflict)
+            else:
+                accepted.append((row, client))
+            seen_emails.add(client.email)
+            seen_phones.add(client.phone_number)
+        if not accepted:
+            return
+
+        hashes = await self.hasher.hash_many([c.password for _, c in accepted], rounds=self.rounds)
+
+        # (рядок файлу, клієнт, запис users, запис clients)
+        pending: list[tuple[int, ClientCreate, dict, dict]] = []
+        now = datetime.utcnow()
+        for (row, client), password_hash in zip(accepted, hashes):
+            user_id = uuid.uuid4()
+            data = client.model_dump(exclude={"password"})
+            user = {
+                "id": user_id,
+                "role": PermissionRole.CLIENT,
+                "is_active": True,
+                "is_deleted": False,
+                "email": data["email"],
+                "password_hash": password_hash,
+            }
+            record = {
+                **_CLIENT_DEFAULTS,
+                **data,
+                "id": user_id,
+                # момент призначення — час імпорту (як при ручному призначенні)
+                "taken_at_worker": now if data.get("worker_id") else None,
+                "taken_at_broker": now if data.get("broker_id") else None,
+            }
+            pending.append((row, client, user, {column: record.get(column) for column in _CLIENT_COLUMNS}))
+
+        while pending:
+            error = await self._insert([p[2] for p in pending], [p[3] for p in pending])
+            if error is None:
+                notify_change(self.db, USERS, CLIENTS)
+                await self.db.commit()
+                report.imported += len(pending)
+                return
+            await self.db.rollback()
+
+            # конкурентний запис (той самий email / телефон з іншого запиту, видалений воркер):
+            # перевірити пачку ще раз і повторити без рядків, що тепер конфліктують
+            found = await self._existing([(row, client) for row, client, _, _ in pending])
+            retry = []
+            for item in pending:
+                conflict = self._conflict(item[1], found, set(), set())
+                if conflict is not None:
+                    self._count_conflict(report, item[0], conflict)
+                else:
+                    retry.append(item)
+            if len(retry) == len(pending):  # помилку не пояснює жоден рядок — відхиляється вся пачка
+                report.failed += len(pending)
+                for row, *_ in pending:
+                    self._reject(report, row, None, f"Rejected by the database: {error}")
+                return
+            pending = retry
+
+    async def _insert(self, users: list[dict], clients: list[dict]) -> Optional[str]:
+        """Вставка пачки; повертає текст помилки БД (конкурентний дубль тощо) або None."""
+        conn = await self.db.connection()
+        if conn.dialect.driver == "asyncpg":
+            import asyncpg
+
+            raw = (await conn.get_raw_connection()).driver_connection
+            try:
+                # transaction(): якщо SQLAlchemy вже відкрив транзакцію — це savepoint у ній
+                async with raw.transaction():
+                    await raw.copy_records_to_table(
+                        User.__tablename__, columns=_USER_COLUMNS,
+                        records=_records(users, _USER_COLUMNS, role=PermissionRole.CLIENT.name),
+                    )
+                    await raw.copy_records_to_table(
+                        Client.__tablename__, columns=_CLIENT_COLUMNS,
+                        records=_records(clients, _CLIENT_COLUMNS),
+                    )
+            except asyncpg.IntegrityConstraintViolationError as exc:
+                return str(exc)
+            return None
+        try:
+            await conn.execute(insert(User.__table__), users)
+            await conn.execute(insert(Client.__table__), clients)
+        except IntegrityError as exc:
+            return str(exc.orig)
+        return None
+
+
+def _records(rows: list[dict], columns: Iterable[str], **overrides) -> list[tuple]:
+    columns = tuple(columns)
+    return [tuple(overrides.get(c, row[c]) for c in columns) for row in rows]
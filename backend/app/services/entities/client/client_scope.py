@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Client
+
+
+class ClientOwners(NamedTuple):
+    worker_id: Optional[UUID] = None
+    broker_id: Optional[UUID] = None
+
+
+async def client_owners(db: AsyncSession, client_id: UUID) -> ClientOwners:
+    """
+    Поточні (worker_id, broker_id) клієнта — читаються ДО зміни призначення,
+    щоб notify_change зачепив і старого, і нового власника (кеш / live-метрики),
+    а не всі дашборди ролі.
+    """
+    row = (await db.execute(
+        select(Client.worker_id, Client.broker_id).where(Client.id == client_id)
+    )).one_or_none()
+    return ClientOwners(*row) if row is not None else ClientOwners()
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Sequence, cast, TypeVar, Type
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,6 +10,7 @@ from app.services.auth import PasswordService
 from app.services.entities import UserService
 from app.utils.decorators import handle_exceptions
 from app.schemas.entities.client_schema import ClientSchema
+from app.services.live.change_bus import CLIENTS, USERS, notify_change
 
 ClientT = TypeVar("ClientT", bound=Client)
 
@@ -138,9 +140,12 @@ class ClientService(UserService):
         Create a new Client user. Hashes the password before saving.
         """
         updated_client_data = client_data.model_dump()
-        updated_client_data["password_hash"] = PasswordService.hash(updated_client_data.pop("password"))
+        updated_client_data["password_hash"] = await PasswordService.hash(updated_client_data.pop("password"))
         client = Client(**updated_client_data)
+        if client.worker_id is not None and client.taken_at_worker is None:
+            client.taken_at_worker = datetime.utcnow()
         self.db.add(client)
+        notify_change(self.db, USERS, CLIENTS, worker_ids=[client.worker_id], broker_ids=[client.broker_id])
         await self.db.commit()
         await self.db.refresh(client)
         return cast(ClientT, client)
@@ -157,6 +162,7 @@ class ClientService(UserService):
         client = await self.get_by_id(client_id)
         for key, value in client_data.model_dump(exclude_unset=True).items():
             setattr(client, key, value)
+        notify_change(self.db, CLIENTS)
         await self.db.commit()
         await self.db.refresh(client)
         return client
@@ -171,5 +177,6 @@ class ClientService(UserService):
         """
         client = await self.get_by_id(client_id)
         await self.db.delete(client)
+        notify_change(self.db, USERS, CLIENTS)
         await self.db.commit()
         return client
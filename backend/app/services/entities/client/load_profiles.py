@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Type
+
+from pydantic import BaseModel
+from sqlalchemy import Select, func, select, true
+from sqlalchemy.orm import aliased, defer, raiseload, with_expression
+
+from app.models import Client
+from app.models.entities.credit import Credit
+from app.schemas.entities.client_schema import (
+    ClientAdminOut,
+    ClientBrokerOut,
+    ClientWorkerOut,
+    WorkerClientNewToday,
+)
+from app.utils.serialization import RowProjection
+
+
+# атрибути зведення (query_expression) на моделі Client
+_SUMMARY_ATTRS = frozenset({"credits_count", "credits_total", "last_credit_status"})
+# ключ keyset-пагінації (split_page читає його з рядка) — вантажимо завжди
+_PAGINATION_ATTRS = frozenset({"id", "created_at"})
+
+
+class ClientLoadProfile:
+    """
+    Named loader profile for a Client output schema.
+
+    Вантажить рівно ті колонки, що є у схемі (решта — defer), забороняє ліниві
+    зв'язки (raiseload) і, за потреби, додає зведення по кредитах
+    (count / sum / останній статус) в тому ж SELECT:
+      • PostgreSQL → LEFT JOIN LATERAL (одна агрегація на клієнта сторінки);
+      • інші діалекти (тести на sqlite) → корельовані скалярні підзапити.
+
+    Таким чином список = 1 запит на сторінку (+1 на total), замість
+    трьох selectinload (worker, broker, credits) на кожну сторінку.
+    """
+
+    def __init__(self, name: str, schema: Type[BaseModel], *, credit_summary: bool = False):
+        self.name = name
+        self.schema = schema
+        self.credit_summary = credit_summary
+        mapper = Client.__mapper__
+        mapped = {
+            attr.key for attr in mapper.column_attrs
+            if attr.key not in _SUMMARY_ATTRS
+        }
+        self.columns = tuple(
+            getattr(Client, field) for field in schema.model_fields if field in mapped
+        )
+        # load_only() теж «відкладає» query_expression-атрибути і конфліктує з with_expression,
+        # тому проєкцію будуємо через defer() решти колонок (pk і дискримінатор — завжди)
+        keep = {*schema.model_fields, *_PAGINATION_ATTRS} | {
+            attr.key for attr in mapper.column_attrs
+            if any(col.primary_key for col in attr.columns) or attr.columns[0] is mapper.polymorphic_on
+        }
+        self._deferred = tuple(defer(getattr(Client, key)) for key in sorted(mapped - keep))
+        self._projections: dict[str, RowProjection] = {}
+        # raiseload("*") конфліктує з with_expression, тому — явно по кожному зв'язку
+        self._no_relationships = tuple(
+            raiseload(rel.class_attribute) for rel in Client.__mapper__.relationships
+        )
+
+    def apply(self, stmt: Select, dialect: str = "postgresql") -> Select:
+        """Attach column projection (and the credit summary) to a select(Client) statement."""
+        stmt = stmt.options(*self._deferred, *self._no_relationships)
+        if not self.credit_summary:
+            return stmt
+
+        lateral, exprs = _credit_summary(dialect)
+        if lateral is not None:
+            stmt = stmt.outerjoin(lateral, true())
+        return stmt.options(
+            *(with_expression(getattr(Client, name), expr) for name, expr in exprs.items())
+        )
+
+    def projection(self, dialect: str = "postgresql") -> RowProjection:
+        """
+        Row-level variant of the profile: ті самі колонки і зведення, але рядки → dict
+        (без ORM-об'єктів і model_validate), для швидкого шляху списків.
+        """
+        projection = self._projections.get(dialect)
+        if projection is None:
+            extra, joins = {}, ()
+            if self.credit_summary:
+                lateral, extra = _credit_summary(dialect)
+                joins = ((lateral, true()),) if lateral is not None else ()
+            projection = RowProjection(Client, self.schema, extra=extra, joins=joins)
+            self._projections[dialect] = projection
+        return projection
+
+    def out(self, client: Client) -> BaseModel:
+        return self.schema.model_validate(client)
+
+    def __repr__(self):
+        return f"<ClientLoadProfile {self.name} columns={len(self.columns)} summary={self.credit_summary}>"
+
+
+def _latest_status(credit) -> Select:
+    return (
+        select(credit.status)
+        .where(credit.client_id == Client.id, credit.is_deleted.is_(False))
+        .order_by(credit.issued_at.desc(), credit.id.desc())
+        .limit(1)
+        .correlate_except(credit)  # clients — із зовнішнього запиту (крізь LATERAL)
+    )
+
+
+def _credit_summary(dialect: str):
+    """
+    (lateral | None, {attr: expr}) для credits_count / credits_total / last_credit_status:
+    на PostgreSQL — колонки LEFT JOIN LATERAL, інакше — корельовані скалярні підзапити.
+    """
+    if dialect == "postgresql":
+        credit = aliased(Credit)
+        lateral = (
+            select(
+                func.count(credit.id).label("credits_count"),
+                func.coalesce(func.sum(credit.amount), 0).label("credits_total"),
+                _latest_status(aliased(Credit)).scalar_subquery().label("last_credit_status"),
+            )
+            .where(credit.client_id == Client.id, credit.is_deleted.is_(False))
+            .lateral("credit_summary")
+        )
+        return lateral, {name: lateral.c[name] for name in _SUMMARY_ATTRS}
+
+    credit = aliased(Credit)
+    base = select().where(credit.client_id == Client.id, credit.is_deleted.is_(False))
+    return None, {
+        "credits_count": base.add_columns(func.count(credit.id)).scalar_subquery(),
+        "credits_total": base.add_columns(func.coalesce(func.sum(credit.amount), 0)).scalar_subquery(),
+        "last_credit_status": _latest_status(aliased(Credit)).scalar_subquery(),
+    }
+
+
+CLIENT_ADMIN = ClientLoadProfile("admin", ClientAdminOut, credit_summary=True)
+CLIENT_BROKER = ClientLoadProfile("broker", ClientBrokerOut, credit_summary=True)
+CLIENT_WORKER = ClientLoadProfile("worker", ClientWorkerOut, credit_summary=True)
+CLIENT_NEW_TODAY = ClientLoadProfile("new_today", WorkerClientNewToday)
+
+LOAD_PROFILES: dict[Type[BaseModel], ClientLoadProfile] = {
+    profile.schema: profile
+    for profile in (CLIENT_ADMIN, CLIENT_BROKER, CLIENT_WORKER, CLIENT_NEW_TODAY)
+}
+
+
+def load_profile(schema: Type[BaseModel]) -> ClientLoadProfile:
+    """Return the registered profile for an output schema (KeyError if none)."""
+    return LOAD_PROFILES[schema]
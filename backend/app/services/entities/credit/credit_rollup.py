@@ -0,0 +1,214 @@
+# backend/app/services/entities/credit/credit_rollup.py
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import select, delete, func, literal
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.utils.decorators import handle_exceptions
+from app.models.entities.credit import Credit, CreditStatus
+from app.models.entities.credit_rollup import CreditDailyRollup, NIL_UUID
+from app.services.live.change_bus import CREDITS, notify_change
+
+
+class RollupKey(NamedTuple):
+    """Внесок одного кредиту в credit_daily_rollup."""
+    day: date
+    worker_id: UUID
+    broker_id: UUID
+    status: CreditStatus
+    amount: Decimal
+
+
+def rollup_key(credit: Any) -> Optional[RollupKey]:
+    """
+    Snapshot of the rollup-relevant fields of a credit (ORM object or RETURNING row).
+    Soft-deleted credits contribute nothing → None.
+    """
+    if credit is None or getattr(credit, "is_deleted", False) or credit.issued_at is None:
+        return None
+    return RollupKey(
+        day=credit.issued_at.date(),
+        worker_id=credit.worker_id or NIL_UUID,
+        broker_id=credit.broker_id or NIL_UUID,
+        status=CreditStatus(credit.status),
+        amount=Decimal(str(credit.amount or 0)),
+    )
+
+
+class CreditRollupService:
+    """
+    Incremental maintenance and reads of `credit_daily_rollup`.
+
+    Writers call `apply(before, after)` inside their own transaction (before commit),
+    so the rollup is always consistent with `credits`. `rebuild()` recomputes it
+    from scratch for backfills or after manual data fixes.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _dialect(self) -> str:
+        # "postgresql", "sqlite", ...
+        return (self.db.bind and self.db.bind.dialect.name) or "postgresql"
+
+    # ───────────────────────────────────────────────
+    # INCREMENTAL
+    # ───────────────────────────────────────────────
+    async def apply(self, before: Optional[RollupKey], after: Optional[RollupKey]) -> None:
+        """Переносить внесок кредиту зі старого ключа в новий (−before, +after)."""
+        if before == after:
+            return
+
+        deltas: dict[tuple, list] = defaultdict(lambda: [Decimal(0), 0])
+        if before is not None:
+            deltas[before[:4]][0] -= before.amount
+            deltas[before[:4]][1] -= 1
+        if after is not None:
+            deltas[after[:4]][0] += after.amount
+            deltas[after[:4]][1] += 1
+
+        for key, (amount, count) in deltas.items():
+            if amount == 0 and count == 0:
+                continue
+            await self._upsert(key, amount, count)
+
+        # live dashboard: зміна кредиту зачіпає і старого, і нового воркера/брокера
+        keys = [k for k in (before, after) if k is not None]
+        notify_change(
+            self.db,
+            CREDITS,
+            worker_ids={k.worker_id for k in keys if k.worker_id != NIL_UUID},
+            broker_ids={k.broker_id for k in keys if k.broker_id != NIL_UUID},
+        )
+
+    async def _upsert(self, key: tuple, amount: Decimal, count: int) -> None:
+        day, worker_id, broker_id, status_ = key
+        insert = sqlite.insert if self._dialect() == "sqlite" else postgresql.insert
+        R = CreditDailyRollup
+
+        stmt = insert(R).values(
+            day=day,
+            worker_id=worker_id,
+            broker_id=broker_id,
+            status=status_,
+            total_amount=amount,
+            credits_count=count,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[R.day, R.worker_id, R.broker_id, R.status],
+            set_={
+                "total_amount": R.total_amount + stmt.excluded.total_amount,
+                "credits_count": R.credits_count + stmt.excluded.credits_count,
+            },
+        )
+        await self.db.execute(stmt)
+
+        if count < 0:
+            # порожні бакети не тримаємо
+            await self.db.execute(
+                delete(R).where(
+                    R.day == day,
+                    R.worker_id == worker_id,
+                    R.broker_id == broker_id,
+                    R.status == status_,
+                    R.credits_count <= 0,
+                )
+            )
+
+    # ───────────────────────────────────────────────
+    # BACKFILL / REBUILD
+    # ───────────────────────────────────────────────
+    @handle_exceptions()
+    async def rebuild(self, day_from: Optional[date] = None, day_to: Optional[date] = None) -> int:
+        """
+        Перераховує rollup з таблиці credits для [day_from, day_to) (або повністю).
+        Повертає кількість записаних бакетів.
+        """
+        R = CreditDailyRollup
+        nil = literal(NIL_UUID, PGUUID(as_uuid=True))
+        day_expr = func.date(Credit.issued_at)
+        worker_expr = func.coalesce(Credit.worker_id, nil)
+        broker_expr = func.coalesce(Credit.broker_id, nil)
+
+        wipe = delete(R)
+        source = (
+            select(
+                day_expr,
+                worker_expr,
+                broker_expr,
+                Credit.status,
+                func.coalesce(func.sum(Credit.amount), 0),
+                func.count(Credit.id),
+            )
+            .where(Credit.is_deleted.is_(False))
+            .group_by(day_expr, worker_expr, broker_expr, Credit.status)
+        )
+        if day_from is not None:
+            wipe = wipe.where(R.day >= day_from)
+            source = source.where(Credit.issued_at >= day_from)
+        if day_to is not None:
+            wipe = wipe.where(R.day < day_to)
+            source = source.where(Credit.issued_at < day_to)
+
+        await self.db.execute(wipe)
+        result = await self.db.execute(
+            R.__table__.insert().from_select(
+                ["day", "worker_id", "broker_id", "status", "total_amount", "credits_count"],
+                source,
+            )
+        )
+        await self.db.commit()
+        return max(result.rowcount or 0, 0)
+
+    # ───────────────────────────────────────────────
+    # READ (charts)
+    # ───────────────────────────────────────────────
+    @handle_exceptions()
+    async def daily_totals(
+        self,
+        start: date,
+        end: date,
+        *,
+        worker_id: Optional[UUID] = None,
+        broker_id: Optional[UUID] = None,
+    ) -> dict[date, float]:
+        """Сума кредитів по днях у [start, end)."""
+        R = CreditDailyRollup
+        stmt = (
+            select(R.day, func.coalesce(func.sum(R.total_amount), 0))
+            .where(R.day >= start, R.day < end)
+            .group_by(R.day)
+        )
+        if worker_id is not None:
+            stmt = stmt.where(R.worker_id == worker_id)
+        if broker_id is not None:
+            stmt = stmt.where(R.broker_id == broker_id)
+
+        rows = (await self.db.execute(stmt)).all()
+        return {d: float(total or 0.0) for d, total in rows}
+
+    @handle_exceptions()
+    async def monthly_totals(
+        self,
+        year: int,
+        *,
+        worker_id: Optional[UUID] = None,
+        broker_id: Optional[UUID] = None,
+    ) -> dict[int, float]:
+        """Сума кредитів по місяцях року (≤ 366 денних бакетів, згортаємо в Python — без extract())."""
+        daily = await self.daily_totals(
+            date(year, 1, 1), date(year + 1, 1, 1), worker_id=worker_id, broker_id=broker_id
+        )
+        totals: dict[int, float] = defaultdict(float)
+        for d, amount in daily.items():
+            totals[d.month] += amount
+        return dict(totals)
+
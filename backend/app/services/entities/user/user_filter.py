@@ -1,39 +1,141 @@
-from sqlalchemy import select
+from typing import Any, Optional
+
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
+
 from app.models import User
 from app.permissions import PermissionRole
+from app.utils.pagination import Page, TotalMode, count_total
 
 
 class UserFilterService:
     """
-    Async-compatible query builder for filtering User records.
+    Lazy, composable query builder for filtering User records.
 
-    This service enables dynamic, chainable construction of SQLAlchemy Select queries
-    targeting the User model. Designed to be used with async sessions for efficient,
-    non-blocking database operations.
+    Фільтри лише накопичують предикати — нічого не виконується, доки викликач сам
+    не виконає отриманий `Select`. Тому той самий набір фільтрів можна віддати
+    у пагінацію, COUNT чи агрегацію і все це порахує БД, без завантаження таблиці.
+
+    Subclasses set `model` and add `by_*` methods that call `where(...)`.
 
     Methods:
         - by_role(role): Filter users by their role (e.g., ADMIN, BROKER).
-        - apply(): Finalize and retrieve the built query.
+        - where(*clauses): Add arbitrary predicates (chainable).
+        - count_range(fk, min_count, max_count): Filter by number of related rows;
+          several ranges on the same FK fuse into one GROUP BY … HAVING subquery.
+        - conditions(): All accumulated predicates (for reuse in other SELECTs).
+        - apply(): The filtered SELECT of `model`.
+        - ids(): SELECT of matching ids (for `Model.id.in_(...)`).
+        - count(): SELECT count(*) over the same predicates.
+        - aggregate(*columns): SELECT of aggregates over the same predicates.
+        - page(skip, limit, *order_by): The filtered SELECT with ORDER/OFFSET/LIMIT.
+        - paginate(db, ...): Execute page + total in the database → Page.
     """
-    def __init__(self):
-        # Start with a basic select statement for the User model
-        self.query: Select = select(User)
 
-    def by_role(self, role: PermissionRole):
+    model: Any = User
+
+    def __init__(self, query: Optional[Select] = None):
         """
-        Add a filter clause to restrict users by role.
+        :param query: Optional base SELECT (e.g. with options / projection);
+                      defaults to `select(model)`.
+        """
+        self.query: Select = query if query is not None else select(self.model)
+        self.filters: list[ColumnElement[bool]] = []
+        # fk column → [min, max]; межі однієї зв'язки зливаються в один HAVING
+        self._count_ranges: dict[Any, list[Optional[int]]] = {}
+
+    # ───────────── composition ─────────────
+    def where(self, *clauses: ColumnElement[bool]):
+        """
+        Add predicates to the filter.
+
+        :return: Self for fluent chaining.
+        """
+        self.filters.extend(clauses)
+        return self
+
+    def count_range(self, fk: Any, min_count: Optional[int] = None, max_count: Optional[int] = None):
+        """
+        Keep rows whose number of related rows (`fk` → model.id) is within [min_count, max_count].
+
+        Повторні виклики для того самого `fk` звужують той самий діапазон, а не додають
+        ще один підзапит.
 
-        :param role: The PermissionRole enum value to filter by.
         :return: Self for fluent chaining.
         """
-        self.query = self.query.where(User.role == role)
+        bounds = self._count_ranges.setdefault(fk, [None, None])
+        if min_count is not None:
+            bounds[0] = min_count if bounds[0] is None else max(bounds[0], min_count)
+        if max_count is not None:
+            bounds[1] = max_count if bounds[1] is None else min(bounds[1], max_count)
         return self
 
+    def _count_clause(self, fk: Any, min_count: Optional[int], max_count: Optional[int]) -> Optional[ColumnElement[bool]]:
+        # колонка таблиці, а не ORM-атрибут: інакше підзапит тягне JOIN батьківської таблиці (users)
+        fk = fk.property.columns[0] if hasattr(fk, "property") else fk
+        counts = select(fk).where(fk.is_not(None)).group_by(fk)
+        if min_count is not None and min_count > 0:
+            having = [func.count() >= min_count]
+            if max_count is not None:
+                having.append(func.count() <= max_count)
+            return self.model.id.in_(counts.having(*having))
+        if max_count is None:
+            return None  # «не менше 0» — без обмеження
+        # нижньої межі немає → рядки без жодного зв'язку теж підходять
+        return self.model.id.not_in(counts.having(func.count() > max_count))
+
+    def conditions(self) -> list[ColumnElement[bool]]:
+        """All accumulated predicates, including the fused count ranges."""
+        counts = (self._count_clause(fk, lo, hi) for fk, (lo, hi) in self._count_ranges.items())
+        return [*self.filters, *(clause for clause in counts if clause is not None)]
+
+    # ───────────── statements ─────────────
     def apply(self) -> Select:
         """
         Return the final SQLAlchemy Select query to be executed.
 
         :return: The fully constructed Select object.
         """
-        return self.query
+        conditions = self.conditions()
+        return self.query.where(*conditions) if conditions else self.query
+
+    def ids(self) -> Select:
+        """SELECT of matching ids — for `Model.id.in_(...)` in other queries."""
+        return select(self.model.id).where(*self.conditions())
+
+    def count(self) -> Select:
+        """SELECT count(*) with the same predicates."""
+        return select(func.count()).select_from(self.model).where(*self.conditions())
+
+    def aggregate(self, *columns: Any) -> Select:
+        """SELECT of the given aggregates / columns over the filtered rows (add group_by as needed)."""
+        return select(*columns).select_from(self.model).where(*self.conditions())
+
+    def page(self, skip: int = 0, limit: int = 20, *order_by: Any) -> Select:
+        """The filtered SELECT ordered by `order_by` (default created_at DESC, id) with OFFSET/LIMIT."""
+        order_by = order_by or (self.model.created_at.desc(), self.model.id)
+        return self.apply().order_by(*order_by).offset(skip).limit(limit)
+
+    async def paginate(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 20,
+        *order_by: Any,
+        total_mode: TotalMode = "exact",
+    ) -> Page:
+        """Execute one page and its total (see count_total) in the database."""
+        total, used_mode = await count_total(db, self.apply(), mode=total_mode)
+        items = (await db.execute(self.page(skip, limit, *order_by))).scalars().all()
+        return Page(list(items), total, None, used_mode)
+
+    # ───────────── filters ─────────────
+    def by_role(self, role: PermissionRole):
+        """
+        Add a filter clause to restrict users by role.
+
+        :param role: The PermissionRole enum value to filter by.
+        :return: Self for fluent chaining.
+        """
+        return self.where(self.model.role == role)
@@ -10,6 +10,7 @@ from app.models.entities.user import User
 from app.permissions import PermissionRole
 from app.services.auth import PasswordService
 from app.utils.decorators import handle_exceptions
+from app.services.live.change_bus import CLIENTS, USERS, notify_change
 
 UserT = TypeVar("UserT", bound=User)
 
@@ -102,7 +103,7 @@ class UserService:
         if user is None:
             raise HTTPException(status.HTTP_404_NOT_FOUND, "User not found")
 
-        user.password_hash = PasswordService.hash(new_password)
+        user.password_hash = await PasswordService.hash(new_password)
         await self.db.commit()
         await self.db.refresh(user)
         return user
@@ -116,6 +117,7 @@ class UserService:
             is_deleted=True, deleted_at=datetime.utcnow()
         )
         await self.db.execute(stmt)
+        notify_change(self.db, USERS, CLIENTS)
         await self.db.commit()
 
     @handle_exceptions()
@@ -125,6 +127,7 @@ class UserService:
             is_deleted=False, deleted_at=None
         )
         await self.db.execute(stmt)
+        notify_change(self.db, USERS, CLIENTS)
         await self.db.commit()
 
     # --- HARD DELETE ---
@@ -134,5 +137,6 @@ class UserService:
         # Permanently remove user from database (cannot be restored)
         user = await self.get_user_by_id(user_id)
         await self.db.delete(user)
+        notify_change(self.db, USERS, CLIENTS)
         await self.db.commit()
         return user
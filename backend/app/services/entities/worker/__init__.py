@@ -2,10 +2,13 @@ from .worker_utils import WorkerUtilService
 from .worker_service import WorkerService
 from .worker_filter import WorkerFilterService
 from .worker_interface import WorkerInterfaceService
+from .lead_router import LeadRouter, lead_router
 
 __all__ = [
     "WorkerUtilService",
     'WorkerService',
     "WorkerFilterService",
     "WorkerInterfaceService",
+    "LeadRouter",
+    "lead_router",
 ]
\ No newline at end of file
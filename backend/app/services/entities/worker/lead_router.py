@@ -0,0 +1,257 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import LEAD_ROUTER_FULL_SYNC_SECONDS, LEAD_ROUTER_RESYNC_SECONDS, LEAD_ROUTING_ENABLED
+from app.models import Client, Worker
+from app.models.entities.worker import DepartmentEnum
+from app.services.live.change_bus import CLIENTS, USERS, ChangeEvent, change_bus
+from db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# ключ спільної купи (усі відділи)
+ANY_DEPARTMENT = None
+
+
+@dataclass(slots=True)
+class WorkerSlot:
+    """Стан одного воркера в роутері."""
+    username: str
+    department: Optional[DepartmentEnum]
+    load: int                # активні (не видалені) клієнти
+    active: bool             # is_active і не is_deleted — з БД
+    paused: bool = False     # вручну знятий з роздачі (відпустка тощо)
+    version: int = 0         # записи купи зі старою версією — застарілі
+
+    @property
+    def available(self) -> bool:
+        return self.active and not self.paused
+
+
+class LeadRouter:
+    """
+    In-memory least-loaded routing of new clients (leads) to workers.
+
+    • Стан: воркер → (навантаження, відділ, доступність) + купа (load, seq, worker_id, version)
+      на кожен відділ і одна спільна; pick() — верхівка купи, O(log n) з ледачим
+      видаленням застарілих записів. Навантаження обраного воркера одразу +1.
+    • Засів — один згрупований запит при старті. Далі зміни з change bus (CLIENTS / USERS)
+      позначають воркерів «брудними», і їхні лічильники перечитуються одним GROUP BY
+      з дебаунсом — поза гарячим шляхом реєстрації.
+    • Change bus бачить лише зміни свого процесу, тому кожні `full_sync_interval` сек
+      роутер перечитує всіх воркерів — призначення з інших воркерів gunicorn не дають
+      лічильникам розходитись довше за цей інтервал.
+    • Поки роутер не засіяний або вимкнений, pick() повертає None — клієнт лишається
+      без воркера, як і раніше.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        *,
+        enabled: bool = LEAD_ROUTING_ENABLED,
+        resync_delay: float = LEAD_ROUTER_RESYNC_SECONDS,
+        full_sync_interval: float = LEAD_ROUTER_FULL_SYNC_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.enabled = enabled
+        self.resync_delay = resync_delay
+        self.full_sync_interval = full_sync_interval
+        self._slots: dict[UUID, WorkerSlot] = {}
+        self._by_username: dict[str, UUID] = {}
+        self._heaps: dict[Optional[DepartmentEnum], list[tuple[int, int, UUID, int]]] = {}
+        self._seq = itertools.count()
+        self._dirty: set[UUID] = set()
+        self._resync_all = False
+        self._ready = False
+        self._task: Optional[asyncio.Task] = None
+        self._periodic: Optional[asyncio.Task] = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    # ───────────── routing ─────────────
+    def pick(self, department: Optional[DepartmentEnum] = ANY_DEPARTMENT) -> Optional[UUID]:
+        """Найменш завантажений доступний воркер (відділу `department`), одразу +1 до навантаження."""
+        if not self._ready:
+            return None
+        heap = self._heaps.get(department)
+        while heap:
+            _, _, worker_id, version = heap[0]
+            slot = self._slots.get(worker_id)
+            if slot is None or slot.version != version or not slot.available:
+                heapq.heappop(heap)
+                continue
+            self._set_load(worker_id, slot, slot.load + 1)
+            return worker_id
+        return None
+
+    def assigned(self, worker_id: Optional[UUID], delta: int = 1) -> None:
+        """Клієнта призначено воркеру повз pick() (delta=1) або резерв скасовано (delta=-1)."""
+        slot = self._slots.get(worker_id) if worker_id is not None else None
+        if slot is not None:
+            self._set_load(worker_id, slot, max(0, slot.load + delta))
+
+    def resolve(self, username: str) -> Optional[UUID]:
+        """worker.username → id з пам'яті (None — невідомий роутеру)."""
+        return self._by_username.get(username)
+
+    def set_available(self, worker_id: UUID, available: bool) -> bool:
+        """Вручну зняти воркера з роздачі / повернути; False — воркер невідомий."""
+        slot = self._slots.get(worker_id)
+        if slot is None:
+            return False
+        slot.paused = not available
+        self._push(worker_id, slot)
+        return True
+
+    def load(self, worker_id: UUID) -> Optional[int]:
+        slot = self._slots.get(worker_id)
+        return slot.load if slot is not None else None
+
+    # ───────────── heap ─────────────
+    def _set_load(self, worker_id: UUID, slot: WorkerSlot, load: int) -> None:
+        slot.load = load
+        self._push(worker_id, slot)
+
+    def _push(self, worker_id: UUID, slot: WorkerSlot) -> None:
+        slot.version += 1
+        if not slot.available:
+            return
+        entry = (slot.load, next(self._seq), worker_id, slot.version)
+        for key in {ANY_DEPARTMENT, slot.department}:
+            heap = self._heaps.setdefault(key, [])
+            heapq.heappush(heap, entry)
+            if len(heap) > 2 * len(self._slots) + 64:
+                self._compact(key)
+
+    def _compact(self, key: Optional[DepartmentEnum]) -> None:
+        """Перебудувати купу лише з актуальних записів (щоб застарілі не накопичувались)."""
+        heap = [
+            (slot.load, next(self._seq), worker_id, slot.version)
+            for worker_id, slot in self._slots.items()
+            if slot.available and (key is ANY_DEPARTMENT or slot.department == key)
+        ]
+        heapq.heapify(heap)
+        self._heaps[key] = heap
+
+    # ───────────── sync with DB ─────────────
+    async def sync(self, worker_ids: Optional[Iterable[UUID]] = None) -> None:
+        """Перечитати воркерів і їхнє навантаження одним GROUP BY (None → усіх, це й засів)."""
+        worker_ids = list(worker_ids) if worker_ids is not None else None
+        loads = (
+            select(Client.worker_id, func.count().label("load"))
+            .where(Client.worker_id.is_not(None), Client.is_deleted.is_(False))
+            .group_by(Client.worker_id)
+        )
+        stmt = select(Worker.id, Worker.username, Worker.department, Worker.is_active, Worker.is_deleted)
+        if worker_ids is not None:
+            loads = loads.where(Client.worker_id.in_(worker_ids))
+            stmt = stmt.where(Worker.id.in_(worker_ids))
+        loads = loads.subquery()
+        stmt = stmt.add_columns(func.coalesce(loads.c.load, 0)).outerjoin(loads, loads.c.worker_id == Worker.id)
+
+        async with self.session_factory() as db:
+            rows = (await db.execute(stmt)).all()
+
+        stale = set(self._slots) if worker_ids is None else set(worker_ids)
+        for worker_id, username, department, is_active, is_deleted, load in rows:
+            stale.discard(worker_id)
+            slot = self._slots.get(worker_id)
+            if slot is None:
+                slot = self._slots[worker_id] = WorkerSlot(username, department, load, False)
+            elif slot.username != username:
+                self._by_username.pop(slot.username, None)
+            slot.username, slot.department, slot.load = username, department, load
+            slot.active = bool(is_active) and not is_deleted
+            self._by_username[username] = worker_id
+            self._push(worker_id, slot)
+        for worker_id in stale:
+            slot = self._slots.pop(worker_id, None)
+            if slot is not None:
+                self._by_username.pop(slot.username, None)
+
+        if worker_ids is None:
+            for key in list(self._heaps):
+                self._compact(key)
+            self._ready = True
+
+    def _on_change(self, events: list[ChangeEvent]) -> None:
+        for ev in events:
+            if ev.topic not in (CLIENTS, USERS):
+                continue
+            if ev.worker_ids is None:
+                self._resync_all = True
+            else:
+                self._dirty |= ev.worker_ids
+        if self._resync_all or self._dirty:
+            self._schedule(self.resync_delay)
+
+    def _schedule(self, delay: float) -> None:
+        if self._task is not None and not self._task.done():
+            return  # уже запланований прохід підхопить нові зміни
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = loop.create_task(self._resync_loop(delay), name="lead-router-resync")
+
+    async def _resync_loop(self, delay: float) -> None:
+        while self._resync_all or self._dirty:
+            await asyncio.sleep(delay)
+            delay = self.resync_delay
+            full, dirty = self._resync_all, self._dirty
+            self._resync_all, self._dirty = False, set()
+            try:
+                await self.sync(None if full else dirty)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 — повтор при наступній зміні
+                logger.exception("[LeadRouter] resync failed")
+                self._resync_all |= full
+                self._dirty |= dirty
+                return
+
+    async def _full_sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.full_sync_interval)
+            self._resync_all = True
+            self._schedule(0)
+
+    # ───────────── lifecycle ─────────────
+    def start(self) -> None:
+        if not self.enabled:
+            return
+        if self._unsubscribe is None:
+            self._unsubscribe = change_bus.subscribe(self._on_change)
+        self._resync_all = True
+        self._schedule(0)
+        if self.full_sync_interval > 0 and self._periodic is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._periodic = loop.create_task(self._full_sync_loop(), name="lead-router-full-sync")
+
+    async def stop(self) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        for task in (self._periodic, self._task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._periodic = self._task = None
+
+
+lead_router = LeadRouter()
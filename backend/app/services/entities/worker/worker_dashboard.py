@@ -1,14 +1,19 @@
 from sqlalchemy import select, extract, func, update, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Any, Sequence
-from sqlalchemy.orm import selectinload
 from uuid import UUID
 from datetime import datetime, UTC, date, timedelta
 
 from app.models import Client, Credit
 from app.schemas.entities.client_schema import WorkerClientNewToday, ClientWorkerOut
 from app.schemas.entities.credit_schema import CreditCreate
-from app.utils.decorators import handle_exceptions
+from app.services.entities.client.load_profiles import CLIENT_NEW_TODAY, CLIENT_WORKER
+from app.services.entities.credit.credit_rollup import CreditRollupService
+from app.permissions import PermissionRole
+from app.services.entities.client.client_scope import client_owners
+from app.utils.decorators import cached, handle_exceptions
+from app.utils.pagination import apply_keyset, split_page
+from app.services.live.change_bus import CLIENTS, CREDITS, notify_change
 
 
 class WorkerDashboardService:
@@ -30,7 +35,11 @@ class WorkerDashboardService:
         """
         self.db = db
 
+    def _dialect(self) -> str:
+        return (self.db.bind and self.db.bind.dialect.name) or "postgresql"
+
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CLIENTS,))
     async def get_sum_clients(self, worker_id: UUID) -> int:
         """
         Count total number of clients assigned to the given worker.
@@ -44,6 +53,7 @@ class WorkerDashboardService:
         return result.scalar_one()
 
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CREDITS,))
     async def get_total_sum_credits(self, worker_id: UUID) -> float:
         """
         Calculate the total sum of credits for the given worker.
@@ -53,6 +63,7 @@ class WorkerDashboardService:
         return result.scalar_one() or 0.0
 
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CREDITS,))
     async def get_month_sum_credits(self, worker_id: UUID) -> float:
         """
         Calculate the sum of credits for the current month.
@@ -72,6 +83,7 @@ class WorkerDashboardService:
         return result.scalar_one() or 0.0
 
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CREDITS,))
     async def get_sum_deals(self, worker_id: UUID) -> int:
         """
         Count total number of deals (credits entries) for the given worker.
@@ -85,6 +97,7 @@ class WorkerDashboardService:
         return result.scalar_one() or 0
 
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CLIENTS,))
     async def get_sum_today_new_clients(self, worker_id: UUID) -> int:
         """
         Count number of clients taken by the worker today.
@@ -103,6 +116,7 @@ class WorkerDashboardService:
         return result.scalar_one() or 0
 
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CLIENTS,))
     async def get_sum_yesterday_new_clients(self, worker_id: UUID) -> int:
         """
         Count a number of clients taken by the worker yesterday.
@@ -137,7 +151,7 @@ class WorkerDashboardService:
                 Client.taken_at_worker >= today_start,
             )
         )
-        result = await self.db.execute(stmt)
+        result = await self.db.execute(CLIENT_NEW_TODAY.apply(stmt))
         return [WorkerClientNewToday.model_validate(c) for c in result.scalars().all()]
 
     @handle_exceptions()
@@ -146,41 +160,40 @@ class WorkerDashboardService:
             worker_id: UUID,
             skip: int = 0,
             limit: int = 6,
-    ) -> list[ClientWorkerOut]:
+            cursor: str | None = None,
+    ) -> tuple[list[ClientWorkerOut], str | None]:
         """
-        Return paginated and validated list of clients for a worker.
+        Return paginated and validated list of clients for a worker, plus next_cursor.
+
+        cursor=None keeps OFFSET paging (ordered by id, next_cursor is None);
+        cursor="" or a token switches to keyset paging over (created_at, id).
         """
-        stmt = (
-            select(Client)
-            .where(Client.worker_id == worker_id)
-            .order_by(Client.id)
-            .offset(skip)
-            .limit(limit)
-        )
+        stmt = select(Client).where(Client.worker_id == worker_id)
+        stmt = CLIENT_WORKER.apply(stmt, self._dialect())
+
+        if cursor is not None:
+            stmt = apply_keyset(stmt, Client.created_at, Client.id, cursor, limit, descending=False)
+            rows = (await self.db.execute(stmt)).scalars().all()
+            clients, next_cursor = split_page(rows, limit, "created_at")
+            return [CLIENT_WORKER.out(c) for c in clients], next_cursor
+
+        stmt = stmt.order_by(Client.id).offset(skip).limit(limit)
 
         result = await self.db.execute(stmt)
         clients = result.scalars().all()
-        return [ClientWorkerOut.model_validate(c) for c in clients]
+        return [CLIENT_WORKER.out(c) for c in clients], None
 
     @handle_exceptions()
     async def get_client(self, client_id: UUID) -> ClientWorkerOut | None:
         """
         Fetch and validate a single client by ID.
         """
-        stmt = (
-            select(Client)
-            .where(Client.id == client_id)
-            .options(
-                selectinload(Client.worker),
-                selectinload(Client.broker),
-                selectinload(Client.credits)
-            )
-        )
+        stmt = CLIENT_WORKER.apply(select(Client).where(Client.id == client_id), self._dialect())
 
         result = await self.db.execute(stmt)
         client = result.scalar_one_or_none()
 
-        return ClientWorkerOut.model_validate(client) if client else None
+        return CLIENT_WORKER.out(client) if client else None
 
     @handle_exceptions()
     async def unsign_client(self, client_id: UUID) -> None:
@@ -192,7 +205,9 @@ class WorkerDashboardService:
             .where(Client.id == client_id)
             .values(worker_id=None, taken_at_worker=None)
         )
+        owners = await client_owners(self.db, client_id)
         await self.db.execute(stmt)
+        notify_change(self.db, CLIENTS, worker_ids=[owners.worker_id], broker_ids=[owners.broker_id])
         await self.db.commit()
 
     @handle_exceptions()
@@ -202,10 +217,13 @@ class WorkerDashboardService:
             .where(Client.id == client_id)
             .values(worker_id=worker_id, taken_at_worker=datetime.utcnow())
         )
+        owners = await client_owners(self.db, client_id)
         await self.db.execute(stmt)
+        notify_change(self.db, CLIENTS, worker_ids=[owners.worker_id, worker_id], broker_ids=[owners.broker_id])
         await self.db.commit()
 
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CREDITS,))
     async def get_credits_for_month(self, worker_id: UUID, month: str) -> list[dict[str, Any]]:
         """
         Return credits per day for a specific month (YYYY-MM).
@@ -220,19 +238,8 @@ class WorkerDashboardService:
         except Exception:
             raise ValueError("Invalid month format. Expected YYYY-MM.")
 
-        # Fetch all credits in that month
-        stmt = (
-            select(Credit.issued_at, func.sum(Credit.amount))
-            .where(
-                Credit.worker_id == worker_id,
-                Credit.issued_at >= start_date,
-                Credit.issued_at < end_date,
-            )
-            .group_by(Credit.issued_at)
-        )
-
-        result = await self.db.execute(stmt)
-        credits_map = {row.date: float(row[1]) for row in result.all()}
+        # Daily buckets from credit_daily_rollup
+        credits_map = await CreditRollupService(self.db).daily_totals(start_date, end_date, worker_id=worker_id)
 
         # Fill all days with 0 if missing
         total_days = (end_date - start_date).days
@@ -248,6 +255,7 @@ class WorkerDashboardService:
         return credits_per_day
 
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CREDITS,))
     async def get_credits_for_year(self, worker_id: UUID, year: int) -> list[dict[str, Any]]:
         """
         Return credits per month for a specific year.
@@ -256,25 +264,7 @@ class WorkerDashboardService:
         if year < 1900:
             raise ValueError("Invalid year format. Must be 4 digits, e.g. 2025")
 
-        start_date = date(year, 1, 1)
-        end_date = date(year + 1, 1, 1)
-
-        stmt = (
-            select(
-                extract("month", Credit.issued_at).label("month"),
-                func.sum(Credit.amount)
-            )
-            .where(
-                Credit.worker_id == worker_id,
-                Credit.issued_at >= start_date,
-                Credit.issued_at < end_date
-            )
-            .group_by("month")
-            .order_by("month")
-        )
-
-        result = await self.db.execute(stmt)
-        credits_map = {int(row[0]): float(row[1]) for row in result.all()}
+        credits_map = await CreditRollupService(self.db).monthly_totals(year, worker_id=worker_id)
 
         credits_per_month = []
         for month in range(1, 13):
@@ -286,6 +276,7 @@ class WorkerDashboardService:
         return credits_per_month
 
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CLIENTS,), wide_topics=(CREDITS,))
     async def get_count_completed_clients(self, worker_id: UUID) -> int:
         stmt = (
             select(func.count(Client.id))
@@ -299,6 +290,7 @@ class WorkerDashboardService:
         return result.scalar_one()
 
     @handle_exceptions()
+    @cached(PermissionRole.WORKER, entity="worker_id", topics=(CLIENTS,), wide_topics=(CREDITS,))
     async def get_count_active_clients(self, worker_id: UUID) -> int:
         stmt = (
             select(func.count(Client.id))
@@ -348,20 +340,16 @@ class WorkerDashboardService:
         data_stmt = (
             select(Client)
             .where(where_clause)
-            .options(
-                selectinload(Client.worker),
-                selectinload(Client.broker),
-                selectinload(Client.credits),
-            )
             .order_by(Client.full_name.asc())
             .offset(skip)
             .limit(limit)
         )
+        data_stmt = CLIENT_WORKER.apply(data_stmt, self._dialect())
 
         data_res = await self.db.execute(data_stmt)
         clients: Sequence[Client] = data_res.scalars().all()
 
         return (
-            [ClientWorkerOut.model_validate(c) for c in clients],
+            [CLIENT_WORKER.out(c) for c in clients],
             total,
         )
@@ -1,48 +1,55 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
 from app.models import Worker, Client
 from app.permissions import PermissionRole
+from app.services.entities.user import UserFilterService
 
 
-class WorkerFilterService:
+class WorkerFilterService(UserFilterService):
     """
-    Async service for filtering Worker queries based on dynamic conditions.
+    Lazy query builder for filtering Workers (see UserFilterService).
 
     Methods:
         - by_username(username): Filter workers by their system username.
+        - search_username(username): Filter workers by username substring.
+        - by_is_deleted(is_deleted): Filter by soft-deletion status.
         - by_email(email): Filter workers by email address (partial match).
         - by_has_clients(has_clients): Filter workers based on presence of assigned clients.
-        - by_role(): Filter only users with WORKER role.
+        - by_role(role): Filter by role (default: WORKER).
         - by_client_full_name(full_name): Filter if worker has client with matching name.
         - by_client_phone_number(phone_number): Filter if worker has client with matching phone.
         - by_client_email(email): Filter if worker has client with matching email.
         - by_client_id(client_id): Filter if worker has client with specific ID.
         - by_min_clients_count(min_count): Filter workers who have at least X clients.
         - by_max_clients_count(max_count): Filter workers who have at most X clients.
-        - apply(): Executes the query and returns matching Worker instances.
+          (обидві межі зливаються в один GROUP BY … HAVING підзапит)
+        - apply(): Finalize and return the composed SQLAlchemy Select query.
     """
-    def __init__(self, db: AsyncSession):
-        """
-        Initialize the filter service with a database session.
-        :param db: Async SQLAlchemy session.
-        """
-        self.db = db
-        self.filters = []
+
+    model = Worker
 
     def by_username(self, username: str):
         """
         Filter workers by the system username.
         """
-        self.filters.append(Worker.username == username)
-        return self
+        return self.where(Worker.username == username)
+
+    def search_username(self, username: str):
+        """
+        Filter workers by username substring (case-insensitive).
+        """
+        return self.where(Worker.username.ilike(f"%{username}%"))
+
+    def by_is_deleted(self, is_deleted: bool = False):
+        """
+        Filter workers by soft-deleted status.
+        """
+        return self.where(Worker.is_deleted.is_(is_deleted))
 
     def by_email(self, email: str):
         """
         Filter workers by email address.
         Uses a case-insensitive LIKE match.
         """
-        self.filters.append(Worker.email.ilike(f"%{email}%"))
-        return self
+        return self.where(Worker.email.ilike(f"%{email}%"))
 
     def by_has_clients(self, has_clients: bool = True):
         """
@@ -51,83 +58,48 @@ class WorkerFilterService:
         If has_clients is False — only workers without clients.
         """
         if has_clients:
-            self.filters.append(Worker.clients.any())
-        else:
-            self.filters.append(~Worker.clients.any())
-        return self
+            return self.where(Worker.clients.any())
+        return self.where(~Worker.clients.any())
 
-    def by_role(self):
+    def by_role(self, role: PermissionRole = PermissionRole.WORKER):
         """
-        Filter workers by role.
-        Only includes users with PermissionRole.WORKER.
+        Filter workers by role (default: WORKER).
         """
-        self.filters.append(Worker.role == PermissionRole.WORKER)
-        return self
+        return self.where(Worker.role == role)
 
     def by_client_full_name(self, full_name: str):
         """
         Filter workers by presence of a client with matching full name.
         Case-insensitive partial match.
         """
-        self.filters.append(Worker.clients.any(Client.full_name.ilike(f"%{full_name}%")))
-        return self
+        return self.where(Worker.clients.any(Client.full_name.ilike(f"%{full_name}%")))
 
     def by_client_phone_number(self, phone_number: str):
         """
         Filter workers by presence of a client with matching phone number.
         """
-        self.filters.append(Worker.clients.any(Client.phone_number.ilike(f"%{phone_number}%")))
-        return self
+        return self.where(Worker.clients.any(Client.phone_number.ilike(f"%{phone_number}%")))
 
     def by_client_email(self, email: str):
         """
         Filter workers by presence of a client with matching email.
         """
-        self.filters.append(Worker.clients.any(Client.email.ilike(f"%{email}%")))
-        return self
+        return self.where(Worker.clients.any(Client.email.ilike(f"%{email}%")))
 
     def by_client_id(self, client_id: str):
         """
         Filter workers by presence of a client with the given ID.
         """
-        self.filters.append(Worker.clients.any(Client.id == client_id))
-        return self
+        return self.where(Worker.clients.any(Client.id == client_id))
 
-    async def by_min_clients_count(self, min_count: int):
+    def by_min_clients_count(self, min_count: int):
         """
         Filter workers who have at least `min_count` clients assigned.
-        Uses a subquery with GROUP BY and HAVING clause.
-        """
-        subq = (
-            select(Worker.id, func.count(Client.id).label("client_count"))
-            .join(Client, Worker.id == Client.worker_id)
-            .group_by(Worker.id)
-            .having(func.count(Client.id) >= min_count)
-            .subquery()
-        )
-        self.filters.append(Worker.id.in_(select(subq.c.id)))
-        return self
-
-    async def by_max_clients_count(self, max_count: int):
-        """
-        Filter workers who have at most `max_count` clients assigned.
-        Uses a subquery with GROUP BY and HAVING clause.
-        """
-        subq = (
-            select(Worker.id, func.count(Client.id).label("client_count"))
-            .join(Client, Worker.id == Client.worker_id)
-            .group_by(Worker.id)
-            .having(func.count(Client.id) <= max_count)
-            .subquery()
-        )
-        self.filters.append(Worker.id.in_(select(subq.c.id)))
-        return self
-
-    async def apply(self):
-        """
-        Finalize and execute the built query.
-        Returns a list of Worker instances matching the accumulated filters.
-        """
-        stmt = select(Worker).filter(*self.filters)
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
+        """
+        return self.count_range(Client.worker_id, min_count=min_count)
+
+    def by_max_clients_count(self, max_count: int):
+        """
+        Filter workers who have at most `max_count` clients assigned (including none).
+        """
+        return self.count_range(Client.worker_id, max_count=max_count)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy import select, update
@@ -9,6 +10,7 @@ from app.services.auth import PasswordService
 from app.services.entities import UserService
 from app.utils.decorators import handle_exceptions
 from app.schemas.entities.worker_schema import WorkerSchema
+from app.services.live.change_bus import CLIENTS, USERS, notify_change
 
 WorkerT = TypeVar("WorkerT", bound=Worker)
 
@@ -100,6 +102,7 @@ class WorkerService(UserService):
         """
         stmt = update(Client).where(Client.id == client_id).values(worker_id=worker_id)
         await self.db.execute(stmt)
+        notify_change(self.db, CLIENTS)
         await self.db.commit()
 
     @handle_exceptions()
@@ -113,15 +116,23 @@ class WorkerService(UserService):
         if client and client.worker_id == worker_id:
             stmt = update(Client).where(Client.id == client_id).values(worker_id=None)
             await self.db.execute(stmt)
+            notify_change(self.db, CLIENTS)
             await self.db.commit()
 
     @handle_exceptions()
     async def bulk_assign_clients(self, worker_id: UUID, client_ids: list[UUID]) -> None:
         """
-        Assign multiple clients to a worker in a single batch update.
+        Assign multiple clients to a worker in a single batch update
+        (one taken_at_worker for the whole batch; for distribution see ClientAssignmentService).
         """
-        stmt = update(Client).where(Client.id.in_(client_ids)).values(worker_id=worker_id)
+        stmt = (
+            update(Client)
+            .where(Client.id.in_(client_ids))
+            .values(worker_id=worker_id, taken_at_worker=datetime.utcnow() if worker_id else None)
+            .execution_options(synchronize_session=False)
+        )
         await self.db.execute(stmt)
+        notify_change(self.db, CLIENTS)
         await self.db.commit()
 
     @handle_exceptions()
@@ -130,9 +141,10 @@ class WorkerService(UserService):
         Create a new Worker user. Hashes the password before saving.
         """
         updated_worker_data = worker_data.model_dump()
-        updated_worker_data["password_hash"] = PasswordService.hash(updated_worker_data.pop("password"))
+        updated_worker_data["password_hash"] = await PasswordService.hash(updated_worker_data.pop("password"))
         worker = Worker(**updated_worker_data)
         self.db.add(worker)
+        notify_change(self.db, USERS)
         await self.db.commit()
         await self.db.refresh(worker)
         return cast(WorkerT, worker)
@@ -157,5 +169,6 @@ class WorkerService(UserService):
         """
         worker = await self.get_by_id(worker_id)
         await self.db.delete(worker)
+        notify_change(self.db, USERS, CLIENTS)
         await self.db.commit()
         return cast(WorkerT, worker)
@@ -0,0 +1,14 @@
+from .exporter import ExportFormat, ExportLimiter, export_limiter, export_response
+from .writers import WRITERS, CSVWriter, TableWriter, XLSXWriter, cell_text
+
+__all__ = [
+    "ExportFormat",
+    "ExportLimiter",
+    "export_limiter",
+    "export_response",
+    "WRITERS",
+    "CSVWriter",
+    "TableWriter",
+    "XLSXWriter",
+    "cell_text",
+]
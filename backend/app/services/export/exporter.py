@@ -0,0 +1,137 @@
+import logging
+from collections import Counter
+from datetime import datetime, UTC
+from typing import AsyncIterator, Callable, Literal, Optional
+
+from fastapi import HTTPException, status
+from fastapi.requests import HTTPConnection
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from starlette.types import Receive, Scope, Send
+
+from app.config import EXPORT_BATCH_SIZE, EXPORT_MAX_CONCURRENT_PER_USER
+from db.routing import actor_key
+from db.session import read_session_factory
+from .writers import WRITERS, TableWriter
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["csv", "xlsx"]
+
+
+class ExportLimiter:
+    """
+    Не більше `per_actor` одночасних експортів на користувача (actor_key) у процесі.
+
+    Кожен експорт тримає з'єднання з пулу весь час відправки файлу, тож без ліміту
+    кілька вкладок «Завантажити» від одного адміна з'їдають пул для всіх.
+    """
+
+    def __init__(self, per_actor: int = EXPORT_MAX_CONCURRENT_PER_USER):
+        self.per_actor = per_actor
+        self._active: Counter[str] = Counter()
+
+    def acquire(self, actor: Optional[str]) -> str:
+        key = actor or "anonymous"
+        if self._active[key] >= self.per_actor:
+            raise HTTPException(
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Too many exports in progress (max {self.per_actor}), wait for one to finish",
+                headers={"Retry-After": "5"},
+            )
+        self._active[key] += 1
+        return key
+
+    def release(self, key: str) -> None:
+        self._active[key] -= 1
+        if self._active[key] <= 0:
+            del self._active[key]
+
+    def active(self, actor: Optional[str]) -> int:
+        return self._active.get(actor or "anonymous", 0)
+
+
+export_limiter = ExportLimiter()
+
+
+class _ExportResponse(StreamingResponse):
+    """
+    StreamingResponse, що сам повертає слот ліміту, коли ASGI-виклик завершився.
+
+    Звільняти слот у `finally` генератора тіла недостатньо: якщо клієнт пішов
+    до першого чанка (або send упав на заголовках), генератор так і не стартує,
+    і його `finally` не виконується — слот «висить» до рестарту процесу.
+    """
+
+    def __init__(self, content: AsyncIterator[bytes], release: Callable[[], None], **kwargs):
+        super().__init__(content, **kwargs)
+        self._release = release
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            try:
+                # обірваний стрім: закриваємо генератор одразу (сесія → пул), а не в GC
+                await self.body_iterator.aclose()
+            finally:
+                self._release()
+
+
+async def _stream(
+    session_factory: async_sessionmaker[AsyncSession],
+    actor: Optional[str],
+    build: Callable[[AsyncSession], Select],
+    writer: TableWriter,
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    try:
+        # власна сесія: сесія з Depends закривається ще до того, як почнеться стрім тіла
+        async with session_factory(info={"actor": actor}) as db:
+            # серверний курсор: у пам'яті лише одна пачка з batch_size рядків
+            result = await db.stream(build(db).execution_options(yield_per=batch_size))
+            yield writer.header(list(result.keys()))
+            async for rows in result.partitions():
+                yield writer.rows(rows)
+            yield writer.close()
+    except Exception:
+        # заголовки вже відправлено — клієнт отримає обірваний файл
+        logger.exception("[Export] stream failed")
+        raise
+
+
+async def export_response(
+    connection: HTTPConnection,
+    name: str,
+    build: Callable[[AsyncSession], Select],
+    fmt: ExportFormat = "csv",
+    *,
+    limiter: ExportLimiter = export_limiter,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> StreamingResponse:
+    """
+    Потокова відповідь з файлом `name-<timestamp>.<csv|xlsx>`.
+
+    :param build: (session) → SELECT рядків (колонки з мітками = заголовок файлу);
+                  напр. AdminDashboard(db).client_rows_select(**filters).
+    """
+    actor = actor_key(connection)
+    key = limiter.acquire(actor)
+    try:
+        session_factory = await read_session_factory(actor)
+        writer = WRITERS[fmt](name)
+    except BaseException:
+        limiter.release(key)
+        raise
+
+    filename = f"{name}-{datetime.now(UTC):%Y%m%d-%H%M%S}.{writer.extension}"
+    return _ExportResponse(
+        _stream(session_factory, actor, build, writer, batch_size),
+        lambda: limiter.release(key),
+        media_type=writer.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+        },
+    )
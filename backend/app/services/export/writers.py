@@ -0,0 +1,217 @@
+import csv
+import io
+from abc import ABC, abstractmethod
+import re
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, Sequence
+from xml.sax.saxutils import escape
+
+import orjson
+
+
+def cell_text(value: Any) -> str:
+    """Значення рядка БД → текст клітинки (однаково для CSV і рядкових клітинок XLSX)."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return "; ".join(cell_text(v) for v in value)
+    if isinstance(value, dict):
+        return orjson.dumps(value).decode()
+    return str(value)
+
+
+class TableWriter(ABC):
+    """
+    Incremental table encoder: header → rows (пачками) → close.
+
+    Кожен виклик повертає байти, готові до відправки; між викликами writer тримає
+    лише власний невеликий буфер — пам'ять не залежить від кількості рядків.
+    """
+
+    media_type: str = "application/octet-stream"
+    extension: str = "bin"
+
+    @abstractmethod
+    def header(self, columns: Sequence[str]) -> bytes:
+        """Рядок заголовка (і все, що формат пише до першого рядка даних)."""
+
+    @abstractmethod
+    def rows(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        """Пачка рядків даних."""
+
+    def close(self) -> bytes:
+        return b""
+
+
+# Excel виконує клітинку як формулу, якщо вона починається з цих символів (CSV injection);
+# «+380…» / «-5» — звичайні телефон і число, їх не чіпаємо
+_FORMULA_RE = re.compile(r"^(?:[=@\t\r]|[+-][^\d\s])")
+
+
+class CSVWriter(TableWriter):
+    """UTF-8 з BOM (Excel інакше відкриває кирилицю як cp1251)."""
+
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    def __init__(self, sheet: str = ""):
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf)
+
+    def _take(self) -> bytes:
+        data = self._buf.getvalue().encode()
+        self._buf.seek(0)
+        self._buf.truncate()
+        return data
+
+    @staticmethod
+    def _safe(value: Any) -> str:
+        text = cell_text(value)
+        return "'" + text if _FORMULA_RE.match(text) else text
+
+    def header(self, columns: Sequence[str]) -> bytes:
+        self._writer.writerow(columns)
+        return "\ufeff".encode() + self._take()
+
+    def rows(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        safe = self._safe
+        self._writer.writerows([safe(v) for v in row] for row in rows)
+        return self._take()
+
+
+class _Sink:
+    """Write-only ціль для ZipFile: без seek → zipfile пише data descriptors, тобто потоково."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._pos = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+_XML = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_CONTENT_TYPES = _XML + (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+_ROOT_RELS = _XML + (
+    f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK_RELS = _XML + (
+    f'<Relationships xmlns="{_PKG_REL_NS}">'
+    f'<Relationship Id="rId1" Type="{_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+# style 0 — звичайна клітинка, 1 — жирний заголовок
+_STYLES = _XML + (
+    f'<styleSheet xmlns="{_MAIN_NS}">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '</styleSheet>'
+)
+# символи, заборонені в XML 1.0
+_ILLEGAL_XML_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+
+class XLSXWriter(TableWriter):
+    """
+    Minimal streaming XLSX (один аркуш, inline strings).
+
+    Службові частини пакета пишуться одразу, аркуш — потоком через ZipFile у режимі
+    без seek; рядки не накопичуються ні в пам'яті, ні на диску. Числа — числовими
+    клітинками, решта (дати — ISO) — текстом. Межа Excel — 1 048 576 рядків на аркуш.
+    """
+
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    extension = "xlsx"
+
+    def __init__(self, sheet: str = "Sheet1"):
+        self._sink = _Sink()
+        self._zip = zipfile.ZipFile(self._sink, "w", compression=zipfile.ZIP_DEFLATED)
+        self._zip.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        self._zip.writestr("_rels/.rels", _ROOT_RELS)
+        self._zip.writestr(
+            "xl/workbook.xml",
+            _XML + f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}"><sheets>'
+                   f'<sheet name="{escape(sheet[:31] or "Sheet1")}" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        )
+        self._zip.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        self._zip.writestr("xl/styles.xml", _STYLES)
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._row = 0
+
+    @staticmethod
+    def _cell(value: Any, style: str = "") -> str:
+        if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            return f"<c{style}><v>{value}</v></c>"
+        text = _ILLEGAL_XML_RE.sub("", cell_text(value))
+        return f'<c{style} t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+    def _write_rows(self, rows: Iterable[Sequence[Any]], style: str = "") -> bytes:
+        parts = []
+        cell = self._cell
+        for row in rows:
+            self._row += 1
+            parts.append(f'<row r="{self._row}">{"".join(cell(v, style) for v in row)}</row>')
+        self._sheet.write("".join(parts).encode())
+        return self._sink.take()
+
+    def header(self, columns: Sequence[str]) -> bytes:
+        self._sheet.write((_XML + f'<worksheet xmlns="{_MAIN_NS}"><sheetData>').encode())
+        return self._write_rows([columns], style=' s="1"')
+
+    def rows(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        return self._write_rows(rows)
+
+    def close(self) -> bytes:
+        self._sheet.write(b"</sheetData></worksheet>")
+        self._sheet.close()
+        self._zip.close()
+        return self._sink.take()
+
+
+WRITERS: dict[str, type[TableWriter]] = {"csv": CSVWriter, "xlsx": XLSXWriter}
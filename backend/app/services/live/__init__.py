@@ -0,0 +1,13 @@
+from .change_bus import ChangeBus, ChangeEvent, change_bus, notify_change, CREDITS, CLIENTS, USERS
+from .cache_sync import tags_for
+
+__all__ = [
+    "ChangeBus",
+    "ChangeEvent",
+    "change_bus",
+    "notify_change",
+    "CREDITS",
+    "CLIENTS",
+    "USERS",
+    "tags_for",
+]
@@ -0,0 +1,27 @@
+# backend/app/services/live/cache_sync.py
+from __future__ import annotations
+
+from typing import Iterable
+
+from app.permissions import PermissionRole
+from app.utils.cache import cache, change_tags
+from .change_bus import ChangeEvent, change_bus
+
+
+def tags_for(events: Iterable[ChangeEvent]) -> set[str]:
+    """Закомічені зміни → теги кешу (скоуп worker_ids / broker_ids — як і для live-метрик)."""
+    tags: set[str] = set()
+    for ev in events:
+        tags |= change_tags(ev.topic, {
+            PermissionRole.WORKER.value: ev.worker_ids,
+            PermissionRole.BROKER.value: ev.broker_ids,
+        })
+    return tags
+
+
+def _invalidate(events: list[ChangeEvent]) -> None:
+    cache.invalidate(tags_for(events))
+
+
+# після commit (і лише після нього) — rollback нічого не скидає
+change_bus.subscribe(_invalidate)
@@ -0,0 +1,99 @@
+# backend/app/services/live/change_bus.py
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Топіки змін, на які підписуються live-метрики
+CREDITS = "credits"
+CLIENTS = "clients"
+USERS = "users"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    One committed change.
+
+    `worker_ids` / `broker_ids` narrow the event to scoped subscribers
+    (worker/broker dashboards); None means "unknown scope" → everyone on the topic.
+    """
+    topic: str
+    worker_ids: Optional[frozenset[UUID]] = None
+    broker_ids: Optional[frozenset[UUID]] = None
+
+
+Listener = Callable[[list[ChangeEvent]], None]
+
+
+class ChangeBus:
+    """
+    In-process pub/sub for data changes.
+
+    Service write methods call `notify_change(db, ...)` before commit; the events are
+    published only after that transaction commits (dropped on rollback).
+    Listeners are called synchronously and must not block — they only schedule work.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: list[Listener] = []
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _unsubscribe
+
+    def publish(self, events: list[ChangeEvent]) -> None:
+        if not events:
+            return
+        for listener in list(self._listeners):
+            try:
+                listener(events)
+            except Exception:
+                logger.exception("[ChangeBus] listener failed")
+
+
+change_bus = ChangeBus()
+
+
+def _scope(ids: Optional[Iterable[Optional[UUID]]]) -> Optional[frozenset[UUID]]:
+    if ids is None:
+        return None
+    return frozenset(i for i in ids if i is not None)
+
+
+def notify_change(
+    db: AsyncSession | Session,
+    *topics: str,
+    worker_ids: Optional[Iterable[Optional[UUID]]] = None,
+    broker_ids: Optional[Iterable[Optional[UUID]]] = None,
+) -> None:
+    """Реєструє зміну в поточній транзакції; на шину вона піде після commit."""
+    workers, brokers = _scope(worker_ids), _scope(broker_ids)
+    db.info.setdefault("_pending_changes", []).extend(
+        ChangeEvent(topic, workers, brokers) for topic in topics
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    events = session.info.pop("_pending_changes", None)
+    if events:
+        change_bus.publish(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back(session: Session) -> None:
+    session.info.pop("_pending_changes", None)
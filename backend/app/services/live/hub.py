@@ -0,0 +1,228 @@
+# backend/app/services/live/hub.py
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional, Protocol, Tuple
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import LIVE_DASHBOARD_DEBOUNCE_SECONDS
+from app.permissions import PermissionRole
+from app.services.live.change_bus import ChangeBus, ChangeEvent, change_bus
+from app.services.live.metrics import LIVE_METRICS, LiveMetric
+from app.websockets.frames import encode_frame
+
+logger = logging.getLogger(__name__)
+
+# (role, metric, scope_id, params_json)
+GroupKey = Tuple[PermissionRole, str, Optional[UUID], str]
+
+
+class Subscriber(Protocol):
+    # WebSocketConnection: неблокуюча постановка готового кадру в чергу
+    def enqueue(self, frame: str) -> bool: ...
+
+
+class LiveMetricError(ValueError):
+    """Unknown metric / missing params in a subscribe request."""
+
+
+class _Group:
+    """All subscribers of one (role, metric, scope, params) — share one computation."""
+
+    __slots__ = ("key", "metric", "scope_id", "params", "subscribers", "snapshot", "dirty", "task", "lock")
+
+    def __init__(self, key: GroupKey, metric: LiveMetric, scope_id: Optional[UUID], params: dict):
+        self.key = key
+        self.metric = metric
+        self.scope_id = scope_id
+        self.params = params
+        self.subscribers: set[Subscriber] = set()
+        self.snapshot: Any = None
+        self.dirty = False
+        self.task: Optional[asyncio.Task] = None
+        self.lock = asyncio.Lock()
+
+    def affected_by(self, ev: ChangeEvent) -> bool:
+        if ev.topic not in self.metric.topics:
+            return False
+        if self.scope_id is None:
+            return True
+        ids = ev.worker_ids if self.metric.role == PermissionRole.WORKER else ev.broker_ids
+        return ids is None or self.scope_id in ids
+
+    def describe(self) -> dict:
+        return {"metric": self.metric.name, "params": self.params}
+
+
+def _delta(old: Any, new: Any) -> Optional[dict]:
+    """Тільки змінені ключі для dict-метрик; інакше повний snapshot (або None, якщо нічого не змінилось)."""
+    if old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict) and old.keys() == new.keys():
+        return {"type": "delta", "data": {k: v for k, v in new.items() if old.get(k) != v}}
+    return {"type": "snapshot", "data": new}
+
+
+class LiveDashboardHub:
+    """
+    Long-lived dashboard subscriptions.
+
+    🔹 Subscribers are grouped by (role, metric, scope, params); a group computes its
+       metric once and fans the result out to every subscriber.
+    🔹 Change-bus events mark affected groups dirty; recomputation is debounced, so a
+       burst of writes costs one query round per group.
+    🔹 Only changes are pushed: dict metrics as a delta of changed keys, others as a snapshot.
+       A subscriber whose send queue overflowed gets `snapshots()` instead of the lost frames.
+    """
+
+    def __init__(
+        self,
+        bus: ChangeBus = change_bus,
+        *,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        debounce: float = LIVE_DASHBOARD_DEBOUNCE_SECONDS,
+    ) -> None:
+        self._bus = bus
+        self._session_factory = session_factory
+        self._debounce = debounce
+        self._groups: Dict[GroupKey, _Group] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._unsubscribe_bus = None
+
+    # ───────────── subscriptions ─────────────
+    @staticmethod
+    def resolve(role: PermissionRole, name: str, params: Optional[dict]) -> Tuple[LiveMetric, dict]:
+        metric = LIVE_METRICS.get((role, name))
+        if metric is None:
+            raise LiveMetricError(f"Unknown live metric '{name}' for role {role.value}")
+        params = params or {}
+        missing = [p for p in metric.params if p not in params]
+        if missing:
+            raise LiveMetricError(f"Metric '{name}' requires params: {', '.join(missing)}")
+        return metric, {p: params[p] for p in metric.params}
+
+    async def subscribe(
+        self,
+        subscriber: Subscriber,
+        role: PermissionRole,
+        scope_id: Optional[UUID],
+        name: str,
+        params: Optional[dict] = None,
+    ) -> GroupKey:
+        """Додає підписника і одразу шле йому поточне значення (спільне для групи)."""
+        self._attach()
+        metric, params = self.resolve(role, name, params)
+        key: GroupKey = (role, name, scope_id, json.dumps(params, sort_keys=True, default=str))
+
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _Group(key, metric, scope_id, params)
+        group.subscribers.add(subscriber)
+
+        try:
+            async with group.lock:
+                if group.snapshot is None:
+                    group.snapshot = await self._compute(group)
+        except Exception:
+            self.unsubscribe(subscriber, key)
+            raise
+
+        subscriber.enqueue(encode_frame({"type": "snapshot", **group.describe(), "data": group.snapshot}))
+        return key
+
+    def unsubscribe(self, subscriber: Subscriber, key: GroupKey) -> None:
+        group = self._groups.get(key)
+        if group is None:
+            return
+        group.subscribers.discard(subscriber)
+        if not group.subscribers:
+            self._groups.pop(key, None)
+            if group.task is not None and not group.task.done():
+                group.task.cancel()
+
+    def snapshots(self, subscriber: Subscriber) -> list[str]:
+        """Повні кадри поточного стану всіх груп підписника — resync після переповнення його черги."""
+        return [
+            encode_frame({"type": "snapshot", **group.describe(), "data": group.snapshot})
+            for group in self._groups.values()
+            if subscriber in group.subscribers and group.snapshot is not None
+        ]
+
+    def drop(self, subscriber: Subscriber) -> None:
+        """Прибирає підписника з усіх груп (disconnect)."""
+        for key in [k for k, g in self._groups.items() if subscriber in g.subscribers]:
+            self.unsubscribe(subscriber, key)
+
+    # ───────────── change bus ─────────────
+    def _attach(self) -> None:
+        if self._unsubscribe_bus is None:
+            self._loop = asyncio.get_running_loop()
+            self._unsubscribe_bus = self._bus.subscribe(self._on_change)
+
+    def _on_change(self, events: list[ChangeEvent]) -> None:
+        # може викликатись з after_commit будь-якої сесії → переносимо в наш loop
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._mark_dirty(events)
+        else:
+            loop.call_soon_threadsafe(self._mark_dirty, events)
+
+    def _mark_dirty(self, events: list[ChangeEvent]) -> None:
+        for group in self._groups.values():
+            if any(group.affected_by(ev) for ev in events):
+                group.dirty = True
+                if group.task is None or group.task.done():
+                    group.task = asyncio.create_task(self._flush(group))
+
+    async def _flush(self, group: _Group) -> None:
+        # події, що прийшли під час sleep/перерахунку, зливаються в наступний прохід
+        while group.dirty and group.subscribers:
+            await asyncio.sleep(self._debounce)
+            group.dirty = False
+            try:
+                async with group.lock:
+                    fresh = await self._compute(group)
+                    message = _delta(group.snapshot, fresh)
+                    group.snapshot = fresh
+            except Exception as e:
+                logger.exception(f"[LiveHub] recompute failed for {group.key}")
+                message = {"type": "error", "data": str(e)}
+            if message is not None:
+                self._broadcast(group, {**message, **group.describe()})
+
+    # ───────────── helpers ─────────────
+    async def _compute(self, group: _Group) -> Any:
+        factory = self._session_factory
+        if factory is None:
+            from db.session import AsyncSessionLocal  # лінь: не тягнемо engine при імпорті
+            factory = self._session_factory = AsyncSessionLocal
+        async with factory() as db:
+            raw = await group.metric.compute(db, group.scope_id, **group.params)
+        return jsonable_encoder(raw)
+
+    @staticmethod
+    def _broadcast(group: _Group, message: dict) -> None:
+        # серіалізуємо один раз на групу, а не на кожен сокет
+        frame = encode_frame(message)
+        for subscriber in list(group.subscribers):
+            subscriber.enqueue(frame)
+
+    def stats(self) -> dict:
+        return {
+            "groups": len(self._groups),
+            "subscribers": sum(len(g.subscribers) for g in self._groups.values()),
+        }
+
+
+live_dashboard_hub = LiveDashboardHub()
@@ -0,0 +1,127 @@
+# backend/app/services/live/metrics.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.permissions import PermissionRole
+from app.services.entities.admin.admin_dashboard import AdminDashboard
+from app.services.entities.broker.broker_dashboard import BrokerDashboard
+from app.services.entities.worker.worker_dashboard import WorkerDashboardService
+from app.services.live.change_bus import CREDITS, CLIENTS, USERS
+
+# compute(db, scope_id, **params) → JSON-сумісний результат
+Compute = Callable[..., Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class LiveMetric:
+    """
+    Dashboard metric that can be pushed over the live analyze socket.
+
+    `topics` — change-bus topics that can alter the value;
+    `params` — required subscription params (e.g. month="YYYY-MM").
+    Worker/broker metrics are scoped to the subscriber's own id.
+    """
+    name: str
+    role: PermissionRole
+    topics: frozenset[str]
+    compute: Compute
+    params: Tuple[str, ...] = ()
+
+
+# ─────────────────────────────
+# ADMIN
+# ─────────────────────────────
+async def _admin_overview(db: AsyncSession, _scope: Optional[UUID]) -> dict:
+    return (await AdminDashboard(db).get_overview()).model_dump()
+
+
+async def _admin_credits_monthly(db: AsyncSession, _scope: Optional[UUID], *, month: str) -> list:
+    return await AdminDashboard(db).get_credits_for_month(month)
+
+
+async def _admin_credits_yearly(db: AsyncSession, _scope: Optional[UUID], *, year: int) -> list:
+    return await AdminDashboard(db).get_credits_for_year(int(year))
+
+
+# ─────────────────────────────
+# WORKER
+# ─────────────────────────────
+async def _worker_summary(db: AsyncSession, worker_id: UUID) -> dict:
+    svc = WorkerDashboardService(db)
+    # одна сесія → запити послідовно
+    return {
+        "sum_clients": await svc.get_sum_clients(worker_id),
+        "total_sum_credits": await svc.get_total_sum_credits(worker_id),
+        "month_sum_credits": await svc.get_month_sum_credits(worker_id),
+        "sum_deals": await svc.get_sum_deals(worker_id),
+        "today_new_clients": await svc.get_sum_today_new_clients(worker_id),
+        "yesterday_new_clients": await svc.get_sum_yesterday_new_clients(worker_id),
+        "count_active_clients": await svc.get_count_active_clients(worker_id),
+        "count_completed_clients": await svc.get_count_completed_clients(worker_id),
+    }
+
+
+async def _worker_credits_monthly(db: AsyncSession, worker_id: UUID, *, month: str) -> list:
+    return await WorkerDashboardService(db).get_credits_for_month(worker_id, month)
+
+
+async def _worker_credits_yearly(db: AsyncSession, worker_id: UUID, *, year: int) -> list:
+    return await WorkerDashboardService(db).get_credits_for_year(worker_id, int(year))
+
+
+# ─────────────────────────────
+# BROKER
+# ─────────────────────────────
+async def _broker_summary(db: AsyncSession, broker_id: UUID) -> dict:
+    svc = BrokerDashboard(db)
+    return {
+        "total_credits_count": await svc.get_total_credits_count(broker_id),
+        "month_credits_count": await svc.get_mount_credits_count(broker_id),
+        "count_active_credits": await svc.get_count_active_credits(broker_id),
+        "count_completed_credits": await svc.get_count_completed_credits(broker_id),
+        "sum_active_credits": await svc.get_sum_active_credits(broker_id),
+        "sum_completed_credits": await svc.get_sum_completed_credits(broker_id),
+        "sum_signed_clients": await svc.get_sum_signed_clients(broker_id),
+        "sum_unsigned_clients": await svc.get_sum_unsigned_clients(broker_id),
+        "today_new_clients": await svc.get_sum_today_new_clients(broker_id),
+        "yesterday_new_clients": await svc.get_sum_yesterday_new_clients(broker_id),
+        "sum_commissions": await svc.get_sum_broker_commissions(broker_id),
+        "month_commissions": await svc.get_month_broker_commissions(broker_id),
+    }
+
+
+async def _broker_credits_monthly(db: AsyncSession, broker_id: UUID, *, month: str) -> list:
+    return await BrokerDashboard(db).get_credits_for_month(broker_id, month)
+
+
+async def _broker_credits_yearly(db: AsyncSession, broker_id: UUID, *, year: int) -> list:
+    return await BrokerDashboard(db).get_credits_for_year(broker_id, int(year))
+
+
+_ALL = frozenset({CREDITS, CLIENTS, USERS})
+_CREDITS = frozenset({CREDITS})
+
+LIVE_METRICS: Dict[Tuple[PermissionRole, str], LiveMetric] = {
+    (m.role, m.name): m
+    for m in (
+        LiveMetric("overview", PermissionRole.ADMIN, _ALL, _admin_overview),
+        LiveMetric("credits_monthly", PermissionRole.ADMIN, _CREDITS, _admin_credits_monthly, ("month",)),
+        LiveMetric("credits_yearly", PermissionRole.ADMIN, _CREDITS, _admin_credits_yearly, ("year",)),
+
+        LiveMetric("summary", PermissionRole.WORKER, _ALL, _worker_summary),
+        LiveMetric("credits_monthly", PermissionRole.WORKER, _CREDITS, _worker_credits_monthly, ("month",)),
+        LiveMetric("credits_yearly", PermissionRole.WORKER, _CREDITS, _worker_credits_yearly, ("year",)),
+
+        LiveMetric("summary", PermissionRole.BROKER, _ALL, _broker_summary),
+        LiveMetric("credits_monthly", PermissionRole.BROKER, _CREDITS, _broker_credits_monthly, ("month",)),
+        LiveMetric("credits_yearly", PermissionRole.BROKER, _CREDITS, _broker_credits_yearly, ("year",)),
+    )
+}
+
+# ролі, для яких є хоч одна live-метрика
+LIVE_ROLES = frozenset(role for role, _ in LIVE_METRICS)
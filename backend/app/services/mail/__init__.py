@@ -0,0 +1,12 @@
+from .outbox import MailOutboxWorker, enqueue_email, mail_worker
+from .templates import TEMPLATES, EmailTemplate, RenderedEmail, render
+
+__all__ = [
+    "MailOutboxWorker",
+    "enqueue_email",
+    "mail_worker",
+    "TEMPLATES",
+    "EmailTemplate",
+    "RenderedEmail",
+    "render",
+]
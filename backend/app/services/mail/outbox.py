@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable, Optional
+
+from sqlalchemy import delete, event, null, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import (
+    MAIL_OUTBOX_BATCH_SIZE,
+    MAIL_OUTBOX_LEASE_SECONDS,
+    MAIL_OUTBOX_MAX_ATTEMPTS,
+    MAIL_OUTBOX_POLL_SECONDS,
+    MAIL_OUTBOX_RETENTION_DAYS,
+    MAIL_RETRY_BASE_SECONDS,
+    MAIL_RETRY_MAX_SECONDS,
+)
+from app.models.outbox import EmailOutbox, EmailStatus
+from app.services.smtp_service import SMTPService
+from db.session import AsyncSessionLocal
+from .templates import render
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_email(db: AsyncSession | Session, template: str, recipient: str, **context: Any) -> EmailOutbox:
+    """
+    Додає лист у outbox поточної транзакції (commit — за викликачем).
+    Після commit воркер будиться одразу; після rollback листа просто немає.
+    """
+    row = EmailOutbox(
+        template=template,
+        recipient=str(recipient),
+        context=context,
+        status=EmailStatus.PENDING,
+        attempts=0,
+        next_attempt_at=datetime.now(UTC),
+    )
+    db.add(row)
+    db.info["_mail_enqueued"] = True
+    return row
+
+
+def _is_permanent(exc: Exception) -> bool:
+    """5xx від сервера (адресат / відправник відхилені) — повтор не допоможе."""
+    import aiosmtplib  # уже завантажений SMTPService-ом, якщо дійшло до відправки
+
+    if isinstance(exc, aiosmtplib.SMTPRecipientsRefused):
+        return all(500 <= refused.code < 600 for refused in exc.recipients)
+    return isinstance(exc, aiosmtplib.SMTPResponseException) and 500 <= exc.code < 600
+
+
+class MailOutboxWorker:
+    """
+    Background drainer of `email_outbox`.
+
+    • Claim: пачка до `batch_size` pending-листів, у яких настав час, отримує lease
+      (next_attempt_at = now + lease, attempts += 1) однією короткою транзакцією;
+      FOR UPDATE SKIP LOCKED — кілька воркерів не беруть ті самі листи.
+    • Відправка — через одне постійне SMTP-з'єднання (SMTPService); статуси пачки
+      записуються одним UPDATE.
+    • Помилка → повтор через base · 2^(attempts-1) (з jitter, не більше max);
+      5xx або вичерпані спроби → FAILED. Падіння процесу посеред відправки → лист
+      повториться після lease (at-least-once).
+    • Будиться після commit-у з enqueue_email, інакше — раз на `poll_interval`.
+    • Відправлені листи старші за retention видаляються пачками, коли черга порожня.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        transport: Optional[SMTPService] = None,
+        *,
+        batch_size: int = MAIL_OUTBOX_BATCH_SIZE,
+        poll_interval: float = MAIL_OUTBOX_POLL_SECONDS,
+        max_attempts: int = MAIL_OUTBOX_MAX_ATTEMPTS,
+        retry_base: float = MAIL_RETRY_BASE_SECONDS,
+        retry_max: float = MAIL_RETRY_MAX_SECONDS,
+        lease: float = MAIL_OUTBOX_LEASE_SECONDS,
+        retention_days: float = MAIL_OUTBOX_RETENTION_DAYS,
+    ):
+        self.session_factory = session_factory
+        self._transport = transport
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lease = lease
+        self.retention_days = retention_days
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.failed = 0
+
+    @property
+    def transport(self) -> SMTPService:
+        if self._transport is None:
+            self._transport = SMTPService()
+        return self._transport
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def backoff(self, attempts: int) -> float:
+        delay = min(self.retry_max, self.retry_base * 2 ** max(0, attempts - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    # ───────────── drain ─────────────
+    async def drain(self) -> int:
+        """Відправити все, що вже настав час відправляти; повертає кількість відправлених."""
+        sent = 0
+        while True:
+            batch = await self._claim()
+            if not batch:
+                return sent
+            sent += await self._deliver(batch)
+
+    async def _claim(self) -> list:
+        now = datetime.now(UTC)
+        due = (
+            select(EmailOutbox.id)
+            .where(EmailOutbox.status == EmailStatus.PENDING, EmailOutbox.next_attempt_at <= now)
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(due.scalar_subquery()))
+            .values(attempts=EmailOutbox.attempts + 1, next_attempt_at=now + timedelta(seconds=self.lease))
+            .returning(EmailOutbox.id, EmailOutbox.template, EmailOutbox.recipient,
+                       EmailOutbox.context, EmailOutbox.attempts)
+            .execution_options(synchronize_session=False)
+        )
+        async with self.session_factory() as db:
+            rows = (await db.execute(stmt)).all()
+            await db.commit()
+        return rows
+
+    async def _deliver(self, batch: list) -> int:
+        sent_ids, failures = [], []
+        for row in batch:
+            try:
+                email = render(row.template, row.context or {})
+            except Exception as exc:  # noqa: BLE001 — невідомий шаблон / помилка рендеру
+                failures.append((row, exc, True))
+                continue
+            try:
+                await self.transport.send(row.recipient, email.subject, email.html)
+            except Exception as exc:  # noqa: BLE001
+                failures.append((row, exc, _is_permanent(exc)))
+            else:
+                sent_ids.append(row.id)
+
+        now = datetime.now(UTC)
+        async with self.session_factory() as db:
+            if sent_ids:
+                await db.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id.in_(sent_ids))
+                    .values(status=EmailStatus.SENT, sent_at=now, context=null(), last_error=None)
+                    .execution_options(synchronize_session=False)
+                )
+            for row, exc, permanent in failures:
+                give_up = permanent or row.attempts >= self.max_attempts
+                values = {"last_error": repr(exc)[:1000]}
+                if give_up:
+                    values["status"] = EmailStatus.FAILED
+                else:
+                    values["next_attempt_at"] = now + timedelta(seconds=self.backoff(row.attempts))
+                await db.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.id == row.id)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                logger.warning(
+                    "[MailOutbox] %s to %s failed (attempt %d%s): %r",
+                    row.template, row.recipient, row.attempts, ", giving up" if give_up else "", exc,
+                )
+                self.failed += give_up
+            await db.commit()
+
+        self.sent += len(sent_ids)
+        return len(sent_ids)
+
+    async def purge(self) -> int:
+        """Видалити одну пачку відправлених листів, старших за retention."""
+        cutoff = datetime.now(UTC) - timedelta(days=self.retention_days)
+        old = (
+            select(EmailOutbox.id)
+            .where(EmailOutbox.status == EmailStatus.SENT, EmailOutbox.sent_at < cutoff)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with self.session_factory() as db:
+            result = await db.execute(
+                delete(EmailOutbox)
+                .where(EmailOutbox.id.in_(old.scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        return result.rowcount
+
+    # ───────────── lifecycle ─────────────
+    async def _loop(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                if not await self.drain():
+                    await self.purge()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 — БД / SMTP недоступні; наступна спроба за poll_interval
+                logger.exception("[MailOutbox] drain failed")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop(), name="mail-outbox")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._transport is not None:
+            await self._transport.close()
+
+
+mail_worker = MailOutboxWorker()
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_on_commit(session: Session) -> None:
+    if session.info.pop("_mail_enqueued", False):
+        mail_worker.wake()
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_on_rollback(session: Session) -> None:
+    session.info.pop("_mail_enqueued", None)
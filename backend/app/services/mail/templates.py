@@ -0,0 +1,62 @@
+from functools import cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+RESET_PASSWORD_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Reset your password</title>
+</head>
+<body>
+    <h2>🔐 Password Reset Request</h2>
+    <p>Hello,</p>
+    <p>We received a request to reset your password. Click the link below:</p>
+    <p><a href="{{ reset_link }}">Reset Password</a></p>
+    <p>This link is valid for {{ ttl_minutes }} minutes.</p>
+    <p>If you didn’t request this, just ignore this email.</p>
+    <br>
+    <p>Regards,<br>FinControl Team</p>
+</body>
+</html>
+"""
+
+class EmailTemplate(NamedTuple):
+    subject: "Template"
+    html: "Template"
+
+
+class RenderedEmail(NamedTuple):
+    subject: str
+    html: str
+
+
+# Джерела шаблонів (subject, html); ключ — EmailOutbox.template
+TEMPLATES: dict[str, tuple[str, str]] = {
+    "password_reset": ("🔐 Reset your FinControl password", RESET_PASSWORD_TEMPLATE),
+}
+
+
+@cache
+def _env():
+    # jinja2 імпортується при першому рендері, а не при старті воркера
+    from jinja2 import Environment, select_autoescape
+
+    # autoescape: значення контексту (імена, посилання) не можуть зламати HTML
+    return Environment(autoescape=select_autoescape(default=True, default_for_string=True))
+
+
+@cache
+def _compiled(name: str) -> EmailTemplate:
+    """Компілюється один раз на процес, при першому рендері."""
+    subject, html = TEMPLATES[name]
+    return EmailTemplate(_env().from_string(subject), _env().from_string(html))
+
+
+def render(name: str, context: dict[str, Any]) -> RenderedEmail:
+    """KeyError для невідомого шаблону — такий лист не відправиться ніколи (FAILED одразу)."""
+    template = _compiled(name)
+    return RenderedEmail(template.subject.render(**context), template.html.render(**context))
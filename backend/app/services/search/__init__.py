@@ -0,0 +1,6 @@
+from .builder import SearchQuery, ClientSearch
+
+__all__ = [
+    "SearchQuery",
+    "ClientSearch",
+]
@@ -0,0 +1,113 @@
+# backend/app/services/search/builder.py
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import String, and_, case, cast, func, literal, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.entities.client import Client
+
+
+# терм схожий на телефон: лише цифри/пробіли/дужки/+/-, щонайменше 3 цифри
+_PHONE_TERM = re.compile(r"^[\d\s()+\-]*\d[\d\s()+\-]*$")
+_MIN_PHONE_DIGITS = 3
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """Розібраний пошуковий рядок: терми (через пробіли/коми) і ті з них, що є UUID."""
+    raw: str
+    terms: Tuple[str, ...]
+    uuids: Tuple[UUID, ...]
+
+    @classmethod
+    def parse(cls, raw: Optional[str]) -> Optional["SearchQuery"]:
+        terms = tuple(t.strip() for t in re.split(r"[\s,]+", raw or "") if t.strip())
+        if not terms:
+            return None
+        uuids = []
+        for t in terms:
+            try:
+                uuids.append(UUID(t))
+            except ValueError:
+                pass
+        return cls(raw=" ".join(terms), terms=terms, uuids=tuple(uuids))
+
+
+def _phone_digits(term: str) -> Optional[str]:
+    if not _PHONE_TERM.match(term):
+        return None
+    digits = re.sub(r"[^0-9]", "", term)
+    return digits if len(digits) >= _MIN_PHONE_DIGITS else None
+
+
+class ClientSearch:
+    """
+    Query builder for client-centric search, shared by the admin client bucket
+    and the credit list (which joins Client).
+
+    PostgreSQL: substring match against the generated `clients.search_document`
+    and `clients.phone_digits` columns, served by pg_trgm GIN indexes.
+    Other dialects (SQLite in tests): ILIKE over the raw client fields.
+
+    `id_columns` — extra UUID PKs matched exactly (Client.id is always included).
+    `partial_ids` — (uuid column, generated text column) pairs for "fragment of id"
+    search, e.g. (Credit.id, Credit.id_text).
+    """
+
+    def __init__(
+        self,
+        dialect: str,
+        *,
+        id_columns: Sequence = (),
+        partial_ids: Sequence[tuple] = (),
+    ):
+        self.pg = dialect == "postgresql"
+        self.id_columns = (*id_columns, Client.id)
+        self.partial_ids = tuple(partial_ids)
+
+    # ───────────── WHERE ─────────────
+    def clause(self, q: SearchQuery) -> ColumnElement:
+        """Усі терми з’єднуються AND-ом; всередині терму — OR по полях."""
+        return and_(*(self._term_clause(t) for t in q.terms))
+
+    def _term_clause(self, term: str) -> ColumnElement:
+        disj: list = []
+        needle = term.lower()
+        if self.pg:
+            disj.append(Client.search_document.contains(needle, autoescape=True))
+            disj.extend(text_col.contains(needle, autoescape=True) for _, text_col in self.partial_ids)
+            digits = _phone_digits(term)
+            if digits:
+                disj.append(Client.phone_digits.contains(digits, autoescape=True))
+        else:
+            for col in (Client.full_name, Client.email, Client.phone_number, Client.fact_address):
+                disj.append(col.icontains(term, autoescape=True))
+            disj.extend(
+                cast(id_col, String).icontains(term, autoescape=True) for id_col, _ in self.partial_ids
+            )
+
+        try:
+            uid = UUID(term)
+            disj.extend(col == uid for col in self.id_columns)
+        except ValueError:
+            pass
+        return or_(*disj)
+
+    # ───────────── ORDER BY ─────────────
+    def ranking(self, q: SearchQuery) -> list:
+        """
+        Exact UUID hits first, then (PostgreSQL) trigram similarity of the whole query
+        to search_document. The caller appends its own stable tie-breaker.
+        """
+        order: list = []
+        if q.uuids:
+            exact = or_(*(col.in_(q.uuids) for col in self.id_columns))
+            order.append(case((exact, 0), else_=1))
+        if self.pg:
+            order.append(func.similarity(Client.search_document, literal(q.raw.lower())).desc())
+        return order
@@ -0,0 +1,12 @@
+from .refresh_token import RefreshTokenService
+from .session_cache import RefreshSession, SessionCache, session_cache
+from .sweeper import SessionSweeper, session_sweeper
+
+__all__ = [
+    "RefreshTokenService",
+    "RefreshSession",
+    "SessionCache",
+    "session_cache",
+    "SessionSweeper",
+    "session_sweeper",
+]
@@ -2,11 +2,14 @@ from datetime import datetime, UTC, timedelta
 from uuid import UUID
 from hashlib import sha256
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import delete, select, update
 import secrets
 
+from app.config import SESSION_MAX_PER_USER
+from app.models.entities.user import User
 from app.models.sessions.refresh_token import RefreshToken
 from app.utils.decorators import handle_exceptions
+from .session_cache import RefreshSession, SessionCache, session_cache
 
 
 class RefreshTokenService:
@@ -15,16 +18,25 @@ class RefreshTokenService:
 
     Supports creation, validation, revocation, and rotation of secure refresh tokens.
     Designed for use in FastAPI async workflows.
+
+    • Один рядок = одна сесія: rotate оновлює рядок на місці (новий хеш/строк), а не
+      додає новий, тож таблиця не росте з кожним refresh.
+    • Не більше SESSION_MAX_PER_USER активних сесій на користувача — найстаріші
+      видаляються при створенні нової.
+    • verify читає з SessionCache (hash → user_id, role, expires_at), без ORM і User.
+    • Прострочені / відкликані рядки видаляє SessionSweeper.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: SessionCache = session_cache):
         """
         Initialize the service with an async database session.
 
         Args:
             db (AsyncSession): The active async DB session.
+            cache (SessionCache): Hot token cache (global by default).
         """
         self.db = db
+        self.cache = cache
 
     @staticmethod
     def hash(raw: str) -> str:
@@ -49,7 +61,8 @@ class RefreshTokenService:
         ttl_days: int = 30,
     ):
         """
-        Create and persist a new refresh token.
+        Create and persist a new refresh token, then trim the user's sessions
+        to the SESSION_MAX_PER_USER most recent ones.
 
         Args:
             user_id (UUID): ID of the user.
@@ -67,8 +80,31 @@ class RefreshTokenService:
             is_active=True,
         )
         self.db.add(token_row)
+        await self.db.flush()
+        evicted = await self._trim_sessions(user_id)
         await self.db.commit()
-        await self.db.refresh(token_row)
+        if evicted:
+            await self.cache.drop(*evicted)
+
+    async def _trim_sessions(self, user_id: UUID) -> list[str]:
+        """Видаляє все, крім N найсвіжіших активних сесій користувача; повертає їх хеші."""
+        newest = (
+            select(RefreshToken.id)
+            .where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.is_active.is_(True),
+                RefreshToken.expires_at > datetime.now(UTC),
+            )
+            .order_by(RefreshToken.updated_at.desc(), RefreshToken.expires_at.desc())
+            .limit(SESSION_MAX_PER_USER)
+        )
+        stmt = (
+            delete(RefreshToken)
+            .where(RefreshToken.user_id == user_id, RefreshToken.id.not_in(newest.scalar_subquery()))
+            .returning(RefreshToken.token_hash)
+            .execution_options(synchronize_session=False)
+        )
+        return list((await self.db.execute(stmt)).scalars())
 
     @handle_exceptions()
     async def revoke(self, token_hash: str) -> None:
@@ -85,9 +121,10 @@ class RefreshTokenService:
         )
         await self.db.execute(stmt)
         await self.db.commit()
+        await self.cache.drop(token_hash)
 
     @handle_exceptions(default_return=None)
-    async def verify(self, raw_token: str) -> RefreshToken | None:
+    async def verify(self, raw_token: str) -> RefreshSession | None:
         """
         Check if a token is active and not expired.
 
@@ -95,53 +132,78 @@ class RefreshTokenService:
             raw_token (str): Raw token string.
 
         Returns:
-            Optional[RefreshToken]: Token object if valid, else None.
+            Optional[RefreshSession]: (token_hash, user_id, role, expires_at) if valid, else None.
         """
         hashed = self.hash(raw_token)
+        cached = await self.cache.get(hashed)
+        if cached is not None:
+            return cached
 
-        stmt = select(RefreshToken).where(
-            RefreshToken.token_hash == hashed,
-            RefreshToken.is_active.is_(True),
-            RefreshToken.expires_at > datetime.now(UTC),
+        stmt = (
+            select(RefreshToken.user_id, User.role, RefreshToken.expires_at)
+            .join(User, User.id == RefreshToken.user_id)
+            .where(
+                RefreshToken.token_hash == hashed,
+                RefreshToken.is_active.is_(True),
+                RefreshToken.expires_at > datetime.now(UTC),
+            )
         )
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        row = (await self.db.execute(stmt)).first()
+        if row is None:
+            return None
+
+        session = RefreshSession(hashed, row.user_id, row.role, row.expires_at)
+        await self.cache.put(session)
+        return session
 
     @handle_exceptions()
     async def rotate(
         self,
-        stored_token: RefreshToken,
+        stored_token: RefreshSession,
         ip: str | None,
         ua: str | None,
         ttl_days: int = 30,
-    ) -> str:
+    ) -> str | None:
         """
-        Soft-revoke the existing token and issue a new one.
+        Replace the session's token with a new one (single conditional UPDATE).
 
         Args:
-            stored_token (RefreshToken): The token being rotated.
+            stored_token (RefreshSession): The verified token being rotated.
             ip (Optional[str]): New client IP.
             ua (Optional[str]): New User-Agent.
             ttl_days (int): New token lifespan.
 
         Returns:
-            str: The new raw token.
+            Optional[str]: The new raw token, or None if the token was already
+            rotated / revoked / expired meanwhile (e.g. a replayed refresh).
         """
-        stored_token.is_active = False
-        self.db.add(stored_token)
-
         raw_token = secrets.token_urlsafe(48)
         hashed = self.hash(raw_token)
+        now = datetime.now(UTC)
+        expires_at = now + timedelta(days=ttl_days)
 
-        new_token = RefreshToken(
-            user_id=stored_token.user_id,
-            token_hash=hashed,
-            created_from_ip=ip,
-            user_agent=ua,
-            expires_at=datetime.now(UTC) + timedelta(days=ttl_days),
-            is_active=True,
+        stmt = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == stored_token.token_hash,
+                RefreshToken.is_active.is_(True),
+                RefreshToken.expires_at > now,
+            )
+            .values(
+                token_hash=hashed,
+                created_from_ip=ip,
+                user_agent=ua,
+                expires_at=expires_at,
+                updated_at=now,
+            )
+            .returning(RefreshToken.id)
+            .execution_options(synchronize_session=False)
         )
-        self.db.add(new_token)
+        rotated = (await self.db.execute(stmt)).first()
         await self.db.commit()
+        await self.cache.drop(stored_token.token_hash)
+        if rotated is None:
+            return None
 
+        await self.cache.put(stored_token._replace(token_hash=hashed, expires_at=expires_at))
         return raw_token
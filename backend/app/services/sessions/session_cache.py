@@ -0,0 +1,106 @@
+import logging
+from datetime import datetime, UTC
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from app.config import (
+    CACHE_REDIS_URL,
+    SESSION_CACHE_BACKEND,
+    SESSION_CACHE_MAX_ENTRIES,
+    SESSION_CACHE_TTL_SECONDS,
+)
+from app.permissions import PermissionRole
+from app.utils.cache import MISS, CacheBackend, MemoryBackend, RedisBackend
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshSession(NamedTuple):
+    """Те, що потрібно refresh-ендпоінту від токена — без ORM-об'єкта і без User."""
+    token_hash: str
+    user_id: UUID
+    role: PermissionRole
+    expires_at: datetime
+
+
+def seconds_left(expires_at: datetime) -> float:
+    if expires_at.tzinfo is None:  # sqlite віддає naive
+        expires_at = expires_at.replace(tzinfo=UTC)
+    return (expires_at - datetime.now(UTC)).total_seconds()
+
+
+def build_session_backend(kind: str = SESSION_CACHE_BACKEND) -> Optional[CacheBackend]:
+    """memory (за замовчуванням) | redis | off → None."""
+    if kind == "off":
+        return None
+    if kind == "redis":
+        return RedisBackend(CACHE_REDIS_URL, prefix="fincontrol:sessions:")
+    return MemoryBackend(SESSION_CACHE_MAX_ENTRIES)
+
+
+class SessionCache:
+    """
+    Hot refresh-token hashes → RefreshSession.
+
+    Кеш лише економить lookup: ротація (UPDATE … WHERE is_active) усе одно перевіряє
+    токен у БД, тож застарілий запис (напр. токен відкликано в іншому процесі) не
+    дасть нової пари токенів. TTL — не довше за час життя токена.
+    Помилки бекенду не валять refresh: лог + звичайний запит у БД.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, *, ttl: float = SESSION_CACHE_TTL_SECONDS):
+        self._backend = backend
+        self._configured = backend is not None
+        self.ttl = ttl
+
+    @property
+    def backend(self) -> Optional[CacheBackend]:
+        if not self._configured:
+            self._backend = build_session_backend()
+            self._configured = True
+        return self._backend
+
+    def configure(self, backend: Optional[CacheBackend]) -> None:
+        self._backend = backend
+        self._configured = True
+
+    @staticmethod
+    def _key(token_hash: str) -> str:
+        return f"refresh:{token_hash}"
+
+    async def get(self, token_hash: str) -> Optional[RefreshSession]:
+        if self.backend is None:
+            return None
+        try:
+            value = await self.backend.get(self._key(token_hash))
+        except Exception:  # noqa: BLE001
+            logger.warning("[SessionCache] get failed", exc_info=True)
+            return None
+        if value is MISS or seconds_left(value.expires_at) <= 0:
+            return None
+        return value
+
+    async def put(self, session: RefreshSession) -> None:
+        ttl = min(self.ttl, seconds_left(session.expires_at))
+        if self.backend is None or ttl <= 0:
+            return
+        key = self._key(session.token_hash)
+        try:
+            await self.backend.set(key, session, (key, f"user:{session.user_id}"), ttl)
+        except Exception:  # noqa: BLE001
+            logger.warning("[SessionCache] set failed", exc_info=True)
+
+    async def drop(self, *token_hashes: str, user_id: Optional[UUID] = None) -> None:
+        """Прибрати токени (за хешем) і/або всі закешовані сесії користувача."""
+        tags = [self._key(h) for h in token_hashes]
+        if user_id is not None:
+            tags.append(f"user:{user_id}")
+        if self.backend is None or not tags:
+            return
+        try:
+            await self.backend.invalidate(tags)
+        except Exception:  # noqa: BLE001
+            logger.warning("[SessionCache] invalidate failed", exc_info=True)
+
+
+session_cache = SessionCache()
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from datetime import datetime, UTC
+from typing import Callable, Optional
+
+from sqlalchemy import delete, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import SESSION_SWEEP_BATCH_SIZE, SESSION_SWEEP_INTERVAL_SECONDS
+from app.models.sessions.refresh_token import RefreshToken
+from db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+class SessionSweeper:
+    """
+    Periodic batched cleanup of `refresh_tokens`.
+
+    Прострочені та відкликані (is_active = false) рядки видаляються пачками по
+    `batch_size`, кожна пачка — окрема коротка транзакція (без довгих блокувань).
+    Кілька воркерів можуть мести одночасно: рядки, заблоковані іншим, пропускаються
+    (FOR UPDATE SKIP LOCKED на PostgreSQL).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+        *,
+        interval: float = SESSION_SWEEP_INTERVAL_SECONDS,
+        batch_size: int = SESSION_SWEEP_BATCH_SIZE,
+    ):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self.swept = 0
+
+    async def sweep(self) -> int:
+        """Один повний прохід; повертає кількість видалених рядків."""
+        total = 0
+        for condition in (
+            RefreshToken.expires_at <= datetime.now(UTC),
+            not_(RefreshToken.is_active),
+        ):
+            while True:
+                batch = (
+                    select(RefreshToken.id)
+                    .where(condition)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                async with self.session_factory() as db:
+                    result = await db.execute(
+                        delete(RefreshToken)
+                        .where(RefreshToken.id.in_(batch.scalar_subquery()))
+                        .execution_options(synchronize_session=False)
+                    )
+                    await db.commit()
+                total += result.rowcount
+                if result.rowcount < self.batch_size:
+                    break
+                await asyncio.sleep(0)  # між пачками — дати дорогу запитам
+        self.swept += total
+        return total
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                deleted = await self.sweep()
+                if deleted:
+                    logger.info("[SessionSweeper] removed %d expired/revoked refresh tokens", deleted)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 — наступна спроба через interval
+                logger.exception("[SessionSweeper] sweep failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if self.interval > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._loop(), name="session-sweeper")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+session_sweeper = SessionSweeper()
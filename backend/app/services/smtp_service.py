@@ -1,55 +1,113 @@
 # backend/app/services/smtp_service.py
+import asyncio
+import time
+from email.message import EmailMessage
+from typing import TYPE_CHECKING, Optional
 
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from pydantic import EmailStr
-from jinja2 import Template
+
+from app.config import SMTP_IDLE_CLOSE_SECONDS, SMTP_TIMEOUT_SECONDS
 from app.core.settings import settings
+from app.services.mail.templates import render
 
-RESET_PASSWORD_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Reset your password</title>
-</head>
-<body>
-    <h2>🔐 Password Reset Request</h2>
-    <p>Hello,</p>
-    <p>We received a request to reset your password. Click the link below:</p>
-    <p><a href="{{ reset_link }}">Reset Password</a></p>
-    <p>This link is valid for 30 minutes.</p>
-    <p>If you didn’t request this, just ignore this email.</p>
-    <br>
-    <p>Regards,<br>FinControl Team</p>
-</body>
-</html>
-"""
-
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=settings.MAIL_PASSWORD,
-    MAIL_FROM=settings.MAIL_FROM,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_STARTTLS=settings.MAIL_STARTTLS,
-    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
-    USE_CREDENTIALS=settings.USE_CREDENTIALS,
-)
+if TYPE_CHECKING:
+    import aiosmtplib
 
 
 class SMTPService:
-    def __init__(self):
-        self.fm = FastMail(conf)
+    """
+    SMTP transport with one persistent connection.
 
-    async def send_password_reset_email(self, to_email: EmailStr, reset_token: str) -> None:
-        reset_link = f"{settings.FRONTEND_URL}/reset-password?token={reset_token}"
-        html = Template(RESET_PASSWORD_TEMPLATE).render(reset_link=reset_link)
+    • З'єднання (TLS + AUTH) відкривається при першій відправці й перевикористовується
+      для наступних листів; після `idle_close` секунд простою — перевідкривається
+      (сервери самі рвуть довгі idle-сесії).
+    • Розрив посеред роботи (SMTPServerDisconnected) — одна спроба перепідключитись.
+    • Відправки серіалізуються локом: одна SMTP-сесія — один лист за раз.
+
+    Основний користувач — MailOutboxWorker; для локальної перевірки достатньо
+    `python -m aiosmtpd -n -l localhost:8025` і MAIL_SERVER=localhost, MAIL_PORT=8025,
+    MAIL_STARTTLS=false, MAIL_SSL_TLS=false, USE_CREDENTIALS=false.
+    """
 
-        message = MessageSchema(
-            subject="🔐 Reset your FinControl password",
-            recipients=[to_email],
-            body=html,
-            subtype=MessageType.html,
+    def __init__(
+        self,
+        *,
+        hostname: str = settings.MAIL_SERVER,
+        port: int = settings.MAIL_PORT,
+        username: Optional[str] = settings.MAIL_USERNAME if settings.USE_CREDENTIALS else None,
+        password: Optional[str] = settings.MAIL_PASSWORD if settings.USE_CREDENTIALS else None,
+        use_tls: bool = settings.MAIL_SSL_TLS,
+        start_tls: bool = settings.MAIL_STARTTLS,
+        sender: str = str(settings.MAIL_FROM),
+        timeout: float = SMTP_TIMEOUT_SECONDS,
+        idle_close: float = SMTP_IDLE_CLOSE_SECONDS,
+    ):
+        self._options = dict(
+            hostname=hostname,
+            port=port,
+            username=username,
+            password=password,
+            use_tls=use_tls,
+            start_tls=start_tls,
+            timeout=timeout,
         )
+        self.sender = sender
+        self.idle_close = idle_close
+        self._client: Optional["aiosmtplib.SMTP"] = None
+        self._last_used = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _connection(self) -> "aiosmtplib.SMTP":
+        import aiosmtplib  # лише при першій відправці, не при старті воркера
+
+        if self._client is not None and (
+            not self._client.is_connected or time.monotonic() - self._last_used > self.idle_close
+        ):
+            await self._disconnect()
+        if self._client is None:
+            client = aiosmtplib.SMTP(**self._options)
+            await client.connect()  # + STARTTLS / LOGIN за налаштуваннями
+            self._client = client
+        return self._client
+
+    async def _disconnect(self) -> None:
+        client, self._client = self._client, None
+        if client is not None and client.is_connected:
+            import aiosmtplib
+
+            try:
+                await client.quit()
+            except aiosmtplib.SMTPException:
+                client.close()
+
+    async def send(self, to_email: str, subject: str, html: str) -> None:
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = to_email
+        message["Subject"] = subject
+        message.set_content(html, subtype="html")
+
+        import aiosmtplib
+
+        async with self._lock:
+            for attempt in (1, 2):
+                client = await self._connection()
+                try:
+                    await client.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    await self._disconnect()
+                    if attempt == 2:
+                        raise
+                else:
+                    self._last_used = time.monotonic()
+                    return
+
+    async def send_password_reset_email(self, to_email: EmailStr, reset_token: str) -> None:
+        """Пряма відправка, повз outbox (скрипти / ручна перевірка)."""
+        reset_link = f"{settings.FRONTEND_URL}/reset-password?token={reset_token}"
+        email = render("password_reset", {"reset_link": reset_link, "ttl_minutes": settings.PASSWORD_RESET_TOKEN_TTL})
+        await self.send(str(to_email), email.subject, email.html)
 
-        await self.fm.send_message(message)
\ No newline at end of file
+    async def close(self) -> None:
+        async with self._lock:
+            await self._disconnect()
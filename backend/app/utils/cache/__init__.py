@@ -0,0 +1,16 @@
+from .backends import MISS, CacheBackend, MemoryBackend, RedisBackend
+from .cache import Cache, build_backend, cache, cached
+from .tags import change_tags, entry_tags
+
+__all__ = [
+    "MISS",
+    "CacheBackend",
+    "MemoryBackend",
+    "RedisBackend",
+    "Cache",
+    "build_backend",
+    "cache",
+    "cached",
+    "change_tags",
+    "entry_tags",
+]
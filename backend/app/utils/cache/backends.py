@@ -0,0 +1,140 @@
+import pickle
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Protocol
+
+# значення «немає в кеші» (None — цілком легальний результат методу)
+MISS = object()
+
+
+class CacheBackend(Protocol):
+    """Сховище кешу: значення з TTL + індекс тег → ключі для інвалідації."""
+
+    async def get(self, key: str) -> Any: ...
+
+    async def set(self, key: str, value: Any, tags: Iterable[str], ttl: float) -> None: ...
+
+    async def invalidate(self, tags: Iterable[str]) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+class MemoryBackend:
+    """
+    In-process LRU з TTL (за замовчуванням).
+
+    Значення зберігаються як є (без копіювання) — закешовані результати вважаються read-only.
+    Інвалідація діє лише в межах процесу, тому build_backend() не вмикає його при кількох
+    воркерах (WEB_CONCURRENCY > 1) — там потрібен RedisBackend.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        # key → (expires_at, value, tags)
+        self._data: OrderedDict[str, tuple[float, Any, frozenset[str]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+
+    async def get(self, key: str) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return MISS
+        if entry[0] <= time.monotonic():
+            self._drop(key)
+            return MISS
+        self._data.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: Any, tags: Iterable[str], ttl: float) -> None:
+        self._drop(key)
+        tags = frozenset(tags)
+        self._data[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._data) > self.maxsize:
+            self._drop(next(iter(self._data)))
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                self._drop(key)
+
+    async def clear(self) -> None:
+        self._data.clear()
+        self._tags.clear()
+
+    def _drop(self, key: str) -> None:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisBackend:
+    """
+    Redis-бекенд (спільний для всіх процесів). Пакет `redis` імпортується лише тут; у тестах замість клієнта можна передати fakeredis.aioredis.FakeRedis().
+
+    Значення — pickle (тільки власні результати сервісів, не дані ззовні);
+    тег — SET ключів, його TTL не менший за TTL найдовшого запису (EXPIRE NX + GT, Redis ≥ 7).
+    """
+
+    def __init__(self, url: Optional[str] = None, *, client: Any = None, prefix: str = "fincontrol:cache:"):
+        if client is None:
+            from redis import asyncio as aioredis  # опційна залежність
+
+            client = aioredis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    async def get(self, key: str) -> Any:
+        raw = await self.client.get(self._key(key))
+        return MISS if raw is None else pickle.loads(raw)
+
+    async def set(self, key: str, value: Any, tags: Iterable[str], ttl: float) -> None:
+        ttl_ms = max(1, int(ttl * 1000))
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(self._key(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), px=ttl_ms)
+        for tag in tags:
+            tag_key = self._tag(tag)
+            pipe.sadd(tag_key, self._key(key))
+            pipe.pexpire(tag_key, ttl_ms, nx=True)
+            pipe.pexpire(tag_key, ttl_ms, gt=True)
+        await pipe.execute()
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        tag_keys = [self._tag(tag) for tag in tags]
+        if not tag_keys:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        members = await pipe.execute()
+
+        # SREM лише прочитаних ключів: запис, доданий у тег паралельно, не губиться з індексу
+        pipe = self.client.pipeline(transaction=False)
+        keys = set()
+        for tag_key, tag_members in zip(tag_keys, members):
+            if tag_members:
+                keys.update(tag_members)
+                pipe.srem(tag_key, *tag_members)
+        if keys:
+            pipe.delete(*keys)
+            await pipe.execute()
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=f"{self.prefix}*")]
+        if keys:
+            await self.client.delete(*keys)
@@ -0,0 +1,222 @@
+import asyncio
+import hashlib
+import inspect
+import logging
+import time
+from collections import Counter, OrderedDict
+from functools import wraps
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from app.config import CACHE_BACKEND, CACHE_MAX_ENTRIES, CACHE_REDIS_URL, CACHE_TTL_SECONDS, WEB_CONCURRENCY
+from .backends import MISS, CacheBackend, MemoryBackend, RedisBackend
+from .tags import entry_tags
+
+T = TypeVar("T", bound=Callable[..., Any])
+logger = logging.getLogger(__name__)
+
+
+def build_backend(kind: str = CACHE_BACKEND, workers: int = WEB_CONCURRENCY) -> Optional[CacheBackend]:
+    """
+    memory | redis | off → None (кеш вимкнено).
+
+    memory при кількох воркерах теж → None: інвалідація не дійшла б до інших процесів,
+    і вони віддавали б застарілі дані до CACHE_TTL_SECONDS.
+    """
+    if kind == "off":
+        return None
+    if kind == "redis":
+        return RedisBackend(CACHE_REDIS_URL)
+    if workers > 1:
+        logger.warning(
+            "[Cache] CACHE_BACKEND=memory with WEB_CONCURRENCY=%s — dashboard cache disabled, "
+            "set CACHE_REDIS_URL to share it between workers", workers,
+        )
+        return None
+    return MemoryBackend(CACHE_MAX_ENTRIES)
+
+
+class Cache:
+    """
+    Read-through cache with tag invalidation.
+
+    `invalidate(tags)` синхронний (його кличе after_commit-слухач change bus): теги одразу
+    позначаються «брудними» — читання з ними йде повз кеш, доки бекенд їх не скине, —
+    а саме видалення виконується на бекенді асинхронно. Значення, під час обчислення якого
+    скинули хоч один з його тегів, у кеш не пишеться — інакше воно пережило б запис.
+    Помилки бекенду не валять запит: лог + обчислення напряму.
+
+    `lag_bound` — наскільки (сек) дані сесії можуть відставати від primary (read replica):
+    значення не кешується, якщо якийсь з його тегів інвалідовано протягом останніх lag_bound.
+    Обидві перевірки — по тегах запису: інвалідація одного тегу не зупиняє кешування решти.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, *, ttl: float = CACHE_TTL_SECONDS):
+        self._backend = backend
+        self._configured = backend is not None
+        self.ttl = ttl
+        # tag → (seq, monotonic) останньої інвалідації; порядок — від найстарішої
+        self._invalidated: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._seq = 0
+        self._pruned_seq = 0
+        self._lag_horizon = 0.0
+        self._pending: Counter[str] = Counter()
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def backend(self) -> Optional[CacheBackend]:
+        if not self._configured:
+            self._backend = build_backend()
+            self._configured = True
+        return self._backend
+
+    def configure(self, backend: Optional[CacheBackend]) -> None:
+        """Підміна бекенду (напр. fakeredis у тестах); None вимикає кеш."""
+        self._backend = backend
+        self._configured = True
+
+    async def get_or_compute(
+        self,
+        key: str,
+        tags: frozenset[str],
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        lag_bound: float = 0.0,
+    ) -> Any:
+        backend = self.backend
+        if backend is None or (self._pending and not tags.isdisjoint(self._pending)):
+            return await compute()
+
+        try:
+            value = await backend.get(key)
+        except Exception:  # noqa: BLE001
+            logger.warning("[Cache] get failed for %s", key, exc_info=True)
+            return await compute()
+        if value is not MISS:
+            return value
+
+        self._lag_horizon = max(self._lag_horizon, lag_bound)
+        seq = self._seq
+        value = await compute()
+        if self._may_store(tags, seq, lag_bound):
+            try:
+                await backend.set(key, value, tags, self.ttl if ttl is None else ttl)
+            except Exception:  # noqa: BLE001
+                logger.warning("[Cache] set failed for %s", key, exc_info=True)
+        return value
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        tags = set(tags)
+        if not tags or self.backend is None:
+            return
+        self._seq += 1
+        now = time.monotonic()
+        for tag in tags:
+            self._invalidated[tag] = (self._seq, now)
+            self._invalidated.move_to_end(tag)
+        self._prune(now)
+        self._pending.update(tags)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # sync-контекст (скрипти, alembic) — без event loop
+            asyncio.run(self._invalidate(tags))
+            return
+        task = loop.create_task(self._invalidate(tags))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _may_store(self, tags: frozenset[str], seq: int, lag_bound: float) -> bool:
+        """Жоден тег не скинуто після початку обчислення (seq) і протягом lag_bound до тепер."""
+        if self._pruned_seq > seq:  # мітку, що могла стосуватись запису, вже прибрано
+            return False
+        cutoff = time.monotonic() - lag_bound
+        for tag in tags:
+            mark = self._invalidated.get(tag)
+            if mark is not None and (mark[0] > seq or mark[1] > cutoff):
+                return False
+        return True
+
+    def _prune(self, now: float) -> None:
+        # мітки, старші за TTL і за найбільший lag_bound, потрібні лише дуже довгим обчисленням —
+        # для них лишається _pruned_seq (такий результат просто не кешується)
+        horizon = now - max(self.ttl, self._lag_horizon)
+        while self._invalidated:
+            tag, (seq, at) = next(iter(self._invalidated.items()))
+            if at > horizon:
+                break
+            del self._invalidated[tag]
+            self._pruned_seq = max(self._pruned_seq, seq)
+
+    async def _invalidate(self, tags: set[str]) -> None:
+        try:
+            await self.backend.invalidate(tags)
+        except Exception:  # noqa: BLE001
+            logger.exception("[Cache] invalidation failed for %s", sorted(tags))
+        finally:
+            self._pending.subtract(tags)
+            for tag in tags:
+                if self._pending[tag] <= 0:
+                    del self._pending[tag]
+
+    async def drain(self) -> None:
+        """Дочекатися запланованих інвалідацій (shutdown / тести)."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def clear(self) -> None:
+        if self.backend is not None:
+            await self.backend.clear()
+
+
+cache = Cache()
+
+
+def _args_key(arguments: dict) -> str:
+    raw = repr(sorted(arguments.items()))
+    return raw if len(raw) <= 64 else hashlib.sha1(raw.encode()).hexdigest()
+
+
+def cached(
+    role: str,
+    *,
+    entity: str,
+    topics: Iterable[str] = (),
+    wide_topics: Iterable[str] = (),
+    ttl: Optional[float] = None,
+) -> Callable[[T], T]:
+    """
+    Кешує результат async-методу дашборду.
+
+    Ключ — role + id сутності (аргумент `entity`, напр. "worker_id") + метод + решта аргументів.
+    `topics` — топіки change bus, дані яких метод читає в межах цієї сутності
+    (скидаються подіями зі скоупом на неї); `wide_topics` — топіки, від яких метод
+    залежить цілком (скидаються будь-якою зміною топіка).
+
+    Ставиться під @handle_exceptions(), щоб помилки БД не кешувались і мапились як і раніше.
+    """
+    role = getattr(role, "value", role)
+    topics, wide_topics = tuple(topics), tuple(wide_topics)
+
+    def decorator(func: T) -> T:  # type: ignore[misc]
+        signature = inspect.signature(func)
+        name = func.__qualname__
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self", None)
+            entity_id = arguments.pop(entity)
+
+            key = f"{role}:{entity_id}:{name}"
+            if arguments:
+                key = f"{key}:{_args_key(arguments)}"
+            tags = entry_tags(role, entity_id, topics, wide_topics)
+            db = getattr(args[0], "db", None) if args else None
+            lag_bound = db.info.get("read_lag_bound", 0.0) if db is not None else 0.0
+            return await cache.get_or_compute(key, tags, lambda: func(*args, **kwargs), ttl, lag_bound)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
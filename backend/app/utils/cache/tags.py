@@ -0,0 +1,38 @@
+from typing import Iterable, Mapping, Optional
+
+# Схема тегів (topic — топік change bus: "credits", "clients", …):
+#   "{topic}:{role}:{id}" — запис залежить від даних однієї сутності (дашборд воркера X);
+#   "{topic}:{role}"      — той самий запис, для подій з невідомим скоупом по ролі;
+#   "{topic}:*"           — запис залежить від топіка цілком (не звужується до сутності).
+
+
+def entry_tags(
+    role: str,
+    entity_id: object,
+    topics: Iterable[str] = (),
+    wide_topics: Iterable[str] = (),
+) -> frozenset[str]:
+    """Теги одного закешованого значення ролі `role` для сутності `entity_id`."""
+    tags = set()
+    for topic in topics:
+        tags.add(f"{topic}:{role}")
+        tags.add(f"{topic}:{role}:{entity_id}")
+    for topic in wide_topics:
+        tags.add(f"{topic}:*")
+    return frozenset(tags)
+
+
+def change_tags(topic: str, scopes: Mapping[str, Optional[Iterable[object]]]) -> set[str]:
+    """
+    Теги, які скидає одна зміна топіка.
+
+    `scopes` — {role: ids}: None → скоуп невідомий (скидаються всі сутності ролі),
+    порожня множина → роль не зачеплена.
+    """
+    tags = {f"{topic}:*"}
+    for role, ids in scopes.items():
+        if ids is None:
+            tags.add(f"{topic}:{role}")
+        else:
+            tags.update(f"{topic}:{role}:{entity_id}" for entity_id in ids)
+    return tags
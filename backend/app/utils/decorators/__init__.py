@@ -1,8 +1,11 @@
+from app.utils.cache import cached
+
 from .db import handle_exceptions
 from .route import handle_route_exceptions
 from .websocket import handle_ws_exceptions
 
 __all__ = [
+    "cached",
     "handle_exceptions",
     "handle_route_exceptions",
     "handle_ws_exceptions"
@@ -8,6 +8,8 @@ from fastapi import HTTPException, status
 from psycopg2 import errorcodes
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
+from app.utils.instrumentation import sql_caller
+
 T = TypeVar("T", bound=Callable[..., Any])
 logger = logging.getLogger(__name__)
 
@@ -30,10 +32,15 @@ def handle_exceptions(
     • за `raise_404=True` піднімає 404, коли результат `None`
 
     • будь-які інші SQLAlchemyError → 500 (або `default_status`)
+
+    • позначає метод як `sql_caller` — SQL-метрики групуються по ньому
     """
 
     def decorator(func: T) -> T:  # type: ignore[misc]
+        caller = func.__qualname__
+
         async def _async(*args, **kwargs):
+            token = sql_caller.set(caller)
             try:
                 result = await func(*args, **kwargs)
                 if raise_404 and result is None:
@@ -46,8 +53,11 @@ def handle_exceptions(
                 await _rollback(args)
                 logger.exception("SQLAlchemy error in %s", func.__name__, exc)
                 raise HTTPException(default_return, "Ошибка базы данных") from exc
+            finally:
+                sql_caller.reset(token)
 
         def _sync(*args, **kwargs):
+            token = sql_caller.set(caller)
             try:
                 result = func(*args, **kwargs)
                 if raise_404 and result is None:
@@ -60,6 +70,8 @@ def handle_exceptions(
                 _rollback(args, sync=True)
                 logger.exception("SQLAlchemy error in %s", func.__name__, exc)
                 raise HTTPException(default_return, "Ошибка базы данных") from exc
+            finally:
+                sql_caller.reset(token)
 
         @wraps(func)
         def wrapper(*args, **kwargs):  # type: ignore[override]
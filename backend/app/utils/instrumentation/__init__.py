@@ -0,0 +1,25 @@
+# startup — першим: його origin (початок імпорту main) береться при імпорті модуля
+from .startup import ImportProfiler, ImportRecord, StartupTimings, import_profiler, parse_importtime, startup_timings
+from .http import RequestMetrics, RequestStats, request_metrics, request_stats
+from .prometheus import DEFAULT_BUCKETS, Histogram
+from .sql import SqlMetrics, fingerprint, instrument_engine, sql_caller, sql_metrics
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "Histogram",
+    "ImportProfiler",
+    "ImportRecord",
+    "RequestMetrics",
+    "RequestStats",
+    "SqlMetrics",
+    "StartupTimings",
+    "fingerprint",
+    "import_profiler",
+    "instrument_engine",
+    "parse_importtime",
+    "request_metrics",
+    "request_stats",
+    "sql_caller",
+    "sql_metrics",
+    "startup_timings",
+]
@@ -0,0 +1,162 @@
+import json
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Optional
+
+from app.config import N_PLUS_ONE_THRESHOLD, N_PLUS_ONE_WARN
+from .prometheus import DEFAULT_BUCKETS, Histogram, render_counter, render_histogram
+
+logger = logging.getLogger("app.http")
+
+SIZE_BUCKETS = (100.0, 1_000.0, 10_000.0, 100_000.0, 1_000_000.0, 10_000_000.0)
+STATEMENT_BUCKETS = (0.0, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0, 50.0, 100.0)
+
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+class RequestStats:
+    """SQL одного запиту: скільки statement-ів і скільки разів кожен fingerprint."""
+
+    __slots__ = ("statements", "fingerprints", "sql")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.fingerprints: Counter[str] = Counter()
+        self.sql: dict[str, str] = {}
+
+    def record(self, fp: str, sql: str) -> None:
+        self.statements += 1
+        self.fingerprints[fp] += 1
+        if fp not in self.sql:
+            self.sql[fp] = sql
+
+
+# Поточний HTTP-запит (ставить RequestMetricsMiddleware); engine-хук рахує в нього statement-и
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class _RouteSeries:
+    __slots__ = ("latency", "size", "statements", "statuses", "max_latency", "max_statements", "max_size")
+
+    def __init__(self) -> None:
+        self.latency = Histogram(DEFAULT_BUCKETS)
+        self.size = Histogram(SIZE_BUCKETS)
+        self.statements = Histogram(STATEMENT_BUCKETS)
+        self.statuses: Counter[int] = Counter()
+        self.max_latency = 0.0
+        self.max_statements = 0
+        self.max_size = 0
+
+
+class RequestMetrics:
+    """
+    Per-route (template path) request metrics: latency, response size, DB statements.
+
+    N+1: якщо один fingerprint виконався за запит більше ніж `n_plus_one_threshold` разів —
+    лічильник http_n_plus_one_total і (dev/test, N_PLUS_ONE_WARN) warning у лог.
+    """
+
+    LABELS = ("method", "route")
+
+    def __init__(self, *, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD, warn: bool = N_PLUS_ONE_WARN):
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.warn = warn
+        self.routes: dict[tuple[str, str], _RouteSeries] = {}
+        self.n_plus_one: Counter[tuple[str, str, str]] = Counter()
+
+    def observe(self, method: str, route: str, status: int, seconds: float, size: int, stats: RequestStats) -> None:
+        series = self.routes.get((method, route))
+        if series is None:
+            series = self.routes[(method, route)] = _RouteSeries()
+        series.latency.observe(seconds)
+        series.size.observe(size)
+        series.statements.observe(stats.statements)
+        series.statuses[status] += 1
+        series.max_latency = max(series.max_latency, seconds)
+        series.max_statements = max(series.max_statements, stats.statements)
+        series.max_size = max(series.max_size, size)
+
+        for fp, count in stats.fingerprints.items():
+            if count > self.n_plus_one_threshold:
+                self.n_plus_one[(method, route, fp)] += 1
+                if self.warn:
+                    logger.warning(
+                        "[N+1] %s %s ran the same statement %d times (fingerprint=%s): %.300s",
+                        method, route, count, fp, stats.sql.get(fp, ""),
+                    )
+
+    def reset(self) -> None:
+        self.routes.clear()
+        self.n_plus_one.clear()
+
+    # ── export ───────────────────────────────────
+    def render(self) -> str:
+        keys = list(self.routes)
+        lines = render_histogram(
+            "http_request_duration_seconds", "Request latency by route template.",
+            {key: self.routes[key].latency for key in keys}, self.LABELS,
+        )
+        lines += render_histogram(
+            "http_response_size_bytes", "Response body size by route template.",
+            {key: self.routes[key].size for key in keys}, self.LABELS,
+        )
+        lines += render_histogram(
+            "http_request_db_statements", "SQL statements issued per request.",
+            {key: self.routes[key].statements for key in keys}, self.LABELS,
+        )
+        lines += render_counter(
+            "http_responses_total", "Responses by route template and status.",
+            {(*key, status): n for key in keys for status, n in self.routes[key].statuses.items()},
+            (*self.LABELS, "status"),
+        )
+        lines += render_counter(
+            "http_n_plus_one_total", f"Requests that ran one statement more than {self.n_plus_one_threshold} times.",
+            self.n_plus_one, (*self.LABELS, "fingerprint"),
+        )
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict:
+        """JSON-придатний зріз (для CI: порівняння кількості запитів / латентності між прогонами)."""
+        routes = []
+        for (method, route), s in sorted(self.routes.items(), key=lambda item: (item[0][1], item[0][0])):
+            count = s.latency.count or 1
+            routes.append({
+                "method": method,
+                "route": route,
+                "requests": s.latency.count,
+                "statuses": {str(code): n for code, n in sorted(s.statuses.items())},
+                "latency_ms": {
+                    "mean": round(s.latency.sum / count * 1000, 3),
+                    "p50": _quantile_ms(s.latency, 0.5),
+                    "p95": _quantile_ms(s.latency, 0.95),
+                    "max": round(s.max_latency * 1000, 3),
+                },
+                "db_statements": {"mean": round(s.statements.sum / count, 2), "max": s.max_statements},
+                "response_bytes": {"mean": round(s.size.sum / count), "max": s.max_size},
+            })
+        return {
+            "routes": routes,
+            "n_plus_one": [
+                {"method": method, "route": route, "fingerprint": fp, "requests": n}
+                for (method, route, fp), n in sorted(self.n_plus_one.items())
+            ],
+        }
+
+    def dump_json(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.snapshot(), indent=2, ensure_ascii=False))
+
+
+def _quantile_ms(hist: Histogram, q: float) -> Optional[float]:
+    """Верхня межа бакета, в який потрапляє квантиль (оцінка, як histogram_quantile без інтерполяції)."""
+    if not hist.count:
+        return None
+    rank = q * hist.count
+    for le, cumulative in hist.cumulative():
+        if cumulative >= rank:
+            return None if le == "+Inf" else float(le) * 1000
+    return None
+
+
+request_metrics = RequestMetrics()
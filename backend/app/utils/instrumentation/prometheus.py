@@ -0,0 +1,54 @@
+from bisect import bisect_left
+from typing import Iterable, Mapping
+
+# секунди; +Inf додається при рендері
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """Один ряд гістограми (без міток): лічильники по бакетах, сума, кількість."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> Iterable[tuple[str, int]]:
+        total = 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            yield ("+Inf" if bound == float("inf") else repr(bound)), total
+
+
+def escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def labels(values: Mapping[str, object]) -> str:
+    return ",".join(f'{key}="{escape(value)}"' for key, value in values.items())
+
+
+def render_histogram(name: str, help_text: str, series: Mapping[tuple, Histogram], label_names: tuple[str, ...]) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for key, hist in series.items():
+        base = labels(dict(zip(label_names, key)))
+        for le, count in hist.cumulative():
+            lines.append(f'{name}_bucket{{{base},le="{le}"}} {count}')
+        lines.append(f"{name}_sum{{{base}}} {hist.sum:.6f}")
+        lines.append(f"{name}_count{{{base}}} {hist.count}")
+    return lines
+
+
+def render_counter(name: str, help_text: str, series: Mapping[tuple, float], label_names: tuple[str, ...]) -> list[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    for key, value in series.items():
+        lines.append(f"{name}{{{labels(dict(zip(label_names, key)))}}} {value}")
+    return lines
@@ -0,0 +1,151 @@
+import hashlib
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import SQL_METRICS_MAX_SERIES, SQL_SLOW_QUERY_MS
+from .http import request_stats
+from .prometheus import DEFAULT_BUCKETS, Histogram, labels, render_counter, render_histogram
+
+logger = logging.getLogger("app.sql")
+
+# Метод сервісу, що зараз виконує SQL (ставить handle_exceptions); "-" — поза сервісом
+sql_caller: ContextVar[str] = ContextVar("sql_caller", default="-")
+
+# ───────────────────── fingerprint ─────────────────────
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PARAM = re.compile(r"\$\d+|%\(\w+\)s|\?")
+_NUMBER = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+_OTHER = "other"
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(statement: str) -> tuple[str, str]:
+    """
+    (id, нормалізований SQL): літерали і плейсхолдери → ?, IN-списки → (?+), пробіли стиснуті.
+    Рядки SQL від SQLAlchemy повторюються (compiled cache), тож результат кешується.
+    """
+    sql = _STRING.sub("?", statement)
+    sql = _PARAM.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("(?+)", sql)
+    sql = _SPACE.sub(" ", sql).strip()
+    return hashlib.sha1(sql.encode()).hexdigest()[:12], sql
+
+
+class SqlMetrics:
+    """
+    Per-statement latency histograms keyed by (engine, fingerprint, caller).
+
+    Кількість рядів обмежена `max_series`: нові ключі понад ліміт ідуть у fingerprint="other".
+    Повільні (≥ slow_ms) запити логуються нормалізованим SQL — без параметрів (PII).
+    """
+
+    LABELS = ("db", "fingerprint", "caller")
+
+    def __init__(self, *, slow_ms: float = SQL_SLOW_QUERY_MS, max_series: int = SQL_METRICS_MAX_SERIES):
+        self.slow_seconds = slow_ms / 1000
+        self.max_series = max_series
+        self.latency: dict[tuple, Histogram] = {}
+        self.statements: dict[str, str] = {}
+        self.errors: Counter[tuple] = Counter()
+        self.slow: Counter[tuple] = Counter()
+
+    def _key(self, db: str, statement: str, caller: str) -> tuple[tuple, str]:
+        fp, sql = fingerprint(statement)
+        key = (db, fp, caller)
+        if key not in self.latency and len(self.latency) >= self.max_series:
+            return (db, _OTHER, _OTHER), sql
+        self.statements.setdefault(fp, sql)
+        return key, sql
+
+    def observe(self, db: str, statement: str, seconds: float) -> None:
+        caller = sql_caller.get()
+        key, sql = self._key(db, statement, caller)
+        hist = self.latency.get(key)
+        if hist is None:
+            hist = self.latency[key] = Histogram(DEFAULT_BUCKETS)
+        hist.observe(seconds)
+
+        if seconds >= self.slow_seconds:
+            self.slow[key] += 1
+            logger.warning(
+                "[SQL] slow query %.1f ms db=%s caller=%s fingerprint=%s: %.500s",
+                seconds * 1000, db, caller, key[1], sql,
+            )
+
+    def error(self, db: str, statement: Optional[str]) -> None:
+        key, _ = self._key(db, statement or "", sql_caller.get())
+        self.errors[key] += 1
+
+    def reset(self) -> None:
+        self.latency.clear()
+        self.statements.clear()
+        self.errors.clear()
+        self.slow.clear()
+
+    def render(self) -> str:
+        lines = render_histogram(
+            "sql_statement_duration_seconds", "SQL statement latency by fingerprint and caller.",
+            self.latency, self.LABELS,
+        )
+        lines += render_counter(
+            "sql_slow_statements_total", f"Statements slower than {self.slow_seconds * 1000:g} ms.",
+            self.slow, self.LABELS,
+        )
+        lines += render_counter("sql_statement_errors_total", "Statements that raised.", self.errors, self.LABELS)
+        # текст запиту — окремою info-метрикою, щоб не роздувати мітки гістограми
+        lines += ["# HELP sql_statement_info Normalized SQL for a fingerprint.", "# TYPE sql_statement_info gauge"]
+        lines += [
+            f"sql_statement_info{{{labels({'fingerprint': fp, 'statement': sql[:300]})}}} 1"
+            for fp, sql in self.statements.items()
+        ]
+        return "\n".join(lines) + "\n"
+
+
+sql_metrics = SqlMetrics()
+
+
+def instrument_engine(engine: AsyncEngine | Engine, name: str, metrics: Optional[SqlMetrics] = sql_metrics) -> None:
+    """
+    Вішає before/after_cursor_execute + handle_error на engine (sync або async).
+
+    Statement-и завжди рахуються в поточний HTTP-запит (request_stats, якщо його ставить
+    RequestMetricsMiddleware); `metrics=None` — без per-statement латентності (SQL_INSTRUMENTATION вимкнено).
+    """
+    target = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(target, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        stats = request_stats.get()
+        if stats is not None:
+            stats.record(*fingerprint(statement))
+        if metrics is not None:
+            conn.info.setdefault("_sql_started", []).append(time.perf_counter())
+
+    if metrics is None:
+        return
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["_sql_started"].pop()
+        metrics.observe(name, statement, time.perf_counter() - started)
+
+    @event.listens_for(target, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        stack = conn.info.get("_sql_started") if conn is not None else None
+        if stack:
+            stack.pop()
+        metrics.error(name, exception_context.statement)
@@ -0,0 +1,168 @@
+import asyncio
+import re
+import subprocess
+import sys
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Iterator, Optional
+
+from app.config import IMPORT_PROFILE_CACHE_SIZE, IMPORT_PROFILE_TIMEOUT_SECONDS
+
+# backend/ — звідси `import main` працює так само, як у воркера
+BACKEND_ROOT = Path(__file__).resolve().parents[3]
+
+# "import time:       396 |     629818 |   fastapi"  (відступ після "|" — 1 + 2 * глибина)
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)\s*$")
+# профілюються лише модулі самого бекенду: main, app, app.* (не довільний код у підпроцесі)
+_MODULE_NAME = re.compile(r"main|app(\.[A-Za-z_]\w*)*")
+
+
+class StartupTimings:
+    """
+    Cold-start timings of this process.
+
+    • milestones — секунди від origin: імпорт цього модуля (main імпортує його першим)
+      або явний `begin()`; мітки imports, app_created, ready;
+    • phases — тривалість окремих кроків (напр. routes — побудова таблиці маршрутів).
+    """
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.milestones: dict[str, float] = {}
+        self.phases: dict[str, float] = {}
+
+    def begin(self, origin: Optional[float] = None) -> None:
+        self.origin = origin if origin is not None else time.perf_counter()
+
+    def mark(self, name: str) -> None:
+        self.milestones[name] = time.perf_counter() - self.origin
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - started
+
+    def snapshot(self) -> dict:
+        return {
+            "milestones_ms": {k: round(v * 1000, 1) for k, v in self.milestones.items()},
+            "phases_ms": {k: round(v * 1000, 1) for k, v in self.phases.items()},
+        }
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Рядки `python -X importtime` → записи (решта виводу ігнорується)."""
+    records = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+
+def _row(record: ImportRecord) -> dict:
+    return {
+        "module": record.module,
+        "self_ms": round(record.self_us / 1000, 2),
+        "cumulative_ms": round(record.cumulative_us / 1000, 2),
+        "depth": record.depth,
+    }
+
+
+class ImportProfiler:
+    """
+    Import-time report for a module, as `python -X importtime -c "import <module>"` sees it.
+
+    Профіль знімається у свіжому інтерпретаторі (у поточному процесі все вже імпортовано),
+    один прогін за раз; результат кешується до `refresh=True` (LRU на `max_runs` модулів).
+    Дозволені лише `main` і `app.*`.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float = IMPORT_PROFILE_TIMEOUT_SECONDS,
+        max_runs: int = IMPORT_PROFILE_CACHE_SIZE,
+    ):
+        self.timeout = timeout
+        self.max_runs = max(1, max_runs)
+        self._lock = asyncio.Lock()
+        self._runs: OrderedDict[str, dict] = OrderedDict()
+
+    async def _run(self, module: str) -> dict:
+        started = time.perf_counter()
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-X", "importtime", "-c", f"import {module}",
+            cwd=str(BACKEND_ROOT),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        text = stderr.decode(errors="replace")
+        records = parse_importtime(text)
+        tail = [line for line in text.splitlines() if not line.startswith("import time:")][-20:]
+        return {
+            "records": records,
+            "exit_code": proc.returncode,
+            "wall_ms": round((time.perf_counter() - started) * 1000, 1),
+            "measured_at": datetime.now(UTC).isoformat(),
+            "errors": tail if proc.returncode else [],
+        }
+
+    async def report(self, module: str = "main", *, top: int = 30, refresh: bool = False) -> dict:
+        if not _MODULE_NAME.fullmatch(module):
+            raise ValueError(f"Module is not allowed (main or app.*): {module!r}")
+        async with self._lock:
+            if refresh or module not in self._runs:
+                self._runs[module] = await self._run(module)
+                while len(self._runs) > self.max_runs:
+                    self._runs.popitem(last=False)
+            self._runs.move_to_end(module)
+            run = self._runs[module]
+        records: list[ImportRecord] = run["records"]
+
+        packages: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        for record in records:
+            package = packages[record.module.split(".", 1)[0]]
+            package[0] += record.self_us
+            package[1] += 1
+
+        return {
+            "module": module,
+            "exit_code": run["exit_code"],
+            "errors": run["errors"],
+            "measured_at": run["measured_at"],
+            "wall_ms": run["wall_ms"],
+            "total_import_ms": round(sum(r.self_us for r in records) / 1000, 1),
+            "modules": len(records),
+            "top_cumulative": [_row(r) for r in sorted(records, key=lambda r: -r.cumulative_us)[:top]],
+            "top_self": [_row(r) for r in sorted(records, key=lambda r: -r.self_us)[:top]],
+            "packages": [
+                {"package": name, "self_ms": round(self_us / 1000, 1), "modules": count}
+                for name, (self_us, count) in sorted(packages.items(), key=lambda kv: -kv[1][0])[:top]
+            ],
+        }
+
+
+startup_timings = StartupTimings()
+import_profiler = ImportProfiler()
@@ -1,9 +1,13 @@
 from .limiter import rate_limit
-from .ws_access_token import WebSocketAuthMiddleware
-from .access_token import AccessTokenMiddleware
+from .auth import AuthMiddleware, PathTrie, TokenCache, decode_access_token, token_cache
+from .request_metrics import RequestMetricsMiddleware
 
 __all__ = [
     "rate_limit",
-    "WebSocketAuthMiddleware",
-    "AccessTokenMiddleware",
-]
\ No newline at end of file
+    "AuthMiddleware",
+    "PathTrie",
+    "TokenCache",
+    "decode_access_token",
+    "token_cache",
+    "RequestMetricsMiddleware",
+]
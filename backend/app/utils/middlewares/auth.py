@@ -0,0 +1,175 @@
+import time
+from collections import OrderedDict
+from http.cookies import SimpleCookie
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
+
+import jwt
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.websockets import WebSocket
+
+from app.config import AUTH_HTTP_PROTECTED_PATHS, AUTH_TOKEN_CACHE_SIZE, AUTH_WS_PROTECTED_PATHS
+from app.core.settings import settings
+
+# Токен без exp кешується не довше ніж на стільки (сек)
+_NO_EXP_TTL = 300.0
+
+
+class PathTrie:
+    """
+    Prefix matcher over path segments: "/api/entities" matches "/api/entities" and
+    "/api/entities/…", but not "/api/entities-x". "/" matches every path.
+    """
+
+    __slots__ = ("_root",)
+
+    _END = object()
+
+    def __init__(self, prefixes: Iterable[str] = ()):
+        self._root: dict = {}
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def add(self, prefix: str) -> None:
+        node = self._root
+        for segment in filter(None, prefix.split("/")):
+            node = node.setdefault(segment, {})
+        node[self._END] = True
+
+    def match(self, path: str) -> bool:
+        node = self._root
+        if self._END in node:
+            return True
+        for segment in filter(None, path.split("/")):
+            node = node.get(segment)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+
+
+class TokenCache:
+    """
+    LRU of verified JWT payloads keyed by signature, valid until the token's `exp`.
+
+    Підпис — короткий ключ; на влучанні токен звіряється повністю, тож інший
+    header/payload з тим самим підписом не пройде повз jwt.decode.
+    Payload зберігається як read-only копія: обробник не може змінити
+    `scope["user"]` для наступних запитів з тим самим токеном.
+    """
+
+    def __init__(self, maxsize: int = AUTH_TOKEN_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[str, Mapping[str, Any], float]] = OrderedDict()
+
+    def get(self, token: str) -> Optional[Mapping[str, Any]]:
+        signature = token.rpartition(".")[2]
+        entry = self._entries.get(signature)
+        if entry is None:
+            return None
+        cached_token, payload, expires_at = entry
+        if cached_token != token:
+            return None
+        if time.time() >= expires_at:
+            del self._entries[signature]
+            return None
+        self._entries.move_to_end(signature)
+        return payload
+
+    def put(self, token: str, payload: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Кешує payload і повертає його read-only копію (її ж віддає `get`)."""
+        payload = MappingProxyType(dict(payload))
+        if self.maxsize <= 0:
+            return payload
+        exp = payload.get("exp")
+        expires_at = float(exp) if isinstance(exp, (int, float)) else time.time() + _NO_EXP_TTL
+        signature = token.rpartition(".")[2]
+        self._entries[signature] = (token, payload, expires_at)
+        self._entries.move_to_end(signature)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return payload
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+token_cache = TokenCache()
+
+
+def decode_access_token(token: str, cache: TokenCache = token_cache) -> Mapping[str, Any]:
+    """Decode + verify (settings.JWT_ALGO); raises jwt.PyJWTError. Verified payloads are cached (read-only)."""
+    payload = cache.get(token)
+    if payload is None:
+        payload = cache.put(token, jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGO]))
+    return payload
+
+
+def _extract_token(scope: Scope) -> Optional[str]:
+    """"Authorization: Bearer <token>", інакше cookie access_token."""
+    cookie_header = None
+    for name, value in scope.get("headers") or ():
+        if name == b"authorization":
+            auth = value.decode("latin-1")
+            if auth.startswith("Bearer "):
+                return auth[7:]
+        elif name == b"cookie":
+            cookie_header = value.decode("latin-1")
+    if cookie_header:
+        morsel = SimpleCookie(cookie_header).get("access_token")
+        if morsel is not None and morsel.value:
+            return morsel.value
+    return None
+
+
+class AuthMiddleware:
+    """
+    Pure ASGI JWT authentication for HTTP and WebSocket.
+
+    This middleware:
+    🔹 Extracts the token ("Authorization: Bearer <token>" or the access_token cookie).
+    🔹 Verifies it once per request (LRU of verified tokens until `exp`).
+    🔹 On success, injects the decoded payload (read-only mapping) into `scope["user"]` for dependencies.
+    🔹 On protected prefixes (path trie), rejects a missing/invalid token:
+       HTTP → 401, WebSocket → close 4401. Elsewhere an invalid token is ignored.
+
+    Usage:
+        app.add_middleware(AuthMiddleware)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        http_protected: Iterable[str] = AUTH_HTTP_PROTECTED_PATHS,
+        ws_protected: Iterable[str] = AUTH_WS_PROTECTED_PATHS,
+        cache: TokenCache = token_cache,
+    ):
+        self.app = app
+        self.protected = {"http": PathTrie(http_protected), "websocket": PathTrie(ws_protected)}
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        kind = scope["type"]
+        if kind not in self.protected:
+            await self.app(scope, receive, send)
+            return
+
+        token = _extract_token(scope)
+        error = "Missing token"
+        if token:
+            try:
+                scope["user"] = decode_access_token(token, self.cache)
+                error = None
+            except jwt.PyJWTError:
+                error = "Invalid token"
+
+        if error and self.protected[kind].match(scope["path"]):
+            if kind == "websocket":
+                await WebSocket(scope, receive, send).close(code=4401)
+            else:
+                await PlainTextResponse(error, status_code=401)(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,64 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.instrumentation.http import (
+    UNMATCHED_ROUTE,
+    RequestMetrics,
+    RequestStats,
+    request_metrics,
+    request_stats,
+)
+
+
+class RequestMetricsMiddleware:
+    """
+    Pure ASGI middleware recording per-route request metrics.
+
+    🔹 Латентність (до останнього chunk-а тіла), розмір тіла відповіді, статус.
+    🔹 Кількість SQL statement-ів за запит — через contextvar `request_stats`,
+       у який пише хук engine (instrument_engine).
+    🔹 Мітка route — шаблон шляху (`/api/dashboard/worker/{id}`), не сирий URL;
+       запити без маршруту (404) — "__unmatched__".
+    🔹 WebSocket / lifespan пропускаються як є.
+
+    Usage:
+        app.add_middleware(RequestMetricsMiddleware)  # останнім — найзовнішній
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        status = 500
+        size = 0
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_stats.reset(token)
+            route = scope.get("route")
+            self.metrics.observe(
+                scope["method"],
+                getattr(route, "path", None) or UNMATCHED_ROUTE,
+                status,
+                time.perf_counter() - started,
+                size,
+                stats,
+            )
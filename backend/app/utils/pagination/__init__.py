@@ -0,0 +1,25 @@
+from typing import Any, NamedTuple, Optional
+
+from .cursor import encode_cursor, decode_cursor, decode_cursor_tiebreak, apply_keyset, split_page
+from .total import TotalMode, count_total, invalidate_totals
+
+
+class Page(NamedTuple):
+    """Сторінка пагінованого списку: елементи, total, курсор наступної сторінки і як порахований total."""
+    items: list[Any]
+    total: int
+    next_cursor: Optional[str] = None
+    total_mode: TotalMode = "exact"
+
+
+__all__ = [
+    "Page",
+    "encode_cursor",
+    "decode_cursor",
+    "decode_cursor_tiebreak",
+    "apply_keyset",
+    "split_page",
+    "TotalMode",
+    "count_total",
+    "invalidate_totals",
+]
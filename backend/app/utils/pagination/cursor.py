@@ -0,0 +1,75 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID, tiebreak: Optional[str] = None) -> str:
+    """
+    Opaque token for the keyset position (sort_value, id[, tiebreak]).
+
+    `tiebreak` — третій ключ для злитих джерел, де (sort_value, id) не унікальні
+    (напр. вид події в стрічці активності: у клієнта created і taken — той самий id).
+    """
+    data = {"t": sort_value.isoformat(), "i": str(row_id)}
+    if tiebreak is not None:
+        data["k"] = tiebreak
+    raw = json.dumps(data, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor_tiebreak(token: str) -> Tuple[datetime, UUID, Optional[str]]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        tiebreak = data.get("k")
+        if tiebreak is not None and not isinstance(tiebreak, str):
+            raise ValueError(tiebreak)
+        return datetime.fromisoformat(data["t"]), UUID(data["i"]), tiebreak
+    except Exception:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Невірний cursor")
+
+
+def decode_cursor(token: str) -> Tuple[datetime, UUID]:
+    sort_value, row_id, _ = decode_cursor_tiebreak(token)
+    return sort_value, row_id
+
+
+def apply_keyset(
+    stmt: Select,
+    sort_col: Any,
+    id_col: Any,
+    cursor: Optional[str],
+    limit: int,
+    *,
+    descending: bool = True,
+) -> Select:
+    """
+    Keyset-сторінка замість OFFSET: WHERE (sort, id) </> (cursor) ORDER BY sort, id LIMIT limit + 1.
+
+    `cursor=""` — перша сторінка в cursor-режимі. Зайвий (+1) рядок лише
+    сигналізує, що є наступна сторінка (див. `split_page`).
+    """
+    if cursor:
+        c_sort, c_id = decode_cursor(cursor)
+        key, bound = tuple_(sort_col, id_col), tuple_(c_sort, c_id)
+        stmt = stmt.where(key < bound if descending else key > bound)
+
+    if descending:
+        stmt = stmt.order_by(sort_col.desc(), id_col.desc())
+    else:
+        stmt = stmt.order_by(sort_col.asc(), id_col.asc())
+    return stmt.limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], limit: int, sort_attr: str) -> Tuple[list, Optional[str]]:
+    """Відрізає +1 рядок і будує next_cursor з останнього елемента сторінки."""
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    last = page[-1]
+    return page, encode_cursor(getattr(last, sort_attr), last.id)
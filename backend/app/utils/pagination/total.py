@@ -0,0 +1,200 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict, deque
+from typing import AbstractSet, Literal, Optional, Tuple
+
+from sqlalchemy import Select, event, select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.sql.util import find_tables
+
+from app.config import COUNT_CACHE_MAX_ENTRIES, COUNT_CACHE_TTL_SECONDS
+
+TotalMode = Literal["exact", "estimated", "cached"]
+
+
+class CountCache:
+    """
+    Закешовані total: LRU на `maxsize` ключів з TTL.
+
+    Прострочені записи витісняються при кожному записі (черга в порядку закінчення TTL —
+    він однаковий для всіх), а не лише коли їх хтось перечитає; ключ — sha1 від SQL і
+    параметрів, тож довгий текст пошуку не лежить у пам'яті.
+    """
+
+    def __init__(self, maxsize: int = COUNT_CACHE_MAX_ENTRIES, ttl: float = COUNT_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key → (expires_at, total, таблиці запиту)
+        self._data: OrderedDict[str, Tuple[float, int, frozenset[str]]] = OrderedDict()
+        self._expiry: deque[tuple[float, str]] = deque()
+
+    def get(self, key: str) -> Optional[int]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, total: int, tables: frozenset[str]) -> None:
+        now = time.monotonic()
+        expires_at = now + self.ttl
+        self._data[key] = (expires_at, total, tables)
+        self._data.move_to_end(key)
+        self._expiry.append((expires_at, key))
+        self._evict(now)
+
+    def invalidate(self, tables: Optional[AbstractSet[str]] = None) -> None:
+        if tables is None:
+            self._data.clear()
+            self._expiry.clear()
+            return
+        for key in [k for k, (_, _, t) in self._data.items() if t & tables]:
+            del self._data[key]
+
+    def _evict(self, now: float) -> None:
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, key = self._expiry.popleft()
+            entry = self._data.get(key)
+            if entry is not None and entry[0] == expires_at:  # інакше ключ уже перезаписано
+                del self._data[key]
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        if len(self._expiry) > 2 * self.maxsize:  # записи черги для видалених / перезаписаних ключів
+            self._expiry = deque(
+                (entry[0], key) for key, entry in sorted(self._data.items(), key=lambda kv: kv[1][0])
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_count_cache = CountCache()
+
+
+def _tables_of(stmt) -> frozenset[str]:
+    return frozenset(t.name for t in find_tables(stmt, include_joins=True, include_aliases=True) if hasattr(t, "name"))
+
+
+def _cache_key(stmt: Select) -> str:
+    """Нормалізований ключ фільтра: sha1(SQL + відсортовані параметри)."""
+    compiled = stmt.compile()
+    params = tuple(sorted((k, repr(v)) for k, v in compiled.params.items()))
+    return hashlib.sha1(repr((str(compiled), params)).encode()).hexdigest()
+
+
+def invalidate_totals(tables: Optional[set[str]] = None) -> None:
+    """Скидає закешовані total для запитів, що читають з `tables` (None → усі)."""
+    _count_cache.invalidate(tables)
+
+
+class Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON) <stmt>` — параметри stmt лишаються bind-параметрами драйвера."""
+
+    inherit_cache = False
+
+    def __init__(self, stmt: Select):
+        self.stmt = stmt
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.stmt, **kw)
+
+
+async def count_total(
+    db: AsyncSession,
+    rows_stmt: Select,
+    *,
+    mode: TotalMode = "exact",
+    estimate_table: Optional[str] = None,
+) -> Tuple[int, TotalMode]:
+    """
+    Total для пагінованого списку. `rows_stmt` — SELECT рядків з тим самим WHERE (без ORDER/LIMIT).
+
+    exact     — SELECT count(*) FROM (rows_stmt);
+    estimated — оцінка планувальника: pg_class.reltuples(estimate_table) для нефільтрованих списків,
+                інакше "Plan Rows" з EXPLAIN;
+    cached    — exact, мемоізований на COUNT_CACHE_TTL_SECONDS, скидається при записі в таблиці.
+
+    Повертає (total, режим, яким реально пораховано) — estimated поза PostgreSQL падає в exact.
+    """
+    count_stmt = select(func.count()).select_from(rows_stmt.order_by(None).subquery())
+
+    if mode == "estimated":
+        estimate = await _estimate(db, rows_stmt, estimate_table)
+        if estimate is not None:
+            return estimate, "estimated"
+        mode = "exact"
+
+    if mode == "cached":
+        key = _cache_key(count_stmt)
+        hit = _count_cache.get(key)
+        if hit is not None:
+            return hit, "cached"
+        total = int((await db.execute(count_stmt)).scalar_one())
+        _count_cache.set(key, total, _tables_of(rows_stmt))
+        return total, "cached"
+
+    return int((await db.execute(count_stmt)).scalar_one()), "exact"
+
+
+async def _estimate(db: AsyncSession, rows_stmt: Select, table: Optional[str]) -> Optional[int]:
+    bind = db.bind
+    if bind is None or bind.dialect.name != "postgresql":
+        return None
+
+    if table is not None:
+        res = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"),
+            {"t": table},
+        )
+        reltuples = res.scalar_one_or_none()
+        # -1 → таблиця ще не аналізувалась (ANALYZE/autovacuum), пробуємо EXPLAIN
+        if reltuples is not None and reltuples >= 0:
+            return int(reltuples)
+
+    conn = await db.connection()
+    plan = (await conn.execute(Explain(rows_stmt))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# ───────────────────── invalidation ─────────────────────
+# Таблиці, змінені в транзакції, збираються в session.info і скидаються після COMMIT.
+
+def _remember(session: Session, tables) -> None:
+    session.info.setdefault("_dirty_tables", set()).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        mapper = getattr(obj, "__mapper__", None)
+        if mapper is not None:
+            _remember(session, (t.name for t in mapper.tables))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk(orm_execute_state) -> None:
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        _remember(orm_execute_state.session, _tables_of(orm_execute_state.statement))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    tables = session.info.pop("_dirty_tables", None)
+    if tables:
+        invalidate_totals(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back(session: Session) -> None:
+    session.info.pop("_dirty_tables", None)
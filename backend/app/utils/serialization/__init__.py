@@ -0,0 +1,10 @@
+from .encoder import dumps, json_default
+from .responses import FastJSONResponse
+from .rows import RowProjection
+
+__all__ = [
+    "dumps",
+    "json_default",
+    "FastJSONResponse",
+    "RowProjection",
+]
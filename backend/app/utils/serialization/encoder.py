@@ -0,0 +1,20 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+
+def json_default(obj: Any) -> Any:
+    # orjson сам знає UUID / datetime / date / enum / dataclass; решту доводимо тут
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(data: Any) -> bytes:
+    """orjson.dumps with the project-wide default (Decimal → float, pydantic models, sets)."""
+    return orjson.dumps(data, default=json_default, option=orjson.OPT_NON_STR_KEYS)
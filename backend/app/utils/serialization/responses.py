@@ -0,0 +1,18 @@
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+
+from .encoder import dumps
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    Default response class of the app.
+
+    Як ORJSONResponse, але з нашим default (Decimal з Numeric-колонок, pydantic-моделі).
+    Повернений з ендпоінта екземпляр не проходить повторну валідацію через response_model —
+    це і є швидкий шлях для списків, зібраних з рядків (див. RowProjection).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,66 @@
+from typing import Any, Iterable, Mapping, Optional, Sequence, Type
+
+from pydantic import BaseModel
+from sqlalchemy import Row, Select, inspect
+from sqlalchemy.sql.elements import ColumnElement
+
+
+class RowProjection:
+    """
+    Column projection of an ORM model onto an output schema.
+
+    Замість select(Model) → ORM-об'єкти → Schema.model_validate() на кожен рядок
+    вибирає лише колонки схеми (з мітками = імена полів), а рядки віддає як dict:
+    їх напряму серіалізує FastJSONResponse. Поля схеми, яких немає на моделі,
+    заповнюються їхніми default; обов'язкове поле без колонки — помилка при побудові.
+
+    extra — додаткові вирази (name → column), напр. агрегати;
+    joins — (target, onclause) для LEFT OUTER JOIN, потрібні цим виразам.
+    """
+
+    def __init__(
+        self,
+        model,
+        schema: Type[BaseModel],
+        *,
+        extra: Optional[Mapping[str, ColumnElement]] = None,
+        joins: Sequence[tuple[Any, Any]] = (),
+    ):
+        self.model = model
+        self.schema = schema
+        self.joins = tuple(joins)
+        extra = dict(extra or {})
+        mapped = inspect(model).column_attrs.keys()
+
+        columns: list[ColumnElement] = []
+        defaults: dict[str, Any] = {}
+        for name, field in schema.model_fields.items():
+            if name in extra:
+                columns.append(extra.pop(name).label(name))
+            elif name in mapped:
+                columns.append(getattr(model, name).label(name))
+            elif not field.is_required():
+                defaults[name] = field.get_default(call_default_factory=True)
+            else:
+                raise ValueError(f"{schema.__name__}.{name} has no column on {model.__name__}")
+        # решта extra (не поля схеми) — теж у рядок, напр. ключ keyset-пагінації
+        columns.extend(expr.label(name) for name, expr in extra.items())
+
+        self.columns = tuple(columns)
+        self.defaults = defaults
+
+    def apply(self, stmt: Select) -> Select:
+        """Replace the selected entity of `stmt` (WHERE/JOIN/ORDER BY stay) with the projected columns."""
+        stmt = stmt.with_only_columns(*self.columns)
+        for target, onclause in self.joins:
+            stmt = stmt.outerjoin(target, onclause)
+        return stmt
+
+    def to_dicts(self, rows: Iterable[Row]) -> list[dict[str, Any]]:
+        defaults = self.defaults
+        if defaults:
+            return [{**defaults, **row._asdict()} for row in rows]
+        return [row._asdict() for row in rows]
+
+    def __repr__(self):
+        return f"<RowProjection {self.model.__name__}→{self.schema.__name__} columns={len(self.columns)}>"
@@ -1,5 +1,11 @@
 from .connection import WebSocketConnection
+from .frames import encode_frame, decode_frame
+from .hub import ConnectionHub, connection_hub
 
 __all__ = [
-    "WebSocketConnection"
-]
\ No newline at end of file
+    "WebSocketConnection",
+    "ConnectionHub",
+    "connection_hub",
+    "encode_frame",
+    "decode_frame",
+]
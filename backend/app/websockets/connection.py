@@ -1,6 +1,18 @@
-from fastapi import WebSocket, WebSocketDisconnect
+from __future__ import annotations
+
+import asyncio
 import logging
-import json
+import time
+from collections import deque
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
+
+from app.config import WS_SEND_QUEUE_SIZE
+from app.websockets.frames import encode_frame, decode_frame
+from app.websockets.metrics import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
@@ -9,23 +21,108 @@ class WebSocketConnection:
     """
     Robust WebSocket connection wrapper for real-time communication.
     Provides lifecycle management, JSON messaging, and graceful shutdown.
+
+    Once `start_writer()` is called (ConnectionHub.register does it), outgoing frames go
+    through a bounded queue drained by a dedicated writer task: producers never await a
+    slow client. On overflow the whole queue is discarded and replaced by full snapshots
+    from `on_overflow` (live dashboard state), so the client never applies a delta to a
+    base it did not receive.
     """
 
-    def __init__(self, websocket: WebSocket):
+    def __init__(
+        self,
+        websocket: WebSocket,
+        *,
+        user_id: Optional[UUID] = None,
+        role: Any = None,
+        queue_size: int = WS_SEND_QUEUE_SIZE,
+    ):
         self.websocket = websocket
         self.connection_id = id(self.websocket)
         self.active = False
 
+        # індекси ConnectionHub
+        self.user_id = user_id
+        self.role = role
+        self.topics: set[str] = set()
+
+        # вихідна черга + writer; переповнення → resync (див. enqueue)
+        self._queue: deque[str] = deque()
+        self.queue_size = queue_size
+        # повні кадри стану на заміну скинутій черзі (LiveDashboardHub.snapshots)
+        self.on_overflow: Optional[Callable[[], Iterable[str]]] = None
+        self._wakeup = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+
+        # метрики
+        self.last_seen = time.monotonic()
+        self.sent = 0
+        self.dropped = 0
+        self.resyncs = 0
+        self.latency = LatencyHistogram()
+
     async def connect(self):
         try:
             await self.websocket.accept()
             self.active = True
+            self.last_seen = time.monotonic()
             logger.info(f"[WS:{self.connection_id}] Connected")
         except Exception as e:
             logger.exception(f"[WS:{self.connection_id}] Connection failed: {e}")
             raise
 
+    # ───────────── outgoing ─────────────
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def start_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_loop(), name=f"ws-writer-{self.connection_id}")
+
+    def enqueue(self, frame: str) -> bool:
+        """Non-blocking: ставить готовий кадр у чергу; при переповненні — _resync()."""
+        if not self.active:
+            return False
+        if len(self._queue) >= self.queue_size:
+            self._resync()
+        self._queue.append(frame)
+        self._wakeup.set()
+        return True
+
+    def _resync(self) -> None:
+        """
+        Клієнт не встигає читати. Відкинути лише найстаріший кадр не можна: це може бути
+        snapshot або delta, на які спираються наступні delta. Тож черга скидається
+        цілком, а її місце займають повні snapshot-и поточного стану підписок.
+        """
+        self.dropped += len(self._queue)
+        self.resyncs += 1
+        self._queue.clear()
+        if self.on_overflow is not None:
+            self._queue.extend(self.on_overflow())
+
+    async def _write_loop(self) -> None:
+        while self.active:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            frame = self._queue.popleft()
+            started = time.perf_counter()
+            try:
+                await self.websocket.send_text(frame)
+            except Exception as e:
+                logger.info(f"[WS:{self.connection_id}] Send failed, stopping writer: {e}")
+                self.active = False
+                break
+            self.latency.observe(time.perf_counter() - started)
+            self.sent += 1
+
     async def send_text(self, message: str):
+        if self._writer is not None and not self._writer.done():
+            self.enqueue(message)
+            return
         try:
             await self.websocket.send_text(message)
         except Exception as e:
@@ -33,22 +130,34 @@ class WebSocketConnection:
 
     async def send_json(self, data: dict):
         try:
-            await self.websocket.send_text(json.dumps(data))
-        except Exception as e:
+            frame = encode_frame(data)
+        except TypeError as e:
             logger.exception(f"[WS:{self.connection_id}] Failed to send JSON: {e}")
+            return
+        await self.send_text(frame)
 
+    # ───────────── incoming ─────────────
     async def receive_json(self) -> dict | None:
         try:
             data = await self.websocket.receive_text()
-            return json.loads(data)
+            self.last_seen = time.monotonic()
+            return decode_frame(data)
         except WebSocketDisconnect:
             logger.info(f"[WS:{self.connection_id}] Disconnected during receive")
             self.active = False
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"[WS:{self.connection_id}] Invalid JSON received: {e}")
         except Exception as e:
+            # сокет у невідомому стані → далі з нього не читаємо
             logger.exception(f"[WS:{self.connection_id}] Failed to receive JSON: {e}")
+            self.active = False
         return None
 
     async def close(self, code: int = 1000):
+        writer, self._writer = self._writer, None
+        if writer is not None and not writer.done() and writer is not asyncio.current_task():
+            writer.cancel()
+        self._queue.clear()
         if self.active:
             try:
                 await self.websocket.close(code=code)
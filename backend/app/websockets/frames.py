@@ -0,0 +1,18 @@
+# backend/app/websockets/frames.py
+from typing import Any
+
+import orjson
+
+from app.utils.serialization import dumps
+
+
+def encode_frame(data: Any) -> str:
+    """Serializes a payload once into a text frame that can be sent to any number of sockets."""
+    return dumps(data).decode()
+
+
+def decode_frame(frame: str | bytes) -> Any:
+    return orjson.loads(frame)
+
+
+__all__ = ["encode_frame", "decode_frame"]
@@ -0,0 +1,176 @@
+# backend/app/websockets/hub.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from app.config import WS_HEARTBEAT_INTERVAL_SECONDS, WS_IDLE_TIMEOUT_SECONDS
+from app.websockets.connection import WebSocketConnection
+from app.websockets.frames import encode_frame
+from app.websockets.metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+PING_FRAME = encode_frame({"type": "ping"})
+
+# 4408 — власний код "idle timeout" (діапазон 4000–4999 для застосунку)
+WS_IDLE_CLOSE_CODE = 4408
+
+
+class ConnectionHub:
+    """
+    Registry of live WebSocket connections indexed by user_id / role / topic.
+
+    🔹 `broadcast()` serializes the payload once (orjson) and enqueues the same frame
+       on every target connection; each connection's writer task sends concurrently,
+       so one slow client never blocks the others.
+    🔹 Per-connection queues are bounded (drop-oldest).
+    🔹 A heartbeat task pings every connection and reaps the ones idle longer
+       than WS_IDLE_TIMEOUT_SECONDS (any received message counts as activity).
+    """
+
+    def __init__(
+        self,
+        *,
+        heartbeat_interval: float = WS_HEARTBEAT_INTERVAL_SECONDS,
+        idle_timeout: float = WS_IDLE_TIMEOUT_SECONDS,
+    ) -> None:
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+
+        self._connections: dict[int, WebSocketConnection] = {}
+        self._by_user: dict[UUID, set[WebSocketConnection]] = defaultdict(set)
+        self._by_role: dict[Any, set[WebSocketConnection]] = defaultdict(set)
+        self._by_topic: dict[str, set[WebSocketConnection]] = defaultdict(set)
+
+        self._heartbeat: Optional[asyncio.Task] = None
+
+        # метрики
+        self.send_latency = LatencyHistogram()
+        self.broadcasts = 0
+        self.reaped = 0
+        self._closed_sent = 0
+        self._closed_dropped = 0
+        self._closed_resyncs = 0
+
+    # ───────────── lifecycle ─────────────
+    def register(self, conn: WebSocketConnection) -> None:
+        self._connections[conn.connection_id] = conn
+        if conn.user_id is not None:
+            self._by_user[conn.user_id].add(conn)
+        if conn.role is not None:
+            self._by_role[conn.role].add(conn)
+
+        conn.latency = LatencyHistogram(parent=self.send_latency)
+        conn.start_writer()
+
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop(), name="ws-heartbeat")
+
+    def unregister(self, conn: WebSocketConnection) -> None:
+        if self._connections.pop(conn.connection_id, None) is None:
+            return
+        self._closed_sent += conn.sent
+        self._closed_dropped += conn.dropped
+        self._closed_resyncs += conn.resyncs
+        self._discard(self._by_user, conn.user_id, conn)
+        self._discard(self._by_role, conn.role, conn)
+        for topic in list(conn.topics):
+            self.unsubscribe(conn, topic)
+
+    @staticmethod
+    def _discard(index: dict, key: Any, conn: WebSocketConnection) -> None:
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.discard(conn)
+            if not bucket:
+                index.pop(key, None)
+
+    # ───────────── topics ─────────────
+    def subscribe(self, conn: WebSocketConnection, topic: str) -> None:
+        conn.topics.add(topic)
+        self._by_topic[topic].add(conn)
+
+    def unsubscribe(self, conn: WebSocketConnection, topic: str) -> None:
+        conn.topics.discard(topic)
+        self._discard(self._by_topic, topic, conn)
+
+    # ───────────── fan-out ─────────────
+    def connections(
+        self,
+        *,
+        topic: Optional[str] = None,
+        role: Any = None,
+        user_ids: Optional[Iterable[UUID]] = None,
+    ) -> set[WebSocketConnection]:
+        """Перетин заданих фільтрів (без фільтрів — усі з'єднання)."""
+        selected: Optional[set[WebSocketConnection]] = None
+        for candidates in (
+            self._by_topic.get(topic, set()) if topic is not None else None,
+            self._by_role.get(role, set()) if role is not None else None,
+            set().union(*(self._by_user.get(u, ()) for u in user_ids)) if user_ids is not None else None,
+        ):
+            if candidates is None:
+                continue
+            selected = set(candidates) if selected is None else selected & candidates
+        return set(self._connections.values()) if selected is None else selected
+
+    def broadcast(
+        self,
+        payload: Any,
+        *,
+        topic: Optional[str] = None,
+        role: Any = None,
+        user_ids: Optional[Iterable[UUID]] = None,
+    ) -> int:
+        """Серіалізує payload один раз і ставить кадр у черги адресатів. Повертає к-сть адресатів."""
+        frame = payload if isinstance(payload, str) else encode_frame(payload)
+        targets = self.connections(topic=topic, role=role, user_ids=user_ids)
+        delivered = sum(1 for conn in targets if conn.enqueue(frame))
+        self.broadcasts += 1
+        return delivered
+
+    def send_to_user(self, user_id: UUID, payload: Any) -> int:
+        return self.broadcast(payload, user_ids=(user_id,))
+
+    # ───────────── heartbeat ─────────────
+    async def _heartbeat_loop(self) -> None:
+        while self._connections:
+            await asyncio.sleep(self.heartbeat_interval)
+            now = time.monotonic()
+            for conn in list(self._connections.values()):
+                if not conn.active or now - conn.last_seen > self.idle_timeout:
+                    await self._reap(conn)
+                else:
+                    conn.enqueue(PING_FRAME)
+
+    async def _reap(self, conn: WebSocketConnection) -> None:
+        logger.info(f"[WS:{conn.connection_id}] Reaping idle connection")
+        self.reaped += 1
+        self.unregister(conn)
+        await conn.close(code=WS_IDLE_CLOSE_CODE)
+
+    # ───────────── metrics ─────────────
+    def metrics(self) -> dict:
+        conns = list(self._connections.values())
+        depths = [c.queue_depth for c in conns]
+        return {
+            "connections": len(conns),
+            "users": len(self._by_user),
+            "by_role": {str(getattr(r, "value", r)): len(c) for r, c in self._by_role.items()},
+            "topics": len(self._by_topic),
+            "queue_depth": {"total": sum(depths), "max": max(depths, default=0)},
+            "frames_sent": self._closed_sent + sum(c.sent for c in conns),
+            "frames_dropped": self._closed_dropped + sum(c.dropped for c in conns),
+            "resyncs": self._closed_resyncs + sum(c.resyncs for c in conns),
+            "broadcasts": self.broadcasts,
+            "reaped": self.reaped,
+            "send_latency_seconds": self.send_latency.snapshot(),
+        }
+
+
+connection_hub = ConnectionHub()
@@ -0,0 +1,59 @@
+# backend/app/websockets/metrics.py
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+# межі бакетів (сек) — як у Prometheus histogram
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class LatencyHistogram:
+    """Cumulative-friendly latency histogram: bucket counts + count/sum/max."""
+
+    __slots__ = ("buckets", "counts", "count", "total", "max", "_parent")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS, parent: Optional["LatencyHistogram"] = None):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # останній — +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._parent = parent
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if self._parent is not None:
+            self._parent.observe(seconds)
+
+    def quantile(self, q: float) -> float:
+        """Верхня межа бакета, в який потрапляє q-квантиль (оцінка)."""
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, n in zip((*self.buckets, self.max), self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self) -> dict:
+        cumulative, acc = {}, 0
+        for bound, n in zip((*map(str, self.buckets), "+Inf"), self.counts):
+            acc += n
+            cumulative[bound] = acc
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "max": round(self.max, 6),
+            "p50": round(self.quantile(0.5), 6),
+            "p99": round(self.quantile(0.99), 6),
+            "buckets": cumulative,
+        }
+
+
+__all__ = ["LatencyHistogram", "DEFAULT_BUCKETS"]
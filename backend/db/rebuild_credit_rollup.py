@@ -0,0 +1,34 @@
+"""
+Backfill / rebuild of credit_daily_rollup.
+
+    python -m db.rebuild_credit_rollup                      # усе
+    python -m db.rebuild_credit_rollup --from 2025-01-01    # лише з дати
+    python -m db.rebuild_credit_rollup --from 2025-06-01 --to 2025-07-01
+"""
+import argparse
+import asyncio
+from datetime import date
+from typing import Optional
+
+import app.services.auth  # noqa: F401 — порядок імпортів як у застосунку (user_service ↔ auth)
+from app.services.entities.credit.credit_rollup import CreditRollupService
+from db.session import AsyncSessionLocal
+
+
+async def rebuild(day_from: Optional[date] = None, day_to: Optional[date] = None) -> int:
+    async with AsyncSessionLocal() as db:
+        return await CreditRollupService(db).rebuild(day_from, day_to)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Rebuild credit_daily_rollup from credits.")
+    parser.add_argument("--from", dest="day_from", type=date.fromisoformat, default=None)
+    parser.add_argument("--to", dest="day_to", type=date.fromisoformat, default=None)
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(rebuild(args.day_from, args.day_to))
+    print(f"✅ credit_daily_rollup rebuilt: {rows} buckets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Mapping, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from starlette.requests import HTTPConnection
+
+from app.utils.cache import MISS
+
+logger = logging.getLogger(__name__)
+
+# Лаг репліки: 0, якщо вона програла все отримане (інакше на «тихому» primary
+# now() - pg_last_xact_replay_timestamp() росте без реального відставання)
+_PG_LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+def actor_key(connection: HTTPConnection) -> Optional[str]:
+    """
+    Хто робить запит — для read-your-writes: sub з JWT (scope["user"], AuthMiddleware),
+    інакше хеш access-токена (заголовок / cookie), інакше IP клієнта.
+    """
+    payload = connection.scope.get("user") or getattr(connection.state, "user", None)
+    if isinstance(payload, Mapping) and payload.get("sub"):
+        return f"user:{payload['sub']}"
+
+    token = connection.headers.get("Authorization") or connection.cookies.get("access_token")
+    if token:
+        return "token:" + hashlib.sha1(token.encode()).hexdigest()
+    return f"ip:{connection.client.host}" if connection.client else None
+
+
+class ReplicaRouter:
+    """
+    Decides whether a read session may go to the replica.
+
+    • Лаг репліки перевіряється не частіше ніж раз на `check_interval` (один запит
+      на всі конкурентні читання); лаг > `max_lag` або недоступна репліка → primary.
+    • Read-your-writes: після commit із записом (сесія get_async_db) читання того ж
+      actor-а йдуть у primary `sticky_seconds` = max_lag + check_interval — за цей час
+      репліка, яку ще визнано придатною, гарантовано містить його запис.
+
+    Журнал записів — локальний LRU (на `max_actors`) + маркер з TTL = sticky_seconds у
+    спільному `markers` (RedisBackend), щоб його бачили всі воркери: наступний запит
+    actor-а може прийти в інший процес. Без спільного сховища і з кількома воркерами
+    (`workers` > 1) репліка не використовується — журнал був би неповним.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[AsyncEngine],
+        *,
+        max_lag: float,
+        check_interval: float,
+        probe_timeout: float = 1.0,
+        max_actors: int = 10_000,
+        markers: Any = None,
+        workers: int = 1,
+    ):
+        if engine is not None and markers is None and workers > 1:
+            logger.warning(
+                "[ReplicaRouter] %s workers without a shared write log (CACHE_REDIS_URL) — "
+                "reading from primary only", workers,
+            )
+            engine = None
+        self.engine = engine
+        self.markers = markers
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.probe_timeout = probe_timeout
+        self.sticky_seconds = max_lag + check_interval
+        self.max_actors = max_actors
+        self._lag: Optional[float] = None
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+        self._writes: OrderedDict[str, float] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.engine is not None
+
+    # ── read-your-writes ─────────────────────────
+    def record_write(self, actor: Optional[str]) -> Optional[asyncio.Task]:
+        """Локальна мітка одразу; задача запису маркера в `markers` (None — його немає)."""
+        if not self.enabled or not actor:
+            return None
+        self._writes[actor] = time.monotonic()
+        self._writes.move_to_end(actor)
+        while len(self._writes) > self.max_actors:
+            self._writes.popitem(last=False)
+        if self.markers is None:
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # sync-контекст — без event loop
+            return None
+        return loop.create_task(self._publish(actor))
+
+    async def _publish(self, actor: str) -> None:
+        try:
+            await self.markers.set(actor, True, (), self.sticky_seconds)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("[ReplicaRouter] write marker failed for %s: %r", actor, exc)
+
+    async def recently_wrote(self, actor: Optional[str]) -> bool:
+        if not actor:
+            return False
+        wrote_at = self._writes.get(actor)
+        if wrote_at is not None and time.monotonic() - wrote_at < self.sticky_seconds:
+            return True
+        if self.markers is None:
+            return False
+        try:
+            return await self.markers.get(actor) is not MISS
+        except Exception as exc:  # noqa: BLE001 — не знаємо, чи писав: безпечніше primary
+            logger.warning("[ReplicaRouter] write marker lookup failed: %r", exc)
+            return True
+
+    # ── lag ──────────────────────────────────────
+    async def replica_lag(self) -> Optional[float]:
+        """Останній виміряний лаг (сек); None — репліка недоступна."""
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return self._lag
+        async with self._lock:
+            if time.monotonic() - self._checked_at >= self.check_interval:
+                self._lag = await self._probe()
+                self._checked_at = time.monotonic()
+        return self._lag
+
+    async def _probe(self) -> Optional[float]:
+        try:
+            async with asyncio.timeout(self.probe_timeout):
+                async with self.engine.connect() as conn:
+                    if self.engine.dialect.name != "postgresql":
+                        await conn.execute(text("SELECT 1"))  # напр. sqlite-файл у тестах
+                        return 0.0
+                    return float((await conn.execute(_PG_LAG_SQL)).scalar_one())
+        except Exception as exc:  # noqa: BLE001 — лог без traceback: повторюється кожен check_interval
+            logger.warning("[ReplicaRouter] replica probe failed, reading from primary: %r", exc)
+            return None
+
+    async def use_replica(self, actor: Optional[str]) -> bool:
+        if not self.enabled or await self.recently_wrote(actor):
+            return False
+        lag = await self.replica_lag()
+        return lag is not None and lag <= self.max_lag
+
+
+# ───────────────────── write tracking ─────────────────────
+# Сесії primary несуть session.info["actor"]; запис фіксується лише після COMMIT.
+
+@event.listens_for(Session, "after_flush")
+def _flushed(session: Session, flush_context) -> None:
+    session.info["_wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bulk_write(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["_wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _committed(session: Session) -> None:
+    if session.info.pop("_wrote", False):
+        router = session.info.get("replica_router")
+        if router is not None:
+            marker = router.record_write(session.info.get("actor"))
+            if marker is not None:
+                session.info["write_marker"] = marker
+
+
+@event.listens_for(Session, "after_rollback")
+def _rolled_back(session: Session) -> None:
+    session.info.pop("_wrote", None)
@@ -1,35 +1,99 @@
+from fastapi.requests import HTTPConnection
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 from app.config import (
     SQLALCHEMY_DATABASE_URI,
+    SQLALCHEMY_READ_DATABASE_URI,
     SQLALCHEMY_POOL_PRE_PING,
     SQLALCHEMY_POOL_SIZE,
     SQLALCHEMY_MAX_OVERFLOW,
     SQLALCHEMY_POOL_TIMEOUT,
+    REPLICA_MAX_LAG_SECONDS,
+    REPLICA_LAG_CHECK_SECONDS,
+    SQL_ECHO,
+    SQL_INSTRUMENTATION,
+    CACHE_BACKEND,
+    CACHE_REDIS_URL,
+    WEB_CONCURRENCY,
 )
+from app.utils.cache import RedisBackend
+from app.utils.instrumentation import instrument_engine, sql_metrics
+from db.routing import ReplicaRouter, actor_key
 
 # 🔧 Створюємо async SQLAlchemy engine з pool параметрами
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URI,
-    echo=True,
+    echo=SQL_ECHO,
     pool_pre_ping=(SQLALCHEMY_POOL_PRE_PING.lower() == "true"),
     pool_size=SQLALCHEMY_POOL_SIZE,
     max_overflow=SQLALCHEMY_MAX_OVERFLOW,
     pool_timeout=SQLALCHEMY_POOL_TIMEOUT,
 )
 
+# 📖 Read replica (опційно) — той самий пул
+read_engine = create_async_engine(
+    SQLALCHEMY_READ_DATABASE_URI,
+    echo=SQL_ECHO,
+    pool_pre_ping=(SQLALCHEMY_POOL_PRE_PING.lower() == "true"),
+    pool_size=SQLALCHEMY_POOL_SIZE,
+    max_overflow=SQLALCHEMY_MAX_OVERFLOW,
+    pool_timeout=SQLALCHEMY_POOL_TIMEOUT,
+) if SQLALCHEMY_READ_DATABASE_URI else None
+
+# ⏱ Кількість SQL на HTTP-запит — завжди; латентність по fingerprint / методу — SQL_INSTRUMENTATION=true
+instrument_engine(engine, "primary", sql_metrics if SQL_INSTRUMENTATION else None)
+if read_engine is not None:
+    instrument_engine(read_engine, "replica", sql_metrics if SQL_INSTRUMENTATION else None)
+
+# 🔁 Read-your-writes: маркери записів — у тому ж Redis, що й кеш дашбордів (видно всім воркерам)
+replica_router = ReplicaRouter(
+    read_engine,
+    max_lag=REPLICA_MAX_LAG_SECONDS,
+    check_interval=REPLICA_LAG_CHECK_SECONDS,
+    markers=RedisBackend(CACHE_REDIS_URL, prefix="fincontrol:writes:") if CACHE_BACKEND == "redis" else None,
+    workers=WEB_CONCURRENCY,
+)
+
 # 🧠 Create async sessionmaker
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
     class_=AsyncSession,
+    info={"replica_router": replica_router},
 )
 
+# дані репліки можуть відставати на sticky_seconds — кеш (app.utils.cache) це враховує
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    info={"read_lag_bound": replica_router.sticky_seconds},
+) if read_engine is not None else AsyncSessionLocal
+
 # 📦 Declarative base for models
 Base = declarative_base()
 
 # 📡 Async dependency for FastAPI
-async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+async def get_async_db(connection: HTTPConnection) -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal(info={"actor": actor_key(connection)}) as session:
+        yield session
+        # маркер запису має бути в Redis до відповіді: наступний запит може прийти в інший воркер
+        marker = session.info.pop("write_marker", None)
+        if marker is not None:
+            await marker
+
+
+# 📖 Репліка, якщо вона свіжа і цей actor нещодавно нічого не писав; інакше primary
+async def read_session_factory(actor: Optional[str]) -> async_sessionmaker[AsyncSession]:
+    if await replica_router.use_replica(actor):
+        return AsyncReadSessionLocal
+    return AsyncSessionLocal
+
+
+# 📡 Read-only dependency
+async def get_async_read_db(connection: HTTPConnection) -> AsyncGenerator[AsyncSession, None]:
+    actor = actor_key(connection)
+    session_factory = await read_session_factory(actor)
+    async with session_factory(info={"actor": actor}) as session:
         yield session
@@ -1,20 +1,33 @@
+# першим: startup_timings фіксує початок холодного старту в момент свого імпорту
+from app.utils.instrumentation.startup import startup_timings
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
-from app.utils.middlewares import AccessTokenMiddleware, WebSocketAuthMiddleware
+from app.utils.middlewares import AuthMiddleware, RequestMetricsMiddleware
 from app.routes import create_api_router
 from app.core.settings import settings
+from app.config import REQUEST_METRICS, REQUEST_METRICS_DUMP_PATH
+from app.utils.instrumentation import request_metrics
+from app.services.auth.hashing import password_hasher
+from app.services.entities.client.client_import import import_hasher
+from app.services.sessions import session_sweeper
+from app.services.mail import mail_worker
+from app.services.entities.worker.lead_router import lead_router
+from app.utils.serialization import FastJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.util import get_remote_address
 from db.session import Base
 
+startup_timings.mark("imports")
+
 # Initialize the rate limiter with the key function
 limiter = Limiter(key_func=get_remote_address)
 
 def create_app() -> FastAPI:
-    app = FastAPI(strict_slashes=False)
+    # orjson для всіх відповідей; ендпоінти списків повертають FastJSONResponse з dict-рядків напряму
+    app = FastAPI(strict_slashes=False, default_response_class=FastJSONResponse)
 
     # Add CORS middleware
     app.add_middleware(
@@ -29,11 +42,33 @@ def create_app() -> FastAPI:
     app.state.limiter = limiter
     app.add_middleware(SlowAPIMiddleware)
 
-    # Add Access Token Middleware
-    app.add_middleware(AccessTokenMiddleware)
+    # JWT auth for HTTP + WebSocket (pure ASGI; payload → scope["user"])
+    app.add_middleware(AuthMiddleware)
+
+    # Per-route latency / SQL count — last, so it wraps everything (incl. CORS, rate limit)
+    if REQUEST_METRICS:
+        app.add_middleware(RequestMetricsMiddleware)
+
+        if REQUEST_METRICS_DUMP_PATH:
+            @app.on_event("shutdown")
+            def dump_request_metrics():
+                request_metrics.dump_json(REQUEST_METRICS_DUMP_PATH)
+
+    # bcrypt pools (логіни + масовий імпорт клієнтів) — зупиняємо разом із застосунком
+    app.add_event_handler("shutdown", password_hasher.shutdown)
+    app.add_event_handler("shutdown", import_hasher.shutdown)
 
-    # Add WebSocket Auth Middleware
-    app.add_middleware(WebSocketAuthMiddleware)
+    # Batched cleanup of expired / revoked refresh tokens
+    app.add_event_handler("startup", session_sweeper.start)
+    app.add_event_handler("shutdown", session_sweeper.stop)
+
+    # Email outbox drainer (persistent SMTP connection, retries with backoff)
+    app.add_event_handler("startup", mail_worker.start)
+    app.add_event_handler("shutdown", mail_worker.stop)
+
+    # In-memory least-loaded lead routing (seeded in background, synced via change bus)
+    app.add_event_handler("startup", lead_router.start)
+    app.add_event_handler("shutdown", lead_router.stop)
 
     # Rate limit exception handler
     @app.exception_handler(RateLimitExceeded)
@@ -43,13 +78,18 @@ def create_app() -> FastAPI:
             content={"detail": "Rate limit exceeded"},
         )
 
-    # Include API routes
-    app.include_router(create_api_router())
+    # Include API routes (each leaf router is included once, without nested rebuilds)
+    with startup_timings.phase("routes"):
+        create_api_router().mount(app)
+
+    # Cold-start milestone: worker is ready to serve (see /system/startup)
+    app.add_event_handler("startup", lambda: startup_timings.mark("ready"))
 
     return app
 
 
 application = create_app()
+startup_timings.mark("app_created")
 
 if __name__ == "__main__":
     import uvicorn
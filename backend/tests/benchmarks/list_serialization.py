@@ -0,0 +1,134 @@
+# tests/benchmarks/list_serialization.py
+"""
+Benchmark: serialization of a 1k-row admin clients page.
+
+Порівнює старий шлях (ORM-об'єкти → ClientAdminOut.model_validate на рядок →
+повторна валідація через response_model → stdlib JSONResponse) зі швидким
+(рядки → dict → FastJSONResponse). БД не потрібна: ORM-екземпляри і рядки
+будуються в пам'яті, тож гідрація ORM тут навіть не врахована (консервативно).
+
+    cd backend && python -m tests.benchmarks.list_serialization --rows 1000 --runs 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+import main  # noqa: F401  — конфігурує мапери/схеми так само, як у застосунку
+from app.models import Client
+from app.routes.entities.crud.dashboard.types import AdminPaginatedClientsOut
+from app.schemas.entities.client_schema import ClientAdminOut
+from app.utils.serialization import FastJSONResponse, RowProjection
+
+
+def _fake_client(i: int, now: datetime) -> dict:
+    return {
+        "id": uuid.uuid4(),
+        "full_name": f"Client {i}",
+        "phone_number": f"+38093{i:07d}",
+        "email": f"client{i}@example.com",
+        "amount": "10000",
+        "snils": "123-456-789 00",
+        "inn": "1234567890",
+        "reg_address": "123 Main St",
+        "fact_address": "123 Main St",
+        "reg_date": "01.01.2020",
+        "family_status": "Married",
+        "workplace": "ACME Corp",
+        "org_legal_address": "456 Elm St",
+        "org_fact_address": "456 Elm St",
+        "position": "Engineer",
+        "income": "5000",
+        "income_proof": "2-NDFL",
+        "employment_date": "01.01.2020",
+        "org_activity": "IT",
+        "assets": "Yes",
+        "extra_income": "Freelance",
+        "contact_person": "Olga Petrova, +380631234567, sister",
+        "taken_at_worker": now,
+        "taken_at_broker": now,
+        "created_at": now - timedelta(minutes=i),
+        "is_deleted": False,
+    }
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+async def _orm_path(clients: list[Client], field) -> bytes:
+    items = [ClientAdminOut.model_validate(c) for c in clients]
+    content = await serialize_response(
+        field=field,
+        response_content={"clients": items, "total": len(items), "next_cursor": None, "total_mode": "exact"},
+        is_coroutine=True,
+    )
+    return JSONResponse(content).body
+
+
+async def _rows_path(rows: list, projection: RowProjection) -> bytes:
+    items = projection.to_dicts(rows)
+    return FastJSONResponse(
+        {"clients": items, "total": len(items), "next_cursor": None, "total_mode": "exact"}
+    ).body
+
+
+async def _measure(fn, *args, runs: int) -> list[float]:
+    await fn(*args)  # прогрів
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await fn(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def run(rows_count: int, runs: int) -> None:
+    now = datetime.utcnow()
+    data = [_fake_client(i, now) for i in range(rows_count)]
+    summary = {"credits_count": 3, "credits_total": Decimal("1500.00"), "last_credit_status": "approved"}
+
+    clients = []
+    for row in data:
+        client = Client(**row)
+        for key, value in summary.items():
+            setattr(client, key, value)
+        clients.append(client)
+
+    projection = RowProjection(Client, ClientAdminOut)
+    Row = namedtuple("Row", list(ClientAdminOut.model_fields))
+    rows = [Row(**{**dict.fromkeys(Row._fields), **row, **summary}) for row in data]
+
+    field = create_model_field(name="Response", type_=AdminPaginatedClientsOut, mode="serialization")
+
+    results = {
+        "orm + model_validate + response_model": await _measure(_orm_path, clients, field, runs=runs),
+        "rows → dict + FastJSONResponse": await _measure(_rows_path, rows, projection, runs=runs),
+    }
+
+    print(f"{rows_count} rows × {runs} runs (ms)")
+    for name, samples in results.items():
+        print(
+            f"  {name:<40} p50={statistics.median(samples):8.2f}"
+            f"  p99={_percentile(samples, 0.99):8.2f}"
+        )
+    slow, fast = results.values()
+    print(f"  speedup: p50 ×{statistics.median(slow) / statistics.median(fast):.1f}"
+          f"  p99 ×{_percentile(slow, 0.99) / _percentile(fast, 0.99):.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.runs))
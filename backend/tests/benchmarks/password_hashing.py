@@ -0,0 +1,104 @@
+# tests/benchmarks/password_hashing.py
+"""
+Load test: login throughput of bcrypt verify, inline vs PasswordHasher pool.
+
+Симулює `--logins` конкурентних логінів (bcrypt verify одного хешу) і міряє:
+• throughput (логінів/с) — для inline (як було: verify прямо в event loop) і для пулу
+  з 1, 2, 4 … cpu_count потоків: з пулом він має рости майже лінійно з кількістю ядер;
+• lag event loop-а (тікер кожні 10 мс) — inline блокує loop на весь bcrypt;
+• скільки логінів отримало 503 при `--max-queue` (за замовчуванням черга без обмеження).
+
+    cd backend && python -m tests.benchmarks.password_hashing --logins 64 --rounds 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from fastapi import HTTPException
+
+from app.services.auth import hashing
+from app.services.auth.hashing import PasswordHasher
+
+PASSWORD = "correct horse battery staple"
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event, interval: float = 0.01) -> None:
+    """Наскільки пізніше за план прокидається loop (мс)."""
+    while not stop.is_set():
+        planned = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, (time.perf_counter() - planned) * 1000))
+
+
+async def _inline_login(hashed: str) -> None:
+    hashing.pwd_ctx.verify(PASSWORD, hashed)
+    await asyncio.sleep(0)  # решта обробника (БД, токени)
+
+
+async def _pooled_login(hasher: PasswordHasher, hashed: str) -> None:
+    await hasher.verify(PASSWORD, hashed)
+
+
+async def _run(logins: int, make_login) -> dict:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    rejected = 0
+
+    async def one():
+        nonlocal rejected
+        try:
+            await make_login()
+        except HTTPException as exc:
+            if exc.status_code != 503:
+                raise
+            rejected += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    done = logins - rejected
+    return {
+        "throughput": done / elapsed,
+        "lag_max": max(lags, default=0.0),
+        "lag_p50": statistics.median(lags) if lags else 0.0,
+        "rejected": rejected,
+    }
+
+
+async def run(logins: int, rounds: int, max_queue: int, executor: str) -> None:
+    # вартість verify задається самим хешем, тож і процеси-воркери рахують ті самі rounds
+    hashed = hashing.pwd_ctx.hash(PASSWORD, rounds=rounds)
+
+    cores = os.cpu_count() or 1
+    sizes = sorted({w for w in (1, 2, 4, 8) if w <= cores} | {cores})
+
+    print(f"{logins} concurrent logins, bcrypt rounds={rounds}, {cores} CPU(s), executor={executor}")
+    row = "  {:<22} {:>10.1f} logins/s  loop lag p50={:7.1f} ms  max={:7.1f} ms  503={}"
+
+    result = await _run(logins, lambda: _inline_login(hashed))
+    baseline = result["throughput"]
+    print(row.format("inline (event loop)", result["throughput"], result["lag_p50"], result["lag_max"], result["rejected"]))
+
+    for workers in sizes:
+        hasher = PasswordHasher(kind=executor, workers=workers, max_queue=max_queue)
+        await _pooled_login(hasher, hashed)  # прогрів (старт потоків / процесів)
+        result = await _run(logins, lambda: _pooled_login(hasher, hashed))
+        hasher.shutdown()
+        label = f"pool × {workers}"
+        print(row.format(label, result["throughput"], result["lag_p50"], result["lag_max"], result["rejected"])
+              + f"  (×{result['throughput'] / baseline:.1f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--max-queue", type=int, default=10_000, help="черга понад workers; менше за --logins → 503")
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    args = parser.parse_args()
+    asyncio.run(run(args.logins, args.rounds, args.max_queue, args.executor))
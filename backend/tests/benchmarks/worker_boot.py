@@ -0,0 +1,106 @@
+# tests/benchmarks/worker_boot.py
+"""
+Benchmark: cold start of one API worker (fresh interpreter → `import main` → app ready).
+
+Кожен прогін — окремий процес, як у gunicorn/uvicorn воркера без --preload. Міряє:
+• boot — від запуску інтерпретатора до виходу з `import main` (стіна, зовні);
+• imports / app_created — мітки startup_timings з самого main;
+• routes — побудова таблиці маршрутів і скільки APIRoute при цьому збудовано.
+
+`--nested` додатково будує ту саму таблицю маршрутів старим способом (кожен рівень
+групи — окремий APIRouter + include_router), щоб порівняти з RouterGroup.mount().
+БД не потрібна — startup-хендлери (фонові задачі) не запускаються.
+
+    cd backend && python -m tests.benchmarks.worker_boot --runs 10 --nested
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+
+_CHILD = r"""
+import json, sys, time
+from fastapi import FastAPI, APIRouter, routing
+
+builds = [0]
+_init = routing.APIRoute.__init__
+def _counted(self, *args, **kwargs):
+    builds[0] += 1
+    _init(self, *args, **kwargs)
+routing.APIRoute.__init__ = _counted
+
+if sys.argv[1] == "boot":
+    import main
+    from app.utils.instrumentation import startup_timings
+    snap = startup_timings.snapshot()
+    print(json.dumps({**snap["milestones_ms"], "routes_ms": snap["phases_ms"]["routes"], "builds": builds[0],
+                      "routes": len(main.application.routes)}))
+else:
+    from app.routes import RouterGroup, create_api_router
+    group = create_api_router()
+    before = builds[0]
+
+    def nested(g):
+        router = APIRouter(prefix=g.prefix, tags=g.tags)
+        for child, prefix, tags in g.children:
+            router.include_router(nested(child) if isinstance(child, RouterGroup) else child, prefix=prefix, tags=tags)
+        return router
+
+    app = FastAPI()
+    started = time.perf_counter()
+    if sys.argv[1] == "nested":
+        app.include_router(nested(group))
+    else:
+        group.mount(app)
+    print(json.dumps({"routes_ms": (time.perf_counter() - started) * 1000, "builds": builds[0] - before,
+                      "routes": len(app.routes)}))
+"""
+
+
+def _spawn(mode: str) -> dict:
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_ROOT), "PYTHONWARNINGS": "ignore"}
+    started = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode],
+        cwd=BACKEND_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result["wall_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def _summary(values: list[float]) -> str:
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+    return f"p50={statistics.median(ordered):8.1f} ms  p95={p95:8.1f} ms  min={ordered[0]:8.1f} ms"
+
+
+def run(runs: int, nested: bool) -> None:
+    print(f"{runs} cold starts, python {sys.version.split()[0]}, {os.cpu_count()} CPU(s)")
+    _spawn("boot")  # прогрів файлового кешу / .pyc
+
+    boots = [_spawn("boot") for _ in range(runs)]
+    print(f"  boot (spawn → import main)  {_summary([b['wall_ms'] for b in boots])}")
+    for key in ("imports", "app_created", "routes_ms"):
+        print(f"    {key:<25} {_summary([b[key] for b in boots])}")
+    print(f"    routes={boots[0]['routes']}  APIRoute builds={boots[0]['builds']}")
+
+    if nested:
+        for mode in ("flat", "nested"):
+            results = [_spawn(mode) for _ in range(runs)]
+            print(f"  route table, {mode:<6}          {_summary([r['routes_ms'] for r in results])}"
+                  f"  builds={results[0]['builds']}  routes={results[0]['routes']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--nested", action="store_true", help="порівняти з вкладеним include_router")
+    args = parser.parse_args()
+    run(args.runs, args.nested)
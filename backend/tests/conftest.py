@@ -4,11 +4,12 @@ from httpx import ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession
 from collections.abc import AsyncGenerator
 
-from app.main import application
-from db.session import get_async_db
-from app.db.init_test_db import override_test_db
+# main — першим: він імпортує сервіси в порядку, що не впирається в цикл auth ↔ user_service
+from main import application
+from db.session import get_async_db, get_async_read_db
 
 
+# тестова БД імпортується у фікстурах — юніт-тести без неї її не тягнуть
 @pytest.fixture(scope="session")
 def anyio_backend() -> str:
     return "asyncio"
@@ -16,7 +17,10 @@ def anyio_backend() -> str:
 
 @pytest.fixture(scope="session")
 async def async_client() -> AsyncGenerator[AsyncClient, None]:
+    from app.db.init_test_db import override_test_db
+
     application.dependency_overrides[get_async_db] = override_test_db
+    application.dependency_overrides[get_async_read_db] = override_test_db
 
     transport = ASGITransport(app=application)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
@@ -25,6 +29,8 @@ async def async_client() -> AsyncGenerator[AsyncClient, None]:
 
 @pytest.fixture(scope="function")
 async def test_db_session() -> AsyncGenerator[AsyncSession, None]:
+    from app.db.init_test_db import override_test_db
+
     async for session in override_test_db():
         try:
             yield session
@@ -0,0 +1,53 @@
+# tests/db/test_routing.py
+import asyncio
+
+import fakeredis
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.utils.cache import RedisBackend
+from db.routing import ReplicaRouter
+
+
+@pytest.fixture
+async def replica_engine():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    yield engine
+    await engine.dispose()
+
+
+def _worker_router(engine, server: fakeredis.FakeServer) -> ReplicaRouter:
+    """Роутер одного воркера; маркери записів — у спільному Redis."""
+    markers = RedisBackend(client=fakeredis.aioredis.FakeRedis(server=server), prefix="test:writes:")
+    return ReplicaRouter(engine, max_lag=5, check_interval=2, markers=markers, workers=3)
+
+
+@pytest.mark.anyio
+async def test_write_in_one_worker_pins_reads_in_another(replica_engine):
+    server = fakeredis.FakeServer()
+    first, second = _worker_router(replica_engine, server), _worker_router(replica_engine, server)
+
+    await first.record_write("user:1")
+    assert not await first.use_replica("user:1")
+    assert not await second.use_replica("user:1")
+    assert await second.use_replica("user:2")
+
+
+@pytest.mark.anyio
+async def test_write_marker_expires_after_sticky_window(replica_engine):
+    server = fakeredis.FakeServer()
+    router = _worker_router(replica_engine, server)
+    router.sticky_seconds = 0.05
+
+    await router.record_write("user:1")
+    other = _worker_router(replica_engine, server)
+    assert await other.recently_wrote("user:1")
+    await asyncio.sleep(0.1)
+    assert not await other.recently_wrote("user:1")
+    assert not await router.recently_wrote("user:1")
+
+
+def test_replica_disabled_for_many_workers_without_shared_log():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    assert not ReplicaRouter(engine, max_lag=5, check_interval=2, workers=3).enabled
+    assert ReplicaRouter(engine, max_lag=5, check_interval=2, workers=1).enabled
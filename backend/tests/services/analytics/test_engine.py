@@ -0,0 +1,246 @@
+# tests/services/analytics/test_engine.py
+from datetime import datetime, timedelta, UTC
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from starlette.requests import Request
+
+from app.permissions import PermissionRole
+from app.routes.entities.analyze.router_factory import make_analyze_handler
+from app.routes.entities.analyze.types import AnalyzeType
+from app.services.analytics import AnalyticsEngine, AnalyticsError
+from app.services.analytics import engine as engine_module
+from app.services.live.change_bus import CREDITS
+from app.utils.cache import Cache, MemoryBackend, change_tags
+
+# лише колонки, які читають метрики (моделі розраховані на PostgreSQL)
+_DDL = (
+    """CREATE TABLE users (
+        id CHAR(32) PRIMARY KEY, role VARCHAR(6) NOT NULL, is_active BOOLEAN NOT NULL,
+        is_deleted BOOLEAN NOT NULL, created_at DATETIME NOT NULL
+    )""",
+    "CREATE TABLE clients (id CHAR(32) PRIMARY KEY REFERENCES users(id), worker_id CHAR(32), broker_id CHAR(32))",
+    """CREATE TABLE credits (
+        id CHAR(32) PRIMARY KEY, worker_id CHAR(32), broker_id CHAR(32), amount NUMERIC NOT NULL,
+        status VARCHAR(9) NOT NULL, issued_at DATETIME NOT NULL, is_deleted BOOLEAN NOT NULL
+    )""",
+)
+
+TODAY = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+W1, W2, B1 = uuid4(), uuid4(), uuid4()
+
+
+def _ts(moment: datetime) -> str:
+    # формат, у якому SQLAlchemy пише DateTime у sqlite
+    return moment.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _hex(value: UUID | None) -> str | None:
+    return value.hex if value else None
+
+
+class _Fixture:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.statements = 0
+
+    async def _insert(self, sql: str, params: tuple) -> None:
+        await (await self.db.connection()).exec_driver_sql(sql, params)
+
+    async def user(self, role: PermissionRole, user_id: UUID | None = None, created_at: datetime = TODAY) -> UUID:
+        user_id = user_id or uuid4()
+        await self._insert(
+            "INSERT INTO users VALUES (?, ?, 1, 0, ?)", (user_id.hex, role.name, _ts(created_at))
+        )
+        return user_id
+
+    async def client(self, created_at: datetime, worker_id: UUID | None = None, broker_id: UUID | None = None):
+        client_id = await self.user(PermissionRole.CLIENT, created_at=created_at)
+        await self._insert(
+            "INSERT INTO clients VALUES (?, ?, ?)", (client_id.hex, _hex(worker_id), _hex(broker_id))
+        )
+
+    async def credit(self, issued_at: datetime, amount: float = 100, *, worker_id=None, broker_id=None,
+                     status: str = "NEW", deleted: bool = False):
+        await self._insert(
+            "INSERT INTO credits VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (uuid4().hex, _hex(worker_id), _hex(broker_id), amount, status, _ts(issued_at), int(deleted)),
+        )
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch) -> Cache:
+    fresh = Cache(MemoryBackend(), ttl=60)
+    monkeypatch.setattr(engine_module, "cache", fresh)
+    return fresh
+
+
+@pytest.fixture
+async def data():
+    sql_engine = create_async_engine("sqlite+aiosqlite://")
+    async with sql_engine.begin() as conn:
+        for ddl in _DDL:
+            await conn.exec_driver_sql(ddl)
+    try:
+        async with AsyncSession(sql_engine) as db:
+            fixture = _Fixture(db)
+
+            @event.listens_for(sql_engine.sync_engine, "before_cursor_execute")
+            def _count(conn, cursor, statement, parameters, context, executemany):
+                if statement.lstrip().upper().startswith("SELECT"):
+                    fixture.statements += 1
+
+            yield fixture
+    finally:
+        await sql_engine.dispose()
+
+
+def _run(fixture: _Fixture, role: PermissionRole, metric: str, scope_id=None, **params):
+    query = {key: value if isinstance(value, list) else [value] for key, value in params.items()}
+    return AnalyticsEngine().run(fixture.db, role, metric, scope_id, query)
+
+
+def _by_bucket(result: dict, *fields: str) -> dict:
+    return {row["bucket"]: tuple(row[f] for f in fields) for row in result["data"]}
+
+
+def _day(days_ago: int) -> str:
+    return (TODAY - timedelta(days=days_ago)).date().isoformat()
+
+
+# ───────────── series: closed / open buckets ─────────────
+@pytest.mark.anyio
+async def test_series_splits_closed_and_open_buckets(data, fresh_cache):
+    await data.credit(TODAY - timedelta(days=3), 100)
+    await data.credit(TODAY - timedelta(days=3, hours=-2), 50)
+    await data.credit(TODAY - timedelta(days=1), 10)
+    await data.credit(TODAY, 7)
+    await data.credit(TODAY, 1000, deleted=True)
+    date_from = (TODAY - timedelta(days=5)).isoformat()
+
+    data.statements = 0
+    result = await _run(data, PermissionRole.ADMIN, "applications_over_time", date_from=date_from, bucket="day")
+
+    assert result["granularity"] == "day"
+    assert _by_bucket(result, "count", "amount") == {
+        _day(3): (2, 150), _day(1): (1, 10), _day(0): (1, 7),
+    }
+    assert data.statements == 2  # закриті бакети [date_from, сьогодні) + відкритий [сьогодні, …)
+
+    # зміна скидає лише відкритий бакет: закриті беруться з кешу і не перераховуються
+    await data.credit(TODAY, 3)
+    await data.credit(TODAY - timedelta(days=1), 20)
+    fresh_cache.invalidate(change_tags(CREDITS, {}))
+    data.statements = 0
+    result = await _run(data, PermissionRole.ADMIN, "applications_over_time", date_from=date_from, bucket="day")
+
+    assert data.statements == 1
+    assert _by_bucket(result, "count", "amount")[_day(0)] == (2, 10)
+    assert _by_bucket(result, "count", "amount")[_day(1)] == (1, 10)
+
+
+@pytest.mark.anyio
+async def test_series_date_to_in_the_past_is_closed_only(data):
+    await data.credit(TODAY - timedelta(days=2), 5)
+    await data.credit(TODAY, 9)
+
+    data.statements = 0
+    result = await _run(
+        data, PermissionRole.ADMIN, "revenue_per_day",
+        date_from=(TODAY - timedelta(days=7)).isoformat(), date_to=(TODAY - timedelta(days=1)).isoformat(),
+    )
+
+    assert data.statements == 1
+    assert _by_bucket(result, "amount") == {_day(2): (5,)}
+
+
+# ───────────── cumulative ─────────────
+@pytest.mark.anyio
+async def test_cumulative_totals_run_across_closed_and_open_parts(data):
+    for days_ago, count in ((4, 2), (2, 1), (1, 3), (0, 2)):
+        for _ in range(count):
+            await data.client(TODAY - timedelta(days=days_ago))
+
+    result = await _run(
+        data, PermissionRole.ADMIN, "clients_growth", date_from=(TODAY - timedelta(days=10)).isoformat(),
+    )
+
+    assert _by_bucket(result, "count", "count_cumulative") == {
+        _day(4): (2, 2), _day(2): (1, 3), _day(1): (3, 6), _day(0): (2, 8),
+    }
+
+
+# ───────────── scope ─────────────
+@pytest.mark.anyio
+async def test_worker_metrics_are_bound_to_scope(data):
+    await data.credit(TODAY, 100, worker_id=W1, status="APPROVED")
+    await data.credit(TODAY, 40, worker_id=W1)
+    await data.credit(TODAY, 500, worker_id=W2)
+    await data.credit(TODAY, 1, broker_id=B1)
+
+    mine = await _run(data, PermissionRole.WORKER, "total_revenue", W1)
+    assert mine["data"] == {"amount": 140, "count": 2}
+
+    # фільтр worker_id не виводить за межі скоупу — лише звужує його
+    other = await _run(data, PermissionRole.WORKER, "total_revenue", W1, worker_id=str(W2))
+    assert other["data"] == {"amount": 0, "count": 0}
+
+    admin = await _run(data, PermissionRole.ADMIN, "total_revenue")
+    assert admin["data"] == {"amount": 641, "count": 4}
+
+
+@pytest.mark.anyio
+async def test_broker_dimension_metric_is_bound_to_scope(data):
+    await data.client(TODAY, worker_id=W1, broker_id=B1)
+    await data.client(TODAY, worker_id=W1, broker_id=B1)
+    await data.client(TODAY, worker_id=W2, broker_id=B1)
+    await data.client(TODAY, worker_id=W2, broker_id=uuid4())
+
+    result = await _run(data, PermissionRole.BROKER, "clients_per_worker", B1)
+
+    assert result["data"] == [{"worker_id": str(W1), "count": 2}, {"worker_id": str(W2), "count": 1}]
+
+
+@pytest.mark.anyio
+async def test_scoped_role_without_scope_or_scope_column_is_rejected(data):
+    with pytest.raises(AnalyticsError):
+        await _run(data, PermissionRole.WORKER, "total_revenue")
+    with pytest.raises(AnalyticsError):
+        await _run(data, PermissionRole.WORKER, "system_load", W1)
+
+
+# ───────────── route: 400 / scope from the caller ─────────────
+def _request(user_id: UUID, query: str) -> Request:
+    return Request({
+        "type": "http", "method": "GET", "path": "/", "headers": [],
+        "query_string": query.encode(), "user": {"sub": str(user_id)},
+    })
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("query", ["nope=1", "bucket=year", "bucket=day&bucket=week", "status=lost", "date_from=soon"])
+async def test_route_rejects_bad_params_with_400(data, query):
+    admin = await data.user(PermissionRole.ADMIN)
+    handler = make_analyze_handler(role=PermissionRole.ADMIN, metric=AnalyzeType("applications_over_time"))
+
+    with pytest.raises(HTTPException) as exc:
+        await handler(_request(admin, query), data.db)
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_route_scopes_worker_to_caller(data):
+    worker = await data.user(PermissionRole.WORKER, W1)
+    await data.credit(TODAY, 100, worker_id=W1)
+    await data.credit(TODAY, 500, worker_id=W2)
+    handler = make_analyze_handler(role=PermissionRole.WORKER, metric=AnalyzeType("total_revenue"))
+
+    assert (await handler(_request(worker, ""), data.db))["data"] == {"amount": 100, "count": 1}
+
+    wrong_role = make_analyze_handler(role=PermissionRole.BROKER, metric=AnalyzeType("total_revenue"))
+    with pytest.raises(HTTPException) as exc:
+        await wrong_role(_request(worker, ""), data.db)
+    assert exc.value.status_code == 403
@@ -0,0 +1,208 @@
+# tests/services/entities/admin/test_activity_feed.py
+from datetime import UTC, date, datetime, timedelta
+from uuid import UUID, uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.schemas.entities.activity_schema import ActivityKind
+from app.services.entities.admin.activity_feed import ActivityFeed, day_window, resolve_timezone
+
+KYIV = ZoneInfo("Europe/Kyiv")
+
+# моделі розраховані на PostgreSQL — для SQLite лише колонки, які читає стрічка
+_DDL = (
+    """CREATE TABLE users (
+        id CHAR(32) PRIMARY KEY, role VARCHAR(6) NOT NULL, email VARCHAR(255),
+        created_at DATETIME NOT NULL, is_deleted BOOLEAN NOT NULL DEFAULT 0
+    )""",
+    """CREATE TABLE clients (
+        id CHAR(32) PRIMARY KEY REFERENCES users(id), full_name VARCHAR(255) NOT NULL,
+        taken_at_worker DATETIME, taken_at_broker DATETIME
+    )""",
+    "CREATE TABLE workers (id CHAR(32) PRIMARY KEY REFERENCES users(id), username VARCHAR(64) NOT NULL)",
+    "CREATE TABLE brokers (id CHAR(32) PRIMARY KEY REFERENCES users(id), company_name VARCHAR(255))",
+    "CREATE TABLE admins (id CHAR(32) PRIMARY KEY REFERENCES users(id), timezone VARCHAR(64))",
+)
+
+
+def _ts(moment: datetime) -> str:
+    # SQLite не зберігає tz: created_at — UTC-стіна aware-значення, taken_at_* — naive UTC
+    return moment.astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+class _Data:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _insert(self, sql: str, params: tuple) -> None:
+        await (await self.db.connection()).exec_driver_sql(sql, params)
+
+    async def _user(self, role: str, created_at: datetime, email: str = "") -> UUID:
+        user_id = uuid4()
+        await self._insert("INSERT INTO users VALUES (?, ?, ?, ?, 0)", (user_id.hex, role, email, _ts(created_at)))
+        return user_id
+
+    async def client(self, name: str, created_at: datetime, worker_at: datetime | None = None,
+                     broker_at: datetime | None = None) -> UUID:
+        client_id = await self._user("CLIENT", created_at)
+        await self._insert(
+            "INSERT INTO clients VALUES (?, ?, ?, ?)",
+            (client_id.hex, name, worker_at and _ts(worker_at), broker_at and _ts(broker_at)),
+        )
+        return client_id
+
+    async def worker(self, username: str, created_at: datetime) -> UUID:
+        worker_id = await self._user("WORKER", created_at)
+        await self._insert("INSERT INTO workers VALUES (?, ?)", (worker_id.hex, username))
+        return worker_id
+
+    async def broker(self, company: str | None, created_at: datetime, email: str = "") -> UUID:
+        broker_id = await self._user("BROKER", created_at, email)
+        await self._insert("INSERT INTO brokers VALUES (?, ?)", (broker_id.hex, company))
+        return broker_id
+
+    async def admin(self, timezone: str | None) -> UUID:
+        admin_id = await self._user("ADMIN", datetime(2020, 1, 1, tzinfo=UTC))
+        await self._insert("INSERT INTO admins VALUES (?, ?)", (admin_id.hex, timezone))
+        return admin_id
+
+
+@pytest.fixture
+async def data():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        for ddl in _DDL:
+            await conn.exec_driver_sql(ddl)
+    try:
+        async with AsyncSession(engine) as db:
+            yield _Data(db)
+    finally:
+        await engine.dispose()
+
+
+def _local(*args) -> datetime:
+    return datetime(*args, tzinfo=KYIV)
+
+
+# ───────────── day_window / timezone ─────────────
+@pytest.mark.parametrize("day, hours, utc_start", [
+    (date(2025, 3, 30), 23, datetime(2025, 3, 29, 22, tzinfo=UTC)),   # весна: 03:00 → 04:00
+    (date(2025, 10, 26), 25, datetime(2025, 10, 25, 21, tzinfo=UTC)),  # осінь: 04:00 → 03:00
+    (date(2025, 6, 1), 24, datetime(2025, 5, 31, 21, tzinfo=UTC)),
+])
+def test_day_window_on_dst_change(day, hours, utc_start):
+    start, end = day_window(KYIV, day)
+
+    assert (start.date(), start.hour, end.date(), end.hour) == (day, 0, day + timedelta(days=1), 0)
+    assert start == utc_start
+    # aware-різниця в одній tz рахується по стіні — тривалість доби лише через UTC
+    assert end.astimezone(UTC) - start.astimezone(UTC) == timedelta(hours=hours)
+
+
+def test_day_window_offset_crosses_dst():
+    start, end = day_window(KYIV, date(2025, 3, 31), offset=-1)
+
+    assert (start, end) == (_local(2025, 3, 30), _local(2025, 3, 31))
+    assert end.astimezone(UTC) - start.astimezone(UTC) == timedelta(hours=23)
+
+
+def test_resolve_timezone_falls_back_to_utc():
+    assert resolve_timezone("Europe/Kyiv") == KYIV
+    assert resolve_timezone(None).key == resolve_timezone("Mars/Olympus").key == resolve_timezone("../etc").key == "UTC"
+
+
+@pytest.mark.anyio
+async def test_dst_day_window_selects_local_day(data):
+    feed = ActivityFeed(data.db)
+    await data.client("before", _local(2025, 3, 29, 23, 59))
+    await data.client("first", _local(2025, 3, 30, 0, 0))
+    await data.client("after-jump", _local(2025, 3, 30, 4, 30))
+    await data.client("last", _local(2025, 3, 30, 23, 59))
+    await data.client("next-day", _local(2025, 3, 31, 0, 0))
+
+    admin_id = await data.admin("Europe/Kyiv")
+    tz = await feed.timezone_of(admin_id)
+    page = await feed.get([ActivityKind.CLIENT_CREATED], *day_window(tz, date(2025, 3, 30)), tz=tz)
+
+    assert [item.label for item in page.items] == ["last", "after-jump", "first"]
+    assert page.items[0].at == _local(2025, 3, 30, 23, 59) and page.items[0].at.utcoffset() == timedelta(hours=3)
+    assert page.items[-1].at.utcoffset() == timedelta(hours=2)
+    assert page.timezone == "Europe/Kyiv"
+
+    # naive межі — локальний час адміна
+    naive = await feed.get([ActivityKind.CLIENT_CREATED], datetime(2025, 3, 30), datetime(2025, 3, 31), tz=tz)
+    assert [item.label for item in naive.items] == ["last", "after-jump", "first"]
+
+
+# ───────────── merge naive taken_at_* with aware created_at ─────────────
+@pytest.mark.anyio
+async def test_naive_and_aware_columns_merge_in_order(data):
+    base = datetime(2025, 5, 10, 9, 0, tzinfo=UTC)
+    ann = await data.client("Ann", base, worker_at=base + timedelta(minutes=30), broker_at=base + timedelta(hours=3))
+    await data.worker("wendy", base + timedelta(hours=1))
+    await data.broker(None, base + timedelta(hours=2), email="b@x.com")
+    await data.client("Bob", base + timedelta(hours=2, minutes=30), worker_at=base + timedelta(hours=4))
+
+    feed = ActivityFeed(data.db)
+    page = await feed.get(None, base - timedelta(hours=1), base + timedelta(hours=5), tz=KYIV)
+
+    assert [(item.kind, item.label) for item in page.items] == [
+        (ActivityKind.CLIENT_TAKEN_BY_WORKER, "Bob"),
+        (ActivityKind.CLIENT_TAKEN_BY_BROKER, "Ann"),
+        (ActivityKind.CLIENT_CREATED, "Bob"),
+        (ActivityKind.BROKER_CREATED, "b@x.com"),
+        (ActivityKind.WORKER_CREATED, "wendy"),
+        (ActivityKind.CLIENT_TAKEN_BY_WORKER, "Ann"),
+        (ActivityKind.CLIENT_CREATED, "Ann"),
+    ]
+    # naive UTC у БД → aware у таймзоні адміна (травень: UTC+3)
+    taken = page.items[-2]
+    assert taken.id == ann and taken.at == base + timedelta(minutes=30)
+    assert taken.at.utcoffset() == timedelta(hours=3)
+    assert all(item.at.tzinfo is not None for item in page.items)
+
+    # межі вікна застосовуються і до naive колонок
+    narrow = await feed.get(
+        [ActivityKind.CLIENT_TAKEN_BY_WORKER, ActivityKind.CLIENT_TAKEN_BY_BROKER],
+        base + timedelta(minutes=30), base + timedelta(hours=4), tz=KYIV,
+    )
+    assert [(item.kind, item.label) for item in narrow.items] == [
+        (ActivityKind.CLIENT_TAKEN_BY_BROKER, "Ann"),
+        (ActivityKind.CLIENT_TAKEN_BY_WORKER, "Ann"),
+    ]
+
+
+# ───────────── next_cursor ─────────────
+@pytest.mark.anyio
+@pytest.mark.parametrize("limit", [1, 2, 3, 5])
+async def test_cursor_pages_across_kinds_without_gaps_or_repeats(data, limit):
+    base = datetime(2025, 5, 10, 12, 0, tzinfo=UTC)
+    for i in range(6):
+        # однакові моменти між видами і всередині виду — порядок розв'язує id
+        at = base + timedelta(minutes=10 * (i // 2))
+        await data.client(f"c{i}", at, worker_at=at, broker_at=at + timedelta(minutes=5) if i % 3 else None)
+        await data.worker(f"w{i}", at)
+        if i % 2:
+            await data.broker(f"b{i}", at)
+
+    feed = ActivityFeed(data.db)
+    window = (base - timedelta(hours=1), base + timedelta(hours=1))
+    everything = await feed.get(None, *window, tz=KYIV)
+    expected = [(item.kind, item.id) for item in everything.items]
+    assert everything.next_cursor is None and len(expected) == 6 + 6 + 4 + 6 + 3
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        page = await feed.get(None, *window, tz=KYIV, limit=limit, cursor=cursor)
+        pages += 1
+        assert len(page.items) <= limit
+        seen.extend((item.kind, item.id) for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+        assert pages < 100
+
+    assert seen == expected
+    assert len(set(seen)) == len(seen)
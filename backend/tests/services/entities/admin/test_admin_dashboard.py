@@ -0,0 +1,74 @@
+# tests/services/entities/admin/test_admin_dashboard.py
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.entities.admin.admin_dashboard import AdminDashboard
+
+_PG = postgresql.asyncpg.dialect()
+
+
+class _Result:
+    def __init__(self, row: dict):
+        self.row = row
+
+    def scalar_one(self):
+        return next(iter(self.row.values()))
+
+    def one(self):
+        return self
+
+    @property
+    def _mapping(self) -> dict:
+        return self.row
+
+
+class _RecordingDB:
+    """Записує SQL і повертає однакові числа для будь-якого KPI."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    async def execute(self, stmt):
+        self.statements.append(" ".join(str(stmt.compile(dialect=_PG)).split()))
+        return _Result(dict.fromkeys(stmt.selected_columns.keys(), 7))
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("getter", "table"),
+    [
+        ("get_total_sum_credits", "credits"),
+        ("get_month_sum_credits", "credits"),
+        ("get_count_credits", "credits"),
+        ("get_count_active_credits", "credits"),
+        ("get_count_completed_credits", "credits"),
+        ("get_sum_users", "users"),
+        ("get_sum_clients", "users"),
+        ("get_sum_brokers", "users"),
+        ("get_sum_workers", "users"),
+        ("get_total_count_signed_clients_by_brokers", "clients"),
+        ("get_total_count_unsigned_clients_by_brokers", "clients"),
+        ("get_count_unsigned_clients_by_worker", "clients"),
+    ],
+)
+async def test_single_kpi_reads_only_its_table(getter, table):
+    db = _RecordingDB()
+
+    assert await getattr(AdminDashboard(db), getter)() == 7
+
+    [sql] = db.statements
+    assert sql.endswith(f"FROM {table}")
+    assert "JOIN" not in sql and "_agg" not in sql
+
+
+@pytest.mark.anyio
+async def test_overview_is_one_statement_with_every_kpi():
+    db = _RecordingDB()
+
+    overview = await AdminDashboard(db).get_overview()
+
+    [sql] = db.statements
+    assert sql.count("JOIN") == 2
+    for alias in ("credits_agg", "users_agg", "clients_agg"):
+        assert f"AS {alias}" in sql
+    assert set(overview.model_dump().values()) == {7}
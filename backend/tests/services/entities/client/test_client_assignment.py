@@ -0,0 +1,60 @@
+# tests/services/entities/client/test_client_assignment.py
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+
+from app.services.entities.client.client_assignment import plan_assignment
+
+
+def _ids(n: int) -> list:
+    return [uuid4() for _ in range(n)]
+
+
+def test_round_robin_starts_from_least_loaded():
+    a, b, c = _ids(3)
+    clients = _ids(5)
+
+    plan = plan_assignment(clients, {a: 4, b: 0, c: 2}, "round_robin")
+
+    assert [client for client, _ in plan] == clients
+    assert [worker for _, worker in plan] == [b, c, a, b, c]
+
+
+def test_least_loaded_evens_out_loads():
+    a, b, c = _ids(3)
+    loads = {a: 5, b: 1, c: 0}
+
+    plan = plan_assignment(_ids(7), loads, "least_loaded")
+    final = Counter(loads) + Counter(worker for _, worker in plan)
+
+    assert final == {a: 5, b: 4, c: 4}
+    assert [worker for _, worker in plan][:2] == [c, b]  # 0 → c, потім b і c по 1 → b (раніше в loads)
+
+
+def test_least_loaded_ties_follow_loads_order():
+    a, b = _ids(2)
+    plan = plan_assignment(_ids(4), {a: 0, b: 0}, "least_loaded")
+    assert [worker for _, worker in plan] == [a, b, a, b]
+
+
+def test_least_loaded_is_the_default():
+    a, b = _ids(2)
+    clients = _ids(3)
+    assert plan_assignment(clients, {a: 3, b: 0}) == plan_assignment(clients, {a: 3, b: 0}, "least_loaded")
+
+
+@pytest.mark.parametrize("strategy", ["round_robin", "least_loaded"])
+def test_every_client_planned_once(strategy):
+    workers = _ids(4)
+    clients = _ids(50)
+
+    plan = plan_assignment(clients, dict.fromkeys(workers, 0), strategy)
+
+    assert sorted(client for client, _ in plan) == sorted(clients)
+    assert set(Counter(worker for _, worker in plan).values()) == {50 // 4, 50 // 4 + 1}
+
+
+@pytest.mark.parametrize("strategy", ["round_robin", "least_loaded"])
+def test_no_clients_no_plan(strategy):
+    assert plan_assignment([], {uuid4(): 0}, strategy) == []
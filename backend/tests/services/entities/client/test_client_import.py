@@ -0,0 +1,81 @@
+# tests/services/entities/client/test_client_import.py
+import pytest
+from fastapi import HTTPException
+
+from app.services.entities.client.client_import import _csv_records, _lines, _ndjson_records
+
+
+async def _chunks(data: bytes, size: int):
+    for i in range(0, len(data), size):
+        yield data[i:i + size]
+
+
+async def _parse(data: bytes, size: int = 4096, parser=_csv_records) -> list:
+    return [record async for record in parser(_lines(_chunks(data, size)))]
+
+
+@pytest.mark.anyio
+async def test_comma_delimiter():
+    data = b"email,full_name\na@x.com,Ann\nb@x.com,Bob\n"
+    assert await _parse(data) == [
+        (2, {"email": "a@x.com", "full_name": "Ann"}, None),
+        (3, {"email": "b@x.com", "full_name": "Bob"}, None),
+    ]
+
+
+@pytest.mark.anyio
+async def test_semicolon_delimiter_from_excel():
+    data = b"email;full_name;notes\r\na@x.com;Ann;1,5 credits\r\n"
+    assert await _parse(data) == [(2, {"email": "a@x.com", "full_name": "Ann", "notes": "1,5 credits"}, None)]
+
+
+@pytest.mark.anyio
+async def test_bom_is_stripped_from_first_header():
+    data = "\ufeffemail,full_name\na@x.com,Ann\n".encode()
+    assert await _parse(data) == [(2, {"email": "a@x.com", "full_name": "Ann"}, None)]
+
+
+@pytest.mark.anyio
+async def test_bom_split_across_chunks():
+    data = "\ufeffemail\nа@x.com\n".encode()
+    assert await _parse(data, size=1) == [(2, {"email": "а@x.com"}, None)]
+
+
+@pytest.mark.anyio
+async def test_multiline_quoted_field_keeps_start_line():
+    data = b'email,notes\na@x.com,"line one\nline two"\nb@x.com,plain\n'
+    assert await _parse(data, size=7) == [
+        (2, {"email": "a@x.com", "notes": "line one\nline two"}, None),
+        (4, {"email": "b@x.com", "notes": "plain"}, None),
+    ]
+
+
+@pytest.mark.anyio
+async def test_empty_cells_and_blank_lines_are_skipped():
+    data = b"email,full_name\n\na@x.com,\n"
+    assert await _parse(data) == [(3, {"email": "a@x.com"}, None)]
+
+
+@pytest.mark.anyio
+async def test_column_count_mismatch_and_unterminated_quote():
+    data = b'email,full_name\na@x.com\nb@x.com,"Bob\n'
+    assert await _parse(data) == [
+        (2, None, "Expected 2 columns, got 1"),
+        (3, None, "Unterminated quoted field"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_invalid_utf8_is_rejected():
+    with pytest.raises(HTTPException) as exc:
+        await _parse(b"email\n\xff\xfe\n")
+    assert exc.value.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_ndjson_records():
+    data = b'{"email": "a@x.com"}\n\n[1]\n{bad\n'
+    records = await _parse(data, size=5, parser=_ndjson_records)
+
+    assert records[:2] == [(1, {"email": "a@x.com"}, None), (3, None, "Expected a JSON object")]
+    assert records[2][0] == 4 and records[2][2].startswith("Invalid JSON")
@@ -0,0 +1,128 @@
+# tests/services/entities/credit/test_credit_rollup.py
+from datetime import date, datetime
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import Table, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models import Client, Credit, CreditDailyRollup, User
+from app.models.entities.credit import CreditStatus
+from app.services.entities.credit.credit_rollup import CreditRollupService
+from app.services.entities.credit.credit_service import CreditService
+
+DAY_1 = date(2025, 4, 1)
+W1, W2, B1, B2 = uuid4(), uuid4(), uuid4(), uuid4()
+
+
+def _ddl(table: Table) -> str:
+    """
+    Таблиця моделі для SQLite без типів і серверних виразів (gen_random_uuid, Computed,
+    JSONB — лише PostgreSQL): значення однаково пишуть/читають type-процесори SQLAlchemy.
+    """
+    columns = [
+        f"{c.name} DEFAULT CURRENT_TIMESTAMP" if c.name in ("created_at", "updated_at") else c.name
+        for c in table.columns
+    ]
+    columns.append(f"PRIMARY KEY ({', '.join(c.name for c in table.primary_key)})")
+    return f"CREATE TABLE {table.name} ({', '.join(columns)})"
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        for model in (User, Client, Credit, CreditDailyRollup):
+            await conn.exec_driver_sql(_ddl(model.__table__))
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+async def _client(session_factory, broker_id: UUID) -> UUID:
+    client_id = uuid4()
+    async with session_factory() as db:
+        conn = await db.connection()
+        await conn.exec_driver_sql(
+            "INSERT INTO users (id, role, is_active, is_deleted) VALUES (?, 'CLIENT', 1, 0)", (client_id.hex,)
+        )
+        await conn.exec_driver_sql("INSERT INTO clients (id, broker_id) VALUES (?, ?)", (client_id.hex, broker_id.hex))
+        await db.commit()
+    return client_id
+
+
+async def _create(session_factory, client_id: UUID, amount: float, issued_at: datetime) -> UUID:
+    async with session_factory() as db:
+        credit = await CreditService(db).create(SimpleNamespace(client_id=client_id, amount=amount))
+        # дата видачі — через update, як при ручному виправленні адміном
+        await CreditService(db).update(credit.id, {"issued_at": issued_at})
+        return credit.id
+
+
+async def _snapshot(session_factory) -> tuple[set, dict]:
+    """Рядки rollup + те, що бачать графіки (daily_totals глобально / по воркеру / по брокеру)."""
+    async with session_factory() as db:
+        R = CreditDailyRollup
+        rows = {
+            (r.day, r.worker_id, r.broker_id, r.status, round(float(r.total_amount), 2), r.credits_count)
+            for r in (await db.scalars(select(R))).all()
+        }
+        daily_totals = CreditRollupService(db).daily_totals
+        start, end = DAY_1, date(2025, 5, 1)
+        totals = {
+            "all": await daily_totals(start, end),
+            "w1": await daily_totals(start, end, worker_id=W1),
+            "w2": await daily_totals(start, end, worker_id=W2),
+            "b1": await daily_totals(start, end, broker_id=B1),
+            "b2": await daily_totals(start, end, broker_id=B2),
+        }
+        return rows, totals
+
+
+@pytest.mark.anyio
+async def test_incremental_rollup_matches_rebuild(session_factory):
+    ann, bob = await _client(session_factory, B1), await _client(session_factory, B2)
+
+    first = await _create(session_factory, ann, 100.25, datetime(2025, 4, 1, 9))
+    second = await _create(session_factory, ann, 50, datetime(2025, 4, 1, 23, 59))
+    third = await _create(session_factory, bob, 300, datetime(2025, 4, 2, 0, 1))
+    gone = await _create(session_factory, bob, 7, datetime(2025, 4, 2, 12))
+
+    async with session_factory() as db:
+        service = CreditService(db)
+        # status change
+        await service.change_status(first, CreditStatus.APPROVED)
+        await service.broker_update_status(third, CreditStatus.TREATMENT)
+        await service.complete(third)
+        # reassign: воркер, брокер, сума і день
+        await service.update(first, {"worker_id": W1})
+        await service.update(second, {"worker_id": W2, "broker_id": B2, "amount": 75.5})
+        await service.update(third, {"worker_id": W1, "issued_at": datetime(2025, 4, 1, 18)})
+        await service.update(first, {"worker_id": W2})
+        # оновлення без зміни ключа rollup
+        await service.update(first, {"comment": "checked"})
+    async with session_factory() as db:
+        # soft delete / restore (повтор — no-op) і видалений назавжди
+        await CreditService.soft_delete(db, first)
+        await CreditService.soft_delete(db, first)
+        await CreditService.soft_delete(db, gone)
+        await CreditService.restore(db, first)
+        await CreditService.restore(db, first)
+
+    incremental = await _snapshot(session_factory)
+
+    rows, totals = incremental
+    assert totals["all"] == {DAY_1: pytest.approx(100.25 + 75.5 + 300)}
+    assert totals["w1"] == {DAY_1: pytest.approx(300)}
+    assert totals["w2"] == {DAY_1: pytest.approx(100.25 + 75.5)}
+    assert totals["b1"] == {DAY_1: pytest.approx(100.25)}
+    assert totals["b2"] == {DAY_1: pytest.approx(75.5 + 300)}
+    # порожні бакети (старі ключі, видалений кредит) не лишаються
+    assert all(row[-1] > 0 for row in rows) and len(rows) == 3
+
+    async with session_factory() as db:
+        assert await CreditRollupService(db).rebuild() == 3
+
+    assert await _snapshot(session_factory) == incremental
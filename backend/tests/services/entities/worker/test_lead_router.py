@@ -0,0 +1,142 @@
+# tests/services/entities/worker/test_lead_router.py
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.models.entities.worker import DepartmentEnum
+from app.services.entities.worker.lead_router import LeadRouter
+
+HELIX, UNION = DepartmentEnum.HELIX, DepartmentEnum.UNION
+
+
+class _FakeDB:
+    """session_factory для sync(): віддає рядки (id, username, department, is_active, is_deleted, load)."""
+
+    def __init__(self, rows: list[tuple]):
+        self.rows = rows
+        self.syncs = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        self.syncs += 1
+        return self
+
+    def all(self):
+        return list(self.rows)
+
+
+def _worker(load: int, department=HELIX, *, active: bool = True, deleted: bool = False):
+    worker_id = uuid4()
+    return (worker_id, f"w-{worker_id.hex[:6]}", department, active, deleted, load)
+
+
+async def _router(rows, **kwargs) -> LeadRouter:
+    router = LeadRouter(_FakeDB(rows), enabled=True, **kwargs)
+    await router.sync()
+    return router
+
+
+@pytest.mark.anyio
+async def test_pick_before_seed_returns_none():
+    router = LeadRouter(_FakeDB([_worker(0)]), enabled=True)
+    assert not router.ready
+    assert router.pick() is None
+
+
+@pytest.mark.anyio
+async def test_pick_balances_least_loaded():
+    a, b, c = _worker(3), _worker(1), _worker(1)
+    router = await _router([a, b, c])
+
+    picks = [router.pick() for _ in range(5)]
+
+    # b, c вирівнюються до 3, далі всі троє рівні — по черзі
+    assert picks[:4].count(b[0]) == 2 and picks[:4].count(c[0]) == 2
+    assert {router.load(w[0]) for w in (a, b, c)} <= {3, 4}
+    assert sum(router.load(w[0]) for w in (a, b, c)) == 10
+
+
+@pytest.mark.anyio
+async def test_pick_by_department_and_availability():
+    helix, union, idle = _worker(5, HELIX), _worker(0, UNION), _worker(0, HELIX, active=False)
+    router = await _router([helix, union, idle])
+
+    assert router.pick(HELIX) == helix[0]  # неактивний idle не отримує клієнтів
+    assert router.pick() == union[0]
+
+    router.set_available(union[0], False)
+    assert router.pick(UNION) is None
+    assert router.pick() == helix[0]
+    router.set_available(union[0], True)
+    assert router.pick() == union[0]
+
+
+@pytest.mark.anyio
+async def test_assigned_adjusts_load():
+    a, b = _worker(0), _worker(1)
+    router = await _router([a, b])
+
+    router.assigned(a[0], 2)
+    assert router.pick() == b[0]
+    router.assigned(b[0], -5)
+    assert router.load(b[0]) == 0
+    assert router.pick() == b[0]
+    router.assigned(None)  # клієнт без воркера — нічого не робить
+    router.assigned(uuid4())
+
+
+@pytest.mark.anyio
+async def test_stale_heap_entries_are_skipped_and_compacted():
+    workers = [_worker(0) for _ in range(3)]
+    router = await _router(workers)
+
+    # кожна зміна навантаження лишає в купі застарілий запис
+    for _ in range(200):
+        router.assigned(workers[0][0], 1)
+        router.assigned(workers[0][0], -1)
+
+    heap = router._heaps[None]
+    assert len(heap) <= 2 * len(workers) + 64 + 1
+    assert router.pick() in {w[0] for w in workers}
+    assert sum(router.load(w[0]) for w in workers) == 1
+
+
+@pytest.mark.anyio
+async def test_sync_drops_removed_workers_and_renames():
+    a, b = _worker(0), _worker(0)
+    router = await _router([a, b])
+    db = router.session_factory
+
+    db.rows = [(a[0], "renamed", a[2], True, False, 7)]
+    await router.sync()
+
+    assert router.resolve("renamed") == a[0]
+    assert router.resolve(a[1]) is None
+    assert router.load(b[0]) is None
+    assert router.pick() == a[0]
+
+
+@pytest.mark.anyio
+async def test_periodic_full_sync_picks_up_foreign_changes():
+    a = _worker(0)
+    db = _FakeDB([a])
+    router = LeadRouter(db, enabled=True, full_sync_interval=0.02)
+    router.start()
+    try:
+        await asyncio.sleep(0.01)
+        assert router.load(a[0]) == 0
+        db.rows = [a[:5] + (4,)]  # клієнтів призначив інший процес — своїх подій немає
+        await asyncio.sleep(0.08)
+        assert router.load(a[0]) == 4
+        assert db.syncs >= 3
+    finally:
+        await router.stop()
@@ -0,0 +1,71 @@
+# tests/services/entities/worker/test_worker_filter.py
+from sqlalchemy.dialects import postgresql
+
+from app.services.entities.admin.admin_dashboard import AdminDashboard
+from app.services.entities.worker.worker_filter import WorkerFilterService
+
+_PG = postgresql.asyncpg.dialect()
+
+
+def _sql(stmt) -> str:
+    return " ".join(str(stmt.compile(dialect=_PG)).split())
+
+
+def _params(stmt) -> dict:
+    return stmt.compile(dialect=_PG).params
+
+
+def test_min_and_max_fuse_into_one_having_subquery():
+    stmt = WorkerFilterService().by_min_clients_count(2).by_max_clients_count(5).apply()
+    sql = _sql(stmt)
+
+    assert sql.count("GROUP BY clients.worker_id") == 1
+    assert "workers.id IN (SELECT clients.worker_id FROM clients" in sql
+    assert "WHERE clients.worker_id IS NOT NULL GROUP BY clients.worker_id HAVING count(*) >= $1::INTEGER AND count(*) <= $2::INTEGER" in sql
+    assert sorted(_params(stmt).values()) == [2, 5]
+
+
+def test_repeated_bounds_narrow_the_same_range():
+    stmt = (
+        WorkerFilterService()
+        .by_min_clients_count(1).by_min_clients_count(3)
+        .by_max_clients_count(10).by_max_clients_count(4)
+        .apply()
+    )
+
+    assert _sql(stmt).count("GROUP BY") == 1
+    assert sorted(_params(stmt).values()) == [3, 4]
+
+
+def test_max_only_range_keeps_workers_without_clients():
+    stmt = WorkerFilterService().by_max_clients_count(3).apply()
+    sql = _sql(stmt)
+
+    # «не більше 3» = не серед тих, у кого > 3; воркери без клієнтів у підзапит не потрапляють
+    assert "workers.id NOT IN (SELECT clients.worker_id FROM clients" in sql
+    assert "HAVING count(*) > $1::INTEGER" in sql
+    assert list(_params(stmt).values()) == [3]
+
+
+def test_zero_min_without_max_adds_no_subquery():
+    stmt = WorkerFilterService().by_min_clients_count(0).apply()
+    assert "clients" not in _sql(stmt)
+
+
+def test_count_and_page_share_predicates():
+    service = WorkerFilterService().search_username("ann").by_max_clients_count(2)
+    count_sql, page_sql = _sql(service.count()), _sql(service.page(10, 5))
+
+    for sql in (count_sql, page_sql):
+        assert "workers.username ILIKE" in sql
+        assert "HAVING count(*) >" in sql
+    assert count_sql.startswith("SELECT count(*)")
+    assert page_sql.endswith("LIMIT $3::INTEGER OFFSET $4::INTEGER")
+
+
+def test_admin_bucket_filter_is_built_from_filter_service():
+    service = AdminDashboard.worker_filter(email="a@", username="ann", is_deleted=False)
+    sql = _sql(service.count())
+
+    assert isinstance(service, WorkerFilterService)
+    assert "users.email ILIKE" in sql and "workers.username ILIKE" in sql and "users.is_deleted IS false" in sql
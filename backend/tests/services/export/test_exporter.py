@@ -0,0 +1,135 @@
+# tests/services/export/test_exporter.py
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import column, select, table
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from starlette.requests import ClientDisconnect, Request
+
+from app.services.export import ExportLimiter, export_response
+from app.services.export import exporter as exporter_module
+
+_CLIENTS = table("clients", column("email"), column("full_name"))
+
+
+@pytest.fixture(autouse=True)
+async def sqlite(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("CREATE TABLE clients (email VARCHAR, full_name VARCHAR)")
+        await conn.exec_driver_sql(
+            "INSERT INTO clients VALUES ('a@x.com', 'Ann'), ('b@x.com', '=HYPERLINK(\"x\")'), ('c@x.com', 'Cid')"
+        )
+    factory = async_sessionmaker(engine)
+
+    async def _read_session_factory(actor):
+        return factory
+
+    monkeypatch.setattr(exporter_module, "read_session_factory", _read_session_factory)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [], "client": ("10.0.0.1", 1)})
+
+
+def _build(db):
+    return select(_CLIENTS.c.email.label("Email"), _CLIENTS.c.full_name.label("Name")).order_by(_CLIENTS.c.email)
+
+
+async def _export(limiter: ExportLimiter, fmt: str = "csv"):
+    return await export_response(_request(), "clients", _build, fmt, limiter=limiter, batch_size=2)
+
+
+class _Client:
+    """ASGI-сторона клієнта: `fail_on` — тип повідомлення, на якому з'єднання «рветься»."""
+
+    def __init__(self, fail_on: str | None = None, spec: str = "2.4"):
+        self.fail_on = fail_on
+        self.scope = {"type": "http", "asgi": {"spec_version": spec}}
+        self.messages: list[dict] = []
+        self.disconnect = asyncio.Event()
+
+    async def receive(self):
+        await self.disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if message["type"] == self.fail_on or (self.fail_on == "body" and message["type"] == "http.response.body"
+                                                and len(self.messages) > 1):
+            raise OSError("connection reset")
+        self.messages.append(message)
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(m.get("body", b"") for m in self.messages if m["type"] == "http.response.body")
+
+
+@pytest.mark.anyio
+async def test_full_export_streams_rows_and_frees_slot():
+    limiter = ExportLimiter(per_actor=1)
+    response = await _export(limiter)
+    assert limiter.active("ip:10.0.0.1") == 1
+
+    client = _Client()
+    await response(client.scope, client.receive, client.send)
+
+    assert client.body.decode("utf-8-sig").splitlines() == [
+        "Email,Name", "a@x.com,Ann", "b@x.com,\"'=HYPERLINK(\"\"x\"\")\"", "c@x.com,Cid",
+    ]
+    assert limiter.active("ip:10.0.0.1") == 0
+
+
+@pytest.mark.anyio
+async def test_limit_per_actor_returns_429():
+    limiter = ExportLimiter(per_actor=1)
+    first = await _export(limiter)
+
+    with pytest.raises(HTTPException) as exc:
+        await _export(limiter)
+    assert exc.value.status_code == 429
+
+    client = _Client()
+    await first(client.scope, client.receive, client.send)
+    await _export(limiter)  # слот звільнився
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("fail_on", ["http.response.start", "body"])
+async def test_slot_is_freed_when_client_drops(fail_on):
+    limiter = ExportLimiter(per_actor=1)
+    response = await _export(limiter)
+
+    client = _Client(fail_on=fail_on)
+    with pytest.raises(ClientDisconnect):
+        await response(client.scope, client.receive, client.send)
+
+    assert limiter.active("ip:10.0.0.1") == 0
+
+
+@pytest.mark.anyio
+async def test_slot_is_freed_on_disconnect_before_body():
+    limiter = ExportLimiter(per_actor=1)
+    response = await _export(limiter)
+
+    # ASGI < 2.4: Starlette слухає http.disconnect і скасовує стрім, тіло ще не ітерувалося
+    client = _Client(spec="2.3")
+    client.disconnect.set()
+    await response(client.scope, client.receive, client.send)
+
+    assert client.body == b""
+    assert limiter.active("ip:10.0.0.1") == 0
+
+
+@pytest.mark.anyio
+async def test_slot_is_freed_when_writer_setup_fails():
+    limiter = ExportLimiter(per_actor=1)
+
+    with pytest.raises(KeyError):
+        await _export(limiter, fmt="pdf")
+
+    assert limiter.active("ip:10.0.0.1") == 0
@@ -0,0 +1,80 @@
+# tests/services/export/test_writers.py
+import csv
+import io
+import zipfile
+from datetime import datetime
+from decimal import Decimal
+from xml.etree import ElementTree
+
+import pytest
+
+from app.permissions import PermissionRole
+from app.services.export import CSVWriter, XLSXWriter
+
+_NS = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+def _write(writer, columns, *batches) -> bytes:
+    return writer.header(columns) + b"".join(writer.rows(batch) for batch in batches) + writer.close()
+
+
+def _csv(*rows) -> list[list[str]]:
+    data = _write(CSVWriter(), ["value"], [[value] for value in rows])
+    assert data.startswith("﻿".encode())
+    return list(csv.reader(io.StringIO(data.decode("utf-8-sig"))))[1:]
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("=SUM(A1:A2)", "'=SUM(A1:A2)"),
+    ("@cmd", "'@cmd"),
+    ("+cmd|' /C calc'!A0", "'+cmd|' /C calc'!A0"),
+    ("-HYPERLINK(\"x\")", "'-HYPERLINK(\"x\")"),
+    ("\t=1", "'\t=1"),
+    ("+380501234567", "+380501234567"),
+    ("-5", "-5"),
+    ("a=b", "a=b"),
+])
+def test_csv_prefixes_formulas(value, expected):
+    assert _csv(value) == [[expected]]
+
+
+def test_csv_cell_types():
+    data = _write(
+        CSVWriter(), ["n", "ok", "role", "at", "tags", "none"],
+        [[1, True, PermissionRole.WORKER, datetime(2025, 1, 2, 3, 4), ["a", "b"], None]],
+    )
+    assert data.decode("utf-8-sig").splitlines()[1] == "1,true,WORKER,2025-01-02T03:04:00,a; b,"
+
+
+def test_xlsx_opens_and_sheet_parses():
+    writer = XLSXWriter("Клієнти & co")
+    data = _write(
+        writer, ["Email", "Amount", "Note"],
+        [["a@x.com", Decimal("10.50"), "<b>&"]],
+        [["b@x.com", 3, "bad\x01char"], ["c@x.com", None, "Привіт"]],
+    )
+
+    with zipfile.ZipFile(io.BytesIO(data)) as package:
+        assert package.testzip() is None
+        assert {"[Content_Types].xml", "_rels/.rels", "xl/workbook.xml", "xl/styles.xml",
+                "xl/_rels/workbook.xml.rels", "xl/worksheets/sheet1.xml"} <= set(package.namelist())
+        for name in package.namelist():
+            ElementTree.fromstring(package.read(name))
+        workbook = ElementTree.fromstring(package.read("xl/workbook.xml"))
+        sheet = ElementTree.fromstring(package.read("xl/worksheets/sheet1.xml"))
+
+    assert workbook.find("m:sheets/m:sheet", _NS).get("name") == "Клієнти & co"
+
+    rows = sheet.findall("m:sheetData/m:row", _NS)
+    assert [row.get("r") for row in rows] == ["1", "2", "3", "4"]
+    assert all(c.get("s") == "1" for c in rows[0])
+
+    def values(row):
+        return [c.findtext("m:v", namespaces=_NS) or c.findtext("m:is/m:t", namespaces=_NS) for c in row]
+
+    assert values(rows[0]) == ["Email", "Amount", "Note"]
+    assert values(rows[1]) == ["a@x.com", "10.50", "<b>&"]
+    assert values(rows[2]) == ["b@x.com", "3", "badchar"]
+    assert values(rows[3]) == ["c@x.com", "", "Привіт"]
+    assert [c.get("t") for c in rows[2]] == ["inlineStr", None, "inlineStr"]
+
@@ -0,0 +1,184 @@
+# tests/services/mail/test_outbox.py
+import socket
+from datetime import datetime, timedelta
+
+import pytest
+from aiosmtpd.controller import Controller
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.models.outbox.email_outbox import EmailOutbox, EmailStatus
+from app.services.mail import MailOutboxWorker, enqueue_email
+from app.services.smtp_service import SMTPService
+
+# модель розрахована на PostgreSQL (JSONB, gen_random_uuid()) — для SQLite таблиця вручну
+_DDL = """
+CREATE TABLE email_outbox (
+    id CHAR(32) PRIMARY KEY,
+    template VARCHAR(64) NOT NULL,
+    recipient VARCHAR(255) NOT NULL,
+    context JSON,
+    status VARCHAR(7) NOT NULL,
+    attempts INTEGER NOT NULL,
+    next_attempt_at DATETIME NOT NULL,
+    last_error TEXT,
+    sent_at DATETIME,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+class _Mailbox:
+    """aiosmtpd-обробник: відповідь на DATA — за адресатом (`replies`), інакше 250."""
+
+    def __init__(self):
+        self.replies: dict[str, str] = {}
+        self.received: list[tuple[str, bytes]] = []
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        rcpt = envelope.rcpt_tos[0]
+        reply = self.replies.get(rcpt, "250 OK")
+        if reply.startswith("250"):
+            self.received.append((rcpt, envelope.content))
+        return reply
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp():
+    mailbox = _Mailbox()
+    controller = Controller(mailbox, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    try:
+        yield mailbox, controller.port
+    finally:
+        controller.stop()
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(_DDL)
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+async def _enqueue_reset(session_factory, recipient: str) -> None:
+    async with session_factory() as db:
+        enqueue_email(db, "password_reset", recipient, reset_link="http://x/reset?token=t", ttl_minutes=15)
+        await db.commit()
+
+
+async def _rows(session_factory) -> dict[str, EmailOutbox]:
+    async with session_factory() as db:
+        return {row.recipient: row for row in (await db.scalars(select(EmailOutbox))).all()}
+
+
+def _worker(session_factory, port: int, **options) -> MailOutboxWorker:
+    transport = SMTPService(
+        hostname="127.0.0.1", port=port, username=None, password=None,
+        use_tls=False, start_tls=False, sender="noreply@fincontrol.test", timeout=5,
+    )
+    return MailOutboxWorker(session_factory, transport, retry_base=60, retry_max=600, **options)
+
+
+@pytest.mark.anyio
+async def test_drain_sends_reset_email(smtp, session_factory):
+    mailbox, port = smtp
+    await _enqueue_reset(session_factory, "ann@x.com")
+    worker = _worker(session_factory, port)
+    try:
+        assert await worker.drain() == 1
+    finally:
+        await worker.stop()
+
+    row = (await _rows(session_factory))["ann@x.com"]
+    assert (row.status, row.attempts, row.context, row.last_error) == (EmailStatus.SENT, 1, None, None)
+    assert row.sent_at is not None
+    [(rcpt, content)] = mailbox.received
+    assert rcpt == "ann@x.com"
+    assert b"Reset your FinControl password" in content and b"http://x/reset?token=t" in content
+
+
+@pytest.mark.anyio
+async def test_transient_4xx_backs_off_then_5xx_fails(smtp, session_factory):
+    mailbox, port = smtp
+    mailbox.replies = {"busy@x.com": "451 4.3.0 Try again later", "gone@x.com": "550 5.1.1 No such user"}
+    for recipient in ("ok@x.com", "busy@x.com", "gone@x.com"):
+        await _enqueue_reset(session_factory, recipient)
+    worker = _worker(session_factory, port, max_attempts=3)
+
+    try:
+        started = datetime.utcnow()
+        assert await worker.drain() == 1
+        rows = await _rows(session_factory)
+
+        assert rows["ok@x.com"].status == EmailStatus.SENT
+
+        busy = rows["busy@x.com"]
+        assert (busy.status, busy.attempts) == (EmailStatus.PENDING, 1)
+        assert "451" in busy.last_error
+        # backoff = retry_base · 2^0 з jitter 0.5–1.0
+        delay = busy.next_attempt_at.replace(tzinfo=None) - started
+        assert timedelta(seconds=29) <= delay <= timedelta(seconds=61)
+
+        gone = rows["gone@x.com"]
+        assert (gone.status, gone.attempts) == (EmailStatus.FAILED, 1)
+        assert "550" in gone.last_error
+        assert worker.failed == 1
+
+        # час повтору ще не настав — воркер лист не чіпає
+        assert await worker.drain() == 0
+        assert (await _rows(session_factory))["busy@x.com"].attempts == 1
+
+        # настав: друга спроба знову 4xx — ще один backoff, уже вдвічі довший
+        async def due_now():
+            async with session_factory() as db:
+                await db.execute(
+                    update(EmailOutbox)
+                    .where(EmailOutbox.recipient == "busy@x.com")
+                    .values(next_attempt_at=datetime.utcnow() - timedelta(seconds=1))
+                )
+                await db.commit()
+
+        await due_now()
+        started = datetime.utcnow()
+        assert await worker.drain() == 0
+        busy = (await _rows(session_factory))["busy@x.com"]
+        assert (busy.status, busy.attempts) == (EmailStatus.PENDING, 2)
+        assert busy.next_attempt_at.replace(tzinfo=None) - started >= timedelta(seconds=59)
+
+        # сервер одужав — третя спроба відправляє
+        mailbox.replies.clear()
+        await due_now()
+        assert await worker.drain() == 1
+        busy = (await _rows(session_factory))["busy@x.com"]
+        assert (busy.status, busy.attempts) == (EmailStatus.SENT, 3)
+        assert [rcpt for rcpt, _ in mailbox.received] == ["ok@x.com", "busy@x.com"]
+    finally:
+        await worker.stop()
+
+
+@pytest.mark.anyio
+async def test_4xx_on_last_attempt_fails(smtp, session_factory):
+    mailbox, port = smtp
+    mailbox.replies = {"busy@x.com": "421 4.7.0 Too many connections"}
+    await _enqueue_reset(session_factory, "busy@x.com")
+    worker = _worker(session_factory, port, max_attempts=1)
+    try:
+        assert await worker.drain() == 0
+    finally:
+        await worker.stop()
+
+    row = (await _rows(session_factory))["busy@x.com"]
+    assert (row.status, row.attempts) == (EmailStatus.FAILED, 1)
+    assert worker.failed == 1
@@ -0,0 +1,103 @@
+# tests/services/search/test_builder.py
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.models.entities.client import Client
+from app.services.search.builder import ClientSearch, SearchQuery
+
+# лише поля, які читає не-PostgreSQL гілка (search_document / phone_digits — generated-колонки PG)
+_DDL = """
+CREATE TABLE clients (
+    id CHAR(32) PRIMARY KEY,
+    full_name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    phone_number VARCHAR(30) NOT NULL,
+    fact_address TEXT
+)
+"""
+
+_ANN, _BOB, _CAROL = uuid4(), uuid4(), uuid4()
+_CLIENTS = [
+    (_ANN, "Anna Kovalenko", "anna@fin.ua", "+380 (67) 123-45-67", "Kyiv, Khreshchatyk 1"),
+    (_BOB, "Bob Shevchenko", "bob@fin.ua", "+380501112233", "Lviv, Rynok 5"),
+    (_CAROL, "Carol_100%", "carol@mail.com", "+380931234567", None),
+]
+
+
+@pytest.fixture
+async def conn():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql(_DDL)
+            for id_, *fields in _CLIENTS:
+                await conn.exec_driver_sql("INSERT INTO clients VALUES (?, ?, ?, ?, ?)", (id_.hex, *fields))
+            yield conn
+    finally:
+        await engine.dispose()
+
+
+async def _search(conn, raw: str) -> list[str]:
+    q = SearchQuery.parse(raw)
+    builder = ClientSearch(conn.dialect.name)
+    stmt = (
+        select(Client.__table__.c.full_name)
+        .where(builder.clause(q))
+        .order_by(*builder.ranking(q), Client.__table__.c.full_name)
+    )
+    return list((await conn.execute(stmt)).scalars())
+
+
+def test_parse_splits_terms_and_uuids():
+    q = SearchQuery.parse(f"  anna, {_ANN}  kyiv ")
+    assert q.terms == ("anna", str(_ANN), "kyiv")
+    assert q.uuids == (_ANN,)
+    assert q.raw == f"anna {_ANN} kyiv"
+    assert SearchQuery.parse(" , ") is None
+
+
+@pytest.mark.anyio
+async def test_sqlite_fallback_matches_raw_fields_case_insensitively(conn):
+    assert conn.dialect.name == "sqlite"
+    assert await _search(conn, "KOVALENKO") == ["Anna Kovalenko"]
+    assert await _search(conn, "fin.ua") == ["Anna Kovalenko", "Bob Shevchenko"]
+    assert await _search(conn, "rynok") == ["Bob Shevchenko"]
+    assert await _search(conn, "111") == ["Bob Shevchenko"]  # телефон — як підрядок сирого номера
+
+
+@pytest.mark.anyio
+async def test_sqlite_fallback_ands_terms(conn):
+    assert await _search(conn, "fin.ua kyiv") == ["Anna Kovalenko"]
+    assert await _search(conn, "fin.ua, lviv") == ["Bob Shevchenko"]
+    assert await _search(conn, "anna lviv") == []
+
+
+@pytest.mark.anyio
+async def test_sqlite_fallback_escapes_like_wildcards(conn):
+    assert await _search(conn, "100%") == ["Carol_100%"]
+    assert await _search(conn, "l_1") == ["Carol_100%"]
+    assert await _search(conn, "%") == ["Carol_100%"]
+
+
+@pytest.mark.anyio
+async def test_sqlite_fallback_matches_exact_uuid(conn):
+    assert await _search(conn, str(_CAROL)) == ["Carol_100%"]
+    # UUID Боба + «fin» в іншому терміні: AND — лише Боб
+    assert await _search(conn, f"{_BOB} fin") == ["Bob Shevchenko"]
+
+
+def test_postgresql_uses_generated_columns_and_similarity():
+    q = SearchQuery.parse("Anna +380 67")
+    builder = ClientSearch("postgresql")
+    sql = str(
+        select(Client.__table__.c.id).where(builder.clause(q)).order_by(*builder.ranking(q))
+        .compile(dialect=postgresql.asyncpg.dialect())
+    )
+
+    assert "clients.search_document LIKE" in sql and "clients.phone_digits LIKE" in sql
+    assert "clients.full_name" not in sql
+    assert "similarity(clients.search_document" in sql
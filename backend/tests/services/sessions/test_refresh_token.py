@@ -0,0 +1,183 @@
+# tests/services/sessions/test_refresh_token.py
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+from app.models.sessions.refresh_token import RefreshToken
+from app.permissions import PermissionRole
+from app.routes.sessions.refresh.router_factory import make_refresh_handler
+from app.routes.sessions.refresh.types import RefreshTypes
+from app.services.sessions import refresh_token as refresh_token_module
+from app.services.sessions.refresh_token import RefreshTokenService
+from app.services.sessions.session_cache import SessionCache, session_cache
+from app.utils.cache import MemoryBackend
+
+# модель розрахована на PostgreSQL (gen_random_uuid()) — для SQLite таблиці вручну
+_DDL = (
+    "CREATE TABLE users (id CHAR(32) PRIMARY KEY, role VARCHAR(6) NOT NULL)",
+    """CREATE TABLE refresh_tokens (
+        id CHAR(32) PRIMARY KEY,
+        user_id CHAR(32) NOT NULL REFERENCES users(id),
+        token_hash VARCHAR(64) NOT NULL UNIQUE,
+        created_from_ip VARCHAR(45),
+        user_agent VARCHAR(255),
+        expires_at DATETIME NOT NULL,
+        is_active BOOLEAN NOT NULL,
+        created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )""",
+)
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        for ddl in _DDL:
+            await conn.exec_driver_sql(ddl)
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def cache() -> SessionCache:
+    return SessionCache(MemoryBackend(), ttl=60)
+
+
+async def _user(session_factory, role: PermissionRole = PermissionRole.WORKER) -> UUID:
+    user_id = uuid4()
+    async with session_factory() as db:
+        await (await db.connection()).exec_driver_sql("INSERT INTO users VALUES (?, ?)", (user_id.hex, role.name))
+        await db.commit()
+    return user_id
+
+
+async def _login(session_factory, cache: SessionCache, user_id: UUID) -> str:
+    raw = uuid4().hex
+    async with session_factory() as db:
+        await RefreshTokenService(db, cache).create(user_id, raw, "127.0.0.1", "pytest")
+    return raw
+
+
+async def _hashes(session_factory, user_id: UUID) -> set[str]:
+    async with session_factory() as db:
+        rows = await db.scalars(select(RefreshToken.token_hash).where(RefreshToken.user_id == user_id))
+        return set(rows)
+
+
+# ───────────── rotate ─────────────
+@pytest.mark.anyio
+async def test_second_rotate_of_same_token_returns_none(session_factory, cache):
+    user_id = await _user(session_factory)
+    raw = await _login(session_factory, cache, user_id)
+
+    async with session_factory() as db:
+        service = RefreshTokenService(db, cache)
+        # дві «паралельні» вкладки встигли перевірити той самий токен
+        first_seen = await service.verify(raw)
+        second_seen = await service.verify(raw)
+        assert first_seen == second_seen is not None
+
+        new_raw = await service.rotate(first_seen, "127.0.0.1", "tab-1")
+        assert new_raw is not None and new_raw != raw
+        assert await service.rotate(second_seen, "127.0.0.1", "tab-2") is None
+
+        assert await service.verify(raw) is None
+        assert (await service.verify(new_raw)).user_id == user_id
+
+    # ротація оновлює рядок на місці — сесія та сама, рядок один
+    assert await _hashes(session_factory, user_id) == {RefreshTokenService.hash(new_raw)}
+
+
+def _refresh_request() -> Request:
+    return Request({
+        "type": "http", "method": "POST", "path": "/", "headers": [(b"user-agent", b"pytest")],
+        "query_string": b"", "client": ("127.0.0.1", 1),
+    })
+
+
+@pytest.mark.anyio
+async def test_route_answers_401_on_replayed_refresh(session_factory, monkeypatch):
+    # обробник бере глобальний session_cache — підміняємо його бекенд на час тесту
+    monkeypatch.setattr(session_cache, "_backend", MemoryBackend())
+    monkeypatch.setattr(session_cache, "_configured", True)
+    user_id = await _user(session_factory, PermissionRole.WORKER)
+    raw = await _login(session_factory, session_cache, user_id)
+    handler = make_refresh_handler(role=PermissionRole.WORKER, refresh_type=RefreshTypes.BOT, input_schema=BaseModel)
+
+    async def refresh(token: str):
+        async with session_factory() as db:
+            return await handler(_refresh_request(), SimpleNamespace(refresh_token=token), db)
+
+    async with session_factory() as db:
+        stale = await RefreshTokenService(db).verify(raw)
+
+    pair = await refresh(raw)
+    assert pair.refresh_token and pair.access_token
+
+    # повтор старого токена: у БД його вже немає → 401
+    with pytest.raises(HTTPException) as exc:
+        await refresh(raw)
+    assert exc.value.status_code == 401
+
+    # застарілий запис у кеші (напр. з іншого процесу) пропускає verify, але не rotate → 401
+    await session_cache.put(stale)
+    with pytest.raises(HTTPException) as exc:
+        await refresh(raw)
+    assert exc.value.status_code == 401
+    assert await session_cache.get(stale.token_hash) is None
+
+    # нова пара працює
+    assert (await refresh(pair.refresh_token)).refresh_token
+
+
+# ───────────── create / SESSION_MAX_PER_USER ─────────────
+@pytest.mark.anyio
+async def test_create_keeps_newest_sessions_and_drops_evicted_from_cache(session_factory, cache, monkeypatch):
+    monkeypatch.setattr(refresh_token_module, "SESSION_MAX_PER_USER", 3)
+    user_id, other_id = await _user(session_factory), await _user(session_factory)
+    other = await _login(session_factory, cache, other_id)
+
+    raws = [await _login(session_factory, cache, user_id) for _ in range(3)]
+    async with session_factory() as db:
+        service = RefreshTokenService(db, cache)
+        for raw in raws:
+            await service.verify(raw)  # гарячі записи в кеші
+    assert all([await cache.get(RefreshTokenService.hash(raw)) for raw in raws])
+
+    raws += [await _login(session_factory, cache, user_id) for _ in range(2)]
+
+    evicted, kept = raws[:2], raws[2:]
+    assert await _hashes(session_factory, user_id) == {RefreshTokenService.hash(raw) for raw in kept}
+    for raw in evicted:
+        assert await cache.get(RefreshTokenService.hash(raw)) is None
+    async with session_factory() as db:
+        service = RefreshTokenService(db, cache)
+        assert [await service.verify(raw) for raw in evicted] == [None, None]
+        assert all([await service.verify(raw) for raw in kept])
+        # ліміт — на користувача: чужі сесії не чіпаються
+        assert await service.verify(other) is not None
+        total = await db.scalar(select(func.count()).select_from(RefreshToken))
+    assert total == 3 + 1
+
+
+@pytest.mark.anyio
+async def test_create_trims_revoked_sessions_first(session_factory, cache, monkeypatch):
+    monkeypatch.setattr(refresh_token_module, "SESSION_MAX_PER_USER", 2)
+    user_id = await _user(session_factory)
+    first, second = await _login(session_factory, cache, user_id), await _login(session_factory, cache, user_id)
+    async with session_factory() as db:
+        await RefreshTokenService(db, cache).revoke(RefreshTokenService.hash(second))
+
+    third = await _login(session_factory, cache, user_id)
+
+    # відкликана сесія не займає місця в ліміті — лишаються дві активні
+    assert await _hashes(session_factory, user_id) == {RefreshTokenService.hash(first), RefreshTokenService.hash(third)}
@@ -0,0 +1,176 @@
+# tests/utils/test_auth_middleware.py
+import time
+from datetime import datetime, timezone
+
+import jwt
+import pytest
+
+from app.core.settings import settings
+from app.utils.middlewares import auth as auth_module
+from app.utils.middlewares.auth import AuthMiddleware, PathTrie, TokenCache
+
+
+def _token(sub: str = "u1", exp_in: float = 60, secret: str | None = None) -> str:
+    claims = {"sub": sub, "exp": int(time.time() + exp_in)}
+    return jwt.encode(claims, secret or settings.JWT_SECRET, algorithm=settings.JWT_ALGO)
+
+
+class _App:
+    """Downstream-застосунок: запам'ятовує `scope["user"]`, відповідає 200 / accept."""
+
+    def __init__(self):
+        self.users: list = []
+
+    async def __call__(self, scope, receive, send):
+        self.users.append(scope.get("user"))
+        if scope["type"] == "websocket":
+            await send({"type": "websocket.accept"})
+            return
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _middleware(cache: TokenCache | None = None) -> tuple[AuthMiddleware, _App]:
+    app = _App()
+    middleware = AuthMiddleware(
+        app, http_protected=("/api/entities",), ws_protected=("/",), cache=cache or TokenCache()
+    )
+    return middleware, app
+
+
+async def _call(middleware: AuthMiddleware, path: str, *, kind: str = "http", bearer=None, cookie=None) -> dict:
+    headers = []
+    if bearer:
+        headers.append((b"authorization", f"Bearer {bearer}".encode()))
+    if cookie:
+        headers.append((b"cookie", f"theme=dark; access_token={cookie}".encode()))
+    scope = {"type": kind, "path": path, "headers": headers, "query_string": b""}
+    sent: list[dict] = []
+
+    async def receive():
+        return {"type": "websocket.connect"} if kind == "websocket" else {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    await middleware(scope, receive, send)
+    return sent[0]
+
+
+def _status(message: dict):
+    return message.get("status") or message.get("code") or message["type"]
+
+
+# ───────────── public / protected ─────────────
+@pytest.mark.anyio
+async def test_public_path_passes_without_token():
+    middleware, app = _middleware()
+
+    assert _status(await _call(middleware, "/api/auth/login")) == 200
+    assert _status(await _call(middleware, "/api/auth/login", bearer="garbage")) == 200
+    assert app.users == [None, None]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("token", [None, "not.a.jwt", _token(secret="x" * 32), _token(exp_in=-10)],
+                         ids=["missing", "malformed", "bad-signature", "expired"])
+async def test_missing_or_invalid_token_is_rejected(token):
+    middleware, app = _middleware()
+
+    assert _status(await _call(middleware, "/api/entities/clients", bearer=token)) == 401
+    assert _status(await _call(middleware, "/ws/analyze/live", kind="websocket", bearer=token)) == 4401
+    assert app.users == []
+
+
+@pytest.mark.anyio
+async def test_bearer_header_and_cookie_are_accepted():
+    middleware, app = _middleware()
+
+    assert _status(await _call(middleware, "/api/entities/clients", bearer=_token("a"))) == 200
+    assert _status(await _call(middleware, "/api/entities/clients", cookie=_token("b"))) == 200
+    assert _status(await _call(middleware, "/ws/analyze/live", kind="websocket", cookie=_token("c"))) == "websocket.accept"
+    assert [user["sub"] for user in app.users] == ["a", "b", "c"]
+
+
+@pytest.mark.anyio
+async def test_bearer_header_wins_over_cookie():
+    middleware, app = _middleware()
+
+    await _call(middleware, "/api/entities/clients", bearer=_token("header"), cookie=_token("cookie"))
+
+    assert app.users[0]["sub"] == "header"
+
+
+class _FrozenDatetime:
+    """Підміна `datetime` у jwt.api_jwt: `now()` повертає заданий момент."""
+
+    def __init__(self, timestamp: float):
+        self._real = datetime
+        self._now = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+    def now(self, tz=None):
+        return self._now
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+
+# ───────────── token cache ─────────────
+@pytest.mark.anyio
+async def test_cached_token_is_not_served_after_exp(monkeypatch):
+    cache = TokenCache()
+    middleware, _ = _middleware(cache)
+    token = _token(exp_in=30)
+    now = time.time()
+
+    assert _status(await _call(middleware, "/api/entities/clients", bearer=token)) == 200
+    assert cache.get(token) is not None
+
+    # jwt.decode теж дивиться на годинник — зсуваємо обидва
+    monkeypatch.setattr(auth_module.time, "time", lambda: now + 31)
+    monkeypatch.setattr(jwt.api_jwt, "datetime", _FrozenDatetime(now + 31))
+
+    assert cache.get(token) is None
+    assert _status(await _call(middleware, "/api/entities/clients", bearer=token)) == 401
+
+
+@pytest.mark.anyio
+async def test_cached_payload_is_read_only():
+    cache = TokenCache()
+    middleware, app = _middleware(cache)
+    token = _token("u1")
+
+    await _call(middleware, "/api/entities/clients", bearer=token)
+    with pytest.raises(TypeError):
+        app.users[0]["sub"] = "admin"
+
+    await _call(middleware, "/api/entities/clients", bearer=token)
+    assert app.users[1]["sub"] == "u1"
+
+
+def test_cache_keeps_payload_copy_and_evicts_lru():
+    cache = TokenCache(maxsize=2)
+    payload = {"sub": "u1", "exp": time.time() + 60}
+    tokens = ["h.p.s1", "h.p.s2", "h.p.s3"]
+
+    cache.put(tokens[0], payload)
+    payload["sub"] = "admin"
+    assert cache.get(tokens[0])["sub"] == "u1"
+
+    cache.put(tokens[1], payload)
+    cache.get(tokens[0])  # s1 — найсвіжіший, витісняється s2
+    cache.put(tokens[2], payload)
+    assert [cache.get(t) is not None for t in tokens] == [True, False, True]
+
+    # той самий підпис, інший header/payload — не влучання
+    assert cache.get("h.other.s1") is None
+
+
+def test_path_trie_matches_by_segment():
+    trie = PathTrie(["/api/entities", "/api/admin/"])
+
+    assert trie.match("/api/entities") and trie.match("/api/entities/clients/1")
+    assert trie.match("/api/admin")
+    assert not trie.match("/api/entities-x") and not trie.match("/api") and not trie.match("/")
+    assert PathTrie(["/"]).match("/anything")
+
@@ -0,0 +1,111 @@
+# tests/utils/test_cache.py
+import fakeredis
+import pytest
+
+from app.utils.cache import MISS, Cache, MemoryBackend, RedisBackend, build_backend, change_tags, entry_tags
+
+
+def _worker_cache(server: fakeredis.FakeServer) -> Cache:
+    """Кеш одного процесу-воркера; усі воркери бачать той самий Redis."""
+    return Cache(RedisBackend(client=fakeredis.aioredis.FakeRedis(server=server)), ttl=60)
+
+
+class _Source:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+@pytest.mark.anyio
+async def test_redis_tag_invalidation_reaches_other_workers():
+    server = fakeredis.FakeServer()
+    first, second = _worker_cache(server), _worker_cache(server)
+    tags = entry_tags("WORKER", "w1", topics=["credits"])
+    source = _Source({"total": 1})
+
+    assert await first.get_or_compute("WORKER:w1:overview", tags, source) == {"total": 1}
+    assert await second.get_or_compute("WORKER:w1:overview", tags, source) == {"total": 1}
+    assert source.calls == 1  # другий воркер узяв значення з Redis
+
+    source.value = {"total": 2}
+    first.invalidate(change_tags("credits", {"WORKER": {"w1"}}))
+    await first.drain()
+
+    assert await second.get_or_compute("WORKER:w1:overview", tags, source) == {"total": 2}
+    assert source.calls == 2
+
+
+@pytest.mark.anyio
+async def test_redis_invalidation_keeps_unrelated_entries():
+    server = fakeredis.FakeServer()
+    cache = _worker_cache(server)
+    w1, w2 = entry_tags("WORKER", "w1", topics=["credits"]), entry_tags("WORKER", "w2", topics=["credits"])
+    source = _Source(1)
+
+    await cache.get_or_compute("w1", w1, source)
+    await cache.get_or_compute("w2", w2, source)
+    cache.invalidate(change_tags("credits", {"WORKER": {"w1"}}))
+    await cache.drain()
+
+    await cache.get_or_compute("w1", w1, source)
+    await cache.get_or_compute("w2", w2, source)
+    assert source.calls == 3  # перераховано лише w1
+
+
+@pytest.mark.anyio
+async def test_wide_topic_invalidation():
+    server = fakeredis.FakeServer()
+    cache = _worker_cache(server)
+    tags = entry_tags("ADMIN", "a1", wide_topics=["clients"])
+    source = _Source(1)
+
+    await cache.get_or_compute("overview", tags, source)
+    cache.invalidate(change_tags("clients", {"WORKER": {"w9"}}))
+    await cache.drain()
+    await cache.get_or_compute("overview", tags, source)
+    assert source.calls == 2
+
+
+def test_memory_backend_only_for_single_worker():
+    assert isinstance(build_backend("memory", workers=1), MemoryBackend)
+    assert build_backend("memory", workers=3) is None
+    assert build_backend("off", workers=1) is None
+
+
+@pytest.mark.anyio
+async def test_lag_bound_applies_only_to_invalidated_tags():
+    cache = Cache(MemoryBackend(), ttl=60)
+    w1, w2 = entry_tags("WORKER", "w1", topics=["credits"]), entry_tags("WORKER", "w2", topics=["credits"])
+    source = _Source(1)
+
+    cache.invalidate(change_tags("credits", {"WORKER": {"w1"}}))
+    await cache.drain()
+
+    # w1 щойно змінився — репліка могла ще не догнати, тож значення не кешується
+    await cache.get_or_compute("w1", w1, source, lag_bound=5)
+    await cache.get_or_compute("w1", w1, source, lag_bound=5)
+    # w2 інвалідація не зачепила
+    await cache.get_or_compute("w2", w2, source, lag_bound=5)
+    await cache.get_or_compute("w2", w2, source, lag_bound=5)
+    assert source.calls == 3
+
+
+@pytest.mark.anyio
+async def test_value_computed_during_invalidation_of_its_tag_is_not_stored():
+    cache = Cache(MemoryBackend(), ttl=60)
+    w1, w2 = entry_tags("WORKER", "w1", topics=["credits"]), entry_tags("WORKER", "w2", topics=["credits"])
+
+    async def racing(tag_owner):
+        cache.invalidate(change_tags("credits", {"WORKER": {tag_owner}}))
+        await cache.drain()
+        return tag_owner
+
+    await cache.get_or_compute("w1", w1, lambda: racing("w1"))
+    await cache.get_or_compute("w2", w2, lambda: racing("w1"))
+
+    assert await cache.backend.get("w1") is MISS
+    assert await cache.backend.get("w2") == "w1"
@@ -0,0 +1,109 @@
+# tests/utils/test_pagination_total.py
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.utils.pagination import count_total, invalidate_totals
+from app.utils.pagination import total as total_module
+from app.utils.pagination.total import CountCache, Explain
+
+_metadata = MetaData()
+_items = Table("items", _metadata, Column("id", Integer, primary_key=True), Column("name", String))
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(total_module.time, "monotonic", clock)
+    return clock
+
+
+def test_count_cache_is_bounded_lru(clock):
+    cache = CountCache(maxsize=2, ttl=30)
+    cache.set("a", 1, frozenset({"items"}))
+    cache.set("b", 2, frozenset({"items"}))
+    assert cache.get("a") == 1  # a — найсвіжіший
+    cache.set("c", 3, frozenset({"items"}))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_count_cache_evicts_expired_without_reads(clock):
+    cache = CountCache(maxsize=100, ttl=30)
+    for i in range(10):
+        cache.set(f"search:{i}", i, frozenset({"items"}))
+
+    clock.now += 31
+    cache.set("fresh", 0, frozenset({"items"}))
+
+    assert len(cache) == 1
+    assert len(cache._expiry) == 1
+
+
+def test_count_cache_rewrite_keeps_new_expiry(clock):
+    cache = CountCache(maxsize=100, ttl=30)
+    cache.set("a", 1, frozenset({"items"}))
+    clock.now += 20
+    cache.set("a", 2, frozenset({"items"}))
+    clock.now += 15  # перший запис "a" протух, другий — ще ні
+    cache.set("b", 3, frozenset())
+
+    assert cache.get("a") == 2
+
+
+def test_count_cache_invalidate_by_table(clock):
+    cache = CountCache(maxsize=100, ttl=30)
+    cache.set("items", 1, frozenset({"items"}))
+    cache.set("other", 2, frozenset({"other"}))
+
+    cache.invalidate({"items"})
+    assert cache.get("items") is None
+    assert cache.get("other") == 2
+
+
+def test_explain_keeps_user_input_in_bind_params():
+    search = "%'; DROP TABLE items; --%"
+    compiled = Explain(select(_items.c.id).where(_items.c.name.ilike(search))).compile(
+        dialect=postgresql.asyncpg.dialect()
+    )
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT items.id")
+    assert "DROP" not in str(compiled)
+    assert search in compiled.params.values()
+
+
+@pytest.mark.anyio
+async def test_count_total_cached_mode():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(_metadata.create_all)
+            await conn.execute(insert(_items), [{"name": "a"}, {"name": "b"}])
+
+        async with AsyncSession(engine) as db:
+            rows = select(_items).where(_items.c.name.is_not(None))
+            invalidate_totals()
+            assert await count_total(db, rows, mode="cached") == (2, "cached")
+
+            await db.execute(insert(_items).values(name="c"))
+            assert await count_total(db, rows, mode="cached") == (2, "cached")
+            assert await count_total(db, rows, mode="exact") == (3, "exact")
+
+            invalidate_totals({"items"})
+            assert await count_total(db, rows, mode="cached") == (3, "cached")
+            # estimated поза PostgreSQL — exact
+            assert await count_total(db, rows, mode="estimated") == (3, "exact")
+    finally:
+        invalidate_totals()
+        await engine.dispose()
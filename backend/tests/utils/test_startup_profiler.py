@@ -0,0 +1,54 @@
+# tests/utils/test_startup_profiler.py
+import pytest
+
+from app.utils.instrumentation.startup import ImportProfiler, parse_importtime
+
+
+class _StubProfiler(ImportProfiler):
+    """Без підпроцесу: рахує прогони і повертає порожній профіль."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.runs: list[str] = []
+
+    async def _run(self, module: str) -> dict:
+        self.runs.append(module)
+        return {"records": [], "exit_code": 0, "wall_ms": 0.0, "measured_at": "", "errors": []}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("module", ["os", "main.x", "app;import os", "app\n", "app..x", "subprocess", ""])
+async def test_report_rejects_modules_outside_backend(module):
+    profiler = _StubProfiler()
+    with pytest.raises(ValueError):
+        await profiler.report(module)
+    assert profiler.runs == []
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("module", ["main", "app", "app.services.export"])
+async def test_report_allows_main_and_app_modules(module):
+    profiler = _StubProfiler()
+    assert (await profiler.report(module))["module"] == module
+
+
+@pytest.mark.anyio
+async def test_runs_cache_is_bounded_lru():
+    profiler = _StubProfiler(max_runs=2)
+    await profiler.report("app.a")
+    await profiler.report("app.b")
+    await profiler.report("app.a")   # a — найсвіжіший
+    await profiler.report("app.c")   # витісняє b
+
+    assert list(profiler._runs) == ["app.a", "app.c"]
+    await profiler.report("app.b")
+    assert profiler.runs == ["app.a", "app.b", "app.c", "app.b"]
+
+
+def test_parse_importtime_depth():
+    records = parse_importtime(
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       396 |        629 |   fastapi\n"
+        "import time:        12 |         12 |     fastapi.types\n"
+    )
+    assert [(r.module, r.self_us, r.depth) for r in records] == [("fastapi", 396, 1), ("fastapi.types", 12, 2)]
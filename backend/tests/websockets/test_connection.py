@@ -0,0 +1,141 @@
+# tests/websockets/test_connection.py
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+
+import orjson
+import pytest
+
+from app.permissions import PermissionRole
+from app.services.live import hub as hub_module
+from app.services.live.change_bus import ChangeBus, ChangeEvent
+from app.services.live.hub import LiveDashboardHub
+from app.services.live.metrics import LiveMetric
+from app.websockets.connection import WebSocketConnection
+
+
+class _SlowSocket:
+    """Клієнт, що не читає, поки не відкрито `gate`."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.frames: list[dict] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame: str):
+        await self.gate.wait()
+        self.frames.append(orjson.loads(frame))
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+@asynccontextmanager
+async def _no_db():
+    yield None
+
+
+def _client_state(frames: list[dict], metric: str) -> dict:
+    """Те, що бачить фронтенд: snapshot замінює стан, delta оновлює змінені ключі."""
+    state: dict = {}
+    for frame in frames:
+        if frame.get("metric") != metric:
+            continue
+        if frame["type"] == "snapshot":
+            state = dict(frame["data"])
+        elif frame["type"] == "delta":
+            state.update(frame["data"])
+    return state
+
+
+@pytest.fixture
+def live(monkeypatch):
+    values = {"totals": {"a": 0, "b": 0, "c": 0}, "other": {"x": 0}}
+
+    def register(name: str) -> None:
+        async def compute(_db, _scope):
+            return dict(values[name])
+
+        metric = LiveMetric(name=name, role=PermissionRole.ADMIN, topics=frozenset({"credits"}), compute=compute)
+        monkeypatch.setitem(hub_module.LIVE_METRICS, (PermissionRole.ADMIN, name), metric)
+
+    register("totals")
+    register("other")
+    bus = ChangeBus()
+    return values, bus, LiveDashboardHub(bus, session_factory=_no_db, debounce=0)
+
+
+async def _connection(
+    hub: LiveDashboardHub, queue_size: int, *, writer: bool = True
+) -> tuple[WebSocketConnection, _SlowSocket]:
+    socket = _SlowSocket()
+    connection = WebSocketConnection(socket, queue_size=queue_size)
+    connection.on_overflow = partial(hub.snapshots, connection)
+    await connection.connect()
+    if writer:
+        connection.start_writer()
+    return connection, socket
+
+
+async def _change(hub: LiveDashboardHub, bus: ChangeBus) -> None:
+    bus.publish([ChangeEvent("credits")])
+    await asyncio.gather(*(g.task for g in hub._groups.values() if g.task is not None))
+
+
+async def _drain(connection: WebSocketConnection, socket: _SlowSocket) -> None:
+    socket.gate.set()
+    while connection.queue_depth:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+@pytest.mark.anyio
+async def test_overflow_resyncs_instead_of_losing_deltas(live):
+    values, bus, hub = live
+    connection, socket = await _connection(hub, queue_size=3)
+    await hub.subscribe(connection, PermissionRole.ADMIN, None, "totals")
+    await hub.subscribe(connection, PermissionRole.ADMIN, None, "other")
+
+    # кожна зміна — delta з одним ключем; черга на 3 кадри переповнюється багато разів
+    for i in range(1, 21):
+        values["totals"]["abc"[i % 3]] = i
+        if i % 5 == 0:
+            values["other"]["x"] = i
+        await _change(hub, bus)
+
+    assert connection.resyncs > 0 and connection.dropped > 0
+    await _drain(connection, socket)
+
+    assert _client_state(socket.frames, "totals") == {"a": 18, "b": 19, "c": 20}
+    assert _client_state(socket.frames, "other") == {"x": 20}
+    await connection.close()
+
+
+@pytest.mark.anyio
+async def test_overflow_queue_holds_one_snapshot_per_subscription(live):
+    values, bus, hub = live
+    connection, _ = await _connection(hub, queue_size=2, writer=False)
+    await hub.subscribe(connection, PermissionRole.ADMIN, None, "totals")
+    await hub.subscribe(connection, PermissionRole.ADMIN, None, "other")
+    values["totals"]["a"] = 1
+    await _change(hub, bus)  # третій кадр у черзі на 2 → resync
+
+    queued = [orjson.loads(frame) for frame in connection._queue]
+    assert [(f["type"], f["metric"]) for f in queued] == [("snapshot", "totals"), ("snapshot", "other"), ("delta", "totals")]
+    assert queued[0]["data"] == {"a": 1, "b": 0, "c": 0}
+    await connection.close()
+
+
+@pytest.mark.anyio
+async def test_overflow_without_resync_source_clears_queue():
+    socket = _SlowSocket()
+    connection = WebSocketConnection(socket, queue_size=2)
+    await connection.connect()
+
+    for i in range(5):
+        connection.enqueue(str(i))
+
+    assert list(connection._queue) == ["4"]
+    assert (connection.dropped, connection.resyncs) == (4, 2)